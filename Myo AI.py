@@ -22,7 +22,7 @@ Myo AI is a modular, end-to-end cardiovascular disease (CVD) prediction system b
 | Layer | Codename | Module | Purpose |
 |:---:|---|---|---|
 | **1 — Foundation** | Synapse | `SynapseIngestionEngine` | Downloads & harmonizes 4 disparate clinical CSV datasets |
-| | Pulse | `run_pulse_harmonization()` | Chunk-processes ~600 MB ECG time-series → statistical features |
+| | Pulse | `run_pulse_harmonization()` | Chunk-processes ~600 MB ECG time-series → statistical, spectral & HRV features |
 | | Catalyst | `CatalystFeatureSynthesizer` | Merges modalities, engineers BMI / Pulse-Pressure, clips outliers |
 | **2 — Tournament** | Aegis Protocol | Random Forest Pipeline | Robust tree-ensemble baseline |
 | | Myo-Core Engine | HistGradientBoosting Pipeline | Optimized gradient-boosted champion |
@@ -31,7 +31,8 @@ Myo AI is a modular, end-to-end cardiovascular disease (CVD) prediction system b
 | | Pulse-Sync | 1D-CNN (TensorFlow/Keras) | Deep Learning for complex non-linear patterns |
 | **3 — Intelligence** | Zenith Map | PCA + KMeans | Unsupervised patient risk-group clustering |
 | | Oracle Layer | SHAP + Permutation Importance | Explainable AI — global & local feature impact |
-| | Myo-Sim Bio-Deck | ipywidgets + Chronos Engine | Interactive digital-twin risk simulator with 20-year projection |
+| | Myo-Sim Bio-Deck | ipywidgets + Chronos Engine | Interactive digital-twin risk simulator with 20-year projection and "what would lower my risk?" counterfactuals |
+| | Drift Monitor | Streaming histograms + PSI / KS | Flags scored traffic and predicted risk that drift from the training distribution |
 
 ---
 
@@ -62,7 +63,7 @@ Raw Data → Synapse (Ingest) → Pulse (ECG Features) → Catalyst (Merge & Eng
 
 | Component | Technology |
 |---|---|
-| Data Engineering | Pandas, NumPy, SciPy, gdown |
+| Data Engineering | Pandas, NumPy, SciPy |
 | Machine Learning | Scikit-learn (Pipeline, RandomForest, HGBC, NaiveBayes, LogisticRegression) |
 | Deep Learning | TensorFlow / Keras (Conv1D) |
 | Explainability | SHAP (TreeExplainer), Permutation Importance |
@@ -81,19 +82,25 @@ Raw Data → Synapse (Ingest) → Pulse (ECG Features) → Catalyst (Merge & Eng
 #  GOOGLE COLAB — Dependency Installation (Run Once)
 # ══════════════════════════════════════════════════════════════
 
-!pip install -q gdown shap tensorflow scikit-learn scipy pandas numpy seaborn matplotlib ipywidgets
+!pip install -q shap tensorflow scikit-learn scipy pandas numpy seaborn matplotlib ipywidgets
+
+# Stage modules (myo_ai/) ship with the repository — make them importable
+import os, sys
+if not os.path.isdir('myo_ai'):
+    !git clone -q https://github.com/4hmed-n/Myo-AI.git
+    sys.path.insert(0, 'Myo-AI')
 print("✅ All dependencies installed.")
 
 """### 📦 Global Imports
 
 | Category | Libraries | Purpose |
 |---|---|---|
-| **Data** | `pandas`, `numpy`, `scipy`, `gdown` | Data manipulation, numerical ops, statistical functions, Google Drive downloads |
-| **Visualization** | `matplotlib`, `seaborn` | Static plots, heatmaps, styled charts |
-| **ML** | `sklearn` (Pipeline, Imputer, Scaler, RF, HGBC, NB, LogReg, PCA, KMeans) | Preprocessing, classification, clustering |
-| **DL** | `tensorflow`, `keras` | Conv1D neural network (Pulse-Sync) |
-| **XAI** | `shap` | Explainable AI — SHAP TreeExplainer |
-| **UI** | `ipywidgets` | Interactive patient simulator dashboard |
+| **Core** | `os`, `json`, `time`, `numpy`, `pandas` | Paths, timing, numerical ops, data frames |
+| **Stages** | `myo_ai.ingest`, `myo_ai.train`, `myo_ai.explain`, `myo_ai.simulate` | Importable pipeline stages (Synapse → Tournament → Oracle → Myo-Sim) |
+| **Telemetry** | `myo_ai.telemetry` | Run-wide stage recorder (`telemetry.RUN`) — wall / CPU time, peak RSS and rows per engine, reported before Layer 4 |
+| **Benchmarks** | `RUN_BENCHMARKS` | Off by default: the micro-benchmark cells (2M-row imputer, standard vs. lean Aegis, Myo-Core profiles, Pulse-Sync epochs, 10M-point Zenith renders) are skipped; `benchmarks/suite.py` times the pipeline stages outside the notebook |
+
+Heavy dependencies — `tensorflow`, `shap`, `seaborn`, `ipywidgets` and the sklearn estimators — are **not** imported here. Each stage loads them lazily the first time they are used, so a run that only ingests or scores never pays for TensorFlow or SHAP. `benchmarks/import_time.py` reports per-stage cost with `python -X importtime`.
 """
 
 # ==============================================================================
@@ -101,40 +108,18 @@ print("✅ All dependencies installed.")
 # ==============================================================================
 
 import os
+import json
 import time
 import warnings
-import gdown
-import shap
 import numpy as np
 import pandas as pd
-import seaborn as sns
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
-import ipywidgets as widgets
-from IPython.display import display, clear_output
-from scipy.stats import skew, kurtosis
-
-# Machine Learning
-from sklearn.pipeline import Pipeline
-from sklearn.preprocessing import StandardScaler, MinMaxScaler
-from sklearn.impute import SimpleImputer
-from sklearn.model_selection import train_test_split
-from sklearn.decomposition import PCA
-from sklearn.cluster import KMeans
-from sklearn.metrics import accuracy_score, roc_auc_score, confusion_matrix, roc_curve, auc
-from sklearn.ensemble import RandomForestClassifier, HistGradientBoostingClassifier
-from sklearn.linear_model import LogisticRegression
-from sklearn.naive_bayes import GaussianNB
-from sklearn.inspection import permutation_importance
 
-# Deep Learning
-import tensorflow as tf
-from tensorflow import keras
-from tensorflow.keras import layers
+from myo_ai import ingest, train, explain, simulate, telemetry
 
+telemetry.RUN.reset()           # one telemetry run per notebook execution
 # Configuration
+RUN_BENCHMARKS = False          # True runs the inline micro-benchmark cells
 warnings.filterwarnings('ignore')
-plt.style.use('seaborn-v0_8-darkgrid')
 print("✅ MYO AI: System Dependencies Loaded.")
 
 """# 🧬 LAYER 1 — THE FOUNDATION (Data Engineering)
@@ -143,8 +128,8 @@ print("✅ MYO AI: System Dependencies Loaded.")
 
 | # | Engine | Class / Function | Input | Output | Key Technique |
 |:---:|---|---|---|---|---|
-| 1 | **Synapse** | `SynapseIngestionEngine` | 4 Google Drive CSVs | `df_tabular` (harmonized rows) | gdown download, column renaming, outer concat |
-| 2 | **Pulse** | `run_pulse_harmonization()` | `ecg_timeseries.csv` (~600 MB) | `df_ecg_features` (mean, std, skew, kurtosis) | Chunk-based streaming, scipy stats |
+| 1 | **Synapse** | `SynapseIngestionEngine` | 4 Google Drive CSVs | `df_tabular` (harmonized rows) | Verified registry fetch, source adapters, schema projection |
+| 2 | **Pulse** | `run_pulse_harmonization()` | `ecg_timeseries.csv` (~600 MB) | `df_ecg_features` (moments, band powers, dominant frequency, zero-crossing rate, HRV) | Chunk-based streaming, batched NumPy / FFT |
 | 3 | **Catalyst** | `CatalystFeatureSynthesizer` | `df_tabular` + `df_ecg_features` | `MASTER_DATA` | Left merge, BMI / Pulse-Pressure engineering, BP clipping |
 
 ### 🔌 Synapse Ingestion Engine
@@ -153,110 +138,32 @@ print("✅ MYO AI: System Dependencies Loaded.")
 |---|---|
 | **Purpose** | Download and harmonize 4 disparate cardiac CSV datasets into one unified DataFrame |
 | **Datasets** | Heart Attack (Kaggle), Cardiac Failure (Kaggle), ECG Time-Series, Cardiac Failure Base (semicolon-delimited) |
-| **Method** | Google Drive download via `gdown`, column renaming to canonical schema, source provenance tagging, outer-join concatenation |
+| **Method** | Source files resolved through the local data registry (`myo_ai.registry`), then read concurrently through per-source adapters (`myo_ai.sources`): renaming and unit conversion to the canonical schema, source provenance tagging, stacking into one preallocated frame |
 | **Output** | `df_tabular` — a single harmonized DataFrame with all patient rows and a `source` column |
-| **Key Design** | Idempotent downloads (skips if file exists), string-safe `id` column, outer join preserves all columns across sources |
+| **Key Design** | Verified downloads (size + SHA-256 from `configs/data_manifest.json`, so a truncated file is never reused), string-safe `id` column, every canonical column preserved across sources |
+| **Source Adapters** | Each feed is a `SourceAdapter` declaring reader options, rename map, dtypes and units (`register_source` adds a hospital feed without code changes). Headers are matched case-insensitively (`HeartDisease` → `target`); raw columns outside `CANONICAL_COLUMNS` are never parsed, so new feeds do not widen the frame into a sparse union, and each source's dropped columns are listed; `benchmarks/harmonize.py` reports time and peak RSS for 12 feeds |
+| **Data Registry** | The four sources are fetched concurrently, hashed while streaming and resumed from `<file>.part` with range requests; backends are Google Drive (default), an HTTP mirror or a local directory (`MYO_DATA_MIRROR`). `registry.pin(...)` records the manifest from a trusted copy; unpinned sources are fetched in full, checked against the announced size and pinned on first use |
+| **Air-Gapped Mode** | `SYNAPSE_AIR_GAPPED = True` (or `MYO_AIR_GAPPED=1`) resolves only from the local store and raises if a file is missing or fails verification |
+| **Synthetic Mode** | `SYNAPSE_SYNTHETIC_ROWS = n` writes `n` synthetic patients with the same files and raw columns (`synthetic.write_synthetic_sources`) instead of downloading — for benchmarks and offline runs |
 """
 
 # ══════════════════════════════════════════════════════════════
 #  SYNAPSE INGESTION ENGINE — Multi-Source Clinical Data Loader
 # ══════════════════════════════════════════════════════════════
 
-import pandas as pd
-import numpy as np
-import gdown
-import os
-
-
-class SynapseIngestionEngine:
-    """
-    Downloads and harmonizes heterogeneous cardiac datasets into a
-    single analysis-ready tabular DataFrame.
-
-    Datasources
-    -----------
-    - Heart Attack (Kaggle)
-    - Cardiac Failure (Kaggle)
-    - Cardiac Failure Base (semicolon-delimited)
-    """
-
-    FILE_IDS = {
-        'heart_attack':          '1mopCa200spbeFRFpkr_ppuLbqsdl0BaR',
-        'cardiac_failure':       '1NBL96uw95T5nhH2_bncc-jvVEOp6_Mjn',
-        'ecg_timeseries':        '1MFOoFkk_ypdbH2jvPXU7YWiNDlvPd-en',
-        'cardiac_failure_base':  '1_pcIRUWpHoUNkiHcDK01HlLkOOMXi9hn',
-    }
-
-    RENAME_MAP = {
-        'output': 'target',
-        'DEATH_EVENT': 'target',
-        'label': 'target',
-        'trtbps': 'sys_bp',
-        'high_blood_pressure': 'sys_bp',
-        'chol': 'cholesterol',
-        'serum_cholesterol': 'cholesterol',
-    }
-
-    # ── Download ────────────────────────────────────────────────
-    def download_data(self) -> dict:
-        """Download all CSVs from Google Drive if not already cached."""
-        paths = {}
-        for name, f_id in self.FILE_IDS.items():
-            output = f'{name}.csv'
-            if not os.path.exists(output):
-                print(f"  ↓  Downloading {name}...")
-                gdown.download(
-                    f'https://drive.google.com/uc?id={f_id}',
-                    output,
-                    quiet=False,
-                )
-            paths[name] = output
-        print("✅ Synapse Download Complete.")
-        return paths
-
-    # ── Ingest & Harmonize ──────────────────────────────────────
-    def ingest_and_harmonize(self, paths: dict) -> pd.DataFrame:
-        """
-        Read the 3 tabular CSVs, rename columns to a canonical
-        schema, tag with source, and merge into one DataFrame.
-        """
-        df_ha = pd.read_csv(paths['heart_attack'])
-        df_cf = pd.read_csv(paths['cardiac_failure'])
-        df_ex = pd.read_csv(paths['cardiac_failure_base'], sep=';')
-
-        # Canonical column names
-        df_ha = df_ha.rename(columns=self.RENAME_MAP)
-        df_cf = df_cf.rename(columns=self.RENAME_MAP)
-        df_ex = df_ex.rename(columns=self.RENAME_MAP)
-
-        # Source provenance tags
-        df_ha['source'] = 'HeartAttack'
-        df_cf['source'] = 'CardiacFailure'
-        df_ex['source'] = 'CardiacFailureBase'
-
-        # Ensure 'id' is string before concat
-        for df in (df_cf, df_ex):
-            if 'id' in df.columns:
-                df['id'] = df['id'].astype(str)
-
-        # Union merge (outer join keeps all columns)
-        df_tabular = pd.concat(
-            [df_ha, df_cf, df_ex],
-            axis=0,
-            ignore_index=True,
-            join='outer',
-        )
-
-        if 'id' in df_tabular.columns:
-            df_tabular['id'] = df_tabular['id'].astype(str)
-
-        print(f"✅ Synapse Harmonization Complete  →  {len(df_tabular):,} patient rows")
-        return df_tabular
+from myo_ai.ingest import SynapseIngestionEngine
 
+SYNAPSE_SYNTHETIC_ROWS = None   # e.g. 100_000 → synthetic sources, no download
+SYNAPSE_AIR_GAPPED = None       # True → local store only; None → MYO_AIR_GAPPED
 
 # ── Instantiate & Run ───────────────────────────────────────────
 synapse = SynapseIngestionEngine()
-paths   = synapse.download_data()
+if SYNAPSE_SYNTHETIC_ROWS:
+    from myo_ai import synthetic
+    paths = synthetic.write_synthetic_sources('.', SYNAPSE_SYNTHETIC_ROWS)
+    print(f"🧪 Synthetic sources written for {SYNAPSE_SYNTHETIC_ROWS:,} patients.")
+else:
+    paths = synapse.download_data(air_gapped=SYNAPSE_AIR_GAPPED)
 df_tabular = synapse.ingest_and_harmonize(paths)
 
 """### ⚡ Pulse-Harmonization Engine
@@ -265,8 +172,11 @@ df_tabular = synapse.ingest_and_harmonize(paths)
 |---|---|
 | **Purpose** | Stream-process a large ECG time-series CSV and extract per-patient statistical features |
 | **Input** | `ecg_timeseries.csv` (potentially ~600 MB) |
-| **Output** | `df_ecg_features` — DataFrame with columns: `id`, `ecg_mean`, `ecg_std`, `ecg_skew`, `ecg_kurtosis`, `source` |
+| **Output** | `df_ecg_features` — DataFrame with columns: `id`, `ecg_mean`, `ecg_std`, `ecg_skew`, `ecg_kurtosis`, `source` (plus the extended features below) |
 | **Technique** | Chunk-based reading (`chunksize=100,000`), auto-detection of signal column, `scipy.stats.skew` & `kurtosis` |
+| **Extended Features** | `PULSE_FEATURES = 'extended'` (default) runs `ecg_features.run_pulse_features`: per-record FFT band powers (`ecg_band_low/qrs/high`), `ecg_dominant_hz`, `ecg_zcr` and R-peak HRV (`ecg_r_peaks`, `ecg_hr_bpm`, `ecg_rr_mean_s`, `ecg_sdnn_s`, `ecg_rmssd_s`) next to the four moments; `'moments'` keeps the original engine |
+| **Windowed Mode** | `PULSE_WINDOWS = True` adds `ecg_features.run_pulse_windows`: the samples are cached once as a float32 memmap (`cache/ecg_signal.npy`) and `sliding_window_view` windows of `PULSE_WINDOW_S` seconds every `PULSE_HOP_S` seconds yield per-window std and max absolute slope, summarized per record (`ecg_win_std_mean/max`, `ecg_win_slope_mean/max`) and merged by Catalyst. Each record is one heartbeat (187 samples, 1.5 s), so the defaults are sub-beat 0.4 s windows every 0.2 s; windows longer than a record are clipped, and a record shorter than one window is summarized by its single partial window |
+| **Batched Execution** | Each chunk of records is one padded `(records × samples)` matrix — masked moments, one `rfft`, a running-max R-peak mask and `bincount`-grouped RR statistics — scored on a joblib process pool, so the richer set streams faster per GB than the per-record `groupby().apply` moments |
 | **Memory Safety** | Never loads entire file into RAM; processes in configurable chunks and aggregates |
 """
 
@@ -274,94 +184,33 @@ df_tabular = synapse.ingest_and_harmonize(paths)
 #  PULSE-HARMONIZATION ENGINE — ECG Time-Series Feature Extractor
 # ══════════════════════════════════════════════════════════════
 
-from scipy.stats import skew, kurtosis
-
-
-def _extract_ecg_stats(group: pd.Series) -> pd.Series:
-    """Compute 4 statistical moments from raw ECG amplitude values."""
-    data = pd.to_numeric(group, errors='coerce').dropna()
-
-    if len(data) == 0:
-        return pd.Series({
-            'ecg_mean': 0, 'ecg_std': 0,
-            'ecg_skew': 0, 'ecg_kurtosis': 0,
-        })
-
-    return pd.Series({
-        'ecg_mean':     data.mean(),
-        'ecg_std':      data.std()      if len(data) >= 2 else 0,
-        'ecg_skew':     skew(data)      if len(data) >= 3 else 0,
-        'ecg_kurtosis': kurtosis(data)  if len(data) >= 3 else 0,
-    })
-
-
-def run_pulse_harmonization(file_path: str, chunk_size: int = 100_000) -> pd.DataFrame:
-    """
-    Stream-process a large ECG CSV in chunks, extracting per-patient
-    statistical features (mean, std, skew, kurtosis).
-
-    Parameters
-    ----------
-    file_path : str
-        Path to `ecg_timeseries.csv`.
-    chunk_size : int
-        Rows per chunk (default 100 000).
-
-    Returns
-    -------
-    pd.DataFrame
-        Columns: id | ecg_mean | ecg_std | ecg_skew | ecg_kurtosis | source
-    """
-    print("⚡ Pulse-Harmonization: Processing ECG signal file...")
-
-    # 1. Detect signal column automatically
-    header = pd.read_csv(file_path, nrows=2)
-    all_cols = header.columns.tolist()
-    print(f"   Columns detected: {all_cols}")
-
-    sig_candidates = [
-        c for c in all_cols
-        if c.isdigit() or 'sig' in c.lower() or 'val' in c.lower()
-    ]
-    if '0' in sig_candidates:
-        sig_col = '0'
-    elif sig_candidates:
-        sig_col = sig_candidates[0]
-    else:
-        sig_col = all_cols[1]
-
-    print(f"   Signal column: '{sig_col}'")
-
-    # 2. Chunk-wise feature extraction
-    ecg_feature_list = []
-    global_row_offset = 0
-
-    for chunk in pd.read_csv(file_path, chunksize=chunk_size, low_memory=False):
-        chunk['id'] = (chunk.index + global_row_offset).astype(str)
-        global_row_offset += len(chunk)
-
-        feats = chunk.groupby('id')[sig_col].apply(_extract_ecg_stats).unstack()
-        ecg_feature_list.append(feats)
-
-    # 3. Aggregate across chunks
-    df_ecg_features = pd.concat(ecg_feature_list).groupby(level=0).mean()
-    df_ecg_features['source'] = 'ECG_Signal'
-    df_ecg_features.index.name = 'id'
-    df_ecg_features = df_ecg_features.reset_index()
-
-    print(f"✅ Pulse-Harmonization Complete  →  {len(df_ecg_features):,} ECG records")
-    return df_ecg_features
+from myo_ai.ingest import run_pulse_harmonization
+from myo_ai.ecg_features import run_pulse_features, run_pulse_windows
 
+PULSE_FEATURES = 'extended'     # 'moments' → the original four-moment engine
+PULSE_WINDOWS  = True           # per-record summary of sliding-window statistics
+PULSE_WINDOW_S = 0.4            # window length (s) — records are single beats of ≤ 1.5 s
+PULSE_HOP_S    = 0.2            # step between window starts (s)
 
 # ── Execute ─────────────────────────────────────────────────────
-df_ecg_features = run_pulse_harmonization(paths['ecg_timeseries'])
+pulse_t0 = time.perf_counter()
+if PULSE_FEATURES == 'extended':
+    df_ecg_features = run_pulse_features(paths['ecg_timeseries'])
+else:
+    df_ecg_features = run_pulse_harmonization(paths['ecg_timeseries'])
+pulse_mb = os.path.getsize(paths['ecg_timeseries']) / 1e6
+print(f"   Throughput: {pulse_mb / (time.perf_counter() - pulse_t0):.1f} MB/s "
+      f"({pulse_mb:,.0f} MB, {df_ecg_features.shape[1] - 2} features per record)")
+
+df_ecg_windows = (run_pulse_windows(paths['ecg_timeseries'], PULSE_WINDOW_S, PULSE_HOP_S)
+                  if PULSE_WINDOWS else None)
 
 """### 🧪 Catalyst Feature Synthesizer
 
 | Property | Detail |
 |---|---|
 | **Purpose** | Merge tabular clinical data with ECG statistical features and engineer clinically meaningful derived variables |
-| **Inputs** | `df_tabular` (Synapse output), `df_ecg_features` (Pulse output) |
+| **Inputs** | `df_tabular` (Synapse output), `df_ecg_features` (Pulse output), optional `df_ecg_windows` (windowed Pulse summaries) |
 | **Output** | `MASTER_DATA` — the analysis-ready master DataFrame used by all downstream models |
 | **Engineered Features** | `bmi` (weight / height²), `pulse_pressure` (systolic − diastolic), `sensor_signal_available` (ECG presence flag) |
 | **Outlier Handling** | Systolic BP clipped to [80, 200], Diastolic BP clipped to [50, 120] |
@@ -372,95 +221,14 @@ df_ecg_features = run_pulse_harmonization(paths['ecg_timeseries'])
 #  CATALYST FEATURE SYNTHESIZER — Multimodal Feature Engineering
 # ══════════════════════════════════════════════════════════════
 
-import pandas as pd
-import numpy as np
-
-
-class CatalystFeatureSynthesizer:
-    """
-    Merges tabular clinical data with ECG statistical features and
-    synthesizes clinically meaningful derived variables.
-
-    Pipeline
-    --------
-    1. Left-merge tabular + ECG on patient `id`
-    2. Create `sensor_signal_available` missingness flag
-    3. Clip blood-pressure outliers to physiological ranges
-    4. Engineer BMI and Pulse Pressure
-    5. Canonicalize the target column
-    """
-
-    # Physiological clipping ranges
-    BP_SYSTOLIC_RANGE  = (80, 200)   # ap_hi
-    BP_DIASTOLIC_RANGE = (50, 120)   # ap_lo
-
-    # Possible names for the binary target across datasets
-    TARGET_CANDIDATES = ['cardio', 'heartdisease', 'output', 'target']
-
-    def synthesize(
-        self,
-        df_tab: pd.DataFrame,
-        df_ecg: pd.DataFrame,
-    ) -> pd.DataFrame:
-        """
-        Execute the full Catalyst pipeline and return MASTER_DATA.
-
-        Parameters
-        ----------
-        df_tab : pd.DataFrame   Harmonized tabular patient data.
-        df_ecg : pd.DataFrame   ECG statistical features (from Pulse engine).
-
-        Returns
-        -------
-        pd.DataFrame  Analysis-ready MASTER_DATA with all derived features.
-        """
-        # ── 1. Standardize IDs & merge ──────────────────────────
-        df_tab  = df_tab.copy()
-        df_ecg  = df_ecg.copy()
-        df_tab['id']  = df_tab['id'].astype(str).str.strip()
-        df_ecg['id']  = df_ecg['id'].astype(str).str.strip()
-
-        df = pd.merge(df_tab, df_ecg, on='id', how='left').reset_index(drop=True)
-        df.columns = df.columns.str.lower()
-        print(f"   Merged shape: {df.shape}")
-
-        # ── 2. Sensor-availability flag ─────────────────────────
-        df['sensor_signal_available'] = df['ecg_mean'].notnull().astype(int)
-        avail = df['sensor_signal_available'].sum()
-        print(f"   ECG signal present for {avail:,} / {len(df):,} patients")
-
-        # ── 3. Blood-pressure outlier clipping ──────────────────
-        if 'ap_hi' in df.columns:
-            df['ap_hi'] = df['ap_hi'].clip(*self.BP_SYSTOLIC_RANGE)
-        if 'ap_lo' in df.columns:
-            df['ap_lo'] = df['ap_lo'].clip(*self.BP_DIASTOLIC_RANGE)
-
-        # ── 4. Clinical feature engineering ─────────────────────
-        if 'weight' in df.columns and 'height' in df.columns:
-            df['bmi'] = df['weight'] / ((df['height'] / 100) ** 2)
-            print("   ✓ BMI synthesized  (weight / height²)")
-
-        if 'ap_hi' in df.columns and 'ap_lo' in df.columns:
-            df['pulse_pressure'] = df['ap_hi'] - df['ap_lo']
-            print("   ✓ Pulse Pressure synthesized  (systolic − diastolic)")
-
-        # ── 5. Canonicalize target column ───────────────────────
-        for candidate in self.TARGET_CANDIDATES:
-            if candidate in df.columns:
-                df = df.rename(columns={candidate: 'target'})
-                break
-
-        print(f"✅ Catalyst Synthesis Complete  →  {df.shape[1]} features, "
-              f"{len(df):,} rows")
-        return df
-
+from myo_ai.ingest import CatalystFeatureSynthesizer
 
 # ══════════════════════════════════════════════════════════════
 #  EXECUTION — Build MASTER_DATA
 # ══════════════════════════════════════════════════════════════
 
 catalyst    = CatalystFeatureSynthesizer()
-MASTER_DATA = catalyst.synthesize(df_tabular, df_ecg_features)
+MASTER_DATA = catalyst.synthesize(df_tabular, df_ecg_features, df_ecg_windows)
 
 # Quick sanity check
 print("\n── MASTER_DATA Preview ─────────────────────────────────")
@@ -479,7 +247,7 @@ MASTER_DATA.head(3)
 | 2 | **Myo-Core Engine** | HistGradientBoosting | Imputer → Scaler → HGBC | `max_iter=300`, `lr=0.05`, `L2=1.5` |
 | 3 | **Sentinel Node** | Naive Bayes | Imputer → MinMaxScaler → GaussianNB | Non-parametric |
 | 4 | **Vanguard System** | Logistic Regression | Imputer → Scaler → LogReg | `max_iter=1000` |
-| 5 | **Pulse-Sync** | 1D-CNN (Keras) | Imputer → Scaler → Conv1D → Dense | `epochs=10`, `filters=64/32`, `dropout=0.3` |
+| 5 | **Pulse-Sync** | 1D-CNN (Keras) | Imputer → Scaler → tf.data → Conv1D → Dense | `epochs≤10` (early stop, `patience=3`), `batch=256`, `filters=64/32`, `dropout=0.3` |
 
 ### Strict Independence Guarantee
 - Each model cell independently: selects features from `MASTER_DATA`, performs its own stratified split, fits its own imputer/scaler, trains, and evaluates
@@ -491,7 +259,7 @@ MASTER_DATA.head(3)
 | Property | Detail |
 |---|---|
 | **Purpose** | Initialize empty containers that each independent model cell will append its results to |
-| **Containers** | `tournament_results` (metrics list), `tournament_predictions` (y_pred dict), `tournament_probabilities` (y_prob dict) |
+| **Containers** | `tournament_results` (metrics list), `tournament_predictions` (y_pred dict), `tournament_probabilities` (y_prob dict), `tournament_labels` (y_test dict — checked for a shared split at evaluation time) |
 | **Design** | Acts as a shared scoreboard only — no preprocessing or data is shared between models |
 """
 
@@ -503,18 +271,91 @@ MASTER_DATA.head(3)
 tournament_results       = []   # List of dicts: Model, Accuracy, ROC-AUC, Train Time
 tournament_predictions   = {}   # model_name → y_pred array
 tournament_probabilities = {}   # model_name → y_prob array
-tournament_y_test        = None # Will be set by first model (identical across all)
+tournament_labels        = {}   # model_name → y_test (verified identical by the evaluation engine)
 
 print("✅ Tournament scoreboard initialized — ready for independent model cells.")
 
+"""### 🧮 Streaming Median Imputer — Sketch vs. SimpleImputer
+
+| Property | Detail |
+|---|---|
+| **Purpose** | Check that `impute.StreamingMedianImputer` — the median imputer in every contestant pipeline — is faster than `SimpleImputer(strategy='median')` at scale and imputes (nearly) the same values |
+| **Method** | One mergeable KLL quantile sketch per column (`sketch.ColumnSketch`, capacity `SKETCH_K`); NaNs are skipped, so mostly-empty outer-join columns cost only their observed values |
+| **Workload** | `MASTER_DATA` features tiled to `IMPUTER_BENCH_ROWS` rows; fit and transform timed for both imputers |
+| **Accuracy** | `compare_exact` — worst distance of a sketch median's rank / n from 0.5 in the exact column; columns with ≤ `SKETCH_K` observed values are imputed exactly |
+| **Streaming** | The tiled matrix is also fitted as `IMPUTER_BENCH_CHUNKS` chunks on two "workers" (`partial_fit`) and combined with `merge` |
+| **Output** | `imputer_bench_df` — fit / transform seconds and max rank error per variant |
+| **Gate** | Runs only with `RUN_BENCHMARKS = True` |
+"""
+
+# ══════════════════════════════════════════════════════════════
+#  STREAMING MEDIAN IMPUTER — Sketch vs. SimpleImputer
+# ══════════════════════════════════════════════════════════════
+
+from sklearn.impute import SimpleImputer
+from myo_ai.impute import StreamingMedianImputer
+
+IMPUTER_BENCH_ROWS   = 2_000_000
+IMPUTER_BENCH_CHUNKS = 8
+
+
+def _time_imputer(imputer):
+    """(fit seconds, transform seconds, imputed matrix) for *imputer* on bench_X."""
+    t0 = time.perf_counter()
+    imputer.fit(bench_X)
+    fit_s = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    out = imputer.transform(bench_X)
+    return fit_s, time.perf_counter() - t0, out
+
+
+if RUN_BENCHMARKS:
+    bench_X, _ = train.select_features(MASTER_DATA)
+    bench_X = bench_X.to_numpy(dtype=np.float64, na_value=np.nan)
+    bench_X = np.resize(bench_X, (max(IMPUTER_BENCH_ROWS, len(bench_X)), bench_X.shape[1]))
+    print(f"📐 Imputer workload: {bench_X.shape[0]:,} rows × {bench_X.shape[1]} features "
+          f"({np.isnan(bench_X).mean():.1%} missing)")
+
+    imputer_rows = []
+    simple_fit, simple_tf, simple_out = _time_imputer(SimpleImputer(strategy='median'))
+    imputer_rows.append({'Imputer': "SimpleImputer(strategy='median')", 'Fit (s)': simple_fit,
+                         'Transform (s)': simple_tf, 'Max Rank Error': 0.0})
+    del simple_out
+
+    sketch_imputer = StreamingMedianImputer()
+    sketch_fit, sketch_tf, _ = _time_imputer(sketch_imputer)
+    imputer_rows.append({'Imputer': 'StreamingMedianImputer', 'Fit (s)': sketch_fit,
+                         'Transform (s)': sketch_tf,
+                         'Max Rank Error': sketch_imputer.compare_exact(bench_X)['Rank Error'].max()})
+
+    # Two workers, each streaming half of the chunks, merged at the end
+    t0 = time.perf_counter()
+    workers = [StreamingMedianImputer(seed=s) for s in (1, 2)]
+    for i, chunk in enumerate(np.array_split(bench_X, IMPUTER_BENCH_CHUNKS)):
+        workers[i % 2].partial_fit(chunk)
+    merged_imputer = workers[0].merge(workers[1])
+    merge_fit = time.perf_counter() - t0
+    imputer_rows.append({'Imputer': f'StreamingMedianImputer ({IMPUTER_BENCH_CHUNKS} chunks, merged)',
+                         'Fit (s)': merge_fit, 'Transform (s)': np.nan,
+                         'Max Rank Error': merged_imputer.compare_exact(bench_X)['Rank Error'].max()})
+
+    imputer_bench_df = pd.DataFrame(imputer_rows)
+    print(imputer_bench_df.round(5).to_string(index=False))
+    print(f"   ↳ Fit speed-up: {simple_fit / sketch_fit:.1f}× · transform speed-up: {simple_tf / sketch_tf:.1f}×")
+    del bench_X
+    print("✅ Streaming Median Imputer Benchmark Complete.")
+else:
+    print("⏭️  Streaming Median Imputer Benchmark skipped (RUN_BENCHMARKS = False).")
+
 """### 🛡️ Aegis Protocol — Independent Random Forest (1/5)
 
 | Property | Detail |
 |---|---|
 | **Purpose** | Establish a robust baseline for cardiovascular risk prediction using an ensemble of decision trees |
 | **Input Data** | `MASTER_DATA` (Numeric subsets), filtered to remove ID/leakage columns (`aegis_X`, `aegis_y`) |
-| **Pipeline Architecture** | `SimpleImputer` (Strategy: Median) → `RandomForestClassifier` |
+| **Pipeline Architecture** | `StreamingMedianImputer` (Median) → `RandomForestClassifier` |
 | **Hyperparameters** | `n_estimators=100`, `max_depth=12`, `n_jobs=-1` (Parallel processing) |
+| **Lean Mode** | `AEGIS_LEAN=True` → float32 input and `max_samples=0.5` bootstrap subsampling (`train.AEGIS_LEAN_PARAMS`) |
 | **Split Strategy** | Independent Stratified 80/20 Split (`test_size=0.2`, `random_state=42`) |
 | **Output** | Accuracy & ROC-AUC metrics appended to `tournament_results` dictionary |
 | **Independence** | Uses its own isolated `train_test_split` to prevent data leakage from other models |
@@ -525,36 +366,20 @@ print("✅ Tournament scoreboard initialized — ready for independent model cel
 # ══════════════════════════════════════════════════════════════
 
 # ── 1. Independent Feature Selection ───────────────────────────
-aegis_X_raw = MASTER_DATA.select_dtypes(include=[np.number])
-aegis_cols_drop = ['target', 'id', 'unnamed: 0', 'patient_id']
-aegis_X = aegis_X_raw.drop(columns=[c for c in aegis_cols_drop if c in aegis_X_raw.columns])
-aegis_y = MASTER_DATA['target'].fillna(0).astype(int)
+aegis_X, aegis_y = train.select_features(MASTER_DATA)
 
 # ── 2. Independent Stratified Split ───────────────────────────
-aegis_X_train, aegis_X_test, aegis_y_train, aegis_y_test = train_test_split(
-    aegis_X, aegis_y, test_size=0.2, random_state=42, stratify=aegis_y,
-)
+aegis_X_train, aegis_X_test, aegis_y_train, aegis_y_test = train.stratified_split(aegis_X, aegis_y)
 
 # ── 3. Independent Pipeline (Imputer → RF) ───────────────────
-aegis_pipeline = Pipeline([
-    ('imputer', SimpleImputer(strategy='median')),
-    ('clf',     RandomForestClassifier(
-                    n_estimators=100,
-                    max_depth=12,
-                    random_state=42,
-                    n_jobs=-1)),
-])
-
-# ── 4. Train ─────────────────────────────────────────────────
-t0 = time.time()
-aegis_pipeline.fit(aegis_X_train, aegis_y_train)
-aegis_elapsed = time.time() - t0
+AEGIS_LEAN     = False                                  # True → float32 + max_samples bootstrap
+aegis_pipeline = train.build_aegis_pipeline(lean=AEGIS_LEAN)
 
-# ── 5. Evaluate ──────────────────────────────────────────────
-aegis_y_pred = aegis_pipeline.predict(aegis_X_test)
-aegis_y_prob = aegis_pipeline.predict_proba(aegis_X_test)[:, 1]
-aegis_acc = accuracy_score(aegis_y_test, aegis_y_pred)
-aegis_auc = roc_auc_score(aegis_y_test, aegis_y_prob)
+# ── 4-5. Train & Evaluate ────────────────────────────────────
+aegis_score = train.fit_and_score(aegis_pipeline, aegis_X_train, aegis_y_train,
+                                  aegis_X_test, aegis_y_test, name='Aegis Protocol (RF)')
+aegis_y_pred, aegis_y_prob = aegis_score['y_pred'], aegis_score['y_prob']
+aegis_acc, aegis_auc, aegis_elapsed = aegis_score['accuracy'], aegis_score['roc_auc'], aegis_score['elapsed']
 
 # ── 6. Store in Tournament ───────────────────────────────────
 tournament_results.append({
@@ -565,22 +390,166 @@ tournament_results.append({
 })
 tournament_predictions['Aegis Protocol\n(Random Forest)'] = aegis_y_pred
 tournament_probabilities['Aegis Protocol (RF)'] = aegis_y_prob
-tournament_y_test = aegis_y_test
+tournament_labels['Aegis Protocol (RF)'] = aegis_y_test
 
 print(f"  ✓ Aegis Protocol (RF)            Acc={aegis_acc:.4f}  AUC={aegis_auc:.4f}  ({aegis_elapsed:.1f}s)")
 print(f"    Dataset: {aegis_X.shape[0]:,} patients × {aegis_X.shape[1]} features")
 print(f"    Train: {len(aegis_X_train):,}  Test: {len(aegis_X_test):,}")
 print("✅ Aegis Protocol — Independent pipeline complete (1/5)")
 
+"""### 🪶 Aegis Lean Benchmark — Memory-Lean Forest & Compact Inference
+
+| Property | Detail |
+|---|---|
+| **Purpose** | Measure what the lean Aegis mode and the compact forest export save in model size, fit time and predict latency |
+| **Standard** | Float64 input, full-size bootstrap samples, fitted sklearn forest pickled as-is — a second full forest fit, so only with `RUN_BENCHMARKS = True` |
+| **Lean** | `train.build_aegis_pipeline(lean=True)` — float32 input, `max_samples=0.5` |
+| **Aegis Lite** | `aegis_lite.export_aegis` flattens the lean forest to pre-order `feature` / `value` / `right` arrays (~10 bytes per node) in `aegis_lite.npz`; `AEGIS_PRUNE_TOL` collapses subtrees whose leaf probabilities span at most that much |
+| **Latency** | Batch = whole test split; single row = mean over `AEGIS_LATENCY_ROWS` one-row calls (the simulator's access pattern) |
+| **Output** | `aegis_lean_df` — size (MB), fit time, batch / single-row latency and test ROC-AUC per variant; largest probability gap between the lossless export and the sklearn forest |
+"""
+
+# ══════════════════════════════════════════════════════════════
+#  AEGIS LEAN BENCHMARK — Size, Fit Time & Latency
+# ══════════════════════════════════════════════════════════════
+
+import pickle
+from sklearn.metrics import roc_auc_score
+from myo_ai import aegis_lite
+
+AEGIS_PRUNE_TOL    = 0.01
+AEGIS_LATENCY_ROWS = 50
+AEGIS_LITE_PATH    = 'aegis_lite.npz'
+
+
+def _latency(model, X):
+    """(batch seconds, mean single-row milliseconds) for *model*.predict_proba."""
+    t0 = time.perf_counter()
+    model.predict_proba(X)
+    batch_s = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    for i in range(AEGIS_LATENCY_ROWS):
+        model.predict_proba(X.iloc[[i]])
+    return batch_s, (time.perf_counter() - t0) / AEGIS_LATENCY_ROWS * 1e3
+
+
+lean_rows = []
+for lean in ((False, True) if RUN_BENCHMARKS else (True,)):     # the lean forest is exported below
+    pipe = train.build_aegis_pipeline(lean=lean)
+    score = train.fit_and_score(pipe, aegis_X_train, aegis_y_train, aegis_X_test, aegis_y_test,
+                                name=f"Aegis benchmark ({'lean' if lean else 'standard'})")
+    batch_s, single_ms = _latency(pipe, aegis_X_test)
+    lean_rows.append({
+        'Variant': 'Lean RF (float32)' if lean else 'Standard RF (float64)',
+        'Size (MB)': len(pickle.dumps(pipe)) / 1e6,
+        'Fit (s)': score['elapsed'],
+        'Batch (s)': batch_s,
+        'Single Row (ms)': single_ms,
+        'ROC-AUC': score['roc_auc'],
+    })
+aegis_lean_pipeline = pipe
+
+# Compact exports of the lean forest: lossless, then pruned
+for tol in (0.0, AEGIS_PRUNE_TOL):
+    t0 = time.perf_counter()
+    aegis_lite.export_aegis(aegis_lean_pipeline.named_steps['clf'], AEGIS_LITE_PATH,
+                            imputer=aegis_lean_pipeline.named_steps['imputer'],
+                            feature_names=aegis_X.columns, prune_tol=tol)
+    export_s = time.perf_counter() - t0
+    aegis_lite_model = aegis_lite.AegisLite(AEGIS_LITE_PATH)
+    batch_s, single_ms = _latency(aegis_lite_model, aegis_X_test)
+    lite_prob = aegis_lite_model.predict_proba(aegis_X_test)[:, 1]
+    if tol == 0.0:
+        aegis_parity = np.max(np.abs(lite_prob - aegis_lean_pipeline.predict_proba(aegis_X_test)[:, 1]))
+    lean_rows.append({
+        'Variant': f'Aegis Lite (prune_tol={tol:g}, {aegis_lite_model.n_nodes:,} nodes)',
+        'Size (MB)': os.path.getsize(AEGIS_LITE_PATH) / 1e6,
+        'Fit (s)': export_s,
+        'Batch (s)': batch_s,
+        'Single Row (ms)': single_ms,
+        'ROC-AUC': roc_auc_score(aegis_y_test, lite_prob),
+    })
+
+aegis_lean_df = pd.DataFrame(lean_rows)
+print(aegis_lean_df.round(4).to_string(index=False))
+print("   (Aegis Lite 'Fit' column = export time on top of the lean fit)")
+print(f"   Lossless export parity: max |Δp| vs sklearn = {aegis_parity:.1e}")
+print(f"✅ Aegis Lean Benchmark Complete — exported {AEGIS_LITE_PATH}")
+
+"""### 🎛️ Myo-Core Tuning — Successive Halving
+
+| Property | Detail |
+|---|---|
+| **Purpose** | Search HistGradientBoosting hyperparameters per site without paying for a full grid of 300-iteration fits |
+| **Method** | Successive halving: `MYOCORE_TUNE_CANDIDATES` random configurations race on growing budgets — each rung multiplies training rows **and** `max_iter` by `eta`, keeping the best 1/`eta` |
+| **Search Space** | `learning_rate`, `max_depth`, `max_leaf_nodes`, `min_samples_leaf`, `l2_regularization` (`tuning.MYOCORE_SEARCH_SPACE`) |
+| **Efficiency** | Median-imputed CV folds are built once — optionally pre-binned to uint8 codes (`MYOCORE_TUNE_PREBIN`) — and cached in `MYOCORE_FOLD_CACHE`; every (candidate × fold) fit of a rung runs on a process pool |
+| **Leakage Guard** | Tuning only sees the Myo-Core **train** split — the test split is untouched until the tournament cell |
+| **Output** | Winning config written to `MYOCORE_TUNED_PATH` and loaded as `MYOCORE_PARAMS` by the Myo-Core cell; if no candidate beats the hand-picked config, an older saved config is removed so the hand-picked one is used; `myocore_tuning_df` reports best CV AUC against wall-clock per rung |
+| **Gate** | `MYOCORE_TUNE = False` by default (27 candidates × 3 folds); otherwise the saved config, if any, is reused |
+"""
+
+# ══════════════════════════════════════════════════════════════
+#  MYO-CORE TUNING — Successive Halving over Rows × Iterations
+# ══════════════════════════════════════════════════════════════
+
+from myo_ai import tuning
+
+MYOCORE_TUNE            = False                         # True re-tunes; False → reuse the saved config
+MYOCORE_TUNE_CANDIDATES = 27
+MYOCORE_TUNE_ETA        = 3
+MYOCORE_TUNED_PATH      = tuning.MYOCORE_TUNED_PATH     # one file per site
+MYOCORE_FOLD_CACHE      = os.path.join('cache', 'myocore_folds')
+MYOCORE_TUNE_PREBIN     = True                          # cache folds as uint8 bin codes
+
+if MYOCORE_TUNE:
+    tune_X, tune_y = train.select_features(MASTER_DATA)
+    tune_X_train, _, tune_y_train, _ = train.stratified_split(tune_X, tune_y)
+
+    # ── 1. Preprocess folds once (cached on disk) ──────────────
+    tune_folds = tuning.make_folds(tune_X_train, tune_y_train, cache_dir=MYOCORE_FOLD_CACHE,
+                                   prebin=MYOCORE_TUNE_PREBIN)
+
+    # ── 2. Baseline: hand-picked config at the full budget ─────
+    t0 = time.perf_counter()
+    tune_baseline_auc = tuning.evaluate_config(train.MYOCORE_PARAMS, tune_folds)
+    tune_baseline_s = time.perf_counter() - t0
+
+    # ── 3. Successive halving ──────────────────────────────────
+    tune_result = tuning.successive_halving(
+        tune_folds,
+        n_candidates=MYOCORE_TUNE_CANDIDATES,
+        eta=MYOCORE_TUNE_ETA,
+        max_iter=train.MYOCORE_PARAMS['max_iter'],
+    )
+    myocore_tuning_df = tune_result['history']
+    print(myocore_tuning_df.to_string(index=False))
+    print(f"\n  Baseline config : CV AUC={tune_baseline_auc:.4f}  ({tune_baseline_s:.1f}s for one config)")
+    print(f"  Tuned config    : CV AUC={tune_result['best_auc']:.4f}  "
+          f"({tune_result['elapsed']:.1f}s for {MYOCORE_TUNE_CANDIDATES} candidates)")
+
+    # ── 4. Write the winner back for the tournament ────────────
+    if tune_result['best_auc'] > tune_baseline_auc:
+        tuning.save_tuned_params(tune_result['best_params'], MYOCORE_TUNED_PATH)
+        print(f"   ↳ Saved winning config to {MYOCORE_TUNED_PATH}")
+    else:
+        if os.path.exists(MYOCORE_TUNED_PATH):       # an earlier run's winner, maybe other data
+            os.remove(MYOCORE_TUNED_PATH)
+        print("   ↳ Hand-picked config kept (no tuned candidate beat it)")
+
+MYOCORE_PARAMS = tuning.load_tuned_params(MYOCORE_TUNED_PATH)
+print(f"✅ Myo-Core Tuning Complete — MYOCORE_PARAMS: {MYOCORE_PARAMS}")
+
 """### ⚡ Myo-Core Engine — HistGradientBoosting (2/5)
 
 | Property | Detail |
 |---|---|
 | **Purpose** | High-performance gradient boosting optimized for speed and accuracy on large datasets |
-| **Pipeline Architecture** | `SimpleImputer` (Median) → `StandardScaler` → `HistGradientBoostingClassifier` |
-| **Key Hyperparameters** | `learning_rate=0.05`, `max_iter=300`, `max_depth=12`, `l2_regularization=1.5` |
+| **Pipeline Architecture** | `StreamingMedianImputer` (Median) → `StandardScaler` → `HistGradientBoostingClassifier` |
+| **Training Profile** | `MYOCORE_PROFILE='standard'` (above) or `'fast'` — no scaler (a no-op for trees) and validation-based early stopping (`n_iter_no_change=10`) |
+| **Key Hyperparameters** | `MYOCORE_PARAMS` from the tuning cell; hand-picked default `learning_rate=0.05`, `max_iter=300`, `max_depth=12`, `l2_regularization=1.5` |
 | **Output** | The "Champion" model candidate; typically achieves highest ROC-AUC |
-| **Special Role** | This model's pipeline components (`imputer`, `scaler`) are **exported** to be used as the pre-processor for the Deep Learning (Pulse-Sync) and SHAP (Oracle) layers |
+| **Special Role** | This model's pipeline components (`imputer`, `scaler`) are **exported** to be used as the pre-processor for the Deep Learning (Pulse-Sync) and SHAP (Oracle) layers; the `fast` profile fits a stand-alone scaler for Zenith's PCA |
 | **Independence** | Uses its own isolated `train_test_split` to ensure zero data leakage |
 """
 
@@ -588,40 +557,26 @@ print("✅ Aegis Protocol — Independent pipeline complete (1/5)")
 #  MYO-CORE ENGINE — Independent HistGradientBoosting Pipeline (2/5)
 # ══════════════════════════════════════════════════════════════
 
+from sklearn.preprocessing import StandardScaler
+
 # ── 1. Independent Feature Selection ───────────────────────────
-myocore_X_raw = MASTER_DATA.select_dtypes(include=[np.number])
-myocore_cols_drop = ['target', 'id', 'unnamed: 0', 'patient_id']
-myocore_X = myocore_X_raw.drop(columns=[c for c in myocore_cols_drop if c in myocore_X_raw.columns])
-myocore_y = MASTER_DATA['target'].fillna(0).astype(int)
+myocore_X, myocore_y = train.select_features(MASTER_DATA)
 myocore_feature_names = myocore_X.columns.tolist()
 
 # ── 2. Independent Stratified Split ───────────────────────────
-myocore_X_train_raw, myocore_X_test_raw, myocore_y_train, myocore_y_test = train_test_split(
-    myocore_X, myocore_y, test_size=0.2, random_state=42, stratify=myocore_y,
+myocore_X_train_raw, myocore_X_test_raw, myocore_y_train, myocore_y_test = train.stratified_split(
+    myocore_X, myocore_y,
 )
 
 # ── 3. Independent Pipeline (Imputer → Scaler → HGBC) ────────
-myocore_pipeline = Pipeline([
-    ('imputer', SimpleImputer(strategy='median')),
-    ('scaler',  StandardScaler()),
-    ('clf',     HistGradientBoostingClassifier(
-                    max_iter=300,
-                    learning_rate=0.05,
-                    max_depth=12,
-                    l2_regularization=1.5,
-                    random_state=42)),
-])
-
-# ── 4. Train ─────────────────────────────────────────────────
-t0 = time.time()
-myocore_pipeline.fit(myocore_X_train_raw, myocore_y_train)
-myocore_elapsed = time.time() - t0
+MYOCORE_PROFILE  = 'standard'                           # 'fast' → no scaler + early stopping
+myocore_pipeline = train.build_myocore_pipeline(MYOCORE_PARAMS, profile=MYOCORE_PROFILE)
 
-# ── 5. Evaluate ──────────────────────────────────────────────
-myocore_y_pred = myocore_pipeline.predict(myocore_X_test_raw)
-myocore_y_prob = myocore_pipeline.predict_proba(myocore_X_test_raw)[:, 1]
-myocore_acc = accuracy_score(myocore_y_test, myocore_y_pred)
-myocore_auc = roc_auc_score(myocore_y_test, myocore_y_prob)
+# ── 4-5. Train & Evaluate ────────────────────────────────────
+myocore_score = train.fit_and_score(myocore_pipeline, myocore_X_train_raw, myocore_y_train,
+                                    myocore_X_test_raw, myocore_y_test, name='Myo-Core Engine (HGBC)')
+myocore_y_pred, myocore_y_prob = myocore_score['y_pred'], myocore_score['y_prob']
+myocore_acc, myocore_auc, myocore_elapsed = myocore_score['accuracy'], myocore_score['roc_auc'], myocore_score['elapsed']
 
 # ── 6. Store in Tournament ───────────────────────────────────
 tournament_results.append({
@@ -632,26 +587,79 @@ tournament_results.append({
 })
 tournament_predictions['Myo-Core Engine\n(HGBC)'] = myocore_y_pred
 tournament_probabilities['Myo-Core Engine (HGBC)'] = myocore_y_prob
+tournament_labels['Myo-Core Engine (HGBC)'] = myocore_y_test
 
 # ── 7. Export for Layer 3 (Zenith, Oracle, Myo-Sim) ──────────
 myocore_imputer = myocore_pipeline.named_steps['imputer']
-myocore_scaler  = myocore_pipeline.named_steps['scaler']
 myocore_model   = myocore_pipeline.named_steps['clf']
-myocore_X_train = myocore_pipeline[:-1].transform(myocore_X_train_raw)
+myocore_X_train = myocore_pipeline[:-1].transform(myocore_X_train_raw)   # model inputs (Oracle)
 myocore_X_test  = myocore_pipeline[:-1].transform(myocore_X_test_raw)
 
+# Zenith's PCA needs standardized features even when the model skips scaling
+if 'scaler' in myocore_pipeline.named_steps:
+    myocore_scaler = myocore_pipeline.named_steps['scaler']
+    myocore_X_test_scaled = myocore_X_test
+else:
+    myocore_scaler = StandardScaler().fit(myocore_X_train)
+    myocore_X_test_scaled = myocore_scaler.transform(myocore_X_test)
+
 print(f"  ✓ Myo-Core Engine (HGBC)         Acc={myocore_acc:.4f}  AUC={myocore_auc:.4f}  ({myocore_elapsed:.1f}s)")
+print(f"    Profile: {MYOCORE_PROFILE}  Boosting iterations: {myocore_model.n_iter_}")
 print(f"    Dataset: {myocore_X.shape[0]:,} patients × {myocore_X.shape[1]} features")
 print(f"    Train: {len(myocore_X_train_raw):,}  Test: {len(myocore_X_test_raw):,}")
 print("✅ Myo-Core Engine — Independent pipeline complete (2/5)")
 print("   ↳ Exported: myocore_imputer, myocore_scaler, myocore_model for Layer 3")
 
+"""### ⏱️ Myo-Core Profile Benchmark — Standard vs. Fast
+
+| Property | Detail |
+|---|---|
+| **Purpose** | Compare today's Myo-Core training profile with the `fast` profile on the same split and hyperparameters |
+| **Standard** | `StreamingMedianImputer` → `StandardScaler` → HGBC, `early_stopping='auto'` |
+| **Fast** | `StreamingMedianImputer` → HGBC with `early_stopping=True`, `validation_fraction=0.1`, `n_iter_no_change=10` |
+| **Pre-binning** | Size and build time of the cached tuning folds as float64 vs. uint8 bin codes (`tuning.make_folds(prebin=True)`) |
+| **Output** | `myocore_profile_df` — train time, boosting iterations used and test ROC-AUC per profile |
+| **Gate** | Runs only with `RUN_BENCHMARKS = True` |
+"""
+
+# ══════════════════════════════════════════════════════════════
+#  MYO-CORE PROFILE BENCHMARK — Standard vs. Fast
+# ══════════════════════════════════════════════════════════════
+
+if RUN_BENCHMARKS:
+    profile_rows = []
+    for profile in train.MYOCORE_PROFILES:
+        pipe = train.build_myocore_pipeline(MYOCORE_PARAMS, profile=profile)
+        score = train.fit_and_score(pipe, myocore_X_train_raw, myocore_y_train,
+                                    myocore_X_test_raw, myocore_y_test,
+                                    name=f'Myo-Core benchmark ({profile})')
+        profile_rows.append({
+            'Profile': profile,
+            'Steps': ' → '.join(pipe.named_steps),
+            'Iterations': pipe.named_steps['clf'].n_iter_,
+            'Train Time (s)': round(score['elapsed'], 2),
+            'ROC-AUC': round(score['roc_auc'], 4),
+        })
+    myocore_profile_df = pd.DataFrame(profile_rows)
+    print(myocore_profile_df.to_string(index=False))
+
+    # Cached tuning folds: raw float64 vs. pre-binned uint8
+    for prebin in (False, True):
+        t0 = time.perf_counter()
+        folds = tuning.make_folds(myocore_X_train_raw, myocore_y_train, prebin=prebin)
+        size_mb = sum(a.nbytes for fold in folds for a in (fold[0], fold[2])) / 1e6
+        print(f"  Folds prebin={str(prebin):<5}  {folds[0][0].dtype}  {size_mb:7.1f} MB  "
+              f"built in {time.perf_counter() - t0:.2f}s")
+    print("✅ Myo-Core Profile Benchmark Complete.")
+else:
+    print("⏭️  Myo-Core Profile Benchmark skipped (RUN_BENCHMARKS = False).")
+
 """### 👁️ Sentinel Node — Naive Bayes (3/5)
 
 | Property | Detail |
 |---|---|
 | **Purpose** | A fast, probabilistic baseline that assumes feature independence (Gaussian Naive Bayes) |
-| **Pipeline Architecture** | `SimpleImputer` (Median) → `MinMaxScaler` → `GaussianNB` |
+| **Pipeline Architecture** | `StreamingMedianImputer` (Median) → `MinMaxScaler` → `GaussianNB` |
 | **Scaling Strategy** | Uses `MinMaxScaler` (0-1 range) instead of Standard scaling, accommodating the probabilistic nature of the model |
 | **Role** | Acts as a "sanity check" — if complex models (like RF or HGBC) can't beat this simple probabilistic approach, they are likely overfitting |
 | **Independence** | Maintains strict isolation with its own `train_test_split` to prevent data leakage |
@@ -662,33 +670,21 @@ print("   ↳ Exported: myocore_imputer, myocore_scaler, myocore_model for Layer
 # ══════════════════════════════════════════════════════════════
 
 # ── 1. Independent Feature Selection ───────────────────────────
-sentinel_X_raw = MASTER_DATA.select_dtypes(include=[np.number])
-sentinel_cols_drop = ['target', 'id', 'unnamed: 0', 'patient_id']
-sentinel_X = sentinel_X_raw.drop(columns=[c for c in sentinel_cols_drop if c in sentinel_X_raw.columns])
-sentinel_y = MASTER_DATA['target'].fillna(0).astype(int)
+sentinel_X, sentinel_y = train.select_features(MASTER_DATA)
 
 # ── 2. Independent Stratified Split ───────────────────────────
-sentinel_X_train, sentinel_X_test, sentinel_y_train, sentinel_y_test = train_test_split(
-    sentinel_X, sentinel_y, test_size=0.2, random_state=42, stratify=sentinel_y,
+sentinel_X_train, sentinel_X_test, sentinel_y_train, sentinel_y_test = train.stratified_split(
+    sentinel_X, sentinel_y,
 )
 
 # ── 3. Independent Pipeline (Imputer → MinMaxScaler → NB) ────
-sentinel_pipeline = Pipeline([
-    ('imputer', SimpleImputer(strategy='median')),
-    ('scaler',  MinMaxScaler()),
-    ('clf',     GaussianNB()),
-])
+sentinel_pipeline = train.build_sentinel_pipeline()
 
-# ── 4. Train ─────────────────────────────────────────────────
-t0 = time.time()
-sentinel_pipeline.fit(sentinel_X_train, sentinel_y_train)
-sentinel_elapsed = time.time() - t0
-
-# ── 5. Evaluate ──────────────────────────────────────────────
-sentinel_y_pred = sentinel_pipeline.predict(sentinel_X_test)
-sentinel_y_prob = sentinel_pipeline.predict_proba(sentinel_X_test)[:, 1]
-sentinel_acc = accuracy_score(sentinel_y_test, sentinel_y_pred)
-sentinel_auc = roc_auc_score(sentinel_y_test, sentinel_y_prob)
+# ── 4-5. Train & Evaluate ────────────────────────────────────
+sentinel_score = train.fit_and_score(sentinel_pipeline, sentinel_X_train, sentinel_y_train,
+                                     sentinel_X_test, sentinel_y_test, name='Sentinel Node (NB)')
+sentinel_y_pred, sentinel_y_prob = sentinel_score['y_pred'], sentinel_score['y_prob']
+sentinel_acc, sentinel_auc, sentinel_elapsed = sentinel_score['accuracy'], sentinel_score['roc_auc'], sentinel_score['elapsed']
 
 # ── 6. Store in Tournament ───────────────────────────────────
 tournament_results.append({
@@ -699,6 +695,7 @@ tournament_results.append({
 })
 tournament_predictions['Sentinel Node\n(Naive Bayes)'] = sentinel_y_pred
 tournament_probabilities['Sentinel Node (NB)'] = sentinel_y_prob
+tournament_labels['Sentinel Node (NB)'] = sentinel_y_test
 
 print(f"  ✓ Sentinel Node (NB)             Acc={sentinel_acc:.4f}  AUC={sentinel_auc:.4f}  ({sentinel_elapsed:.1f}s)")
 print(f"    Dataset: {sentinel_X.shape[0]:,} patients × {sentinel_X.shape[1]} features")
@@ -710,7 +707,7 @@ print("✅ Sentinel Node — Independent pipeline complete (3/5)")
 | Property | Detail |
 |---|---|
 | **Purpose** | Establishing a linear decision boundary to test for simple linear relationships in the data |
-| **Pipeline Architecture** | `SimpleImputer` (Median) → `StandardScaler` → `LogisticRegression` |
+| **Pipeline Architecture** | `StreamingMedianImputer` (Median) → `StandardScaler` → `LogisticRegression` |
 | **Key Hyperparameters** | `max_iter=1000` (extended convergence time for stability), `random_state=42` |
 | **Interpretability** | Highly interpretable via coefficients (odds ratios), serving as a transparent benchmark for the "Black Box" models |
 | **Independence** | Maintains complete isolation with its own `train_test_split` and feature selection step |
@@ -721,33 +718,21 @@ print("✅ Sentinel Node — Independent pipeline complete (3/5)")
 # ══════════════════════════════════════════════════════════════
 
 # ── 1. Independent Feature Selection ───────────────────────────
-vanguard_X_raw = MASTER_DATA.select_dtypes(include=[np.number])
-vanguard_cols_drop = ['target', 'id', 'unnamed: 0', 'patient_id']
-vanguard_X = vanguard_X_raw.drop(columns=[c for c in vanguard_cols_drop if c in vanguard_X_raw.columns])
-vanguard_y = MASTER_DATA['target'].fillna(0).astype(int)
+vanguard_X, vanguard_y = train.select_features(MASTER_DATA)
 
 # ── 2. Independent Stratified Split ───────────────────────────
-vanguard_X_train, vanguard_X_test, vanguard_y_train, vanguard_y_test = train_test_split(
-    vanguard_X, vanguard_y, test_size=0.2, random_state=42, stratify=vanguard_y,
+vanguard_X_train, vanguard_X_test, vanguard_y_train, vanguard_y_test = train.stratified_split(
+    vanguard_X, vanguard_y,
 )
 
 # ── 3. Independent Pipeline (Imputer → Scaler → LogReg) ──────
-vanguard_pipeline = Pipeline([
-    ('imputer', SimpleImputer(strategy='median')),
-    ('scaler',  StandardScaler()),
-    ('clf',     LogisticRegression(max_iter=1000, random_state=42)),
-])
-
-# ── 4. Train ─────────────────────────────────────────────────
-t0 = time.time()
-vanguard_pipeline.fit(vanguard_X_train, vanguard_y_train)
-vanguard_elapsed = time.time() - t0
+vanguard_pipeline = train.build_vanguard_pipeline()
 
-# ── 5. Evaluate ──────────────────────────────────────────────
-vanguard_y_pred = vanguard_pipeline.predict(vanguard_X_test)
-vanguard_y_prob = vanguard_pipeline.predict_proba(vanguard_X_test)[:, 1]
-vanguard_acc = accuracy_score(vanguard_y_test, vanguard_y_pred)
-vanguard_auc = roc_auc_score(vanguard_y_test, vanguard_y_prob)
+# ── 4-5. Train & Evaluate ────────────────────────────────────
+vanguard_score = train.fit_and_score(vanguard_pipeline, vanguard_X_train, vanguard_y_train,
+                                     vanguard_X_test, vanguard_y_test, name='Vanguard System (LogReg)')
+vanguard_y_pred, vanguard_y_prob = vanguard_score['y_pred'], vanguard_score['y_prob']
+vanguard_acc, vanguard_auc, vanguard_elapsed = vanguard_score['accuracy'], vanguard_score['roc_auc'], vanguard_score['elapsed']
 
 # ── 6. Store in Tournament ───────────────────────────────────
 tournament_results.append({
@@ -758,6 +743,7 @@ tournament_results.append({
 })
 tournament_predictions['Vanguard System\n(Logistic Regression)'] = vanguard_y_pred
 tournament_probabilities['Vanguard System (LogReg)'] = vanguard_y_prob
+tournament_labels['Vanguard System (LogReg)'] = vanguard_y_test
 
 print(f"  ✓ Vanguard System (LogReg)       Acc={vanguard_acc:.4f}  AUC={vanguard_auc:.4f}  ({vanguard_elapsed:.1f}s)")
 print(f"    Dataset: {vanguard_X.shape[0]:,} patients × {vanguard_X.shape[1]} features")
@@ -766,98 +752,18 @@ print("✅ Vanguard System — Independent pipeline complete (4/5)")
 
 """### 💓 Pulse-Sync Architecture — Deep Learning CNN (5/5)
 
-| Property | Detail |
-|---|---|
-| **Purpose** | Capturing non-linear, complex patterns using a 1D Convolutional Neural Network (Deep Learning) |
-| **Input Strategy** | **Coupled Preprocessing:** Reuses the fitted `SimpleImputer` and `StandardScaler` from the Myo-Core pipeline to ensure consistent data scaling |
-| **Data Reshaping** | Transforms 2D tabular data into a 3D Tensor `(Samples, Features, 1)` to simulate a "signal" for the Conv1D layers |
-| **Architecture** |  `Conv1D(64)` → `Conv1D(32)` → `Flatten` → `Dense(64)` → `Dropout(0.3)` → `Output(Sigmoid)` |
-| **Training** | 10 Epochs, Batch Size 64, `Adam` Optimizer, `Binary Crossentropy` Loss |
-| **Role** | The "Wildcard" entry — uses Deep Learning to find feature interactions that traditional tree-based models might miss |
-"""
-
-# ══════════════════════════════════════════════════════════════
-#  PULSE-SYNC ARCHITECTURE — Deep Learning CNN (Contestant 5)
-# ══════════════════════════════════════════════════════════════
-
-import warnings
-warnings.filterwarnings('ignore', category=DeprecationWarning)
-
-import tensorflow as tf
-from tensorflow import keras
-from tensorflow.keras import layers
-
-# ── Preprocess using the same imputer/scaler from Myo-Core ─────
-X_train_nn = myocore_pipeline[:-1].transform(X_train_raw)
-X_test_nn  = myocore_pipeline[:-1].transform(X_test_raw)
-
-# ── Reshape to 3-D for Conv1D: (samples, features, 1) ─────────
-n_features = X_train_nn.shape[1]
-X_train_3d = X_train_nn.reshape(-1, n_features, 1)
-X_test_3d  = X_test_nn.reshape(-1, n_features, 1)
-
-# ── Build Pulse-Sync CNN ───────────────────────────────────────
-pulse_sync = keras.Sequential([
-    layers.Conv1D(filters=64, kernel_size=3, activation='relu',
-                  padding='same', input_shape=(n_features, 1)),
-    layers.Conv1D(filters=32, kernel_size=3, activation='relu',
-                  padding='same'),
-    layers.Flatten(),
-    layers.Dense(64, activation='relu'),
-    layers.Dropout(0.3),
-    layers.Dense(1, activation='sigmoid'),
-], name='Pulse_Sync_CNN')
-
-pulse_sync.compile(
-    optimizer='adam',
-    loss='binary_crossentropy',
-    metrics=['accuracy'],
-)
-
-print("⚡ Pulse-Sync Architecture Summary:")
-pulse_sync.summary()
-
-# ── Train ──────────────────────────────────────────────────────
-t0 = time.time()
-history = pulse_sync.fit(
-    X_train_3d, y_train,
-    epochs=10,
-    batch_size=64,
-    validation_split=0.15,
-    verbose=1,
-)
-elapsed_cnn = time.time() - t0
-
-# ── Evaluate ───────────────────────────────────────────────────
-y_prob_cnn = pulse_sync.predict(X_test_3d, verbose=0).ravel()
-y_pred_cnn = (y_prob_cnn >= 0.5).astype(int)
-
-acc_cnn = accuracy_score(y_test, y_pred_cnn)
-auc_cnn = roc_auc_score(y_test, y_prob_cnn)
-
-print(f"\n  ✓ Pulse-Sync CNN               Acc={acc_cnn:.4f}  AUC={auc_cnn:.4f}  ({elapsed_cnn:.1f}s)")
-
-# Append to tournament results
-results.append({
-    'Model': 'Pulse-Sync (CNN)',
-    'Accuracy': acc_cnn,
-    'ROC-AUC': auc_cnn,
-    'Train Time (s)': round(elapsed_cnn, 2),
-})
-
-# Store in model_zoo for reference (not a Pipeline, but kept for parity)
-model_zoo['Pulse-Sync (CNN)'] = pulse_sync
-print("\n✅ 5 / 5 contestants trained.")
-
-"""### 💓 Pulse-Sync Architecture — Deep Learning CNN (5/5)
-
 | Property | Detail |
 |---|---|
 | **Purpose** | Capturing non-linear, complex patterns using a 1D Convolutional Neural Network (Deep Learning) |
 | **Input Shape** | 3D Tensor: `(Samples, Features, 1)` — treating patient features as a "signal" sequence |
-| **Preprocessing** | **Independent** `SimpleImputer` (Median) and `StandardScaler` to ensure neural network stability without data leakage |
+| **Preprocessing** | **Independent** `StreamingMedianImputer` (Median) and `StandardScaler` to ensure neural network stability without data leakage |
 | **Architecture** |  `Conv1D(64)` → `Conv1D(32)` → `Flatten` → `Dense(64)` → `Dropout(0.3)` → `Output(Sigmoid)` |
-| **Training** | 10 Epochs, Batch Size 64, `Adam` Optimizer, `Binary Crossentropy` Loss |
+| **Input Pipeline** | `tf.data.Dataset` over float32 arrays — shuffle → batch → prefetch — so Keras never slices or copies the NumPy arrays per epoch |
+| **Validation** | Explicit stratified hold-out (`PULSE_VAL_FRACTION` of train) passed as its own dataset instead of `validation_split` |
+| **Training** | Up to `PULSE_EPOCHS` epochs, batch size `PULSE_BATCH_SIZE` (default 256), `Adam` Optimizer, `Binary Crossentropy` Loss |
+| **Early Stopping** | Stops once `val_loss` has not improved for `PULSE_PATIENCE` epochs and restores the best epoch's weights; the cell reports epochs run vs. saved |
+| **Checkpoint & Resume** | Every `PULSE_CHECKPOINT_EVERY` epochs the full model (incl. optimizer state) and a small `state.json` are written to `PULSE_CHECKPOINT_DIR`. A re-run with the same configuration, training data (hashed) and `build_pulse_sync` source resumes from the last checkpoint, or reloads the best weights if that run had already finished |
+| **CPU Tuning** | `PULSE_INTRA_OP_THREADS` / `PULSE_INTER_OP_THREADS` thread pools (0 = TF default); optional `mixed_bfloat16` policy via `PULSE_MIXED_PRECISION` (sigmoid head stays float32) |
 | **Independence** | Fully isolated pipeline (does not rely on previous models) to ensure a fair "Tournament" comparison |
 """
 
@@ -865,58 +771,96 @@ print("\n✅ 5 / 5 contestants trained.")
 #  PULSE-SYNC — Independent 1D-CNN Deep Learning Pipeline (5/5)
 # ══════════════════════════════════════════════════════════════
 
+from myo_ai.impute import StreamingMedianImputer
+from sklearn.preprocessing import StandardScaler
+from sklearn.model_selection import train_test_split
+from sklearn.metrics import accuracy_score, roc_auc_score
+import joblib
+from myo_ai import dag, pulse_cnn       # first use of TensorFlow
+from myo_ai.pulse_cnn import EpochTimer, PulseCheckpoint
+
+# ── 0. Training configuration ────────────────────────────────
+PULSE_EPOCHS           = 10
+PULSE_BATCH_SIZE       = 256
+PULSE_VAL_FRACTION     = 0.15
+PULSE_SHUFFLE_BUFFER   = 100_000   # elements held in the shuffle buffer
+PULSE_INTRA_OP_THREADS = 0         # threads inside one op (0 = TF default)
+PULSE_INTER_OP_THREADS = 0         # ops run concurrently (0 = TF default)
+PULSE_MIXED_PRECISION  = False     # True → 'mixed_bfloat16' (AVX512-BF16 / AMX CPUs)
+PULSE_PATIENCE         = 3         # epochs without val_loss improvement before stopping
+PULSE_CHECKPOINT_DIR   = 'checkpoints/pulse_sync'
+PULSE_CHECKPOINT_EVERY = 1         # epochs between resumable checkpoints
+PULSE_RESUME           = True      # pick up an interrupted / finished run on re-run
+
+pulse_cnn.configure_tf_cpu(PULSE_INTRA_OP_THREADS, PULSE_INTER_OP_THREADS, PULSE_MIXED_PRECISION)
+
 # ── 1. Independent Feature Selection ───────────────────────────
-pulse_X_raw = MASTER_DATA.select_dtypes(include=[np.number])
-pulse_cols_drop = ['target', 'id', 'unnamed: 0', 'patient_id']
-pulse_X = pulse_X_raw.drop(columns=[c for c in pulse_cols_drop if c in pulse_X_raw.columns])
-pulse_y = MASTER_DATA['target'].fillna(0).astype(int)
+pulse_X, pulse_y = train.select_features(MASTER_DATA)
 
 # ── 2. Independent Stratified Split ───────────────────────────
-pulse_X_train_raw, pulse_X_test_raw, pulse_y_train, pulse_y_test = train_test_split(
-    pulse_X, pulse_y, test_size=0.2, random_state=42, stratify=pulse_y,
+pulse_X_train_raw, pulse_X_test_raw, pulse_y_train, pulse_y_test = train.stratified_split(
+    pulse_X, pulse_y,
 )
 
 # ── 3. Imputer & Scaler (fit only on train) ──────────────────
-pulse_imputer = SimpleImputer(strategy='median')
+pulse_imputer = StreamingMedianImputer()
 pulse_scaler  = StandardScaler()
 pulse_X_train_imp = pulse_imputer.fit_transform(pulse_X_train_raw)
 pulse_X_test_imp  = pulse_imputer.transform(pulse_X_test_raw)
 pulse_X_train = pulse_scaler.fit_transform(pulse_X_train_imp)
 pulse_X_test  = pulse_scaler.transform(pulse_X_test_imp)
 
-# ── 4. Reshape for Conv1D ────────────────────────────────────
+# ── 4. Explicit validation hold-out + tf.data pipelines ──────
+pulse_X_fit, pulse_X_val, pulse_y_fit, pulse_y_val = train_test_split(
+    pulse_X_train, pulse_y_train, test_size=PULSE_VAL_FRACTION,
+    random_state=42, stratify=pulse_y_train,
+)
 n_features = pulse_X_train.shape[1]
-pulse_X_train_3d = pulse_X_train.reshape(-1, n_features, 1)
-pulse_X_test_3d  = pulse_X_test.reshape(-1, n_features, 1)
-
-# ── 5. Build & Train CNN ─────────────────────────────────────
-pulse_sync = keras.Sequential([
-    layers.Conv1D(filters=64, kernel_size=3, activation='relu', padding='same', input_shape=(n_features, 1)),
-    layers.Conv1D(filters=32, kernel_size=3, activation='relu', padding='same'),
-    layers.Flatten(),
-    layers.Dense(64, activation='relu'),
-    layers.Dropout(0.3),
-    layers.Dense(1, activation='sigmoid'),
-], name='Pulse_Sync_CNN')
-
-pulse_sync.compile(optimizer='adam', loss='binary_crossentropy', metrics=['accuracy'])
+pulse_train_ds = pulse_cnn.make_pulse_dataset(pulse_X_fit, pulse_y_fit, PULSE_BATCH_SIZE,
+                                              shuffle=True, shuffle_buffer=PULSE_SHUFFLE_BUFFER)
+pulse_val_ds   = pulse_cnn.make_pulse_dataset(pulse_X_val, pulse_y_val, PULSE_BATCH_SIZE)
+pulse_test_ds  = pulse_cnn.make_pulse_dataset(pulse_X_test, pulse_y_test, PULSE_BATCH_SIZE)
+
+# ── 5. Build CNN (or resume from checkpoint) ─────────────────
+pulse_ckpt = PulseCheckpoint(
+    PULSE_CHECKPOINT_DIR,
+    signature={
+        'n_features': n_features, 'n_fit': len(pulse_X_fit),
+        'epochs': PULSE_EPOCHS, 'batch_size': PULSE_BATCH_SIZE,
+        'patience': PULSE_PATIENCE, 'mixed_precision': PULSE_MIXED_PRECISION,
+        'data': joblib.hash((pulse_X_fit, pulse_y_fit, pulse_X_val, pulse_y_val)),
+        'architecture': dag.code_digest(pulse_cnn.build_pulse_sync),
+    },
+    patience=PULSE_PATIENCE,
+    every=PULSE_CHECKPOINT_EVERY,
+)
+if PULSE_RESUME:
+    pulse_sync, pulse_initial_epoch = pulse_ckpt.restore(lambda: pulse_cnn.build_pulse_sync(n_features))
+else:
+    pulse_sync, pulse_initial_epoch = pulse_cnn.build_pulse_sync(n_features), 0
 
 print("⚡ Pulse-Sync Architecture Summary:")
 pulse_sync.summary()
 
-# ── 6. Train ─────────────────────────────────────────────────
+# ── 6. Train (early stopping + periodic checkpoints) ─────────
+pulse_timer = EpochTimer()
 t0 = time.time()
-history = pulse_sync.fit(
-    pulse_X_train_3d, pulse_y_train,
-    epochs=10,
-    batch_size=64,
-    validation_split=0.15,
-    verbose=1,
-)
+with telemetry.stage('Pulse-Sync (CNN) · fit', rows=len(pulse_X_fit)):
+    if not pulse_ckpt.state['finished']:
+        history = pulse_sync.fit(
+            pulse_train_ds,
+            validation_data=pulse_val_ds,
+            epochs=PULSE_EPOCHS,
+            initial_epoch=pulse_initial_epoch,
+            callbacks=[pulse_timer, pulse_ckpt],
+            verbose=1,
+        )
 pulse_elapsed = time.time() - t0
+pulse_epochs_run = pulse_ckpt.state['epoch']
 
 # ── 7. Evaluate ──────────────────────────────────────────────
-pulse_y_prob = pulse_sync.predict(pulse_X_test_3d, verbose=0).ravel()
+with telemetry.stage('Pulse-Sync (CNN) · predict', rows=len(pulse_X_test)):
+    pulse_y_prob = pulse_sync.predict(pulse_test_ds, verbose=0).ravel()
 pulse_y_pred = (pulse_y_prob >= 0.5).astype(int)
 pulse_acc = accuracy_score(pulse_y_test, pulse_y_pred)
 pulse_auc = roc_auc_score(pulse_y_test, pulse_y_prob)
@@ -930,19 +874,215 @@ tournament_results.append({
 })
 tournament_predictions['Pulse-Sync\n(CNN)'] = pulse_y_pred
 tournament_probabilities['Pulse-Sync (CNN)'] = pulse_y_prob
+tournament_labels['Pulse-Sync (CNN)'] = pulse_y_test
 
 print(f"  ✓ Pulse-Sync (CNN)               Acc={pulse_acc:.4f}  AUC={pulse_auc:.4f}  ({pulse_elapsed:.1f}s)")
 print(f"    Dataset: {pulse_X.shape[0]:,} patients × {pulse_X.shape[1]} features")
-print(f"    Train: {len(pulse_X_train):,}  Test: {len(pulse_X_test):,}")
+print(f"    Train: {len(pulse_X_fit):,}  Val: {len(pulse_X_val):,}  Test: {len(pulse_X_test):,}")
+print(f"    Epochs: {pulse_epochs_run}/{PULSE_EPOCHS} run, "
+      f"{PULSE_EPOCHS - pulse_epochs_run} saved by early stopping "
+      f"(best epoch {pulse_ckpt.state['best_epoch']}, "
+      f"{pulse_initial_epoch} reused from checkpoint)")
+if pulse_timer.epoch_times:
+    print(f"    Mean epoch time: {np.mean(pulse_timer.epoch_times):.2f}s  (batch={PULSE_BATCH_SIZE})")
 print("✅ Pulse-Sync — Independent pipeline complete (5/5)")
 
+"""### ⏱️ Pulse-Sync Epoch Benchmark — Legacy Arrays vs. tf.data
+
+| Property | Detail |
+|---|---|
+| **Purpose** | Quantify the per-epoch CPU cost of the original NumPy-array training setup against the `tf.data` pipeline |
+| **Legacy Setup** | `fit(X_3d, y, batch_size=64, validation_split=0.15)` on float64 arrays — Keras slices and converts the data itself |
+| **tf.data Setup** | Prefetched float32 datasets with explicit validation, at several batch sizes (and bf16 when `PULSE_MIXED_PRECISION` is on) |
+| **Method** | Fresh model per configuration, `BENCH_EPOCHS` epochs each; the first epoch (graph tracing) is excluded from the mean |
+| **Output** | `pulse_bench_df` — mean seconds per epoch and speed-up relative to the legacy setup |
+| **Gate** | Runs only with `RUN_BENCHMARKS = True` |
+"""
+
+# ══════════════════════════════════════════════════════════════
+#  PULSE-SYNC EPOCH BENCHMARK — Legacy vs. tf.data
+# ══════════════════════════════════════════════════════════════
+
+BENCH_EPOCHS      = 3
+BENCH_BATCH_SIZES = [64, 256, 1024]
+
+
+def _mean_epoch_time(fit_fn):
+    """Run *fit_fn(callbacks)* and return mean epoch seconds after warm-up."""
+    timer = EpochTimer()
+    fit_fn([timer])
+    times = timer.epoch_times[1:] or timer.epoch_times
+    return float(np.mean(times))
+
+
+if RUN_BENCHMARKS:
+    bench_rows = []
+
+    # Legacy: NumPy arrays + validation_split (the original training call)
+    legacy_model = pulse_cnn.build_pulse_sync(n_features)
+    legacy_epoch = _mean_epoch_time(lambda cb: legacy_model.fit(
+        pulse_X_train.reshape(-1, n_features, 1), pulse_y_train,
+        epochs=BENCH_EPOCHS, batch_size=64, validation_split=0.15,
+        callbacks=cb, verbose=0,
+    ))
+    bench_rows.append({'Setup': 'NumPy + validation_split', 'Batch': 64,
+                       'Epoch (s)': legacy_epoch})
+
+    # tf.data at increasing batch sizes
+    for bs in BENCH_BATCH_SIZES:
+        model = pulse_cnn.build_pulse_sync(n_features)
+        train_ds = pulse_cnn.make_pulse_dataset(pulse_X_fit, pulse_y_fit, batch_size=bs, shuffle=True)
+        val_ds   = pulse_cnn.make_pulse_dataset(pulse_X_val, pulse_y_val, batch_size=bs)
+        epoch_s = _mean_epoch_time(lambda cb: model.fit(
+            train_ds, validation_data=val_ds, epochs=BENCH_EPOCHS,
+            callbacks=cb, verbose=0,
+        ))
+        bench_rows.append({'Setup': 'tf.data + prefetch', 'Batch': bs, 'Epoch (s)': epoch_s})
+
+    pulse_bench_df = pd.DataFrame(bench_rows)
+    pulse_bench_df['Speed-up'] = legacy_epoch / pulse_bench_df['Epoch (s)']
+    print(pulse_bench_df.round(3).to_string(index=False))
+    print("✅ Pulse-Sync Epoch Benchmark Complete.")
+else:
+    print("⏭️  Pulse-Sync Epoch Benchmark skipped (RUN_BENCHMARKS = False).")
+
+"""### 📦 Pulse-Sync Lite — TensorFlow-Free Inference Export
+
+| Property | Detail |
+|---|---|
+| **Purpose** | Serve the Pulse-Sync CNN without importing TensorFlow (seconds of start-up, hundreds of MB of RAM) |
+| **Exporter** | `export_pulse_sync()` writes the Conv1D / Dense weights plus the fitted imputer medians and scaler moments to `pulse_sync_lite.npz` |
+| **Runtime** | `PulseSyncLite` (`myo_ai/pulse_sync_lite.py`, NumPy only) — Conv1D via `sliding_window_view` im2col → ReLU → Dense → Sigmoid, batched |
+| **Interface** | scikit-learn style `predict_proba` / `predict` on raw feature rows, so it drops into batch scoring and `demo_app.py` |
+| **Verification** | Max absolute difference vs. `pulse_sync.predict` on the full test set must be ≤ `1e-5` |
+"""
+
+# ══════════════════════════════════════════════════════════════
+#  PULSE-SYNC LITE — Export & Parity Check
+# ══════════════════════════════════════════════════════════════
+
+from myo_ai.pulse_sync_lite import export_pulse_sync, PulseSyncLite
+
+PULSE_LITE_PATH = 'pulse_sync_lite.npz'
+
+# 1. Export weights + preprocessing
+export_pulse_sync(pulse_sync, PULSE_LITE_PATH,
+                  imputer=pulse_imputer, scaler=pulse_scaler,
+                  feature_names=pulse_X.columns.tolist())
+print(f"📦 Exported '{PULSE_LITE_PATH}'  ({os.path.getsize(PULSE_LITE_PATH) / 1024:.1f} KB)")
+
+# 2. Cold start: load the file and score one patient
+t0 = time.perf_counter()
+pulse_lite = PulseSyncLite(PULSE_LITE_PATH)
+pulse_lite.predict_proba(pulse_X_test_raw.iloc[:1])
+lite_cold_ms = (time.perf_counter() - t0) * 1000
+
+# 3. Parity on the full test set (raw features in → probabilities out)
+t0 = time.perf_counter()
+lite_prob = pulse_lite.predict_proba(pulse_X_test_raw)[:, 1]
+lite_batch_s = time.perf_counter() - t0
+
+t0 = time.perf_counter()
+tf_prob = pulse_sync.predict(pulse_X_test.reshape(-1, n_features, 1), verbose=0).ravel()
+tf_batch_s = time.perf_counter() - t0
+
+max_diff = float(np.abs(lite_prob - tf_prob).max())
+print(f"   Max |Lite − TF| : {max_diff:.2e}")
+print(f"   Cold start      : {lite_cold_ms:.1f} ms (load + 1 patient)")
+print(f"   Batch scoring   : Lite {lite_batch_s:.3f}s  vs  TF {tf_batch_s:.3f}s  "
+      f"({len(pulse_X_test_raw):,} patients)")
+assert max_diff <= 1e-5, "Pulse-Sync Lite diverges from the Keras model"
+print("✅ Pulse-Sync Lite export verified.")
+
+"""### 🧬 Myo-Stack — Stacked Ensemble Champion
+
+| Property | Detail |
+|---|---|
+| **Purpose** | Blend the contestants instead of discarding all but the top single model |
+| **Base Models** | The four fitted scikit-learn contestants (Aegis, Myo-Core, Sentinel, Vanguard) — reused as-is for scoring, never retrained |
+| **Out-of-Fold Stage** | `ensemble.oof_probabilities` — 5-fold OOF probabilities per contestant on the shared train split; all (contestant × fold) fits run on a process pool and are cached in `cache/stack_oof/` keyed by pipeline config + data |
+| **Meta-Learner** | `LogisticRegression` on the logits of the OOF probabilities |
+| **Artifact** | `ensemble.StackedChampion` → `myo_stack.joblib` — one `predict_proba` object (contestants + meta-learner) |
+| **Inference Cost** | Batched scoring of the test split (`STACK_BATCH_SIZE` rows per call) vs. the best single contestant |
+| **Output** | `Myo-Stack (Stacked)` joins `tournament_results`; `stack_cost_df` compares throughput |
+"""
+
+# ══════════════════════════════════════════════════════════════
+#  MYO-STACK — Stacked Ensemble from Cached OOF Probabilities
+# ══════════════════════════════════════════════════════════════
+
+import joblib
+from sklearn.metrics import accuracy_score, roc_auc_score
+from myo_ai import ensemble
+
+STACK_CONTESTANTS = {
+    'Aegis Protocol (RF)':      aegis_pipeline,
+    'Myo-Core Engine (HGBC)':   myocore_pipeline,
+    'Sentinel Node (NB)':       sentinel_pipeline,
+    'Vanguard System (LogReg)': vanguard_pipeline,
+}
+STACK_ARTIFACT   = 'myo_stack.joblib'
+STACK_BATCH_SIZE = 1024
+
+# ── 1. Out-of-fold probabilities (parallel, cached) ──────────
+t0 = time.perf_counter()
+with telemetry.stage('Myo-Stack (Stacked) · fit', rows=len(myocore_X_train_raw)):
+    stack_oof = ensemble.oof_probabilities(STACK_CONTESTANTS, myocore_X_train_raw, myocore_y_train)
+    stack_elapsed = time.perf_counter() - t0
+
+    # ── 2. Meta-learner on OOF logits ────────────────────────
+    myo_stack = ensemble.StackedChampion(STACK_CONTESTANTS).fit_meta(stack_oof, myocore_y_train)
+
+# ── 3. Score on the shared test split ────────────────────────
+with telemetry.stage('Myo-Stack (Stacked) · predict', rows=len(myocore_X_test_raw)):
+    stack_y_prob = myo_stack.predict_proba(myocore_X_test_raw)[:, 1]
+stack_y_pred = (stack_y_prob >= 0.5).astype(int)
+stack_acc = accuracy_score(myocore_y_test, stack_y_pred)
+stack_auc = roc_auc_score(myocore_y_test, stack_y_prob)
+
+tournament_results.append({
+    'Model': 'Myo-Stack (Stacked)',
+    'Accuracy': stack_acc,
+    'ROC-AUC': stack_auc,
+    'Train Time (s)': round(stack_elapsed, 2),
+})
+tournament_predictions['Myo-Stack\n(Stacked Blend)'] = stack_y_pred
+tournament_probabilities['Myo-Stack (Stacked)'] = stack_y_prob
+tournament_labels['Myo-Stack (Stacked)'] = myocore_y_test
+
+# ── 4. Export as a single scoring artifact ───────────────────
+joblib.dump(myo_stack, STACK_ARTIFACT)
+
+# ── 5. Batched inference cost vs. the best single contestant ─
+stack_champion = max(STACK_CONTESTANTS,
+                     key=lambda name: roc_auc_score(myocore_y_test, tournament_probabilities[name]))
+cost_rows = []
+for label, model in [(stack_champion, STACK_CONTESTANTS[stack_champion]), ('Myo-Stack (Stacked)', myo_stack)]:
+    t0 = time.perf_counter()
+    for start in range(0, len(myocore_X_test_raw), STACK_BATCH_SIZE):
+        model.predict_proba(myocore_X_test_raw.iloc[start:start + STACK_BATCH_SIZE])
+    seconds = time.perf_counter() - t0
+    cost_rows.append({'Model': label, 'Score Test Split (s)': seconds,
+                      'Rows / s': len(myocore_X_test_raw) / seconds})
+stack_cost_df = pd.DataFrame(cost_rows)
+stack_cost_df['Relative Cost'] = stack_cost_df['Score Test Split (s)'] / stack_cost_df['Score Test Split (s)'].iloc[0]
+
+print(myo_stack.weights.round(3).to_string())
+print(f"\n  ✓ Myo-Stack (Stacked)            Acc={stack_acc:.4f}  AUC={stack_auc:.4f}  "
+      f"(OOF {stack_elapsed:.1f}s)")
+print(stack_cost_df.round(3).to_string(index=False))
+print(f"✅ Myo-Stack Complete — exported {STACK_ARTIFACT}")
+
 """### 🏆 Tournament Leaderboard — Final Standings
 
 | Property | Detail |
 |---|---|
 | **Purpose** | Aggregate and rank all model performance metrics to declare a winner |
+| **Evaluation Engine** | `evaluate.evaluate_models` stacks every contestant's probabilities into one (models × samples) array, sorts each row once and derives ROC / PR curves, AUCs, threshold-grid confusion matrices and calibration bins from it (`tournament_eval`, reused by the grid and ROC cells) |
+| **Shared Labels** | `evaluate.shared_labels` verifies every contestant was scored on the same test split (`tournament_y_test`) |
 | **Ranking Metric** | `ROC-AUC` (Area Under the Receiver Operating Characteristic Curve) is used as the primary sorting metric |
-| **Output** | A formatted text table showing Rank, Model Name, Accuracy, ROC-AUC, and Training Time |
+| **Uncertainty** | 95% bootstrap interval for ROC-AUC (`EVAL_BOOTSTRAP` paired resamples from `significance.bootstrap_auc`) and PR-AUC |
+| **Output** | A formatted text table showing Rank, Model Name, Accuracy, ROC-AUC, AUC 95% CI, PR-AUC and Training Time |
 | **Winner Selection** | The model with the highest ROC-AUC is automatically crowned as the "Champion" |
 """
 
@@ -950,10 +1090,21 @@ print("✅ Pulse-Sync — Independent pipeline complete (5/5)")
 #  🏆 TOURNAMENT LEADERBOARD — Results Table Only
 # ══════════════════════════════════════════════════════════════
 
-import pandas as pd
+from myo_ai import evaluate
+
+EVAL_BOOTSTRAP = 10_000      # paired replicates, reused by the significance cell
+
+# One vectorized evaluation pass over all contestants
+tournament_y_test = evaluate.shared_labels(tournament_labels)
+tournament_eval = evaluate.evaluate_models(tournament_y_test, tournament_probabilities,
+                                           n_boot=EVAL_BOOTSTRAP)
 
 # Results Table
-leaderboard_df = pd.DataFrame(tournament_results).sort_values('ROC-AUC', ascending=False)
+leaderboard_df = (pd.DataFrame(tournament_results)
+                  .drop(columns='ROC-AUC')
+                  .merge(tournament_eval['summary'], on='Model')
+                  [['Model', 'Accuracy', 'ROC-AUC', 'AUC 95% CI', 'PR-AUC', 'Train Time (s)']]
+                  .sort_values('ROC-AUC', ascending=False))
 leaderboard_df.index = range(1, len(leaderboard_df) + 1)
 leaderboard_df.index.name = 'Rank'
 
@@ -967,7 +1118,37 @@ print("=" * 62)
 winner = leaderboard_df.iloc[0]
 print(f"\n👑 Tournament Champion: {winner['Model']}")
 print(f"   Accuracy : {winner['Accuracy']:.4f}")
-print(f"   ROC-AUC  : {winner['ROC-AUC']:.4f}")
+print(f"   ROC-AUC  : {winner['ROC-AUC']:.4f}  95% CI {winner['AUC 95% CI']}")
+
+"""### 📐 Significance — Bootstrap Replicates & Paired DeLong Tests
+
+| Property | Detail |
+|---|---|
+| **Purpose** | Decide whether the champion's ROC-AUC lead is real or within noise — leaders often differ only in the third decimal |
+| **Bootstrap** | `EVAL_BOOTSTRAP` paired replicates from the leaderboard (`tournament_eval['auc_replicates']`): each model's scores are sorted once and every resample is a vector of multinomial counts, so a replicate is an O(n) cumulative-sum pass, run across cores |
+| **DeLong** | `significance.pairwise_tests` — paired DeLong z-test for every pair of contestants (fast mid-rank covariance, O(n log n)), with Holm-adjusted p-values |
+| **Output** | `significance_df` — ΔAUC, bootstrap 95% CI of ΔAUC, z, p-value, Holm p-value per pair; verdict for champion vs. runner-up |
+"""
+
+# ══════════════════════════════════════════════════════════════
+#  📐 SIGNIFICANCE — Bootstrap Replicates & Paired DeLong Tests
+# ══════════════════════════════════════════════════════════════
+
+from myo_ai import significance
+
+significance_df = significance.pairwise_tests(
+    tournament_y_test, tournament_eval['P'], tournament_eval['names'],
+    replicates=tournament_eval['auc_replicates'],
+)
+print(significance_df.round(4).to_string(index=False))
+
+# Champion vs. runner-up
+champion, runner_up = leaderboard_df['Model'].iloc[0], leaderboard_df['Model'].iloc[1]
+pair = significance_df[significance_df[['Model A', 'Model B']].isin([champion, runner_up]).all(axis=1)].iloc[0]
+verdict = 'significantly better than' if pair['Significant'] else 'statistically tied with'
+print(f"\n⚖️  {champion} is {verdict} {runner_up} "
+      f"(DeLong p = {pair['p-value']:.4g}, Holm p = {pair['p (Holm)']:.4g})")
+print("✅ Significance Testing Complete.")
 
 """### 📊 Confusion Matrix Grid — Tournament Visualization
 
@@ -976,7 +1157,7 @@ print(f"   ROC-AUC  : {winner['ROC-AUC']:.4f}")
 | **Purpose** | Visually compare the classification errors (False Positives vs. False Negatives) across all 5 models simultaneously |
 | **Visual Format** | **2x3 Grid of Heatmaps** — each subplot represents one model's confusion matrix |
 | **Key Insight** | The **Diagonal** (Top-Left & Bottom-Right) shows correct predictions (Healthy & CVD). The **Off-Diagonal** shows errors (Missed Cases vs. False Alarms) |
-| **Input Data** | Iterates through the `tournament_predictions` dictionary to fetch pre-calculated prediction vectors |
+| **Input Data** | Confusion counts at `threshold = 0.5` from `tournament_eval['confusion']` — no per-model `confusion_matrix` calls |
 | **Styling** | Uses `Seaborn` heatmaps with annotation (`annot=True`) to show raw patient counts in each quadrant |
 """
 
@@ -986,12 +1167,12 @@ print(f"   ROC-AUC  : {winner['ROC-AUC']:.4f}")
 
 import matplotlib.pyplot as plt
 import seaborn as sns
-from sklearn.metrics import confusion_matrix
 
 plt.style.use('seaborn-v0_8-darkgrid')
 
-# Include all models for visualization
-model_names_to_plot = list(tournament_predictions.keys())
+# Include all models for visualization (confusion counts at threshold 0.5)
+model_names_to_plot = tournament_eval['names']
+cm_threshold_idx = int(np.argmin(np.abs(tournament_eval['thresholds'] - 0.5)))
 
 num_models = len(model_names_to_plot)
 rows = 2
@@ -1001,13 +1182,12 @@ fig, axes = plt.subplots(rows, cols, figsize=(18, 11))
 axes_flat = axes.flatten()
 
 for idx, name in enumerate(model_names_to_plot):
-    y_pred = tournament_predictions[name]
-    cm = confusion_matrix(tournament_y_test, y_pred)
+    cm = tournament_eval['confusion'][idx, cm_threshold_idx]
     ax = axes_flat[idx]
     sns.heatmap(cm, annot=True, fmt='d', cmap='Blues', ax=ax,
                 cbar=False, linewidths=0.8, linecolor='white',
                 annot_kws={'size': 16, 'weight': 'bold'})
-    ax.set_title(name, fontsize=12, fontweight='bold', pad=8)
+    ax.set_title(name.replace(' (', '\n('), fontsize=12, fontweight='bold', pad=8)
     ax.set_ylabel('Actual' if idx % cols == 0 else '', fontsize=11)
     ax.set_xlabel('Predicted', fontsize=11)
     ax.set_xticklabels(['Healthy', 'CVD'], fontsize=9)
@@ -1032,7 +1212,7 @@ plt.show()
 | **Key Metric** | `AUC` (Area Under Curve) — higher curves (closer to top-left) indicate better performance |
 | **Visual Styling** | Distinct colors and line styles (solid, dashed, dot-dash) to differentiate between the 5 models |
 | **Baseline** | Includes a diagonal dashed line representing a "Random Classifier" (AUC = 0.5) for reference |
-| **Input** | Uses stored probability predictions (`y_prob`) to calculate the curve at all possible classification thresholds |
+| **Input** | Curves and AUCs from `tournament_eval` — every distinct threshold, computed from one sort per model |
 """
 
 # ══════════════════════════════════════════════════════════════
@@ -1040,7 +1220,6 @@ plt.show()
 # ══════════════════════════════════════════════════════════════
 
 import matplotlib.pyplot as plt
-from sklearn.metrics import roc_curve, auc
 
 plt.style.use('seaborn-v0_8-darkgrid')
 
@@ -1050,15 +1229,16 @@ roc_styles = [
     ('Sentinel Node (NB)',        '#e67e22', '--', 2.2),
     ('Vanguard System (LogReg)',  '#9b59b6', '--', 2.2),
     ('Pulse-Sync (CNN)',          '#e74c3c', '-.', 2.2),
+    ('Myo-Stack (Stacked)',       '#f1c40f', '-',  2.8),
 ]
 
 fig, ax = plt.subplots(figsize=(10, 8))
 
 for (name, color, ls, lw) in roc_styles:
-    y_prob = tournament_probabilities.get(name)
-    if y_prob is not None:
-        fpr, tpr, _ = roc_curve(tournament_y_test, y_prob)
-        auc_val = auc(fpr, tpr)
+    if name in tournament_eval['names']:
+        idx = tournament_eval['names'].index(name)
+        fpr, tpr, _ = tournament_eval['roc'][idx]
+        auc_val = tournament_eval['roc_auc'][idx]
         ax.plot(fpr, tpr, color=color, linestyle=ls, linewidth=lw,
                 label=f'{name}  (AUC = {auc_val:.4f})')
 
@@ -1076,6 +1256,198 @@ ax.grid(True, alpha=0.3)
 plt.tight_layout()
 plt.show()
 
+"""### 🎯 Myo-Core Calibration — Isotonic / Platt Lookup Table
+
+| Property | Detail |
+|---|---|
+| **Purpose** | The simulator thresholds at 0.5 and colours the gauge at 40 / 70 %, but forest and boosting probabilities are not calibrated — map the served model's scores onto observed event rates |
+| **Served Model** | `CALIBRATE_MODEL` is Myo-Core, the pipeline the Bio-Deck scores and `myocore_pipeline.pkl` ships to `demo_app.py`; the export records its name and `CalibratedModel(..., model_name=...)` refuses a calibrator fitted on another model's scores |
+| **Held-Out Data** | The shared test split is divided (stratified, `CALIBRATION_FRACTION`) into a *fit* half for the calibrator and a *check* half for the reliability curves |
+| **Methods** | `isotonic` (monotone step map) and `platt` (sigmoid on the logit) — both reported, `CALIBRATION_METHOD` is exported |
+| **Artifact** | `calibration.export_calibrator` → `myo_calibrator.npz` — a few hundred float32 knots; `calibration.CalibratedModel` applies it with one vectorized `np.interp` (the Bio-Deck, and `MYO_CALIBRATOR_PATH` in `demo_app.py`) |
+| **Output** | `calibration_df` (Brier, ECE on the check half), reliability curves before / after, scoring overhead of the lookup |
+"""
+
+# ══════════════════════════════════════════════════════════════
+#  🎯 MYO-CORE CALIBRATION — Knot-Table Export
+# ══════════════════════════════════════════════════════════════
+
+import matplotlib.pyplot as plt
+from myo_ai import calibration
+
+CALIBRATE_MODEL    = 'Myo-Core Engine (HGBC)'            # the served model (Bio-Deck, demo_app)
+CALIBRATION_METHOD = 'isotonic'                          # 'isotonic' or 'platt'
+CALIBRATOR_PATH    = 'myo_calibrator.npz'
+
+raw_prob = tournament_eval['P'][tournament_eval['names'].index(CALIBRATE_MODEL)]
+cal_fit, cal_check = calibration.calibration_split(tournament_y_test)
+
+# ── 1. Fit both methods on the fit half ──────────────────────
+calibration_tables = {
+    method: calibration.fit_calibrator(raw_prob[cal_fit], tournament_y_test[cal_fit], method)
+    for method in calibration.CALIBRATION_METHODS
+}
+calibrators = {m: calibration.Calibrator(t) for m, t in calibration_tables.items()}
+
+# ── 2. Reliability on the check half ─────────────────────────
+check_probs = {'Raw': raw_prob[cal_check]}
+check_probs.update({f'{m.title()} ({c.n_knots} knots)': c(raw_prob[cal_check])
+                    for m, c in calibrators.items()})
+calibration_df = calibration.reliability_report(tournament_y_test[cal_check], check_probs)
+print(f"Calibrating: {CALIBRATE_MODEL}  (fit {len(cal_fit):,} rows / check {len(cal_check):,} rows)")
+print(calibration_df.round(4).to_string(index=False))
+
+# ── 3. Export the lookup table ───────────────────────────────
+calibrator = calibrators[CALIBRATION_METHOD]
+calibration.export_calibrator(calibration_tables[CALIBRATION_METHOD], CALIBRATOR_PATH,
+                              model_name=CALIBRATE_MODEL)
+
+# ── 4. Scoring overhead of the lookup ────────────────────────
+t0 = time.perf_counter()
+for _ in range(1000):
+    calibrator(raw_prob[:1])
+single_us = (time.perf_counter() - t0) / 1000 * 1e6
+t0 = time.perf_counter()
+calibrator(raw_prob)
+batch_ms = (time.perf_counter() - t0) * 1e3
+print(f"\n⏱️  Lookup overhead: {single_us:.1f} µs per single-row call, "
+      f"{batch_ms:.2f} ms for all {len(raw_prob):,} test rows")
+
+# ── 5. Reliability curves before / after ─────────────────────
+names, P = evaluate.stack_probabilities(check_probs)
+bins = evaluate.calibration_bins(tournament_y_test[cal_check], P)
+fig, ax = plt.subplots(figsize=(8, 7))
+ax.plot([0, 1], [0, 1], 'k--', alpha=0.4, linewidth=1, label='Perfectly Calibrated')
+for i, (name, color) in enumerate(zip(names, ['#e74c3c', '#2ecc71', '#3498db'])):
+    ax.plot(bins['mean_pred'][i], bins['frac_pos'][i], marker='o', color=color, linewidth=2,
+            label=f"{name}  (ECE = {calibration_df['ECE'].iloc[i]:.4f})")
+for risk_band in (0.4, 0.7):
+    ax.axvline(risk_band, color='gray', linestyle=':', alpha=0.6)
+ax.set_xlabel('Mean Predicted Probability', fontsize=13)
+ax.set_ylabel('Observed CVD Rate', fontsize=13)
+ax.set_title(f'Reliability Curves — {CALIBRATE_MODEL}', fontsize=16, fontweight='bold')
+ax.legend(loc='upper left', fontsize=11, framealpha=0.9)
+ax.set_xlim([0, 1])
+ax.set_ylim([0, 1])
+plt.tight_layout()
+plt.show()
+
+print(f"✅ Calibration Complete — exported {CALIBRATOR_PATH} ({os.path.getsize(CALIBRATOR_PATH) / 1024:.1f} KB)")
+
+"""### 🔁 Incremental Updates — Daily Batches without a Full Retrain
+
+| Property | Detail |
+|---|---|
+| **Purpose** | New labelled patients arrive daily — update the models from each batch in seconds instead of re-running ingestion, harmonization and the whole tournament |
+| **Simulation** | The Myo-Core train split is divided into a *base* set and `INCREMENTAL_DAYS` daily batches of `INCREMENTAL_BATCH_FRAC` each; models fit on the base set, then absorb one batch per day |
+| **Updates** | `incremental.partial_update` — Sentinel `GaussianNB.partial_fit`, Vanguard online (`SGDClassifier` log-loss, `partial_fit`), Myo-Core `MYOCORE_WARM_ITER` warm-start boosting iterations on the batch with the original bin mapper frozen (a private scikit-learn hook — raises on releases outside `incremental.SKLEARN_TESTED`); imputer / scaler statistics stay frozen |
+| **Versioning** | `incremental.save_version` → `artifacts/incremental/simulation/vNNNN/` (reset on every run) (one joblib per model + `manifest.json`: parent, rows, batch hash, test AUCs); `incremental.load_version` restores any version |
+| **Output** | `incremental_df` — update time and test ROC-AUC per day, against a full retrain on the same rows |
+"""
+
+# ══════════════════════════════════════════════════════════════
+#  🔁 INCREMENTAL UPDATES — partial_fit / Warm Start + Versions
+# ══════════════════════════════════════════════════════════════
+
+import shutil
+from sklearn.metrics import roc_auc_score
+from myo_ai import incremental
+
+INCREMENTAL_DAYS       = 5
+INCREMENTAL_BATCH_FRAC = 0.02      # share of the train split arriving per day
+INCREMENTAL_ROOT       = os.path.join(incremental.INCREMENTAL_ROOT, 'simulation')
+shutil.rmtree(INCREMENTAL_ROOT, ignore_errors=True)   # fresh lineage on every run
+
+batch_rows = int(len(myocore_X_train_raw) * INCREMENTAL_BATCH_FRAC)
+base_rows = len(myocore_X_train_raw) - INCREMENTAL_DAYS * batch_rows
+X_base, y_base = myocore_X_train_raw.iloc[:base_rows], myocore_y_train.iloc[:base_rows]
+
+def incremental_models():
+    return {
+        'sentinel': train.build_sentinel_pipeline(),
+        'vanguard': train.build_vanguard_pipeline(online=True),
+        'myocore':  train.build_myocore_pipeline(MYOCORE_PARAMS, profile=MYOCORE_PROFILE),
+    }
+
+def test_aucs(models):
+    return {name: roc_auc_score(myocore_y_test, m.predict_proba(myocore_X_test_raw)[:, 1])
+            for name, m in models.items()}
+
+# ── 1. Base version ──────────────────────────────────────────
+t0 = time.perf_counter()
+online_models = {name: m.fit(X_base, y_base) for name, m in incremental_models().items()}
+incremental_rows = [{'Day': 'base', 'Rows Seen': base_rows,
+                     'Update (s)': time.perf_counter() - t0, **test_aucs(online_models)}]
+incremental.save_version(online_models, INCREMENTAL_ROOT, rows_total=base_rows,
+                         metrics=test_aucs(online_models))
+
+# ── 2. One incremental update + version per day ──────────────
+for day in range(1, INCREMENTAL_DAYS + 1):
+    batch = slice(base_rows + (day - 1) * batch_rows, base_rows + day * batch_rows)
+    X_day, y_day = myocore_X_train_raw.iloc[batch], myocore_y_train.iloc[batch]
+    t0 = time.perf_counter()
+    for model in online_models.values():
+        incremental.partial_update(model, X_day, y_day)
+    elapsed = time.perf_counter() - t0
+    aucs = test_aucs(online_models)
+    manifest = incremental.save_version(online_models, INCREMENTAL_ROOT, X_batch=X_day,
+                                        rows_total=base_rows + day * batch_rows, metrics=aucs)
+    incremental_rows.append({'Day': f"day {day} (v{manifest['version']:04d})",
+                             'Rows Seen': manifest['rows_total'], 'Update (s)': elapsed, **aucs})
+
+# ── 3. Reference: full retrain on the same rows ──────────────
+t0 = time.perf_counter()
+retrained = {name: m.fit(myocore_X_train_raw, myocore_y_train) for name, m in incremental_models().items()}
+incremental_rows.append({'Day': 'full retrain', 'Rows Seen': len(myocore_X_train_raw),
+                         'Update (s)': time.perf_counter() - t0, **test_aucs(retrained)})
+
+incremental_df = pd.DataFrame(incremental_rows).rename(columns={
+    'sentinel': 'Sentinel AUC', 'vanguard': 'Vanguard (SGD) AUC', 'myocore': 'Myo-Core AUC'})
+print(incremental_df.round(4).to_string(index=False))
+print(f"✅ Incremental Updates Complete — versions {incremental.list_versions(INCREMENTAL_ROOT)} in {INCREMENTAL_ROOT}/")
+
+"""### 🗄️ Out-of-Core Tournament — Columnar MASTER_DATA under a Memory Budget
+
+| Property | Detail |
+|---|---|
+| **Purpose** | Train when pooled registry data no longer fits in RAM — Layer 2 above holds MASTER_DATA, `select_dtypes` copies and a split per contestant |
+| **Columnar Cache** | `outofcore.cache_master_data` → `cache/master_data.parquet`, `ROW_GROUP_ROWS` rows per row group; every pass streams one row group at a time |
+| **Split** | Labels read alone (1 byte per row) → exact stratified test mask, same `test_size` / seed as the tournament |
+| **Imputation & Bins** | Per-column medians and 255-bin quantile edges from mergeable KLL sketches (`sketch.ColumnSketch`) — no column is ever sorted in full |
+| **Models** | Sentinel `GaussianNB.partial_fit`, Vanguard SGD `partial_fit` over shuffled row groups, Myo-Core HGBC on a uint8 binned matrix whose rows are capped by `outofcore.memory_plan` |
+| **Budget** | `OOC_HEADROOM_MB` above the notebook's current RSS; the kernel's peak-RSS high-water mark is reset and checked (`benchmarks/out_of_core.py` runs the same path standalone on synthetic data) |
+| **Output** | `ooc_df` — streamed test ROC-AUC per model vs. the in-memory contestants, pass timings, peak RSS |
+"""
+
+# ══════════════════════════════════════════════════════════════
+#  🗄️ OUT-OF-CORE TOURNAMENT — Streamed Row Groups
+# ══════════════════════════════════════════════════════════════
+
+from sklearn.metrics import roc_auc_score
+from myo_ai import outofcore
+
+OOC_HEADROOM_MB = 1024                 # working memory allowed on top of the current RSS
+
+outofcore.cache_master_data(MASTER_DATA, outofcore.MASTER_PARQUET)
+ooc_budget_mb = outofcore.current_rss_mb() + OOC_HEADROOM_MB
+ooc = outofcore.train_out_of_core(outofcore.MASTER_PARQUET, budget_mb=ooc_budget_mb,
+                                  myocore_params=MYOCORE_PARAMS)
+
+in_memory_auc = {'Sentinel Node (NB)': 'Sentinel Node (NB)',
+                 'Vanguard System (SGD)': 'Vanguard System (LogReg)',
+                 'Myo-Core Engine (HGBC)': 'Myo-Core Engine (HGBC)'}
+ooc_df = pd.DataFrame([
+    {'Model': name,
+     'Out-of-Core AUC': roc_auc_score(ooc['y_test'], prob),
+     'In-Memory AUC': tournament_eval['roc_auc'][tournament_eval['names'].index(in_memory_auc[name])]}
+    for name, prob in ooc['probabilities'].items()
+])
+print(ooc_df.round(4).to_string(index=False))
+print("\n" + "  ".join(f"{name}: {sec:.2f}s" for name, sec in ooc['timings'].items()))
+print(f"HGBC rows: {ooc['plan']['hgb_rows']:,}  |  Peak RSS {ooc['peak_rss_mb']:.0f} MB "
+      f"(budget {ooc['budget_mb']:.0f} MB) → {'within budget' if ooc['within_budget'] else 'OVER BUDGET'}")
+print("✅ Out-of-Core Tournament Complete.")
+
 """# 🧠 LAYER 3 — THE INTELLIGENCE (Analysis & UI)
 
 > Unsupervised clustering, explainability, and interactive risk simulation. Each cell is documented and contains only one type of output (table, plot, or widget).
@@ -1084,56 +1456,57 @@ plt.show()
 |:---:|---|---|---|
 | 1 | **Zenith** | PCA + KMeans | Unsupervised patient risk-group clustering |
 | 2 | **Oracle** | SHAP TreeExplainer, Permutation Importance | Global feature-impact explainability |
-| 3 | **Myo-Sim** | ipywidgets + Chronos | Interactive risk simulator with 20-year projection |
+| 3 | **Myo-Sim** | ipywidgets + Chronos | Interactive risk simulator with 20-year projection; population trajectories under intervention scenarios |
 
 ### 🌌 Zenith Cluster Map — Unsupervised Patient Grouping
 
 | Property | Detail |
 |---|---|
 | **Purpose** | Unsupervised discovery of patient "Risk Phenotypes" without using the target labels |
-| **Input Data** | `myocore_X_test` — Uses the **scaled features** from the Myo-Core engine to ensure valid PCA results |
+| **Input Data** | `myocore_X_test_scaled` — Uses the **scaled features** from the Myo-Core engine to ensure valid PCA results |
 | **Methodology** | **PCA** (Principal Component Analysis) reduces high-dimensional data to 2D → **K-Means Clustering** groups patients by similarity |
 | **Risk Assignment** | Clusters are sorted by their PC1 value to automatically assign "Low", "Moderate", or "High" risk labels |
 | **Visualization** | A 2D Scatter Plot showing patient distribution, where colors represent risk groups and "X" markers indicate cluster centroids |
+| **Rendering Mode** | `ZENITH_RENDER_MODE` — `'scatter'` draws one marker per patient; `'density'` pre-aggregates points into a per-group 2-D histogram with NumPy and draws a single raster, so plotting cost is independent of N. `'auto'` switches to density above `DENSITY_SWITCH_POINTS` |
 """
 
 # ══════════════════════════════════════════════════════════════
 #  ZENITH CLUSTER MAP — Unsupervised Patient Risk Grouping
 # ══════════════════════════════════════════════════════════════
 
-from sklearn.decomposition import PCA
-from sklearn.cluster import KMeans
 import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
+from myo_ai.explain import (RISK_NAMES as risk_names, RISK_COLORS as risk_colors,
+                            resolve_render_mode, group_density_image, draw_density)
 
-# 1. Reduce to 2-D with PCA
-pca = PCA(n_components=2, random_state=42)
-X_pca = pca.fit_transform(myocore_X_test)
+ZENITH_RENDER_MODE = 'auto'      # 'scatter' | 'density' | 'auto'
 
-print(f"PCA explained variance: {pca.explained_variance_ratio_.sum():.2%}")
+# 1-3. PCA → KMeans → risk-group labelling (clusters ordered by mean PC1)
+X_pca, cluster_labels, pca, kmeans = explain.zenith_clusters(myocore_X_test_scaled)
 
-# 2. KMeans clustering (3 patient risk groups)
-kmeans = KMeans(n_clusters=3, random_state=42, n_init=10)
-clusters = kmeans.fit_predict(X_pca)
-
-# 3. Risk-group labelling (order clusters by mean PC1 value)
-cluster_order = [X_pca[clusters == c, 0].mean() for c in range(3)]
-label_map = {c: rank for rank, c in enumerate(sorted(range(3), key=lambda i: cluster_order[i]))}
-cluster_labels = [label_map[c] for c in clusters]
+print(f"PCA explained variance: {pca.explained_variance_ratio_.sum():.2%}")
 
-risk_names  = {0: 'Low Risk', 1: 'Moderate Risk', 2: 'High Risk'}
-risk_colors = {0: '#2ecc71',  1: '#f39c12',       2: '#e74c3c'}
+# 4. Scatter plot (or density raster at large N)
+zenith_mode = resolve_render_mode(ZENITH_RENDER_MODE, len(X_pca))
+print(f"Zenith render mode: {zenith_mode}  ({len(X_pca):,} points)")
 
-# 4. Scatter plot
 fig, ax = plt.subplots(figsize=(10, 7))
-for group_id in range(3):
-    mask = [cl == group_id for cl in cluster_labels]
-    ax.scatter(
-        X_pca[mask, 0], X_pca[mask, 1],
-        c=risk_colors[group_id],
-        label=risk_names[group_id],
-        alpha=0.55, s=18, edgecolors='none',
+if zenith_mode == 'density':
+    rgba, extent = group_density_image(
+        X_pca[:, 0], X_pca[:, 1], cluster_labels,
+        colors=[risk_colors[g] for g in range(3)],
     )
+    draw_density(ax, rgba, extent)
+    for group_id in range(3):
+        ax.scatter([], [], c=risk_colors[group_id], label=risk_names[group_id], s=18)
+else:
+    for group_id in range(3):
+        mask = cluster_labels == group_id
+        ax.scatter(
+            X_pca[mask, 0], X_pca[mask, 1],
+            c=risk_colors[group_id],
+            label=risk_names[group_id],
+            alpha=0.55, s=18, edgecolors='none',
+        )
 
 # Plot cluster centroids
 centroids_pca = kmeans.cluster_centers_  # kmeans.cluster_centers_ is already in PCA space
@@ -1149,9 +1522,77 @@ plt.tight_layout()
 plt.show()
 
 # Summary
+group_counts = np.bincount(cluster_labels, minlength=3)
 for g in range(3):
-    count = sum(1 for cl in cluster_labels if cl == g)
-    print(f"  {risk_names[g]:15s} → {count:,} patients")
+    print(f"  {risk_names[g]:15s} → {group_counts[g]:,} patients")
+
+"""### ⏱️ Zenith Render Benchmark — Scatter vs. Density
+
+| Property | Detail |
+|---|---|
+| **Purpose** | Measure how Zenith rendering scales with the number of plotted patients |
+| **Input** | Synthetic 3-cluster PCA cloud at 10k, 1M and 10M points (no real data needed) |
+| **Method** | Off-screen Agg canvas; times a full `canvas.draw()` for per-marker `scatter` vs. the pre-aggregated density raster (binning included) |
+| **Output** | `zenith_bench_df` — render seconds per mode and N. Scatter is skipped above `SCATTER_BENCH_MAX` to avoid exhausting memory |
+| **Gate** | Runs only with `RUN_BENCHMARKS = True` |
+"""
+
+# ══════════════════════════════════════════════════════════════
+#  ZENITH RENDER BENCHMARK — Scatter vs. Density Raster
+# ══════════════════════════════════════════════════════════════
+
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+BENCH_SIZES       = [10_000, 1_000_000, 10_000_000]
+SCATTER_BENCH_MAX = 1_000_000
+
+
+def _synthetic_zenith_cloud(n, seed=42):
+    """Three Gaussian blobs in PCA space with their group ids."""
+    rng = np.random.default_rng(seed)
+    groups = rng.integers(0, 3, size=n)
+    centers = np.array([[-2.0, 0.0], [0.0, 1.0], [2.5, -0.5]])
+    pts = centers[groups] + rng.standard_normal((n, 2))
+    return pts, groups
+
+
+def _time_render(pts, groups, mode):
+    """Seconds to build and fully rasterize one Zenith figure off-screen."""
+    fig = Figure(figsize=(10, 7))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    t0 = time.perf_counter()
+    if mode == 'density':
+        rgba, extent = group_density_image(
+            pts[:, 0], pts[:, 1], groups,
+            colors=[risk_colors[g] for g in range(3)],
+        )
+        draw_density(ax, rgba, extent)
+    else:
+        for g in range(3):
+            mask = groups == g
+            ax.scatter(pts[mask, 0], pts[mask, 1], c=risk_colors[g],
+                       alpha=0.55, s=18, edgecolors='none')
+    fig.canvas.draw()
+    return time.perf_counter() - t0
+
+
+if RUN_BENCHMARKS:
+    bench_rows = []
+    for n in BENCH_SIZES:
+        pts, groups = _synthetic_zenith_cloud(n)
+        row = {'Points': n, 'Density (s)': _time_render(pts, groups, 'density')}
+        row['Scatter (s)'] = (_time_render(pts, groups, 'scatter')
+                              if n <= SCATTER_BENCH_MAX else np.nan)
+        bench_rows.append(row)
+        del pts, groups
+
+    zenith_bench_df = pd.DataFrame(bench_rows).set_index('Points')
+    print(zenith_bench_df.round(3).to_string())
+    print("✅ Zenith Render Benchmark Complete.")
+else:
+    print("⏭️  Zenith Render Benchmark skipped (RUN_BENCHMARKS = False).")
 
 """### 📉 Permutation Importance — Feature Robustness Check
 
@@ -1241,6 +1682,7 @@ print("✅ Permutation Importance Complete.")
 | **Visualization** | **Beeswarm Plot** — Shows the distribution of SHAP values for each feature |
 | **Interpretation** | **Color:** Feature Value (Red = High, Blue = Low) <br> **X-Axis:** Impact on Model Output (Right = Drives Risk Up, Left = Drives Risk Down) |
 | **Example** | If "High Blood Pressure" (Red dots) is on the right side, it means high BP increases CVD risk |
+| **Rendering Mode** | `ORACLE_RENDER_MODE` — `'density'` bins each feature's SHAP values into a row of the raster, coloured by the mean (normalized) feature value per bin, with opacity ∝ log(count). Used automatically when the dot count exceeds `DENSITY_SWITCH_POINTS` |
 """
 
 # ══════════════════════════════════════════════════════════════
@@ -1249,31 +1691,52 @@ print("✅ Permutation Importance Complete.")
 
 import shap
 import matplotlib.pyplot as plt
+from myo_ai.explain import shap_density_image
+
+ORACLE_N_EXPLAIN    = 300      # rows explained for the global view
+ORACLE_RENDER_MODE  = 'auto'   # 'scatter' | 'density' | 'auto'
+ORACLE_MAX_DISPLAY  = 20       # features shown (top by mean |SHAP|)
 
 # 1. Initialize Explainer
-explainer = shap.TreeExplainer(myocore_model)
-n_explain = min(300, myocore_X_test.shape[0])
+n_explain = min(ORACLE_N_EXPLAIN, myocore_X_test.shape[0])
 X_explain = myocore_X_test[:n_explain]
 
 # 2. Calculate SHAP values
-shap_values = explainer.shap_values(X_explain)
+explainer, shap_values = explain.tree_shap_values(myocore_model, X_explain)
+# Model-side names: the imputer drops all-NaN training columns (e.g. HRV on single beats)
+oracle_feature_names = myocore_pipeline[:-1].get_feature_names_out(myocore_feature_names).tolist()
 
 print("Oracle Layer: Computing feature-level SHAP impact...")
-plt.figure(figsize=(12, 8))
-
-# 3. Draw Beeswarm
-shap.summary_plot(
-    shap_values,
-    X_explain,
-    feature_names=myocore_feature_names,
-    plot_type="dot",
-    show=False,
-)
+with telemetry.stage('Oracle · beeswarm plot', rows=n_explain):
+    oracle_mode = resolve_render_mode(ORACLE_RENDER_MODE, shap_values.size)
+    plt.figure(figsize=(12, 8))
+
+    # 3. Draw Beeswarm (or its density raster at large N)
+    if oracle_mode == 'density':
+        rgba, extent, shown = shap_density_image(shap_values, X_explain,
+                                                 max_display=ORACLE_MAX_DISPLAY)
+        ax = plt.gca()
+        draw_density(ax, rgba, extent)
+        ax.set_yticks(range(len(shown)))
+        ax.set_yticklabels([oracle_feature_names[i] for i in shown], fontsize=11)
+        ax.axvline(0, color='#999999', linewidth=0.8)
+        ax.set_xlabel('SHAP value (impact on model output)', fontsize=12)
+        plt.colorbar(plt.cm.ScalarMappable(cmap='coolwarm'), ax=ax,
+                     ticks=[0, 1], label='Feature value').ax.set_yticklabels(['Low', 'High'])
+    else:
+        shap.summary_plot(
+            shap_values,
+            X_explain,
+            feature_names=oracle_feature_names,
+            plot_type="dot",
+            max_display=ORACLE_MAX_DISPLAY,
+            show=False,
+        )
 
-plt.title("Oracle Layer: Multimodal Feature Impact (SHAP Analysis)",
-          fontsize=16, fontweight='bold')
-plt.tight_layout()
-plt.show()
+    plt.title("Oracle Layer: Multimodal Feature Impact (SHAP Analysis)",
+              fontsize=16, fontweight='bold')
+    plt.tight_layout()
+    plt.show()
 
 print("✅ Oracle Layer Beeswarm Complete.")
 
@@ -1301,20 +1764,21 @@ print(f"🔎 Analyzing High-Risk Patient at Index: {patient_idx}")
 
 # 2. Draw Force Plot
 # Note: matplotlib=True allows it to render as a static image in the notebook
-plt.figure(figsize=(20, 4))
-shap.force_plot(
-    explainer.expected_value,
-    shap_values[patient_idx],
-    X_explain[patient_idx], # Corrected: Changed .iloc to direct indexing
-    feature_names=myocore_feature_names,
-    matplotlib=True,
-    show=False
-)
+with telemetry.stage('Oracle · force plot', rows=1):
+    plt.figure(figsize=(20, 4))
+    shap.force_plot(
+        explainer.expected_value,
+        shap_values[patient_idx],
+        X_explain[patient_idx], # Corrected: Changed .iloc to direct indexing
+        feature_names=oracle_feature_names,
+        matplotlib=True,
+        show=False
+    )
 
-plt.title(f"Force Plot: Feature 'Tug-of-War' for Patient #{patient_idx}",
-          fontsize=14, fontweight='bold', y=1.5)
-plt.tight_layout()
-plt.show()
+    plt.title(f"Force Plot: Feature 'Tug-of-War' for Patient #{patient_idx}",
+              fontsize=14, fontweight='bold', y=1.5)
+    plt.tight_layout()
+    plt.show()
 
 print("✅ Oracle Layer Force Plot Complete.")
 
@@ -1339,21 +1803,22 @@ shap_explanation = shap.Explanation(
     values=shap_values[patient_idx],
     base_values=explainer.expected_value,
     data=X_explain[patient_idx], # Corrected: Changed .iloc to direct indexing
-    feature_names=myocore_feature_names
+    feature_names=oracle_feature_names
 )
 
 # 2. Draw Waterfall Plot
-plt.figure(figsize=(8, 8)) # Vertical plots need standard aspect ratio
-shap.plots.waterfall(
-    shap_explanation,
-    max_display=12,
-    show=False
-)
+with telemetry.stage('Oracle · waterfall plot', rows=1):
+    plt.figure(figsize=(8, 8)) # Vertical plots need standard aspect ratio
+    shap.plots.waterfall(
+        shap_explanation,
+        max_display=12,
+        show=False
+    )
 
-plt.title(f"Waterfall Plot: Decision Path for Patient #{patient_idx}",
-          fontsize=14, fontweight='bold')
-plt.tight_layout()
-plt.show()
+    plt.title(f"Waterfall Plot: Decision Path for Patient #{patient_idx}",
+              fontsize=14, fontweight='bold')
+    plt.tight_layout()
+    plt.show()
 
 print("✅ Oracle Layer Waterfall Plot Complete.")
 
@@ -1373,18 +1838,19 @@ print("✅ Oracle Layer Waterfall Plot Complete.")
 
 import matplotlib.pyplot as plt
 
-plt.figure(figsize=(12, 6))
-shap.summary_plot(
-    shap_values,
-    X_explain,
-    feature_names=myocore_feature_names,
-    plot_type="bar",
-    show=False,
-)
-plt.title("Oracle Layer: Mean |SHAP| Feature Importance",
-          fontsize=14, fontweight='bold')
-plt.tight_layout()
-plt.show()
+with telemetry.stage('Oracle · bar plot', rows=n_explain):
+    plt.figure(figsize=(12, 6))
+    shap.summary_plot(
+        shap_values,
+        X_explain,
+        feature_names=oracle_feature_names,
+        plot_type="bar",
+        show=False,
+    )
+    plt.title("Oracle Layer: Mean |SHAP| Feature Importance",
+              fontsize=14, fontweight='bold')
+    plt.tight_layout()
+    plt.show()
 
 print("✅ Oracle Layer Bar Plot Complete.")
 
@@ -1394,8 +1860,9 @@ print("✅ Oracle Layer Bar Plot Complete.")
 |---|---|
 | **Purpose** | Interactive digital twin for patient risk simulation and 20-year projection |
 | **Input** | User widget controls (age, BP, cholesterol, weight, height, smoker, active, years ahead) |
-| **Output** | Gauge chart (current risk), line plot (20-year risk projection), stats panel |
-| **Design** | Uses `ipywidgets`, `matplotlib`, and Myo-Core's fitted pipeline for real-time inference |
+| **Output** | Gauge chart (current risk), line plot (20-year risk projection), stats panel; above 50 % risk, the smallest lever changes that bring it below |
+| **Design** | Uses `ipywidgets`, `matplotlib`, and Myo-Core's fitted pipeline wrapped in its exported calibrator (`biodeck_model`) for real-time inference |
+| **Counterfactuals** | `counterfactual.counterfactuals` scores every combination of systolic / diastolic BP, cholesterol, weight and smoking changes (within Catalyst's BP clips) in one batched call, coarsening the grid to stay within `COUNTERFACTUAL_LATENCY_MS` |
 """
 
 # ══════════════════════════════════════════════════════════════
@@ -1405,121 +1872,21 @@ print("✅ Oracle Layer Bar Plot Complete.")
 import ipywidgets as widgets
 from IPython.display import display, clear_output
 import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
-import numpy as np
-import pandas as pd
+from myo_ai.simulate import draw_gauge, draw_chronos_projection
+from myo_ai import counterfactual
+
+RISK_THRESHOLD = 0.5
+
+biodeck_model = calibration.CalibratedModel(myocore_pipeline, CALIBRATOR_PATH,
+                                            model_name='Myo-Core Engine (HGBC)')
 
 
 def _predict_risk(age, sys_bp, dia_bp, cholesterol, weight, height,
                   smoker, active, years_future=0):
-    """
-    Build a single-patient feature vector matching the Myo-Core
-    pipeline's training schema, then return P(CVD).
-    """
-    sim_age = age + years_future
-    bmi = weight / ((height / 100) ** 2) if height > 0 else 0
-    pulse_pressure = sys_bp - dia_bp
-
-    # Start from zeros matching model feature order
-    feature_names = myocore_X.columns.tolist()
-    patient = {f: 0.0 for f in feature_names}
-
-    # Map widget inputs → canonical feature names
-    mapping = {
-        'age': sim_age,
-        'ap_hi': sys_bp, 'sys_bp': sys_bp, 'restingbp': sys_bp,
-        'ap_lo': dia_bp,
-        'cholesterol': cholesterol,
-        'weight': weight,
-        'height': height,
-        'bmi': bmi,
-        'pulse_pressure': pulse_pressure,
-        'smoke': int(smoker),
-        'active': int(active),
-        'sensor_signal_available': 0,
-    }
-    for key, val in mapping.items():
-        if key in patient:
-            patient[key] = val
-
-    df_patient = pd.DataFrame([patient], columns=feature_names)
-    df_imputed = myocore_imputer.transform(df_patient)
-    df_scaled  = myocore_scaler.transform(df_imputed)
-    prob = myocore_model.predict_proba(df_scaled)[:, 1][0]
-    return prob
-
-
-def _draw_gauge(ax, prob):
-    """Render a semicircular gauge chart for CVD risk probability."""
-    ax.clear()
-    ax.set_aspect('equal')
-    ax.set_xlim(-1.3, 1.3)
-    ax.set_ylim(-0.3, 1.4)
-    ax.axis('off')
-
-    # Background arc segments (green → yellow → red)
-    n_seg = 100
-    for i in range(n_seg):
-        frac = i / n_seg
-        angle = np.pi * (1 - frac)  # pi → 0
-        if frac < 0.4:
-            color = '#2ecc71'
-        elif frac < 0.7:
-            color = '#f39c12'
-        else:
-            color = '#e74c3c'
-        a1 = np.degrees(np.pi - frac * np.pi)
-        a2 = np.degrees(np.pi - (frac + 1/n_seg) * np.pi)
-        wedge = mpatches.Wedge((0, 0), 1.0, min(a1, a2), max(a1, a2),
-                               width=0.25, color=color, alpha=0.35)
-        ax.add_patch(wedge)
-
-    # Needle
-    needle_angle = np.pi * (1 - prob)
-    nx = 0.85 * np.cos(needle_angle)
-    ny = 0.85 * np.sin(needle_angle)
-    ax.annotate('', xy=(nx, ny), xytext=(0, 0),
-                arrowprops=dict(arrowstyle='->', color='black', lw=2.5))
-    ax.plot(0, 0, 'ko', markersize=8)
-
-    # Labels
-    status = 'HIGH RISK' if prob > 0.5 else 'LOW RISK'
-    status_color = '#e74c3c' if prob > 0.5 else '#2ecc71'
-    ax.text(0, -0.15, f'{prob:.1%}', ha='center', va='center',
-            fontsize=28, fontweight='bold', color=status_color)
-    ax.text(0, 1.25, 'CVD Risk Gauge', ha='center', va='center',
-            fontsize=14, fontweight='bold')
-    ax.text(-1.1, -0.05, '0%', fontsize=9, ha='center')
-    ax.text(1.1, -0.05, '100%', fontsize=9, ha='center')
-    ax.text(0, -0.30, status, ha='center', fontsize=13,
-            fontweight='bold', color=status_color,
-            bbox=dict(boxstyle='round,pad=0.3', facecolor=status_color,
-                      alpha=0.15, edgecolor=status_color))
-
-
-def _draw_chronos_projection(ax, age, sys_bp, dia_bp, cholesterol,
-                              weight, height, smoker, active):
-    """Plot projected CVD risk over the next 20 years."""
-    ax.clear()
-    years = list(range(0, 21))
-    risks = [
-        _predict_risk(age, sys_bp, dia_bp, cholesterol, weight, height,
-                      smoker, active, y)
-        for y in years
-    ]
-    ages = [age + y for y in years]
-
-    ax.fill_between(ages, risks, alpha=0.15, color='#e74c3c')
-    ax.plot(ages, risks, 'o-', color='#e74c3c', linewidth=2.5,
-            markersize=5, label='Projected CVD Risk')
-    ax.axhline(y=0.5, color='gray', linestyle='--', alpha=0.6, label='Risk Threshold (50%)')
-
-    ax.set_xlabel('Age (years)', fontsize=12)
-    ax.set_ylabel('CVD Probability', fontsize=12)
-    ax.set_title('Chronos Engine: 20-Year Risk Projection', fontsize=14, fontweight='bold')
-    ax.set_ylim(-0.02, 1.02)
-    ax.legend(loc='upper left', fontsize=10)
-    ax.grid(True, alpha=0.3)
+    """Calibrated P(CVD) from the Myo-Core pipeline for the simulated patient."""
+    return simulate.predict_risk(biodeck_model, myocore_feature_names,
+                                 age, sys_bp, dia_bp, cholesterol, weight,
+                                 height, smoker, active, years_future)
 
 
 # ═══════════════════════════════════════════════════════
@@ -1581,8 +1948,10 @@ def _on_change(*args):
         ax_gauge = fig.add_subplot(gs[0, 0])
         ax_line  = fig.add_subplot(gs[0, 2])
 
-        _draw_gauge(ax_gauge, prob)
-        _draw_chronos_projection(ax_line, age, sys_, dia_, chol, wt, ht, smoke, act)
+        draw_gauge(ax_gauge, prob)
+        ages, risks = simulate.chronos_projection(biodeck_model, myocore_feature_names,
+                                                  age, sys_, dia_, chol, wt, ht, smoke, act)
+        draw_chronos_projection(ax_line, ages, risks)
 
         # Highlight current year marker on projection
         ax_line.axvline(x=age + yrs, color='#3498db', linestyle='-', lw=2, alpha=0.7)
@@ -1602,9 +1971,24 @@ def _on_change(*args):
         print(f"  BMI               : {bmi:.1f}")
         print(f"  Pulse Pressure    : {pp} mmHg")
         print(f"  CVD Probability   : {prob:.2%}")
-        print(f"  Status            : {'██ HIGH RISK' if prob > 0.5 else '██ LOW RISK'}")
+        print(f"  Status            : {'██ HIGH RISK' if prob > RISK_THRESHOLD else '██ LOW RISK'}")
         print("─" * 52)
 
+        # ══ What would lower my risk? ═══════════════════
+        if prob > RISK_THRESHOLD:
+            patient = simulate.patient_frame(myocore_feature_names, age, sys_, dia_, chol,
+                                             wt, ht, smoke, act, yrs)
+            cf = counterfactual.counterfactuals(biodeck_model, patient,
+                                                threshold=RISK_THRESHOLD)
+            print(f"  What would lower my risk?  ({cf['candidates']:,} candidates "
+                  f"in {cf['latency_ms']:.0f} ms)")
+            for rank, option in cf['options'].iterrows():
+                print(f"   {rank}. {option['changes']}  →  {option['risk']:.1%}")
+            if cf['options'].empty:
+                print("   No combination of the levers brings the risk below "
+                      f"{RISK_THRESHOLD:.0%}.")
+            print("─" * 52)
+
 
 # ══ Wire up all widgets to the callback ════════════════
 for w in [w_age, w_sys_bp, w_dia_bp, w_cholesterol, w_weight,
@@ -1640,13 +2024,170 @@ _on_change()
 
 print("\n✅ Myo-Sim Bio-Deck with Chronos Engine deployed.")
 
+"""### 🌍 Chronos Cohort — Population Risk Trajectories
+
+| Property | Detail |
+|---|---|
+| **Purpose** | Forecast the risk distribution of the whole enrolled population over 20 years, under ageing and intervention scenarios |
+| **Input** | `myocore_X` — every MASTER_DATA patient in the training schema — scored by the calibrated Myo-Core model (`biodeck_model`), so the population view, the Bio-Deck's single-patient Chronos and the 0.5 high-risk cut all use calibrated probabilities |
+| **Scenarios** | `COHORT_SCENARIOS` — `ageing` (baseline), `sbp_minus_10` (−10 mmHg systolic, every source's systolic column), `smoking_cessation`; custom specs are dicts of `shift` / `fix` / `scale` per column (`cohort.Scenario`) |
+| **Engine** | `cohort.project_cohort` stacks each chunk of `COHORT_CHUNK_PATIENTS` patients into one (years × patients) matrix per scenario — a single `predict_proba` call instead of one per patient — and scores the chunks on a joblib process pool |
+| **Output** | `trajectories.parquet` (risk per patient and year) and `quantiles.parquet` (per-year mean, quantiles and high-risk share from mergeable risk histograms) in `COHORT_OUTPUT_DIR`; fan chart of the median and interquartile band per scenario |
+"""
+
+# ══════════════════════════════════════════════════════════════
+#  CHRONOS COHORT — Population Risk Trajectories under Scenarios
+# ══════════════════════════════════════════════════════════════
+
+import matplotlib.pyplot as plt
+from myo_ai import cohort
+
+COHORT_SCENARIOS      = ['ageing', 'sbp_minus_10', 'smoking_cessation']
+COHORT_CHUNK_PATIENTS = cohort.COHORT_CHUNK_PATIENTS
+COHORT_OUTPUT_DIR     = cohort.COHORT_OUTPUT_DIR
+
+cohort_df = cohort.project_cohort(
+    biodeck_model, myocore_X, COHORT_SCENARIOS,
+    ids=MASTER_DATA.loc[myocore_X.index, 'id'],
+    output_dir=COHORT_OUTPUT_DIR, chunk_patients=COHORT_CHUNK_PATIENTS,
+)
+
+fig, ax = plt.subplots(figsize=(11, 6))
+for (name, g), color in zip(cohort_df.groupby('scenario', sort=False),
+                            ['#e74c3c', '#3498db', '#2ecc71', '#9b59b6']):
+    ax.fill_between(g['year'], g['q25'], g['q75'], color=color, alpha=0.15)
+    ax.plot(g['year'], g['q50'], 'o-', color=color, lw=2, ms=4, label=f'{name} (median, IQR)')
+ax.set_xlabel('Years from today', fontsize=12)
+ax.set_ylabel('CVD Probability', fontsize=12)
+ax.set_title('Chronos Cohort: Population Risk Trajectories by Scenario', fontsize=14, fontweight='bold')
+ax.set_ylim(-0.02, 1.02)
+ax.legend(loc='upper left', fontsize=10)
+ax.grid(True, alpha=0.3)
+plt.tight_layout()
+plt.show()
+
+horizon = cohort_df[cohort_df['year'] == cohort_df['year'].max()]
+for _, r in horizon.iterrows():
+    print(f"  {r['scenario']:<18} year {r['year']}: mean risk {r['mean']:.1%}, "
+          f"high-risk share {r['high_risk_share']:.1%}")
+
+"""### 🛰️ Drift Monitor — Scored Traffic vs. Training Distribution
+
+| Property | Detail |
+|---|---|
+| **Purpose** | Detect incoming patients that drift from the MASTER_DATA training distribution, and shifts in predicted risk, once Myo-Core is deployed |
+| **Reference** | `drift.DriftMonitor.fit` — `DRIFT_BINS` quantile bins per training feature (plus tails and a missing bin) and `PROB_BUCKETS` buckets of Myo-Core's out-of-fold P(CVD) (the cached Myo-Stack OOF vector — in-sample scores are overconfident and would flag held-out traffic as drift), saved to `DRIFT_MONITOR_PATH` |
+| **Streaming** | `drift.MonitoredModel` updates fixed-size histograms on every `predict_proba` batch — O(bins) memory per feature, one `searchsorted` per column and a single `bincount` |
+| **Traffic** | Held-out patients in `DRIFT_BATCH` batches, then the same patients aged 8 years with +15 mmHg systolic BP (`cohort.Scenario`) |
+| **Output** | PSI and binned KS per feature and for the predicted risk (stable < 0.1 ≤ moderate < 0.25 ≤ significant), per-bucket PSI of P(CVD), PSI bar chart |
+"""
+
+# ══════════════════════════════════════════════════════════════
+#  DRIFT MONITOR — Streaming Histograms over Scored Batches
+# ══════════════════════════════════════════════════════════════
+
+import time
+import matplotlib.pyplot as plt
+from myo_ai import drift, ensemble
+
+DRIFT_MONITOR_PATH = os.path.join('artifacts', 'drift_monitor.npz')
+DRIFT_BATCH        = 5_000
+
+drift_oof = ensemble.oof_probabilities({'Myo-Core Engine (HGBC)': myocore_pipeline},
+                                       myocore_X_train_raw, myocore_y_train)   # cached by Myo-Stack
+drift_monitor = drift.DriftMonitor.fit(myocore_X_train_raw, drift_oof['Myo-Core Engine (HGBC)'])
+os.makedirs(os.path.dirname(DRIFT_MONITOR_PATH), exist_ok=True)
+drift_monitor.save(DRIFT_MONITOR_PATH)
+monitored_model = drift.MonitoredModel(myocore_pipeline, drift_monitor)
+
+
+def _score_traffic(X):
+    """Score *X* batch by batch through the monitor → (seconds scoring, seconds monitoring)."""
+    t_score = t_monitor = 0.0
+    for a in range(0, len(X), DRIFT_BATCH):
+        batch = X.iloc[a:a + DRIFT_BATCH]
+        t0 = time.perf_counter()
+        P = myocore_pipeline.predict_proba(batch)
+        t1 = time.perf_counter()
+        drift_monitor.update(batch, P[:, 1])
+        t_score, t_monitor = t_score + t1 - t0, t_monitor + time.perf_counter() - t1
+    return t_score, t_monitor
+
+
+drift_reports = {}
+t_score, t_monitor = _score_traffic(myocore_X_test_raw)
+drift_reports['Held-out patients'] = drift_monitor.report()
+print(f"🛰️ {drift_monitor.n_observed:,} scored rows — monitoring took {t_monitor * 1e3:.0f} ms "
+      f"next to {t_score * 1e3:.0f} ms of scoring ({t_monitor / t_score:.1%})")
+
+shifted = cohort.Scenario('older_hypertensive',
+                          shift={'age': 8, **{c: 15 for c in cohort.SYSTOLIC_COLUMNS}})
+drift_monitor.reset()
+monitored_model.predict_proba(pd.DataFrame(
+    shifted.apply(myocore_X_test_raw.to_numpy(dtype=np.float64), myocore_feature_names),
+    columns=myocore_feature_names, index=myocore_X_test_raw.index))
+drift_reports['Aged +8y, SBP +15'] = drift_monitor.report()
+
+for name, rep in drift_reports.items():
+    print(f"\n  {name}: {(rep['Status'] == 'significant').sum()} significant, "
+          f"{(rep['Status'] == 'moderate').sum()} moderate")
+    print(rep.head(6).round(3).to_string(index=False))
+print("\n  Predicted-risk buckets (Aged +8y, SBP +15):")
+print(drift_monitor.bucket_report().round(3).to_string(index=False))
+
+top = drift_reports['Aged +8y, SBP +15'].head(12)['Feature'].tolist()
+fig, ax = plt.subplots(figsize=(11, 6))
+y = np.arange(len(top))
+for k, ((name, rep), color) in enumerate(zip(drift_reports.items(), ['#3498db', '#e74c3c'])):
+    ax.barh(y + 0.4 * k, rep.set_index('Feature').loc[top, 'PSI'], height=0.4,
+            color=color, label=name)
+ax.axvline(drift.PSI_MODERATE, color='#f39c12', ls='--', lw=1.5, label='Moderate (0.1)')
+ax.axvline(drift.PSI_SIGNIFICANT, color='#c0392b', ls='--', lw=1.5, label='Significant (0.25)')
+ax.set_yticks(y + 0.2)
+ax.set_yticklabels(top)
+ax.invert_yaxis()
+ax.set_xlabel('Population Stability Index', fontsize=12)
+ax.set_title('Drift Monitor: PSI per Feature vs. Training Distribution', fontsize=14, fontweight='bold')
+ax.legend(loc='lower right', fontsize=10)
+ax.grid(True, axis='x', alpha=0.3)
+plt.tight_layout()
+plt.show()
+
+print(f"✅ Drift Monitor Complete  →  {DRIFT_MONITOR_PATH}")
+
+"""### 📊 Run Telemetry — Stage Profile
+
+| Property | Detail |
+|---|---|
+| **Purpose** | Show where this run's time and memory went — ingestion, merging, contestant fits, SHAP or plotting |
+| **Recorder** | `telemetry.RUN` — engines are decorated with `telemetry.profiled` (Synapse, Pulse, Catalyst, `train.fit_and_score`, `explain.tree_shap_values`); the Pulse-Sync, Myo-Stack and SHAP plot cells use `telemetry.stage` |
+| **Metrics** | Wall time, CPU time (this process, all threads), peak RSS (kernel high-water mark, reset per stage) and rows processed |
+| **Output** | `telemetry_df` summary table (nested stages indented under their parent) and the structured JSON record of every stage at `TELEMETRY_PATH` |
+"""
+
+# ══════════════════════════════════════════════════════════════
+#  RUN TELEMETRY — Stage Profile & JSON Export
+# ══════════════════════════════════════════════════════════════
+
+TELEMETRY_PATH = telemetry.TELEMETRY_PATH
+
+telemetry_df = telemetry.RUN.summary()
+print(telemetry_df.round({'Wall (s)': 2, 'CPU (s)': 2, 'CPU / Wall': 2, 'Peak RSS (MB)': 0, 'Rows / s': 0})
+      .to_string(index=False))
+
+slowest = telemetry_df[~telemetry_df['Stage'].str.startswith(' ')].nlargest(3, 'Wall (s)')
+print(f"\n⏱️ Slowest stages: " + ", ".join(f"{s.strip()} ({w:.1f}s)"
+                                        for s, w in zip(slowest['Stage'], slowest['Wall (s)'])))
+print(f"✅ Run Telemetry Complete — {len(telemetry.RUN.records)} stage records → "
+      f"{telemetry.RUN.to_json(TELEMETRY_PATH)}")
+
 """### 💾 Layer 4 — The Archive (Model Export)
 
 | Property | Detail |
 |---|---|
 | **Purpose** | Serialize the winning model pipeline for deployment in external applications |
 | **Format** | `myocore_pipeline.pkl` (Python Pickle format via Joblib) |
-| **Contents** | 1. `SimpleImputer` (Handles missing values) <br> 2. `StandardScaler` (Normalizes data) <br> 3. `HistGradientBoostingClassifier` (The trained model) |
+| **Contents** | 1. `StreamingMedianImputer` (Handles missing values) <br> 2. `StandardScaler` (Normalizes data) <br> 3. `HistGradientBoostingClassifier` (The trained model) |
 | **Verification** | MD5 Checksum generated to ensure file integrity during transfer |
 """
 
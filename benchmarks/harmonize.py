@@ -0,0 +1,124 @@
+"""
+Synapse harmonization across many source feeds.
+
+Writes `--sources` synthetic hospital feeds, cycling through the three
+Kaggle-style schemas.  Every feed also carries its own lab columns, so
+the raw column union is wide and sparse.  Some feeds report height /
+weight in inches / pounds or age in days.  Each feed gets a
+`SourceAdapter`, and the feeds are harmonized three ways:
+
+- legacy concat      — per-source `pd.read_csv` → rename / convert → outer `pd.concat`
+- adapters (union)   — `sources.harmonize` with ``schema=None`` (every column kept)
+- adapters (schema)  — `sources.harmonize` projected onto `CANONICAL_COLUMNS`
+
+The adapter results are checked against the matching legacy columns;
+wall time, CPU time and peak RSS of each run are reported via `telemetry`.
+
+Usage
+-----
+    python benchmarks/harmonize.py [--sources 12] [--rows 2000000] [--lab-columns 6]
+"""
+
+import argparse
+import gc
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from myo_ai import sources, synthetic, telemetry                  # noqa: E402
+
+KINDS = ('heart_attack', 'cardiac_failure', 'cardiac_failure_base')
+
+
+def write_feeds(directory: str, n_sources: int, n_rows: int, lab_columns: int,
+                seed: int = 0) -> tuple:
+    """Write the feeds → (paths, adapter keyword arguments per feed)."""
+    os.makedirs(directory, exist_ok=True)
+    rng = np.random.default_rng(seed)
+    paths, adapters = {}, []
+    per_source = n_rows // n_sources
+    for i in range(n_sources):
+        kind, name = KINDS[i % 3], f'hospital_{i:02d}'
+        if kind == 'heart_attack':
+            df = synthetic.heart_attack_chunk(rng, per_source)
+        elif kind == 'cardiac_failure':
+            df = synthetic.cardiac_failure_chunk(rng, per_source)
+        else:
+            df = synthetic.cardiac_base_chunk(rng, per_source, id_start=i * per_source)
+        for k in range(lab_columns):
+            df[f'lab_{name}_{k}'] = rng.normal(size=per_source).round(3)
+
+        units = {}
+        if kind == 'cardiac_failure_base' and i % 2:
+            df['height'] = (df['height'] / 2.54).round(1)
+            df['weight'] = (df['weight'] / 0.45359237).round(1)
+            df['age'] = df['age'] * 365
+            units = {'height': 'in', 'weight': 'lb', 'age': 'days'}
+        sep = ';' if kind == 'cardiac_failure_base' else ','
+        paths[name] = os.path.join(directory, f'{name}.csv')
+        df.to_csv(paths[name], sep=sep, index=False)
+        adapters.append(dict(name=name, tag=f'Hospital{i:02d}', reader={'sep': sep},
+                             rename=sources.CARDIAC_RENAME,
+                             dtypes={'id': str} if 'id' in df.columns else None, units=units))
+    return paths, adapters
+
+
+def legacy_harmonize(paths: dict, adapters: list) -> pd.DataFrame:
+    """The pre-adapter engine: read one by one, rename, convert, tag, outer concat."""
+    frames = []
+    for a in adapters:
+        df = a.read(paths[a.name])
+        for raw, factor in a.factors.items():
+            df[raw] = df[raw] * factor
+        df = df.rename(columns=a.canonical)
+        df['source'] = a.tag
+        frames.append(df)
+    return pd.concat(frames, axis=0, ignore_index=True, join='outer')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sources', type=int, default=12)
+    parser.add_argument('--rows', type=int, default=2_000_000)
+    parser.add_argument('--lab-columns', type=int, default=6)
+    parser.add_argument('--data-dir', default=os.path.join('cache', 'harmonize'))
+    args = parser.parse_args()
+
+    paths, specs = write_feeds(args.data_dir, args.sources, args.rows, args.lab_columns)
+    mb = sum(os.path.getsize(p) for p in paths.values()) / 1e6
+    print(f"Wrote {args.sources} feeds, {args.rows:,} rows, {mb:,.0f} MB → {args.data_dir}")
+    union = [sources.SourceAdapter(**s, schema=None) for s in specs]
+    canonical = [sources.SourceAdapter(**s) for s in specs]
+
+    telemetry.RUN.reset()
+    results = {}
+    for label, run in [('legacy concat', lambda: legacy_harmonize(paths, union)),
+                       ('adapters (union)', lambda: sources.harmonize(paths, union)[0]),
+                       ('adapters (schema)', lambda: sources.harmonize(paths, canonical)[0])]:
+        gc.collect()
+        with telemetry.stage(label, rows=args.rows):
+            df = run()
+        results[label] = (df.shape, df.isna().to_numpy().mean())
+        if label == 'legacy concat':
+            legacy = df
+        else:
+            pd.testing.assert_frame_equal(legacy[df.columns], df, check_dtype=False)
+        del df
+
+    print(f"\n{'Engine':<18} {'Wall':>8} {'CPU':>8} {'Peak RSS':>10} {'MB/s':>7} "
+          f"{'Columns':>8} {'Missing':>8}")
+    print('─' * 73)
+    for rec in telemetry.RUN.records:
+        (_, cols), missing = results[rec['stage']]
+        print(f"{rec['stage']:<18} {rec['wall_s']:>7.2f}s {rec['cpu_s']:>7.2f}s "
+              f"{rec['peak_rss_mb'] - rec['rss_start_mb']:>7.0f} MB {mb / rec['wall_s']:>7.1f} "
+              f"{cols:>8} {missing:>8.0%}")
+    print("  Peak RSS is measured above each run's starting RSS; adapter results match legacy.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+"""
+Per-stage import cost of the Myo AI package.
+
+Each stage is imported in a fresh interpreter under `python -X importtime`
+and the cumulative microseconds of every top-level import are summed.
+The "eager (legacy)" row reproduces the original notebook's global
+import cell for comparison.
+
+Usage
+-----
+    python benchmarks/import_time.py [--top N]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+STAGES = {
+    'ingest':          'import myo_ai.ingest',
+    'train':           'import myo_ai.train',
+    'tuning':          'import myo_ai.tuning',
+    'ensemble':        'import myo_ai.ensemble',
+    'evaluate':        'import myo_ai.evaluate',
+    'significance':    'import myo_ai.significance',
+    'calibration':     'import myo_ai.calibration',
+    'incremental':     'import myo_ai.incremental',
+    'outofcore':       'import myo_ai.outofcore',
+    'impute':          'import myo_ai.impute',
+    'telemetry':       'import myo_ai.telemetry',
+    'synthetic':       'import myo_ai.synthetic',
+    'registry':        'import myo_ai.registry',
+    'ecg_features':    'import myo_ai.ecg_features',
+    'sources':         'import myo_ai.sources',
+    'dag':             'import myo_ai.dag',
+    'pipeline':        'import myo_ai.pipeline',
+    'cohort':          'import myo_ai.cohort',
+    'counterfactual':  'import myo_ai.counterfactual',
+    'drift':           'import myo_ai.drift',
+    'explain':         'import myo_ai.explain',
+    'simulate':        'import myo_ai.simulate',
+    'pulse_sync_lite': 'import myo_ai.pulse_sync_lite',
+    'aegis_lite':      'import myo_ai.aegis_lite',
+    'pulse_cnn (TF)':  'import myo_ai.pulse_cnn',
+    'eager (legacy)':  ('import gdown, shap, numpy, pandas, seaborn, ipywidgets, '
+                        'matplotlib.pyplot, scipy.stats, sklearn.ensemble, '
+                        'sklearn.linear_model, sklearn.naive_bayes, sklearn.decomposition, '
+                        'sklearn.cluster, sklearn.inspection, tensorflow'),
+}
+
+
+def measure(statement: str):
+    """
+    Run *statement* under ``-X importtime``.
+
+    Returns
+    -------
+    (float, dict[str, float])
+        Total milliseconds of the top-level imports, and the cumulative
+        milliseconds of each root package imported at any depth.
+    """
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        cwd=REPO_ROOT, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"`{statement}` failed:\n{proc.stderr[-2000:]}")
+
+    total_ms, packages = 0.0, {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        if not cumulative.strip().isdigit():
+            continue                                  # header row
+        ms = int(cumulative) / 1000
+        if not name.startswith('  '):                 # top-level import
+            total_ms += ms
+        root = name.strip()
+        if '.' not in root:
+            packages[root] = max(packages.get(root, 0.0), ms)
+    return total_ms, packages
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--top', type=int, default=3,
+                        help='heaviest third-party packages listed per stage')
+    args = parser.parse_args()
+
+    # Interpreter start-up (site, encodings, …) is subtracted from every row
+    startup_ms, startup_pkgs = measure('pass')
+
+    print(f"{'Stage':<18} {'Import (ms)':>12}   Heaviest packages (ms)")
+    print('─' * 78)
+    for stage, statement in STAGES.items():
+        try:
+            total_ms, packages = measure(statement)
+        except RuntimeError as exc:
+            print(f"{stage:<18} {'n/a':>12}   {str(exc).splitlines()[-1]}")
+            continue
+        third_party = [(ms, name) for name, ms in packages.items()
+                       if name not in startup_pkgs and name != 'myo_ai']
+        heaviest = sorted(third_party, reverse=True)[:args.top]
+        detail = ', '.join(f"{name} {ms:.0f}" for ms, name in heaviest)
+        print(f"{stage:<18} {total_ms - startup_ms:>12.1f}   {detail}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+"""
+Out-of-core training under a peak-RSS budget.
+
+A synthetic MASTER_DATA-shaped Parquet file is written chunk by chunk
+(never held in memory), then `outofcore.train_out_of_core` trains
+Sentinel, Vanguard (SGD) and Myo-Core from it.  The script reports the
+time per pass, test ROC-AUCs, the HGBC row cap chosen by `memory_plan`
+and the measured peak RSS against the budget.
+
+Usage
+-----
+    python benchmarks/out_of_core.py [--rows 5000000] [--budget-mb 1024]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from myo_ai import outofcore                                      # noqa: E402
+
+N_FEATURES = 24
+CHUNK_ROWS = 250_000
+
+
+def write_synthetic(path: str, n_rows: int, row_group_rows: int, seed: int = 0):
+    """Stream a synthetic numeric MASTER_DATA (a third of rows miss half the columns)."""
+    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    rng = np.random.default_rng(seed)
+    coef = rng.normal(size=6)
+    writer = None
+    for start in range(0, n_rows, CHUNK_ROWS):
+        n = min(CHUNK_ROWS, n_rows - start)
+        X = rng.normal(size=(n, N_FEATURES))
+        logit = X[:, :6] @ coef + 0.5 * np.sin(3 * X[:, 6])
+        X[rng.random(n) < 1 / 3, N_FEATURES // 2:] = np.nan       # source without these columns
+        df = pd.DataFrame(X, columns=[f'feature_{j}' for j in range(N_FEATURES)])
+        df['target'] = (rng.random(n) < 1 / (1 + np.exp(-logit))).astype(float)
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        writer = writer or pq.ParquetWriter(path, table.schema)
+        writer.write_table(table, row_group_size=row_group_rows)
+    writer.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=5_000_000)
+    parser.add_argument('--budget-mb', type=float, default=outofcore.MEMORY_BUDGET_MB)
+    parser.add_argument('--row-group-rows', type=int, default=outofcore.ROW_GROUP_ROWS)
+    parser.add_argument('--path', default=os.path.join('cache', 'ooc_benchmark.parquet'))
+    args = parser.parse_args()
+
+    os.makedirs(os.path.dirname(args.path) or '.', exist_ok=True)
+    t0 = time.perf_counter()
+    write_synthetic(args.path, args.rows, args.row_group_rows)
+    print(f"Wrote {args.rows:,} rows × {N_FEATURES} features → {args.path} "
+          f"({os.path.getsize(args.path) / 2 ** 20:.0f} MB, {time.perf_counter() - t0:.1f}s)")
+
+    from sklearn.metrics import roc_auc_score
+    result = outofcore.train_out_of_core(args.path, budget_mb=args.budget_mb)
+
+    print(f"\n{'Pass':<22} {'Seconds':>8}")
+    print('─' * 31)
+    for name, seconds in result['timings'].items():
+        print(f"{name:<22} {seconds:>8.2f}")
+    print(f"\n{'Model':<26} {'ROC-AUC':>8}")
+    print('─' * 35)
+    for name, prob in result['probabilities'].items():
+        print(f"{name:<26} {roc_auc_score(result['y_test'], prob):>8.4f}")
+    print(f"\nHGBC rows      : {result['plan']['hgb_rows']:,}")
+    print(f"Peak RSS       : {result['peak_rss_mb']:.0f} MB  (budget {result['budget_mb']:.0f} MB) "
+          f"→ {'OK' if result['within_budget'] else 'OVER BUDGET'}")
+    sys.exit(0 if result['within_budget'] else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,241 @@
+"""
+Reproducible stage benchmarks on synthetic cardiac data.
+
+`synthetic.write_synthetic_sources` writes the four Synapse source files
+(no Google Drive needed), then every stage runs under `telemetry`:
+
+    Synapse harmonize → Pulse-Harmonization (moments, extended, windowed) →
+    Catalyst → each contestant's fit / predict (Aegis, Myo-Core,
+    Sentinel, Vanguard, Pulse-Sync) → Aegis Lite export parity (with an
+    all-NaN column) → SHAP values → Myo-Sim single-row
+    and Chronos latency → Chronos cohort projection (test split, every
+    preset scenario)
+
+The stages run `--repeats` times on the same files; each stage keeps its
+fastest wall / CPU time (the least noisy estimate) and its lowest peak
+RSS (later repeats inherit memory the first one left resident, e.g.
+TensorFlow).  Wall time, CPU time, peak RSS and rows per stage are written as
+JSON to `--output`.  With a baseline (`--baseline`, written by
+`--update-baseline`) every stage whose wall time exceeds the baseline by
+more than `--tolerance` (and `--min-seconds`) is flagged as a regression
+and the script exits with status 1.  Baselines only compare like with
+like: the row count, ECG length and CPU count are stored with them.
+
+Usage
+-----
+    python benchmarks/suite.py [--rows 10000] [--ecg-samples 187] [--repeats 3]
+                               [--baseline benchmarks/baseline.json]
+                               [--update-baseline] [--skip-pulse-sync]
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from myo_ai import (aegis_lite, cohort, ecg_features, explain, ingest, simulate,  # noqa: E402
+                    synthetic, telemetry, train)
+
+BASELINE_PATH = os.path.join('benchmarks', 'baseline.json')
+RESULTS_PATH = os.path.join('artifacts', 'benchmarks', 'latest.json')
+TOLERANCE = 0.25                # flag > 25 % slower than the baseline …
+MIN_SECONDS = 0.05              # … and at least this many seconds slower
+REPEATS = 3
+SHAP_ROWS = 500
+SIM_CALLS = 200
+PULSE_EPOCHS = 2
+
+SIM_PATIENT = dict(age=55, sys_bp=145, dia_bp=90, cholesterol=240, weight=88,
+                   height=172, smoker=True, active=False)
+
+
+def run_stages(paths: dict, shap_rows: int = SHAP_ROWS, sim_calls: int = SIM_CALLS,
+               pulse_sync: bool = True):
+    """Run every benchmarked stage on the source files in *paths* (recorded in `telemetry.RUN`)."""
+    df_tabular = ingest.SynapseIngestionEngine().ingest_and_harmonize(paths)
+    df_ecg = ingest.run_pulse_harmonization(paths['ecg_timeseries'])
+    ecg_features.run_pulse_features(paths['ecg_timeseries'])
+    ecg_features.run_pulse_windows(paths['ecg_timeseries'], memmap_path=os.path.join(
+        os.path.dirname(paths['ecg_timeseries']), 'ecg_signal.npy'))
+    master = ingest.CatalystFeatureSynthesizer().synthesize(df_tabular, df_ecg)
+
+    X, y = train.select_features(master)
+    X_train, X_test, y_train, y_test = train.stratified_split(X, y)
+    contestants = {
+        'Aegis Protocol (RF)':      train.build_aegis_pipeline(),
+        'Myo-Core Engine (HGBC)':   train.build_myocore_pipeline(),
+        'Sentinel Node (NB)':       train.build_sentinel_pipeline(),
+        'Vanguard System (LogReg)': train.build_vanguard_pipeline(),
+    }
+    aucs = {name: train.fit_and_score(pipe, X_train, y_train, X_test, y_test, name=name)['roc_auc']
+            for name, pipe in contestants.items()}
+
+    # Aegis Lite parity, with an all-NaN column the imputer drops
+    X_empty = X_train.assign(empty_feature=np.nan)
+    lean = train.build_aegis_pipeline(lean=True).fit(X_empty, y_train)
+    with telemetry.stage('Aegis Lite · export + parity', rows=len(X_empty)):
+        err = aegis_lite.parity_error(lean, X_empty, os.path.join(
+            os.path.dirname(paths['ecg_timeseries']), 'aegis_lite.npz'))
+    if err > aegis_lite.PARITY_ATOL:
+        raise RuntimeError(f"Aegis Lite differs from the sklearn forest by {err:.2e}")
+
+    if pulse_sync:
+        from myo_ai import pulse_cnn
+        prep = train.build_vanguard_pipeline()[:-1].fit(X_train)
+        X_fit, X_eval = prep.transform(X_train), prep.transform(X_test)
+        model = pulse_cnn.build_pulse_sync(X_fit.shape[1])
+        with telemetry.stage('Pulse-Sync (CNN) · fit', rows=len(X_fit)):
+            model.fit(pulse_cnn.make_pulse_dataset(X_fit, y_train.to_numpy(), shuffle=True),
+                      epochs=PULSE_EPOCHS, verbose=0)
+        with telemetry.stage('Pulse-Sync (CNN) · predict', rows=len(X_eval)):
+            prob = model.predict(pulse_cnn.make_pulse_dataset(X_eval, y_test.to_numpy()),
+                                 verbose=0).ravel()
+        from sklearn.metrics import roc_auc_score
+        aucs['Pulse-Sync (CNN)'] = roc_auc_score(y_test, prob)
+
+    myocore = contestants['Myo-Core Engine (HGBC)']
+    X_explain = myocore[:-1].transform(X_test.iloc[:shap_rows])
+    explain.tree_shap_values(myocore.named_steps['clf'], X_explain)
+
+    features = list(X.columns)
+    with telemetry.stage('Myo-Sim · single-row risk', rows=sim_calls):
+        for i in range(sim_calls):
+            simulate.predict_risk(myocore, features, **SIM_PATIENT, years_future=i % 5)
+    with telemetry.stage('Myo-Sim · Chronos projection', rows=sim_calls):
+        for _ in range(sim_calls):
+            simulate.chronos_projection(myocore, features, **SIM_PATIENT)
+    cohort.project_cohort(myocore, X_test, list(cohort.SCENARIOS), output_dir=os.path.join(
+        os.path.dirname(paths['ecg_timeseries']), 'cohort'))
+    return aucs
+
+
+def collect(records: list) -> dict:
+    """Telemetry records of one repeat → stage name → {wall_s, cpu_s, peak_rss_mb, rows}."""
+    stages = {}
+    for rec in records:
+        s = stages.setdefault(rec['stage'], {'wall_s': 0.0, 'cpu_s': 0.0, 'peak_rss_mb': 0.0,
+                                             'rows': None})
+        s['wall_s'] += rec['wall_s']
+        s['cpu_s'] += rec['cpu_s']
+        s['peak_rss_mb'] = max(s['peak_rss_mb'], rec['peak_rss_mb'])
+        if rec['rows'] is not None:
+            s['rows'] = (s['rows'] or 0) + int(rec['rows'])
+    return stages
+
+
+def best_of(repeats: list) -> dict:
+    """Per stage: fastest wall / CPU time and lowest peak RSS over the repeats."""
+    best = {}
+    for stages in repeats:
+        for name, s in stages.items():
+            if name not in best:
+                best[name] = dict(s)
+                continue
+            b = best[name]
+            b['wall_s'], b['cpu_s'] = min(b['wall_s'], s['wall_s']), min(b['cpu_s'], s['cpu_s'])
+            b['peak_rss_mb'] = min(b['peak_rss_mb'], s['peak_rss_mb'])
+    return best
+
+
+def compare(results: dict, baseline: dict, tolerance: float = TOLERANCE,
+            min_seconds: float = MIN_SECONDS) -> list:
+    """Rows of (stage, baseline s, current s, ratio, regressed); baseline s is None for new stages."""
+    rows = []
+    for name, cur in results['stages'].items():
+        base = baseline['stages'].get(name)
+        if base is None:
+            rows.append((name, None, cur['wall_s'], None, False))
+            continue
+        ratio = cur['wall_s'] / base['wall_s'] if base['wall_s'] > 0 else np.inf
+        regressed = ratio > 1 + tolerance and cur['wall_s'] - base['wall_s'] > min_seconds
+        rows.append((name, base['wall_s'], cur['wall_s'], ratio, regressed))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=10_000)
+    parser.add_argument('--ecg-samples', type=int, default=synthetic.ECG_SAMPLES)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeats', type=int, default=REPEATS)
+    parser.add_argument('--data-dir', default=os.path.join('cache', 'synthetic'))
+    parser.add_argument('--output', default=RESULTS_PATH)
+    parser.add_argument('--baseline', default=BASELINE_PATH)
+    parser.add_argument('--update-baseline', action='store_true')
+    parser.add_argument('--tolerance', type=float, default=TOLERANCE)
+    parser.add_argument('--min-seconds', type=float, default=MIN_SECONDS)
+    parser.add_argument('--shap-rows', type=int, default=SHAP_ROWS)
+    parser.add_argument('--sim-calls', type=int, default=SIM_CALLS)
+    parser.add_argument('--skip-pulse-sync', action='store_true')
+    args = parser.parse_args()
+
+    telemetry.RUN.reset()
+    t0 = time.perf_counter()
+    with telemetry.stage('Synthetic · generate', rows=args.rows):
+        paths = synthetic.write_synthetic_sources(args.data_dir, args.rows, args.ecg_samples,
+                                                  args.seed)
+    print(f"Generated {args.rows:,} synthetic patients ({args.ecg_samples} ECG samples per beat) "
+          f"→ {args.data_dir} ({time.perf_counter() - t0:.1f}s)")
+
+    repeats = [collect(telemetry.RUN.records)]
+    for r in range(args.repeats):
+        telemetry.RUN.reset()
+        aucs = run_stages(paths, args.shap_rows, args.sim_calls, pulse_sync=not args.skip_pulse_sync)
+        repeats.append(collect(telemetry.RUN.records))
+        print(f"── repeat {r + 1}/{args.repeats} done")
+    meta = {'rows': args.rows, 'ecg_samples': args.ecg_samples, 'seed': args.seed,
+            'repeats': args.repeats, 'cpus': os.cpu_count(), 'python': platform.python_version(),
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S')}
+    results = {'meta': meta, 'stages': best_of(repeats), 'roc_auc': aucs}
+
+    os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"\n{'Stage':<42} {'Wall':>8} {'CPU':>8} {'Peak RSS':>9} {'Rows':>10}")
+    print('─' * 81)
+    for name, s in results['stages'].items():
+        rows = f"{s['rows']:,}" if s['rows'] is not None else '—'
+        print(f"{name:<42} {s['wall_s']:>7.3f}s {s['cpu_s']:>7.3f}s {s['peak_rss_mb']:>6.0f} MB {rows:>10}")
+    print(f"\nResults → {args.output}")
+
+    if args.update_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"Baseline updated → {args.baseline}")
+        return
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline} (create one with --update-baseline)")
+        return
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    mismatched = [k for k in ('rows', 'ecg_samples', 'cpus') if baseline['meta'].get(k) != meta[k]]
+    if mismatched:
+        print(f"⚠️  Baseline differs in {', '.join(mismatched)} — timings are not comparable")
+
+    rows = compare(results, baseline, args.tolerance, args.min_seconds)
+    print(f"\n{'Stage':<42} {'Baseline':>9} {'Current':>9} {'Ratio':>7}")
+    print('─' * 70)
+    for name, base_s, cur_s, ratio, regressed in rows:
+        if base_s is None:
+            print(f"{name:<42} {'—':>9} {cur_s:>8.3f}s {'—':>7}  ← no baseline")
+            continue
+        print(f"{name:<42} {base_s:>8.3f}s {cur_s:>8.3f}s {ratio:>6.2f}×"
+              f"{'  ← REGRESSION' if regressed else ''}")
+    regressions = [r[0] for r in rows if r[4]]
+    unbaselined = [r[0] for r in rows if r[1] is None]
+    print(f"\n{len(regressions)} regression(s) at tolerance {args.tolerance:.0%}")
+    if unbaselined:
+        print(f"⚠️  {len(unbaselined)} stage(s) without a baseline entry "
+              f"(re-record with --update-baseline)")
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == '__main__':
+    main()
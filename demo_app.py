@@ -1,13 +1,44 @@
+import os
 import streamlit as st
 import joblib
 import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
+from myo_ai.counterfactual import counterfactuals
 
-# Load the trained model
-model = joblib.load('myocore_pipeline.pkl')
+# Load the trained model (a `.npz` path selects a NumPy-only export:
+# Aegis Lite compact forest or the TensorFlow-free Pulse-Sync Lite CNN)
+MODEL_PATH = os.environ.get('MYO_MODEL_PATH', 'myocore_pipeline.pkl')
+if MODEL_PATH.endswith('.npz'):
+    from myo_ai import aegis_lite
+    with np.load(MODEL_PATH) as npz:
+        is_aegis = 'format' in npz.files and str(npz['format']) == aegis_lite.FORMAT
+    if is_aegis:
+        model = aegis_lite.AegisLite(MODEL_PATH)
+        model_name = 'Aegis Protocol (RF)'
+    else:
+        from myo_ai.pulse_sync_lite import PulseSyncLite
+        model = PulseSyncLite(MODEL_PATH)
+        model_name = 'Pulse-Sync (CNN)'
+else:
+    model = joblib.load(MODEL_PATH)
+    model_name = 'Myo-Core Engine (HGBC)'
+MODEL_NAME = os.environ.get('MYO_MODEL_NAME', model_name)   # tournament name of the served model
+
+# Optional calibrator lookup table exported by the notebook's calibration cell
+# (only applied if it was fitted on the served model's scores)
+CALIBRATOR_PATH = os.environ.get('MYO_CALIBRATOR_PATH')
+calibration_warning = None
+if CALIBRATOR_PATH:
+    from myo_ai.calibration import CalibratedModel
+    try:
+        model = CalibratedModel(model, CALIBRATOR_PATH, model_name=MODEL_NAME)
+    except ValueError as e:
+        calibration_warning = f'{e} — serving uncalibrated probabilities.'
 
 st.title('Myo-AI Patient Simulator')
+if calibration_warning:
+    st.warning(calibration_warning)
 
 # Feature order (update to match your model's training columns)
 feature_names = ['age', 'sex', 'trestbps', 'chol', 'smoke', 'weight', 'height']
@@ -102,6 +133,17 @@ if predict_btn:
         fig2.update_layout(title="Chronos Engine: 20-Year Risk Projection", xaxis_title="Age (years)", yaxis_title="CVD Probability", yaxis_range=[0,1])
         st.plotly_chart(fig2, use_container_width=True)
 
+        # What would lower my risk? (all candidate changes scored in one batch)
+        if prob > 0.5 and hasattr(model, 'predict_proba'):
+            st.markdown('<div class="section-title">What would lower my risk?</div>', unsafe_allow_html=True)
+            cf = counterfactuals(model, input_df, threshold=0.5)
+            if cf['options'].empty:
+                st.write('No combination of blood pressure, cholesterol, weight and smoking changes brings the risk below 50%.')
+            else:
+                options = cf['options'][['changes', 'risk']].rename(columns={'changes': 'Change', 'risk': 'CVD Probability'})
+                st.table(options.style.format({'CVD Probability': '{:.1%}'}))
+            st.caption(f"{cf['candidates']:,} candidate changes scored in {cf['latency_ms']:.0f} ms")
+
 # --- Thicken sliders with custom CSS ---
 st.markdown("""
 <style>
@@ -0,0 +1,46 @@
+"""
+Myo AI — importable pipeline stages.
+
+| Stage      | Module              | Contents |
+|---|---|---|
+| ingest     | `myo_ai.ingest`     | Synapse ingestion, Pulse-Harmonization, Catalyst synthesis |
+| train      | `myo_ai.train`      | Feature selection, split protocol, tournament contestants |
+| explain    | `myo_ai.explain`    | Zenith clustering, SHAP / Oracle, density rendering |
+| simulate   | `myo_ai.simulate`   | Myo-Sim scoring, gauge and Chronos projection |
+
+Supporting modules: `myo_ai.tuning` (Myo-Core successive halving),
+`myo_ai.ensemble` (Myo-Stack stacked champion),
+`myo_ai.evaluate` (vectorized leaderboard / ROC / confusion metrics),
+`myo_ai.significance` (bootstrap AUC replicates and DeLong tests),
+`myo_ai.calibration` (isotonic / Platt lookup-table calibration),
+`myo_ai.incremental` (daily-batch updates and versioned artifacts),
+`myo_ai.outofcore` (streamed Parquet training under a memory budget),
+`myo_ai.sketch` (mergeable streaming quantile sketches),
+`myo_ai.impute` (sketch-backed streaming median imputer),
+`myo_ai.telemetry` (per-stage wall / CPU / peak-RSS profiling),
+`myo_ai.synthetic` (synthetic source files for benchmarks),
+`myo_ai.registry` (verified, resumable, air-gap capable source fetching),
+`myo_ai.ecg_features` (batched spectral / HRV and windowed ECG features),
+`myo_ai.sources` (Synapse source adapters and harmonization),
+`myo_ai.dag` (cached, parallel stage DAG executor),
+`myo_ai.pipeline` (the pipeline stages as incremental DAG nodes),
+`myo_ai.cohort` (population Chronos projection under scenarios),
+`myo_ai.counterfactual` (minimal risk-lowering changes for one patient),
+`myo_ai.drift` (streaming feature / prediction drift monitoring),
+`myo_ai.pulse_cnn` (TensorFlow Pulse-Sync training),
+`myo_ai.pulse_sync_lite` (NumPy-only Pulse-Sync inference) and
+`myo_ai.aegis_lite` (compact NumPy-only Aegis forest inference).
+
+Importing the package is cheap: stages are loaded on first attribute
+access, and each stage defers its heavy third-party imports until use.
+"""
+
+import importlib
+
+__all__ = ['ingest', 'train', 'explain', 'simulate']
+
+
+def __getattr__(name):
+    if name in __all__:
+        return importlib.import_module(f'{__name__}.{name}')
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
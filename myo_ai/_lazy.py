@@ -0,0 +1,62 @@
+"""
+Deferred imports for heavy optional dependencies.
+
+`lazy_import('shap')` returns a module stand-in that performs the real
+import the first time one of its attributes is touched.  Stage modules
+bind tensorflow, shap, seaborn, sklearn estimators, scipy, … this way so
+that importing a stage only pays for what that stage actually runs.
+"""
+
+import importlib
+import sys
+import types
+
+
+def _resolve(name: str):
+    """Import *name*; fall back to attribute access for re-exported submodules
+    such as ``tensorflow.keras`` that are not importable by path."""
+    try:
+        return importlib.import_module(name)
+    except ModuleNotFoundError:
+        parent, _, child = name.rpartition('.')
+        if not parent:
+            raise
+        return getattr(_resolve(parent), child)
+
+
+class _LazyModule(types.ModuleType):
+    """Module proxy that imports its target on first attribute access."""
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__['_target'] = None
+
+    def _load(self):
+        target = self.__dict__['_target']
+        if target is None:
+            target = _resolve(self.__name__)
+            self.__dict__['_target'] = target
+        return target
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = 'loaded' if self.__dict__['_target'] is not None else 'deferred'
+        return f"<lazy module '{self.__name__}' ({state})>"
+
+
+def lazy_import(name: str):
+    """
+    Return *name* as a lazily-imported module.
+
+    If the module is already in ``sys.modules`` it is returned as-is,
+    since there is nothing left to defer.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    return _LazyModule(name)
+
@@ -0,0 +1,236 @@
+"""
+Aegis Lite — compact, NumPy-only inference for the Aegis Random Forest.
+
+`export_aegis` flattens a fitted `RandomForestClassifier` (plus its
+fitted imputer) into a single `.npz` file; `AegisLite` loads that file
+and scores rows by walking every tree at once in NumPy.
+
+Each tree is re-laid out in pre-order so a node's left child is always
+the next node, and only three arrays per node survive:
+
+| Array     | dtype         | Internal node            | Leaf           |
+|---|---|---|---|
+| `feature` | int16 / int32 | split feature            | -1             |
+| `value`   | float32       | split threshold          | P(class 1)     |
+| `right`   | int32         | index of the right child | -1             |
+
+That is ~10 bytes per node against ~80 in a fitted sklearn tree
+(impurity, sample counts, class-count arrays, …).  Optional pruning
+collapses every subtree whose leaf probabilities span at most
+`prune_tol` into one leaf, so each tree's probability moves by at most
+`prune_tol` (and the forest mean likewise).
+
+Thresholds are rounded *down* to float32, which keeps `x <= threshold`
+identical to sklearn for float32 inputs; with `prune_tol=0` predictions
+match `predict_proba` to float32 precision.
+"""
+
+import numpy as np
+
+
+FORMAT = 'aegis_lite'
+PARITY_ATOL = 1e-6              # lossless export vs sklearn `predict_proba`
+
+
+# ══════════════════════════════════════════════════════════════
+#  EXPORT
+# ══════════════════════════════════════════════════════════════
+
+def _compact_tree(tree, pos_class: int, prune_tol: float):
+    """Pre-order (feature, value, right) arrays for one fitted sklearn tree."""
+    t = tree.tree_
+    counts = t.value[:, 0, :]
+    prob = counts[:, pos_class] / counts.sum(axis=1)
+    left, right = t.children_left, t.children_right
+
+    # Leaf-probability span of every subtree (children always follow parents)
+    lo, hi = prob.copy(), prob.copy()
+    for node in range(t.node_count - 1, -1, -1):
+        if left[node] >= 0:
+            lo[node] = min(lo[left[node]], lo[right[node]])
+            hi[node] = max(hi[left[node]], hi[right[node]])
+
+    thr = t.threshold.astype(np.float32)
+    thr = np.where(thr > t.threshold, np.nextafter(thr, np.float32(-np.inf)), thr)
+
+    out_feature, out_value, out_right = [], [], []
+    stack = [(0, -1)]                       # (sklearn node, parent slot awaiting its right child)
+    while stack:
+        node, parent = stack.pop()
+        pos = len(out_feature)
+        if parent >= 0:
+            out_right[parent] = pos
+        if left[node] < 0 or hi[node] - lo[node] <= prune_tol:
+            out_feature.append(-1)
+            out_value.append(prob[node])
+            out_right.append(-1)
+        else:
+            out_feature.append(t.feature[node])
+            out_value.append(thr[node])
+            out_right.append(-1)
+            stack.append((right[node], pos))
+            stack.append((left[node], -1))
+    return out_feature, out_value, out_right
+
+
+def compact_forest(forest, prune_tol: float = 0.0) -> dict:
+    """
+    Flatten a fitted binary `RandomForestClassifier` into one node table.
+
+    Returns
+    -------
+    dict  feature, value, right (global node indices), roots (per tree)
+          and depth (longest root-to-leaf path).
+    """
+    pos_class = len(forest.classes_) - 1
+    feature, value, right, roots = [], [], [], []
+    for est in forest.estimators_:
+        offset = len(feature)
+        f, v, r = _compact_tree(est, pos_class, prune_tol)
+        roots.append(offset)
+        feature.extend(f)
+        value.extend(v)
+        right.extend(ri + offset if ri >= 0 else -1 for ri in r)
+
+    n_features = forest.n_features_in_
+    feat_dtype = np.int16 if n_features < np.iinfo(np.int16).max else np.int32
+    return {
+        'feature': np.asarray(feature, dtype=feat_dtype),
+        'value':   np.asarray(value, dtype=np.float32),
+        'right':   np.asarray(right, dtype=np.int32),
+        'roots':   np.asarray(roots, dtype=np.int32),
+        'depth':   np.int32(max(est.get_depth() for est in forest.estimators_)),
+    }
+
+
+def export_aegis(forest, path, imputer=None, feature_names=None, prune_tol: float = 0.0) -> str:
+    """
+    Dump a fitted Aegis forest (and its imputer) to `.npz`.
+
+    Parameters
+    ----------
+    forest : RandomForestClassifier   Fitted binary forest.
+    path : str                        Output file (`.npz` is appended if missing).
+    imputer : StreamingMedianImputer  Optional fitted imputer (median statistics).
+    feature_names : list[str]         Optional training column order.
+    prune_tol : float                 Collapse subtrees whose leaf probabilities
+                                      span at most this much (0 = lossless).
+
+    Returns
+    -------
+    str  Path of the written file.
+    """
+    arrays = compact_forest(forest, prune_tol)
+    arrays['format'] = np.array(FORMAT)
+    if imputer is not None:
+        values = np.asarray(imputer.statistics_, dtype=np.float32)
+        if feature_names is not None:                  # columns the imputer dropped as all-NaN
+            kept = np.isin(list(feature_names), imputer.get_feature_names_out(list(feature_names)))
+            values = values[kept]
+            feature_names = [f for f, k in zip(feature_names, kept) if k]
+        arrays['impute_values'] = np.nan_to_num(values)
+    if feature_names is not None:
+        arrays['feature_names'] = np.array(list(feature_names))
+
+    if not str(path).endswith('.npz'):
+        path = f'{path}.npz'
+    np.savez(path, **arrays)
+    return path
+
+
+def parity_error(pipeline, X, path, prune_tol: float = 0.0) -> float:
+    """
+    Export a fitted Aegis *pipeline* (``imputer`` → … → ``clf``) to *path*,
+    reload it and return max |Δp| against the pipeline on *X*.
+    """
+    export_aegis(pipeline.named_steps['clf'], path, imputer=pipeline.named_steps['imputer'],
+                 feature_names=X.columns, prune_tol=prune_tol)
+    lite = AegisLite(path if str(path).endswith('.npz') else f'{path}.npz')
+    return float(np.max(np.abs(lite.predict_proba(X)[:, 1] - pipeline.predict_proba(X)[:, 1])))
+
+
+# ══════════════════════════════════════════════════════════════
+#  INFERENCE
+# ══════════════════════════════════════════════════════════════
+
+class AegisLite:
+    """
+    Pure-NumPy batched scorer for an exported Aegis forest.
+
+    Mirrors the scikit-learn classifier interface (`predict_proba`,
+    `predict`) so it can stand in for a fitted pipeline in batch scoring
+    and the simulator.
+    """
+
+    def __init__(self, path: str):
+        with np.load(path, allow_pickle=False) as data:
+            self._data = {k: data[k] for k in data.files}
+        if str(self._data.get('format', '')) != FORMAT:
+            raise ValueError(f"{path} is not an Aegis Lite export")
+        self.feature = self._data['feature']
+        self.value = self._data['value']
+        self.right = self._data['right']
+        self.roots = self._data['roots'].astype(np.intp)
+        self.depth = int(self._data['depth'])
+        self.feature_names = (self._data['feature_names'].tolist()
+                              if 'feature_names' in self._data else None)
+
+        # Traversal tables: leaves loop onto themselves behind a +inf
+        # threshold, so every (row, tree) pair can step `depth` times
+        # without masking finished paths.
+        leaf = self.feature < 0
+        node_ids = np.arange(len(self.feature), dtype=np.intp)
+        self._split_feature = np.where(leaf, 0, self.feature).astype(np.intp)
+        self._threshold = np.where(leaf, np.inf, self.value).astype(np.float32)
+        self._left = np.where(leaf, node_ids, node_ids + 1)
+        self._right = np.where(leaf, node_ids, self.right).astype(np.intp)
+
+    @property
+    def n_nodes(self) -> int:
+        return len(self.feature)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the node table."""
+        return self.feature.nbytes + self.value.nbytes + self.right.nbytes + self.roots.nbytes
+
+    # ── Preprocessing ───────────────────────────────────────
+    def preprocess(self, X) -> np.ndarray:
+        """Select columns, then apply the exported median imputation."""
+        if self.feature_names is not None and hasattr(X, 'columns'):
+            X = X[self.feature_names]
+        X = np.array(X, dtype=np.float32)
+        if 'impute_values' in self._data:
+            X = np.where(np.isnan(X), self._data['impute_values'], X)
+        return X
+
+    # ── Traversal ───────────────────────────────────────────
+    def forward(self, X: np.ndarray) -> np.ndarray:
+        """
+        Mean leaf probability over all trees for preprocessed rows.
+
+        Every (row, tree) pair holds a node index, and all pairs advance
+        together with flat `take` gathers — `depth` vectorized steps
+        regardless of the number of rows or trees.
+        """
+        n, n_trees = len(X), len(self.roots)
+        X_flat = np.ascontiguousarray(X, dtype=np.float32).ravel()
+        row_offset = np.repeat(np.arange(n, dtype=np.intp) * X.shape[1], n_trees)
+        node = np.tile(self.roots, n)
+        for _ in range(self.depth):
+            x = X_flat.take(row_offset + self._split_feature.take(node))
+            node = np.where(x > self._threshold.take(node),
+                            self._right.take(node), self._left.take(node))
+        return self.value.take(node).reshape(n, n_trees).mean(axis=1, dtype=np.float64)
+
+    def predict_proba(self, X, batch_size: int = 4096) -> np.ndarray:
+        """Return class probabilities, shape (n, 2), scoring in batches."""
+        X = self.preprocess(X)
+        p = np.empty(len(X), dtype=np.float64)
+        for start in range(0, len(X), batch_size):
+            p[start:start + batch_size] = self.forward(X[start:start + batch_size])
+        return np.column_stack([1 - p, p])
+
+    def predict(self, X, threshold: float = 0.5) -> np.ndarray:
+        """Return hard 0/1 labels at *threshold*."""
+        return (self.predict_proba(X)[:, 1] >= threshold).astype(int)
@@ -0,0 +1,251 @@
+"""
+Cohort Chronos — population risk trajectories under scenarios.
+
+`simulate.chronos_projection` ages one widget patient.  This engine ages a
+whole patient table (rows in the training schema, e.g. MASTER_DATA
+features) under one or more `Scenario` specs:
+
+| Spec | Meaning |
+|---|---|
+| `shift` | column → additive change (e.g. ``{'weight': -5}`` for −5 kg) |
+| `fix` | column → value for everyone (e.g. ``{'smoke': 0}`` for smoking cessation) |
+| `scale` | column → multiplicative factor (e.g. ``{'weight': 0.95}``) |
+
+Every scenario also ages the cohort by ``0 … horizon`` years.  Derived
+features follow their inputs as in Catalyst: blood pressure is clipped to
+the physiological ranges and `pulse_pressure` / `bmi` are recomputed when
+a scenario touches them.  Systolic pressure goes by a different name in
+each source (`SYSTOLIC_COLUMNS`), so a systolic scenario shifts and clips
+every alias; a blood-pressure value off the mmHg scale (the cardiac
+failure source's 0/1 ``high_blood_pressure`` flag, read as `sys_bp`) is
+left as it is.  Missing values stay missing (the pipeline imputes them).
+
+The workload is chunked by patients.  A chunk is stacked into a
+``(years × patients) × features`` matrix, one `predict_proba` call per
+scenario, and chunks are scored on a joblib process pool
+(``return_as='generator'``, so only a few chunks are in flight).  Each chunk
+returns float32 trajectories, written straight to Parquet as one row
+group, and a per-year risk histogram (`RISK_BINS` bins on [0, 1]).  The
+histograms add up across chunks, so the per-year quantiles (error below
+1 / `RISK_BINS`), mean risk and high-risk share need no pass over the
+trajectories.
+
+Output (`output_dir`)
+---------------------
+- ``trajectories.parquet``  id | scenario | risk_y00 … risk_y<horizon>
+- ``quantiles.parquet``     scenario | year | mean | q05 … q95 | high_risk_share
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from ._lazy import lazy_import
+from .ingest import CatalystFeatureSynthesizer
+from .simulate import CHRONOS_YEARS
+from .telemetry import annotate, profiled
+
+joblib = lazy_import('joblib')
+pa     = lazy_import('pyarrow')
+pq     = lazy_import('pyarrow.parquet')
+
+
+COHORT_CHUNK_PATIENTS = 10_000          # patients per scored chunk
+COHORT_QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+COHORT_OUTPUT_DIR = os.path.join('artifacts', 'cohort')
+RISK_BINS = 10_000                      # histogram resolution of the quantiles
+HIGH_RISK = 0.5                         # threshold of `high_risk_share`
+SYSTOLIC_COLUMNS = ('ap_hi', 'sys_bp', 'restingbp', 'trestbps')    # aliases across sources
+BP_LIMITS = {                           # column → (clipping range, mmHg scale of real readings)
+    **{c: (CatalystFeatureSynthesizer.BP_SYSTOLIC_RANGE, (40, 300)) for c in SYSTOLIC_COLUMNS},
+    'ap_lo': (CatalystFeatureSynthesizer.BP_DIASTOLIC_RANGE, (20, 200)),
+}
+
+
+class Scenario:
+    """
+    One intervention scenario (see the module docstring).
+
+    Parameters
+    ----------
+    name : str     Label in the output files.
+    shift : dict   Column → additive change.
+    fix : dict     Column → value.
+    scale : dict   Column → factor.
+    """
+
+    def __init__(self, name: str, shift: dict = None, fix: dict = None, scale: dict = None):
+        self.name = name
+        self.shift = dict(shift or {})
+        self.fix = dict(fix or {})
+        self.scale = dict(scale or {})
+
+    @classmethod
+    def from_spec(cls, spec) -> 'Scenario':
+        """A `Scenario`, a `SCENARIOS` name or a ``{'name', 'shift', 'fix', 'scale'}`` dict."""
+        if isinstance(spec, Scenario):
+            return spec
+        if isinstance(spec, str):
+            if spec not in SCENARIOS:
+                raise KeyError(f"Unknown scenario {spec!r}; presets: {list(SCENARIOS)}")
+            return SCENARIOS[spec]
+        return cls(**spec)
+
+    def apply(self, X: np.ndarray, columns: list) -> np.ndarray:
+        """Apply the scenario to a float matrix with *columns* (in place) and return it."""
+        col = {c: j for j, c in enumerate(columns)}
+        touched = set(self.shift) | set(self.scale) | set(self.fix)
+        bp = [(col[c], clip, scale) for c, (clip, scale) in BP_LIMITS.items()
+              if c in touched and c in col]
+        coded = {}                                           # off-scale BP values → kept as-is
+        for j, _, (lo, hi) in bp:
+            rows = ~((X[:, j] >= lo) & (X[:, j] <= hi))
+            coded[j] = rows, X[rows, j]
+
+        for c, delta in self.shift.items():
+            if c in col:
+                X[:, col[c]] += delta
+        for c, factor in self.scale.items():
+            if c in col:
+                X[:, col[c]] *= factor
+        for c, value in self.fix.items():
+            if c in col:
+                X[:, col[c]] = value
+
+        for j, (lo, hi), _ in bp:
+            np.clip(X[:, j], lo, hi, out=X[:, j])
+            rows, values = coded[j]
+            X[rows, j] = values
+        if touched & {'ap_hi', 'ap_lo'} and {'ap_hi', 'ap_lo', 'pulse_pressure'} <= col.keys():
+            X[:, col['pulse_pressure']] = X[:, col['ap_hi']] - X[:, col['ap_lo']]
+        if touched & {'weight', 'height'} and {'weight', 'height', 'bmi'} <= col.keys():
+            X[:, col['bmi']] = X[:, col['weight']] / (X[:, col['height']] / 100) ** 2
+        return X
+
+    def __repr__(self):
+        return f"Scenario({self.name!r}, shift={self.shift}, fix={self.fix}, scale={self.scale})"
+
+
+SCENARIOS = {
+    'ageing':            Scenario('ageing'),
+    'sbp_minus_10':      Scenario('sbp_minus_10', shift={c: -10 for c in SYSTOLIC_COLUMNS}),
+    'smoking_cessation': Scenario('smoking_cessation', fix={'smoke': 0, 'smoking': 0}),
+}
+
+
+# ── Chunk scoring (runs in the worker) ──────────────────────
+def _score_chunk(pipeline, X: np.ndarray, columns: list, scenarios: list, horizon: int,
+                 bins: int = RISK_BINS) -> list:
+    """Per scenario: (patients × years float32 risks, years × bins histogram)."""
+    n, f = X.shape
+    years = np.arange(horizon + 1)
+    age = columns.index('age')
+    out = []
+    for scenario in scenarios:
+        stacked = np.repeat(scenario.apply(X.copy(), columns)[None], len(years), axis=0)
+        stacked[:, :, age] += years[:, None]
+        risk = pipeline.predict_proba(pd.DataFrame(stacked.reshape(-1, f), columns=columns))[:, 1]
+        risk = risk.reshape(len(years), n)
+        idx = np.minimum((risk * bins).astype(np.int64), bins - 1) + (years * bins)[:, None]
+        hist = np.bincount(idx.ravel(), minlength=len(years) * bins).reshape(len(years), bins)
+        out.append((risk.T.astype(np.float32), hist))
+    return out
+
+
+def histogram_quantiles(hist: np.ndarray, q) -> np.ndarray:
+    """Bin-centre quantiles of each row of a (rows × bins) histogram on [0, 1]."""
+    bins = hist.shape[1]
+    cdf = np.cumsum(hist, axis=1)
+    targets = np.asarray(q)[None, :] * cdf[:, -1:]
+    idx = np.array([np.searchsorted(row, t) for row, t in zip(cdf, targets)])
+    return (np.minimum(idx, bins - 1) + 0.5) / bins
+
+
+@profiled('Chronos · cohort projection')
+def project_cohort(pipeline, patients: pd.DataFrame, scenarios=('ageing',),
+                   horizon: int = CHRONOS_YEARS, ids=None, output_dir: str = COHORT_OUTPUT_DIR,
+                   chunk_patients: int = COHORT_CHUNK_PATIENTS, quantiles=COHORT_QUANTILES,
+                   n_jobs: int = -1) -> pd.DataFrame:
+    """
+    Score every patient in every scenario for years ``0 … horizon``.
+
+    Parameters
+    ----------
+    pipeline : Pipeline          Fitted contestant (e.g. Myo-Core) or a wrapper such as
+                                 `calibration.CalibratedModel`.
+    patients : pd.DataFrame      Patient rows; the pipeline's `feature_names_in_`
+                                 are taken from it (missing columns → NaN; a model
+                                 without them is scored on *patients*' columns).
+    scenarios : list             `Scenario` objects, `SCENARIOS` names or spec dicts.
+    horizon : int                Years projected.
+    ids : array-like             Patient ids (default: *patients*' index).
+    output_dir : str             Where the two Parquet files are written.
+    chunk_patients : int         Patients per scored chunk.
+    n_jobs : int                 joblib workers (``-1`` = all cores).
+
+    Returns
+    -------
+    pd.DataFrame  The per-year quantile table (also in ``quantiles.parquet``).
+    """
+    scenarios = [Scenario.from_spec(s) for s in scenarios]
+    columns = list(getattr(pipeline, 'feature_names_in_', patients.columns))
+    if 'age' not in columns:
+        raise ValueError("The pipeline has no 'age' feature — nothing to age")
+    X = patients.reindex(columns=columns).to_numpy(dtype=np.float64)
+    ids = np.asarray(patients.index if ids is None else ids).astype(str)
+    n, years = len(X), horizon + 1
+    print(f"🌍 Chronos Cohort: {n:,} patients × {years} years × {len(scenarios)} scenario(s) "
+          f"= {n * years * len(scenarios):,} scored rows")
+
+    os.makedirs(output_dir, exist_ok=True)
+    paths = {k: os.path.join(output_dir, f'{k}.parquet') for k in ('trajectories', 'quantiles')}
+    for path in paths.values():                     # never leave an earlier run's files behind
+        if os.path.exists(path):
+            os.remove(path)
+    risk_cols = [f'risk_y{y:02d}' for y in range(years)]
+    hists = np.zeros((len(scenarios), years, RISK_BINS), dtype=np.int64)
+    sums = np.zeros((len(scenarios), years))
+
+    starts = range(0, n, chunk_patients)
+    results = joblib.Parallel(n_jobs=n_jobs, prefer='processes', return_as='generator')(
+        joblib.delayed(_score_chunk)(pipeline, X[a:a + chunk_patients], columns, scenarios,
+                                     horizon)
+        for a in starts
+    )
+    writer = None
+    try:
+        for a, chunk in zip(starts, results):
+            chunk_ids = ids[a:a + chunk_patients]
+            for s, (scenario, (risk, hist)) in enumerate(zip(scenarios, chunk)):
+                hists[s] += hist
+                sums[s] += risk.sum(axis=0, dtype=np.float64)
+                table = pa.table({'id': chunk_ids,
+                                  'scenario': np.full(len(chunk_ids), scenario.name),
+                                  **{c: risk[:, y] for y, c in enumerate(risk_cols)}})
+                if writer is None:
+                    writer = pq.ParquetWriter(paths['trajectories'], table.schema)
+                writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+    if writer is None:                              # no patients: an empty table, same schema
+        pq.write_table(pa.table({'id': pa.array([], pa.string()),
+                                 'scenario': pa.array([], pa.string()),
+                                 **{c: pa.array([], pa.float32()) for c in risk_cols}}),
+                       paths['trajectories'])
+    annotate(rows=n * years * len(scenarios))
+
+    qcols = [f'q{round(q * 100):02d}' for q in quantiles]
+    frames = []
+    for s, scenario in enumerate(scenarios):
+        frame = pd.DataFrame(histogram_quantiles(hists[s], quantiles), columns=qcols)
+        frame.insert(0, 'mean', sums[s] / max(n, 1))
+        frame.insert(0, 'year', np.arange(years))
+        frame.insert(0, 'scenario', scenario.name)
+        frame['high_risk_share'] = hists[s][:, int(HIGH_RISK * RISK_BINS):].sum(axis=1) / max(n, 1)
+        frames.append(frame)
+    summary = pd.concat(frames, ignore_index=True)
+    summary.to_parquet(paths['quantiles'], index=False)
+    print(f"✅ Chronos Cohort Complete  →  {paths['trajectories']}, {paths['quantiles']}")
+    return summary
@@ -0,0 +1,260 @@
+"""
+Counterfactual search — "what would lower my risk?" for one patient.
+
+Instead of hand-moving simulator sliders, every combination of a few
+modifiable `Lever` settings is generated and scored in one batched
+`predict_proba` call:
+
+| Lever | Columns (whichever the model has) | Changes | Bounds |
+|---|---|---|---|
+| systolic | `ap_hi`, `sys_bp`, `restingbp`, `trestbps` | 0 … −40 mmHg (step 5) | `BP_SYSTOLIC_RANGE` |
+| diastolic | `ap_lo` | 0 … −20 mmHg (step 5) | `BP_DIASTOLIC_RANGE` |
+| cholesterol | `cholesterol`, `chol` | 0 … −100 mg/dL (step 10) | 100 – 600 |
+| weight | `weight` | 0 … −20 kg (step 2) | 40 – 200 |
+| smoking | `smoke`, `smoking` | quit | 0 – 1 |
+
+The blood-pressure bounds are Catalyst's clipping ranges, and candidates
+whose pulse pressure falls below `MIN_PULSE_PRESSURE` are discarded.
+Only changes are clipped: the patient's own value is always a setting,
+so a patient already outside the bounds is never pushed *into* them, and
+a lever whose column holds a value off its unit scale (the cardio
+source's 1–3 coded cholesterol) is skipped.  A lever only overwrites the
+alias columns the patient has a value in — the others stay missing, as
+the model saw them — and the all-current candidate must reproduce the
+patient's risk (`RuntimeError` otherwise).
+`bmi` and `pulse_pressure` follow their inputs.  About 11 000 candidates
+come out of the default grid.
+
+Latency target: a `PROBE_ROWS` probe measures the model's scoring
+throughput first.  If the full grid would not fit in ``latency_ms``,
+the lever with the most settings is coarsened (every other step, end
+points kept) until it does.  The answer is the set of minimal changes
+that bring risk under *threshold*.  A candidate is dropped if another
+one below the threshold changes no lever more; the rest are ranked by
+the number of levers touched, then by `effort` (one unit ≈ 10 mmHg
+systolic, 5 mmHg diastolic, 20 mg/dL cholesterol, 5 kg or quitting
+smoking).
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+from .ingest import CatalystFeatureSynthesizer
+from .telemetry import annotate, profiled
+
+
+COUNTERFACTUAL_LATENCY_MS = 300         # interactive budget per search
+COUNTERFACTUAL_TOP_K = 5
+PROBE_ROWS = 256
+MIN_PULSE_PRESSURE = 20                 # mmHg between systolic and diastolic
+RISK_PARITY_ATOL = 1e-9                 # all-current candidate vs. the patient's risk
+
+
+class Lever:
+    """
+    One modifiable risk factor.
+
+    Parameters
+    ----------
+    name : str       Label in the results.
+    columns : tuple  Feature columns it sets (aliases across sources).
+    deltas : array   Changes tried, relative to the patient's value (0 included).
+    bounds : tuple   Clinical (low, high) range of the modified value.
+    unit : str       Unit shown in the change description.
+    effort : float   Size of one unit of effort.
+    scale : tuple    Range of plausible values in *unit*; a patient value
+                     outside it is coded differently (e.g. the 1–3 cholesterol
+                     levels of the cardio source) and the lever is skipped.
+    """
+
+    def __init__(self, name: str, columns, deltas, bounds: tuple, unit: str, effort: float,
+                 scale: tuple = None):
+        self.name = name
+        self.columns = tuple(columns)
+        self.deltas = np.asarray(deltas, dtype=np.float64)
+        self.bounds = bounds
+        self.unit = unit
+        self.effort = effort
+        self.scale = scale or bounds
+
+    def present(self, row: pd.Series) -> list:
+        """
+        The lever's columns holding *row*'s value (the ones a candidate overwrites).
+
+        Missing aliases are left out, and so is an alias holding a different
+        value than the first one (a differently coded column).
+        """
+        present = [c for c in self.columns if c in row.index and pd.notna(row[c])]
+        return [c for c in present if row[c] == row[present[0]]]
+
+    def values(self, row: pd.Series) -> tuple:
+        """
+        (current value, settings to try) for *row*; (None, None) if absent or off-scale.
+
+        The current value always comes first.  Changed values are clipped to
+        `bounds` and dropped if clipping turned them into no change or a
+        change in the other direction (a patient already below the bound).
+        """
+        present = self.present(row)
+        if not present:
+            return None, None
+        current = float(row[present[0]])
+        if not self.scale[0] <= current <= self.scale[1]:
+            return None, None
+        deltas = self.deltas[self.deltas != 0]
+        changed = np.clip(current + deltas, *self.bounds)
+        changed = np.unique(changed[np.sign(changed - current) == np.sign(deltas)])
+        changed = changed[np.argsort(np.abs(changed - current), kind='stable')]
+        return current, np.r_[current, changed]
+
+    def __repr__(self):
+        return f"Lever({self.name!r}, columns={self.columns})"
+
+
+LEVERS = [
+    Lever('systolic',    ('ap_hi', 'sys_bp', 'restingbp', 'trestbps'), -np.arange(0, 45, 5),
+          CatalystFeatureSynthesizer.BP_SYSTOLIC_RANGE, 'mmHg', 10.0, scale=(40, 300)),
+    Lever('diastolic',   ('ap_lo',), -np.arange(0, 25, 5),
+          CatalystFeatureSynthesizer.BP_DIASTOLIC_RANGE, 'mmHg', 5.0, scale=(20, 200)),
+    Lever('cholesterol', ('cholesterol', 'chol'), -np.arange(0, 110, 10), (100, 600), 'mg/dL', 20.0,
+          scale=(30, 1000)),
+    Lever('weight',      ('weight',), -np.arange(0, 22, 2), (40, 200), 'kg', 5.0, scale=(20, 350)),
+    Lever('smoking',     ('smoke', 'smoking'), (0, -1), (0, 1), '', 1.0),
+]
+
+
+def _coarsen(settings: np.ndarray) -> np.ndarray:
+    """Every other setting, keeping the current value (first) and the largest change (last)."""
+    return np.r_[settings[::2], settings[-1]] if len(settings) % 2 == 0 else settings[::2]
+
+
+def candidate_grid(grid: dict) -> np.ndarray:
+    """(candidates × levers) array of every combination of the lever settings."""
+    mesh = np.meshgrid(*grid.values(), indexing='ij')
+    return np.column_stack([m.ravel() for m in mesh])
+
+
+def _frame(row: pd.Series, levers: list, values: np.ndarray) -> pd.DataFrame:
+    """
+    Candidate rows: the patient with the columns each lever read (and the
+    features derived from them) replaced; missing aliases stay missing.
+    """
+    df = pd.DataFrame(np.repeat(row.to_numpy(dtype=np.float64)[None], len(values), axis=0),
+                      columns=row.index)
+    written = set()
+    for j, lever in enumerate(levers):
+        for c in lever.present(row):
+            df[c] = values[:, j]
+            written.add(c)
+    if written & {'ap_hi', 'ap_lo'} and {'ap_hi', 'ap_lo', 'pulse_pressure'} <= set(df.columns):
+        df['pulse_pressure'] = df['ap_hi'] - df['ap_lo']
+    if 'weight' in written and {'weight', 'height', 'bmi'} <= set(df.columns):
+        df['bmi'] = df['weight'] / (df['height'] / 100) ** 2
+    return df
+
+
+def _describe(lever: Lever, current: float, value: float) -> str:
+    if lever.name == 'smoking':
+        return 'quit smoking'
+    return f"{lever.name} {value - current:+g} {lever.unit} (→ {value:g})"
+
+
+def _options(kept: list, levers: list, current: dict, values, probs, change) -> pd.DataFrame:
+    """Result table for the candidate indices *kept* (ranked)."""
+    units = np.array([lever.effort for lever in levers])
+    return pd.DataFrame({
+        'risk': [probs[i] for i in kept],
+        'levers changed': [int((change[i] > 0).sum()) for i in kept],
+        'effort': [round(float((change[i] / units).sum()), 2) for i in kept],
+        'changes': ['; '.join(_describe(lever, current[lever.name], values[i, j])
+                              for j, lever in enumerate(levers) if change[i, j] > 0)
+                    for i in kept],
+        **{lever.name: [values[i, j] for i in kept] for j, lever in enumerate(levers)},
+    }, index=pd.RangeIndex(1, len(kept) + 1, name='Rank'))
+
+
+@profiled('Myo-Sim · counterfactual search')
+def counterfactuals(pipeline, patient: pd.DataFrame, threshold: float = 0.5,
+                    levers: list = None, top_k: int = COUNTERFACTUAL_TOP_K,
+                    latency_ms: float = COUNTERFACTUAL_LATENCY_MS) -> dict:
+    """
+    Smallest lever changes that bring *patient*'s risk below *threshold*.
+
+    A patient already below *threshold*, without any applicable lever, or
+    out of reach of every lever, gets an empty `options` table.
+
+    Parameters
+    ----------
+    pipeline : object          Anything with ``predict_proba(DataFrame)``.
+    patient : pd.DataFrame     One row in the model's feature schema.
+    threshold : float          Target P(CVD).
+    levers : list[Lever]       Default `LEVERS`; levers without a column are skipped.
+    top_k : int                Options returned.
+    latency_ms : float         Budget for the whole search.
+
+    Returns
+    -------
+    dict  risk (current P), options (DataFrame: rank, risk, levers changed,
+          effort, changes, one column per lever with the new value),
+          candidates (scored), grid (lever → settings tried), latency_ms.
+    """
+    t0 = time.perf_counter()
+    row = patient.iloc[0]
+    active, grid, current = [], {}, {}
+    for lever in levers or LEVERS:
+        now, settings = lever.values(row)
+        if settings is not None:
+            active.append(lever)
+            grid[lever.name], current[lever.name] = settings, now
+    t_call = time.perf_counter()
+    risk = float(pipeline.predict_proba(patient)[0, 1])
+    per_call = time.perf_counter() - t_call
+    if risk < threshold or not active:
+        return {'risk': risk, 'options': _options([], active, current, None, None, None),
+                'candidates': 0, 'grid': {}, 'latency_ms': (time.perf_counter() - t0) * 1e3}
+
+    # Throughput probe (net of the per-call overhead) → coarsen the grid until it fits
+    probe = candidate_grid(grid)[:PROBE_ROWS]                 # row 0 changes nothing
+    t_probe = time.perf_counter()
+    probe_probs = pipeline.predict_proba(_frame(row, active, probe))[:, 1]
+    per_row = max(time.perf_counter() - t_probe - per_call, 1e-9) / len(probe)
+    if abs(probe_probs[0] - risk) > RISK_PARITY_ATOL:
+        raise RuntimeError(f"Unchanged candidate scores {probe_probs[0]:.6f}, patient {risk:.6f}: "
+                           f"candidate rows do not reproduce the patient")
+    left = latency_ms / 1e3 - (time.perf_counter() - t0) - per_call
+    budget = max(PROBE_ROWS, int(left / per_row))
+    while np.prod([len(v) for v in grid.values()]) > budget:
+        name = max(grid, key=lambda k: len(grid[k]))
+        if len(grid[name]) <= 2:
+            break
+        grid[name] = _coarsen(grid[name])
+
+    values = candidate_grid(grid)
+    if {'systolic', 'diastolic'} <= grid.keys():
+        s, d = list(grid).index('systolic'), list(grid).index('diastolic')
+        values = values[values[:, s] - values[:, d] >= MIN_PULSE_PRESSURE]
+    probs = pipeline.predict_proba(_frame(row, active, values))[:, 1]
+    annotate(rows=len(values))
+
+    base = np.array([current[lever.name] for lever in active])
+    change = np.abs(values - base)
+    units = np.array([lever.effort for lever in active])
+    effort = (change / units).sum(axis=1)
+    n_changed = (change > 0).sum(axis=1)
+
+    feasible = np.flatnonzero((probs < threshold) & (n_changed > 0))
+    order = feasible[np.lexsort((probs[feasible], effort[feasible], n_changed[feasible]))]
+    kept = []
+    for i in order:                                  # drop candidates that only add to a kept one
+        if any(np.all(change[k] <= change[i]) for k in kept):
+            continue
+        kept.append(i)
+        if len(kept) == top_k:
+            break
+
+    options = _options(kept, active, current, values, probs, change)
+    return {'risk': risk, 'options': options, 'candidates': len(values),
+            'grid': {k: len(v) for k, v in grid.items()},
+            'latency_ms': (time.perf_counter() - t0) * 1e3}
@@ -0,0 +1,289 @@
+"""
+Cached stage DAG — incremental, parallel re-runs of the pipeline.
+
+`Myo AI.py` runs top to bottom, so one changed Vanguard hyperparameter
+used to mean re-downloading, re-harmonizing and re-training everything.
+A `DAG` declares each stage as a `Node` instead:
+
+| Declaration | Meaning |
+|---|---|
+| `fn` | ``fn(*dependency outputs, **params)`` → the node's output |
+| `deps` | upstream node names, passed to `fn` positionally |
+| `params` | keyword arguments (hyperparameters, paths, switches) |
+| `code` | extra functions, classes, modules (or module names, hashed without importing) and constants the output depends on |
+| `files` | input files, fingerprinted by size and mtime |
+| `outputs` | files the node writes besides its return value (side effects) |
+
+A node's cache key is `joblib.hash` of its name, the source of `fn` and
+`code`, its params, its files' fingerprints and the keys of its
+dependencies — so a change anywhere upstream reaches every descendant,
+and nothing else.  Outputs are stored as ``<cache_dir>/<node>/<key>.pkl``;
+`DAG.run` executes only the nodes whose file is missing and reuses the
+rest without loading them.  A cache hit restores the return value only,
+so a node's declared `outputs` are fingerprinted next to it
+(``<key>.outputs.json``) and the node runs again when one of them is
+missing or was overwritten since — e.g. by a run with other params.
+
+Nodes run on a loky process pool (`workers`), each as soon as its last
+dependency finishes, so independent branches (Pulse next to Synapse,
+the contestants, Zenith / permutation importance / Oracle) overlap.  A
+worker loads its inputs from the cache and writes its output there, so
+only paths cross process boundaries.  ``workers=1`` runs the nodes in
+this process, where the engines' `telemetry` stages are recorded too.
+`print_timeline` shows what ran, on which worker, when, and what was
+reused.
+"""
+
+import hashlib
+import importlib.util
+import inspect
+import json
+import os
+import time
+
+from ._lazy import lazy_import
+
+joblib = lazy_import('joblib')
+loky   = lazy_import('joblib.externals.loky')
+
+
+DAG_CACHE_DIR = os.path.join('cache', 'dag')
+DAG_WORKERS = os.cpu_count() or 1
+TIMELINE_WIDTH = 40             # characters of the widest timeline bar
+
+
+# ── Fingerprints ────────────────────────────────────────────
+def code_digest(obj) -> str:
+    """
+    SHA-256 of the source of a function, class or module.
+
+    A string is a module name whose file is hashed without importing it
+    (e.g. TensorFlow-backed modules); other objects without source
+    (constants, builtins) hash their bytecode or ``repr``.
+    """
+    if isinstance(obj, str):
+        with open(importlib.util.find_spec(obj).origin, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    try:
+        text = inspect.getsource(obj).encode()
+    except (OSError, TypeError):
+        code = getattr(inspect.unwrap(obj), '__code__', None)
+        text = code.co_code + repr(code.co_consts).encode() if code else repr(obj).encode()
+    return hashlib.sha256(text).hexdigest()
+
+
+def file_fingerprint(path: str) -> tuple:
+    """(size, mtime_ns) of *path*; (None, None) if it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None, None
+    return st.st_size, st.st_mtime_ns
+
+
+class Node:
+    """One stage of a `DAG` (see the module docstring for the fields)."""
+
+    def __init__(self, name: str, fn, deps=(), params: dict = None, code=(), files=(),
+                 outputs=()):
+        self.name = name
+        self.fn = fn
+        self.deps = tuple(deps)
+        self.params = dict(params or {})
+        self.code = tuple(code)
+        self.files = tuple(files)
+        self.outputs = tuple(outputs)
+
+    def key(self, dep_keys: list) -> str:
+        return joblib.hash((
+            self.name,
+            [code_digest(obj) for obj in (self.fn, *self.code)],
+            self.params,
+            [(os.path.basename(p), *file_fingerprint(p)) for p in self.files],
+            list(dep_keys),
+        ))
+
+    def __repr__(self):
+        return f"Node({self.name!r}, deps={list(self.deps)})"
+
+
+# ── Execution (runs in the worker) ──────────────────────────
+def _outputs_path(out_path: str) -> str:
+    return f'{os.path.splitext(out_path)[0]}.outputs.json'
+
+
+def _outputs_current(out_path: str, outputs: tuple) -> bool:
+    """True if every side-effect file still has the fingerprint recorded when the node ran."""
+    if not outputs:
+        return True
+    try:
+        with open(_outputs_path(out_path)) as f:
+            recorded = json.load(f)
+    except (OSError, ValueError):
+        return False
+    return recorded == [[p, *file_fingerprint(p)] for p in outputs]
+
+
+def _execute(fn, params: dict, dep_paths: list, out_path: str, outputs: tuple = ()) -> tuple:
+    """Load the inputs, run *fn*, store its output → (start, end, pid)."""
+    start = time.time()
+    output = fn(*[joblib.load(p) for p in dep_paths], **params)
+    os.makedirs(os.path.dirname(out_path), exist_ok=True)
+    if outputs:
+        with open(_outputs_path(out_path), 'w') as f:
+            json.dump([[p, *file_fingerprint(p)] for p in outputs], f)
+    tmp = f'{out_path}.{os.getpid()}.tmp'
+    joblib.dump(output, tmp)
+    os.replace(tmp, out_path)                       # atomic: no half-written cache entries
+    return start, time.time(), os.getpid()
+
+
+class DAG:
+    """
+    A set of `Node` objects, declared in dependency order.
+
+    Parameters
+    ----------
+    cache_dir : str   Where node outputs are stored.
+    """
+
+    def __init__(self, cache_dir: str = DAG_CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.nodes = {}
+
+    def add(self, name: str, fn, deps=(), params: dict = None, code=(), files=(),
+            outputs=()) -> Node:
+        """Declare node *name*; its dependencies must already be declared."""
+        if name in self.nodes:
+            raise ValueError(f"DAG node {name!r} is already declared")
+        missing = [d for d in deps if d not in self.nodes]
+        if missing:
+            raise ValueError(f"DAG node {name!r} depends on undeclared {missing}")
+        self.nodes[name] = Node(name, fn, deps, params, code, files, outputs)
+        return self.nodes[name]
+
+    def keys(self) -> dict:
+        """Node name → cache key (declaration order is a topological order)."""
+        keys = {}
+        for name, node in self.nodes.items():
+            keys[name] = node.key([keys[d] for d in node.deps])
+        return keys
+
+    def path(self, name: str, key: str) -> str:
+        return os.path.join(self.cache_dir, name, f'{key}.pkl')
+
+    def upstream(self, targets) -> list:
+        """*targets* and everything they depend on, in declaration order."""
+        needed, stack = set(), list(targets)
+        while stack:
+            name = stack.pop()
+            if name not in self.nodes:
+                raise KeyError(f"Unknown DAG node {name!r}")
+            if name not in needed:
+                needed.add(name)
+                stack.extend(self.nodes[name].deps)
+        return [name for name in self.nodes if name in needed]
+
+    def load(self, name: str):
+        """Output of node *name* for the current inputs (`FileNotFoundError` if not run yet)."""
+        return joblib.load(self.path(name, self.keys()[name]))
+
+    def run(self, targets=None, workers: int = DAG_WORKERS) -> dict:
+        """
+        Bring *targets* (default: every node) up to date.
+
+        Returns
+        -------
+        dict  node → {'status': 'ran' | 'cached', 'key', 'path', 'start', 'end', 'worker'};
+              start / end are seconds since the run began (None for cached nodes).
+        """
+        keys = self.keys()
+        names = self.upstream(targets or list(self.nodes))
+        t0 = time.time()
+        records = {}
+        for name in names:
+            path = self.path(name, keys[name])
+            cached = os.path.exists(path) and _outputs_current(path, self.nodes[name].outputs)
+            records[name] = {'status': 'cached' if cached else 'pending', 'key': keys[name],
+                             'path': path, 'start': None, 'end': None, 'worker': None}
+
+        def ready(name):
+            return records[name]['status'] == 'pending' and all(
+                records[d]['status'] in ('cached', 'ran') for d in self.nodes[name].deps)
+
+        def finish(name, result):
+            start, end, pid = result
+            records[name].update(status='ran', start=start - t0, end=end - t0, worker=pid)
+
+        def submit_args(name):
+            node = self.nodes[name]
+            return (node.fn, node.params, [records[d]['path'] for d in node.deps],
+                    records[name]['path'], node.outputs)
+
+        if workers == 1:
+            for name in names:
+                if records[name]['status'] == 'pending':
+                    finish(name, _execute(*submit_args(name)))
+        else:
+            executor = loky.get_reusable_executor(max_workers=workers)
+            running = {}
+            while True:
+                for name in names:
+                    if ready(name) and name not in running.values():
+                        running[executor.submit(_execute, *submit_args(name))] = name
+                if not running:
+                    break
+                done, _ = loky.wait(list(running), return_when=loky.FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        finish(name, future.result())
+                    except Exception as e:
+                        for other in running:
+                            other.cancel()
+                        raise RuntimeError(f"DAG node {name!r} failed: {e}") from e
+
+        pids = {}
+        for rec in records.values():
+            if rec['worker'] is not None:
+                rec['worker'] = pids.setdefault(rec['worker'], len(pids) + 1)
+        return records
+
+    def prune(self) -> int:
+        """Delete cached outputs that no current node key points to → files removed."""
+        keep = {self.path(name, key) for name, key in self.keys().items()}
+        keep |= {_outputs_path(path) for path in keep}
+        removed = 0
+        for name in self.nodes:
+            folder = os.path.join(self.cache_dir, name)
+            if not os.path.isdir(folder):
+                continue
+            for file in os.listdir(folder):
+                path = os.path.join(folder, file)
+                if path not in keep:
+                    os.remove(path)
+                    removed += 1
+        return removed
+
+
+# ── Reporting ───────────────────────────────────────────────
+def print_timeline(records: dict, width: int = TIMELINE_WIDTH):
+    """Per node: status, worker, start, duration and a bar on the run's time axis."""
+    ran = [r for r in records.values() if r['status'] == 'ran']
+    wall = max((r['end'] for r in ran), default=0.0)
+    scale = width / wall if wall > 0 else 0.0
+    print(f"🧭 DAG run — {len(records)} nodes: {len(ran)} ran, "
+          f"{len(records) - len(ran)} reused  ({wall:.1f}s wall, "
+          f"{len({r['worker'] for r in ran})} worker(s))")
+    print(f"   {'Node':<14} {'Status':<7} {'Worker':>6} {'Start':>7} {'Secs':>7}  Timeline")
+    print('   ' + '─' * (47 + width))
+    for name, r in records.items():
+        if r['status'] != 'ran':
+            print(f"   {name:<14} {'cached':<7} {'—':>6} {'—':>7} {'—':>7}  "
+                  f"{'':<{width}}  {r['key'][:10]}")
+            continue
+        lo = int(r['start'] * scale)
+        hi = max(lo + 1, int(round(r['end'] * scale)))
+        bar = ' ' * lo + '█' * (hi - lo)
+        print(f"   {name:<14} {'ran':<7} {'w' + str(r['worker']):>6} {r['start']:>6.1f}s "
+              f"{r['end'] - r['start']:>6.1f}s  {bar:<{width}}")
@@ -0,0 +1,231 @@
+"""
+Drift monitor — are today's patients still the patients we trained on?
+
+A `DriftMonitor` keeps, per feature, a fixed set of histogram bins:
+
+| Part | Detail |
+|---|---|
+| **Bins** | `DRIFT_BINS` quantile bins of the training column (tied quantiles merged, so binary / small-integer features get one bin per value), two open-ended tails and a missing-value bin |
+| **Reference** | Bin counts of the training rows (`fit`, e.g. on MASTER_DATA features) |
+| **Current** | Bin counts of every scored batch since the last `reset` (`update`) |
+| **Prediction** | Same pair of histograms over `PROB_BUCKETS` equal-width buckets of P(CVD); the reference takes held-out (e.g. out-of-fold) scores of the training rows |
+
+Memory is O(bins) per feature however much traffic is scored, and an
+update is one `searchsorted` per column plus a single `bincount`, so it
+runs inline with batch scoring.  `MonitoredModel` wraps a fitted model
+like `calibration.CalibratedModel` and updates the monitor on every
+`predict_proba` call.
+
+`report` gives the population stability index (PSI, missing values as
+their own bin) and the Kolmogorov–Smirnov distance between the binned
+CDFs (a lower bound on the exact KS statistic) per feature and for the
+predicted risk.  PSI above `PSI_MODERATE` / `PSI_SIGNIFICANT` flags
+moderate / significant drift.  `bucket_report` breaks the prediction
+PSI down by risk bucket.  `save` writes the histograms to a few-kilobyte
+`.npz` shipped with the model; `DriftMonitor(path)` loads it.
+"""
+
+import numpy as np
+import pandas as pd
+
+from .telemetry import annotate, profiled
+
+
+FORMAT = 'myo_drift_monitor'
+DRIFT_BINS = 20
+PROB_BUCKETS = 10
+PSI_EPS = 1e-4                  # share floor for empty bins in the PSI log ratio
+PSI_MODERATE = 0.1
+PSI_SIGNIFICANT = 0.25
+PREDICTION = 'P(CVD)'           # report row of the predicted risk
+
+
+def psi(reference: np.ndarray, current: np.ndarray) -> float:
+    """Population stability index of two count vectors over the same bins."""
+    r = np.maximum(reference / max(reference.sum(), 1), PSI_EPS)
+    c = np.maximum(current / max(current.sum(), 1), PSI_EPS)
+    return float(np.sum((c - r) * np.log(c / r)))
+
+
+def binned_ks(reference: np.ndarray, current: np.ndarray) -> float:
+    """Largest gap between the CDFs of two count vectors over the same ordered bins."""
+    if reference.sum() == 0 or current.sum() == 0:
+        return np.nan
+    return float(np.max(np.abs(np.cumsum(reference) / reference.sum()
+                               - np.cumsum(current) / current.sum())))
+
+
+def drift_status(value: float) -> str:
+    if np.isnan(value):
+        return '—'
+    if value >= PSI_SIGNIFICANT:
+        return 'significant'
+    return 'moderate' if value >= PSI_MODERATE else 'stable'
+
+
+class DriftMonitor:
+    """
+    Reference and streaming histograms per feature and for the predicted risk.
+
+    Built with `DriftMonitor.fit` from training rows, or from a `save` file.
+    """
+
+    def __init__(self, state):
+        if not isinstance(state, dict):
+            path = state
+            with np.load(path, allow_pickle=False) as data:
+                state = {k: data[k] for k in data.files}
+            if str(state.get('format', '')) != FORMAT:
+                raise ValueError(f"{path} is not a Myo drift monitor export")
+        self.columns = [str(c) for c in state['columns']]
+        self.cuts = np.split(np.asarray(state['cuts'], dtype=np.float64),
+                             np.cumsum(state['n_cuts'])[:-1])
+        sizes = np.asarray(state['n_cuts']) + 2                   # below … above, missing
+        self.offsets = np.r_[0, np.cumsum(sizes)]
+        self.reference = np.asarray(state['reference'], dtype=np.int64)
+        self.current = np.asarray(state.get('current', np.zeros_like(self.reference)),
+                                  dtype=np.int64)
+        self.prob_cuts = np.linspace(0, 1, PROB_BUCKETS + 1)[1:-1]
+        self.prob_reference = np.asarray(state['prob_reference'], dtype=np.int64)
+        self.prob_current = np.asarray(state.get('prob_current',
+                                                 np.zeros_like(self.prob_reference)),
+                                       dtype=np.int64)
+
+    # ── Building ────────────────────────────────────────────
+    @classmethod
+    @profiled('Drift · reference histograms')
+    def fit(cls, X: pd.DataFrame, probs=None, bins: int = DRIFT_BINS) -> 'DriftMonitor':
+        """
+        Reference histograms of training rows *X* (and their predicted risks *probs*).
+
+        Bin cuts are the interior `bins`-quantiles of every column.  *probs*
+        should be held-out scores (e.g. `ensemble.oof_probabilities`): a
+        model's scores on its own training rows are more extreme than on
+        new patients, so they would flag unshifted traffic as drift.
+        """
+        values = X.to_numpy(dtype=np.float64)
+        q = np.linspace(0, 1, bins + 1)[1:-1]
+        cuts = []
+        for j in range(values.shape[1]):
+            col = values[:, j]
+            col = col[~np.isnan(col)]
+            cuts.append(np.unique(np.quantile(col, q)) if len(col) else np.empty(0))
+        n_cuts = np.array([len(c) for c in cuts])
+        monitor = cls({'columns': np.array(X.columns, dtype=str),
+                       'cuts': np.concatenate(cuts) if cuts else np.empty(0),
+                       'n_cuts': n_cuts,
+                       'reference': np.zeros(int((n_cuts + 2).sum()), dtype=np.int64),
+                       'prob_reference': np.zeros(PROB_BUCKETS, dtype=np.int64)})
+        monitor.reference += monitor._counts(values)
+        if probs is not None:
+            monitor.prob_reference += monitor._prob_counts(probs)
+        annotate(rows=len(values))
+        return monitor
+
+    def _counts(self, values: np.ndarray) -> np.ndarray:
+        """Flat bin counts of a (rows × columns) float matrix in `columns` order."""
+        idx = np.empty(values.shape, dtype=np.int64)
+        for j, cuts in enumerate(self.cuts):
+            col = values[:, j]
+            idx[:, j] = np.where(np.isnan(col), len(cuts) + 1,
+                                 np.searchsorted(cuts, col, side='right')) + self.offsets[j]
+        return np.bincount(idx.ravel(), minlength=self.offsets[-1])
+
+    def _prob_counts(self, probs) -> np.ndarray:
+        idx = np.searchsorted(self.prob_cuts, np.asarray(probs, dtype=np.float64), side='right')
+        return np.bincount(idx, minlength=PROB_BUCKETS)
+
+    # ── Streaming ───────────────────────────────────────────
+    def update(self, X: pd.DataFrame, probs=None) -> 'DriftMonitor':
+        """Add a scored batch (columns missing from *X* count as missing values)."""
+        values = X.reindex(columns=self.columns).to_numpy(dtype=np.float64)
+        self.current += self._counts(values)
+        if probs is not None:
+            self.prob_current += self._prob_counts(probs)
+        return self
+
+    def merge(self, other: 'DriftMonitor') -> 'DriftMonitor':
+        """Add the current histograms of a monitor with the same reference (e.g. another worker)."""
+        if other.columns != self.columns or len(other.current) != len(self.current):
+            raise ValueError("Only monitors built from the same reference can be merged")
+        self.current += other.current
+        self.prob_current += other.prob_current
+        return self
+
+    def reset(self) -> 'DriftMonitor':
+        """Start a new monitoring window."""
+        self.current[:] = 0
+        self.prob_current[:] = 0
+        return self
+
+    @property
+    def n_observed(self) -> int:
+        """Rows scored since the last `reset`."""
+        return int(self.current[self.offsets[0]:self.offsets[1]].sum()) if self.columns else 0
+
+    # ── Reporting ───────────────────────────────────────────
+    def report(self) -> pd.DataFrame:
+        """
+        PSI, binned KS and missing share per feature, plus the predicted risk
+        (row `PREDICTION`), sorted by PSI.
+        """
+        rows = []
+        for j, col in enumerate(self.columns):
+            ref = self.reference[self.offsets[j]:self.offsets[j + 1]]
+            cur = self.current[self.offsets[j]:self.offsets[j + 1]]
+            rows.append((col, psi(ref, cur) if cur.sum() else np.nan, binned_ks(ref[:-1], cur[:-1]),
+                         ref[-1] / max(ref.sum(), 1), cur[-1] / max(cur.sum(), 1)))
+        if self.prob_reference.sum():
+            p = psi(self.prob_reference, self.prob_current) if self.prob_current.sum() else np.nan
+            rows.append((PREDICTION, p, binned_ks(self.prob_reference, self.prob_current),
+                         np.nan, np.nan))
+        df = pd.DataFrame(rows, columns=['Feature', 'PSI', 'KS', 'Missing (ref)', 'Missing (now)'])
+        df['Status'] = df['PSI'].map(drift_status)
+        return df.sort_values('PSI', ascending=False, na_position='last', ignore_index=True)
+
+    def bucket_report(self) -> pd.DataFrame:
+        """Reference vs current share and PSI contribution per predicted-risk bucket."""
+        edges = np.linspace(0, 1, PROB_BUCKETS + 1)
+        r = np.maximum(self.prob_reference / max(self.prob_reference.sum(), 1), PSI_EPS)
+        c = np.maximum(self.prob_current / max(self.prob_current.sum(), 1), PSI_EPS)
+        return pd.DataFrame({
+            'Bucket': [f'{lo:.0%}–{hi:.0%}' for lo, hi in zip(edges[:-1], edges[1:])],
+            'Reference': self.prob_reference / max(self.prob_reference.sum(), 1),
+            'Now': self.prob_current / max(self.prob_current.sum(), 1),
+            'PSI': (c - r) * np.log(c / r),
+        })
+
+    # ── Export ──────────────────────────────────────────────
+    def save(self, path) -> str:
+        """Write the bins and both histograms to `.npz` (`.npz` is appended if missing)."""
+        if not str(path).endswith('.npz'):
+            path = f'{path}.npz'
+        np.savez(path, format=np.array(FORMAT), columns=np.array(self.columns, dtype=str),
+                 cuts=np.concatenate(self.cuts) if self.cuts else np.empty(0),
+                 n_cuts=np.array([len(c) for c in self.cuts]),
+                 reference=self.reference, current=self.current,
+                 prob_reference=self.prob_reference, prob_current=self.prob_current)
+        return path
+
+
+class MonitoredModel:
+    """
+    A fitted classifier whose `predict_proba` also feeds a `DriftMonitor`.
+
+    Mirrors the scikit-learn classifier interface, so it stands in for
+    the raw (or calibrated) model in batch scoring.
+    """
+
+    def __init__(self, model, monitor):
+        self.model = model
+        self.monitor = monitor if isinstance(monitor, DriftMonitor) else DriftMonitor(monitor)
+
+    def predict_proba(self, X) -> np.ndarray:
+        """Return class probabilities, shape (n, 2), and record the batch."""
+        P = self.model.predict_proba(X)
+        self.monitor.update(X, P[:, 1])
+        return P
+
+    def predict(self, X, threshold: float = 0.5) -> np.ndarray:
+        """Return hard 0/1 labels at *threshold*."""
+        return (self.predict_proba(X)[:, 1] >= threshold).astype(int)
@@ -0,0 +1,336 @@
+"""
+Extended Pulse features — batched spectral, rhythm and HRV descriptors.
+
+`run_pulse_harmonization` reduces a record to four moments computed by a
+per-record ``groupby().apply``.  This engine treats each CSV row as one
+record (its sample columns ``0 … n−1``, padded with trailing zeros / NaN
+as in the MIT-BIH heartbeat export) and computes every feature for a whole
+chunk of records at once on the padded ``(records × samples)`` matrix:
+
+| Feature | Columns | Vectorized as |
+|---|---|---|
+| Moments | `ecg_mean`, `ecg_std`, `ecg_skew`, `ecg_kurtosis` | masked sums over the valid samples |
+| Band powers | `ecg_band_<name>` per `BANDS` (share of total power) | one `rfft` of the mean-removed, zero-padded matrix |
+| Dominant frequency | `ecg_dominant_hz` | `argmax` of the power spectrum (DC excluded) |
+| Zero-crossing rate | `ecg_zcr` | sign changes of the mean-removed signal per valid sample pair |
+| R peaks / HRV | `ecg_r_peaks`, `ecg_hr_bpm`, `ecg_rr_mean_s`, `ecg_sdnn_s`, `ecg_rmssd_s` | running-max peak mask, then `bincount`-grouped RR statistics |
+
+R peaks are local maxima above ``mean + R_PEAK_THRESHOLD · (max − mean)``
+that are the largest sample within ±`R_PEAK_REFRACTORY_S`.  HRV needs at
+least two (RR) or three (RMSSD) peaks in a record and is NaN otherwise —
+a single heartbeat carries no rhythm information.
+
+Chunks are read with `usecols` / float32 and scored on a joblib process
+pool (``return_as='generator'``, so only a few chunks are in flight).
+
+Windowed mode (`run_pulse_windows`) parses the samples once into a
+float32 ``.npy`` memmap (`ECG_MEMMAP_PATH`) and slides `WINDOW_S` /
+`HOP_S` windows over it with `sliding_window_view` — per-window std and
+max |slope| without copying a window — then keeps a compact per-record
+summary (mean and max of each statistic) for Catalyst.  A record is one
+beat of at most 1.5 s (187 samples), so the default windows are
+sub-beat: 0.4 s (about one QRS complex plus its flanks) every 0.2 s.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from ._lazy import lazy_import
+from .telemetry import annotate, profiled
+
+joblib  = lazy_import('joblib')
+ndimage = lazy_import('scipy.ndimage')
+
+
+SAMPLING_HZ = 125                       # MIT-BIH heartbeat export
+BANDS = {                               # name → (low Hz, high Hz)
+    'low':  (0.5, 5.0),                 # P / T waves, baseline rhythm
+    'qrs':  (5.0, 15.0),                # QRS complex
+    'high': (15.0, 40.0),               # sharp deflections, muscle noise
+}
+R_PEAK_THRESHOLD = 0.6                  # fraction of the (max − mean) excursion
+R_PEAK_REFRACTORY_S = 0.25              # minimum spacing between R peaks
+CHUNK_ROWS = 20_000                     # records per scored chunk
+WINDOW_S = 0.4                          # windowed mode: window length …
+HOP_S = 0.2                             # … and step between window starts
+ECG_MEMMAP_PATH = os.path.join('cache', 'ecg_signal.npy')
+
+
+def signal_columns(columns) -> list:
+    """The numbered sample columns (``'0'``, ``'1'``, …) of an ECG CSV header, in order."""
+    cols = sorted((c for c in columns if str(c).isdigit()), key=int)
+    if not cols:
+        raise ValueError("No numbered sample columns ('0', '1', …) in the ECG header")
+    return cols
+
+
+def feature_names() -> list:
+    return (['ecg_mean', 'ecg_std', 'ecg_skew', 'ecg_kurtosis']
+            + [f'ecg_band_{b}' for b in BANDS]
+            + ['ecg_dominant_hz', 'ecg_zcr',
+               'ecg_r_peaks', 'ecg_hr_bpm', 'ecg_rr_mean_s', 'ecg_sdnn_s', 'ecg_rmssd_s'])
+
+
+def _safe_div(a, b):
+    return np.divide(a, b, out=np.full(np.broadcast(a, b).shape, np.nan), where=b > 0)
+
+
+# ── Batched feature kernels ─────────────────────────────────
+def _valid_lengths(X: np.ndarray) -> np.ndarray:
+    """Samples up to the last non-zero, non-NaN value of each row."""
+    nonpad = np.isfinite(X) & (X != 0)
+    return np.where(nonpad.any(axis=1), X.shape[1] - np.argmax(nonpad[:, ::-1], axis=1), 0)
+
+
+def _moments(Xc: np.ndarray, n: np.ndarray) -> dict:
+    m2 = _safe_div((Xc ** 2).sum(axis=1), n)
+    m3 = _safe_div((Xc ** 3).sum(axis=1), n)
+    m4 = _safe_div((Xc ** 4).sum(axis=1), n)
+    return {
+        'ecg_std':      np.where(n >= 2, np.sqrt(m2 * _safe_div(n, n - 1)), 0.0),
+        'ecg_skew':     np.where(n >= 3, _safe_div(m3, m2 ** 1.5), 0.0),
+        'ecg_kurtosis': np.where(n >= 3, _safe_div(m4, m2 ** 2) - 3, 0.0),
+    }
+
+
+def _spectral(Xc: np.ndarray, fs: float) -> dict:
+    power = np.abs(np.fft.rfft(Xc, axis=1)) ** 2
+    freqs = np.fft.rfftfreq(Xc.shape[1], 1 / fs)
+    total = power[:, 1:].sum(axis=1)
+    out = {f'ecg_band_{b}': _safe_div(power[:, (freqs >= lo) & (freqs < hi)].sum(axis=1), total)
+           for b, (lo, hi) in BANDS.items()}
+    dominant = freqs[1:][np.argmax(power[:, 1:], axis=1)] if len(freqs) > 1 \
+        else np.zeros(len(Xc))
+    out['ecg_dominant_hz'] = np.where(total > 0, dominant, np.nan)
+    return out
+
+
+def _zero_crossings(Xc: np.ndarray, valid: np.ndarray, n: np.ndarray) -> np.ndarray:
+    pair = valid[:, 1:] & valid[:, :-1]
+    crossings = ((np.signbit(Xc[:, 1:]) != np.signbit(Xc[:, :-1])) & pair).sum(axis=1)
+    return _safe_div(crossings, n - 1)
+
+
+def _hrv(X: np.ndarray, valid: np.ndarray, mean: np.ndarray, fs: float) -> dict:
+    rows = len(X)
+    Xm = np.where(valid, X, -np.inf)
+    peak_max = Xm.max(axis=1, initial=-np.inf)
+    threshold = mean + R_PEAK_THRESHOLD * (peak_max - mean)
+    half = max(1, int(R_PEAK_REFRACTORY_S * fs))
+    running_max = ndimage.maximum_filter1d(Xm, size=2 * half + 1, axis=1, mode='constant',
+                                           cval=-np.inf)
+    rising = np.ones_like(valid)
+    rising[:, 1:] = Xm[:, 1:] > Xm[:, :-1]              # first sample of a plateau only
+    peaks = valid & rising & (Xm == running_max) & (Xm > threshold[:, None])
+
+    r, c = np.nonzero(peaks)                            # row-major: peaks of a row are adjacent
+    same = r[1:] == r[:-1]
+    rr_row, rr = r[1:][same], np.diff(c)[same] / fs
+    n_rr = np.bincount(rr_row, minlength=rows)
+    rr_mean = _safe_div(np.bincount(rr_row, rr, minlength=rows), n_rr)
+    rr_var = _safe_div(np.bincount(rr_row, rr ** 2, minlength=rows), n_rr) - rr_mean ** 2
+
+    same_rr = rr_row[1:] == rr_row[:-1]
+    d_row, d = rr_row[1:][same_rr], np.diff(rr)[same_rr]
+    rmssd = np.sqrt(_safe_div(np.bincount(d_row, d ** 2, minlength=rows),
+                              np.bincount(d_row, minlength=rows)))
+    return {
+        'ecg_r_peaks':   np.bincount(r, minlength=rows).astype(float),
+        'ecg_hr_bpm':    _safe_div(60.0, rr_mean),
+        'ecg_rr_mean_s': rr_mean,
+        'ecg_sdnn_s':    np.sqrt(np.clip(rr_var, 0, None)),
+        'ecg_rmssd_s':   rmssd,
+    }
+
+
+def record_features(X: np.ndarray, fs: float = SAMPLING_HZ) -> np.ndarray:
+    """
+    Every feature of `feature_names` for a padded ``(records × samples)`` matrix.
+
+    Returns
+    -------
+    np.ndarray  float64 ``(records × features)``; all-padding records are NaN.
+    """
+    X = np.asarray(X, dtype=np.float64)
+    lengths = _valid_lengths(X)
+    valid = np.arange(X.shape[1]) < lengths[:, None]
+    valid &= np.isfinite(X)                             # interior gaps are skipped, not zeroed
+    n = valid.sum(axis=1)
+    mean = _safe_div(np.where(valid, X, 0).sum(axis=1), n)
+    Xc = np.where(valid, X - mean[:, None], 0.0)
+
+    feats = {'ecg_mean': mean, **_moments(Xc, n), **_spectral(Xc, fs),
+             'ecg_zcr': _zero_crossings(Xc, valid, n), **_hrv(X, valid, mean, fs)}
+    out = np.column_stack([feats[name] for name in feature_names()])
+    out[n == 0] = np.nan
+    return out
+
+
+# ── Streaming engine ────────────────────────────────────────
+@profiled('Pulse · extended ECG features')
+def run_pulse_features(file_path: str, chunk_size: int = CHUNK_ROWS, fs: float = SAMPLING_HZ,
+                       n_jobs: int = -1) -> pd.DataFrame:
+    """
+    Stream an ECG CSV and extract the extended per-record feature set.
+
+    Parameters
+    ----------
+    file_path : str     Path to `ecg_timeseries.csv` (one record per row).
+    chunk_size : int    Records per chunk scored by one worker.
+    fs : float          Sampling rate in Hz.
+    n_jobs : int        joblib workers (``-1`` = all cores).
+
+    Returns
+    -------
+    pd.DataFrame
+        ``id`` (record number, as in `run_pulse_harmonization`) | `feature_names()` | ``source``
+    """
+    print("⚡ Pulse-Harmonization (extended): batched spectral / HRV features...")
+    cols = signal_columns(pd.read_csv(file_path, nrows=0).columns)
+    print(f"   {len(cols)} samples per record at {fs:g} Hz, {chunk_size:,} records per chunk")
+
+    reader = pd.read_csv(file_path, usecols=cols, dtype=np.float32, chunksize=chunk_size)
+    blocks = joblib.Parallel(n_jobs=n_jobs, prefer='processes', return_as='generator')(
+        joblib.delayed(record_features)(chunk[cols].to_numpy(), fs) for chunk in reader
+    )
+    blocks = list(blocks)
+    feats = np.concatenate(blocks) if blocks else np.empty((0, len(feature_names())))
+    annotate(rows=len(feats))
+
+    df = pd.DataFrame(feats, columns=feature_names())
+    df.insert(0, 'id', np.arange(len(df)).astype(str))
+    df['source'] = 'ECG_Signal'
+    print(f"✅ Pulse-Harmonization (extended) Complete  →  {len(df):,} ECG records, "
+          f"{len(feature_names())} features")
+    return df
+
+
+# ══════════════════════════════════════════════════════════════
+#  WINDOWED MODE — sliding-window statistics over a memmap
+# ══════════════════════════════════════════════════════════════
+
+def signal_memmap(file_path: str, path: str = ECG_MEMMAP_PATH,
+                  chunk_size: int = CHUNK_ROWS) -> np.memmap:
+    """
+    The ECG sample matrix as a read-only float32 memmap (``records × samples``).
+
+    The CSV is parsed once into the ``.npy`` file *path*; later calls reuse
+    it while it is newer than the CSV.
+    """
+    if os.path.exists(path) and os.path.getmtime(path) >= os.path.getmtime(file_path):
+        return np.load(path, mmap_mode='r')
+    cols = signal_columns(pd.read_csv(file_path, nrows=0).columns)
+    n_rows = sum(len(c) for c in pd.read_csv(file_path, usecols=[cols[0]], chunksize=chunk_size))
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp = f'{path}.tmp.npy'
+    out = np.lib.format.open_memmap(tmp, mode='w+', dtype=np.float32, shape=(n_rows, len(cols)))
+    start = 0
+    for chunk in pd.read_csv(file_path, usecols=cols, dtype=np.float32, chunksize=chunk_size):
+        out[start:start + len(chunk)] = chunk[cols].to_numpy()
+        start += len(chunk)
+    out.flush()
+    del out
+    os.replace(tmp, path)
+    return np.load(path, mmap_mode='r')
+
+
+def window_feature_names() -> list:
+    return ['ecg_win_std_mean', 'ecg_win_std_max', 'ecg_win_slope_mean', 'ecg_win_slope_max']
+
+
+def window_features(X: np.ndarray, window: int, hop: int, fs: float = SAMPLING_HZ) -> np.ndarray:
+    """
+    Per-record summary of sliding-window std and max |slope| (units / s).
+
+    Window sums are reductions over `sliding_window_view` views (no window
+    is copied), taken every *hop* samples over the valid (unpadded)
+    samples only.  Windows lying entirely inside a record count; a record
+    shorter than one window is summarized by its first, partial window.
+    Records with fewer than two valid samples are NaN.
+
+    Returns
+    -------
+    np.ndarray  ``(records × window_feature_names())``
+    """
+    X = np.asarray(X, dtype=np.float64)
+    lengths = _valid_lengths(X)
+    mask = (np.arange(X.shape[1]) < lengths[:, None]) & np.isfinite(X)
+    Xz = np.where(mask, X, 0.0)
+    step = np.where(mask[:, 1:] & mask[:, :-1], np.abs(np.diff(Xz, axis=1)), 0.0)
+
+    def windows(a, size):                                                  # (n, windows, size)
+        return sliding_window_view(a, size, axis=1)[:, ::hop]
+
+    n = windows(mask, window).sum(axis=-1)
+    mean = _safe_div(windows(Xz, window).sum(axis=-1), n)
+    var = _safe_div(windows(Xz ** 2, window).sum(axis=-1), n) - mean ** 2
+    slope = windows(step, window - 1).max(axis=-1) * fs
+
+    starts = np.arange(n.shape[1]) * hop
+    valid = ((starts + window <= lengths[:, None]) | (starts == 0)) & (n >= 2)
+    w_std = np.where(valid, np.sqrt(np.clip(var, 0, None)), np.nan)
+    w_slope = np.where(valid, slope, np.nan)
+    count = valid.sum(axis=1)
+    out = np.column_stack([
+        _safe_div(np.nansum(w_std, axis=1), count),
+        np.max(np.where(valid, w_std, -np.inf), axis=1),
+        _safe_div(np.nansum(w_slope, axis=1), count),
+        np.max(np.where(valid, w_slope, -np.inf), axis=1),
+    ])
+    out[count == 0] = np.nan
+    return out
+
+
+def _window_block(path: str, start: int, stop: int, window: int, hop: int,
+                  fs: float) -> np.ndarray:
+    return window_features(np.load(path, mmap_mode='r')[start:stop], window, hop, fs)
+
+
+@profiled('Pulse · windowed ECG features')
+def run_pulse_windows(file_path: str, window_s: float = WINDOW_S, hop_s: float = HOP_S,
+                      fs: float = SAMPLING_HZ, block_rows: int = CHUNK_ROWS,
+                      memmap_path: str = ECG_MEMMAP_PATH, n_jobs: int = -1) -> pd.DataFrame:
+    """
+    Sliding-window ECG statistics summarized per record.
+
+    Parameters
+    ----------
+    file_path : str      Path to `ecg_timeseries.csv` (one record per row).
+    window_s : float     Window length in seconds (clipped to the record width).
+    hop_s : float        Step between window starts in seconds.
+    fs : float           Sampling rate in Hz.
+    block_rows : int     Records per block scored by one worker.
+    memmap_path : str    ``.npy`` cache of the sample matrix (see `signal_memmap`).
+    n_jobs : int         joblib workers (``-1`` = all cores); each maps the
+                         cache itself, so no signal data is pickled.
+
+    Returns
+    -------
+    pd.DataFrame  ``id`` | `window_feature_names()` — merge via
+                  `CatalystFeatureSynthesizer.synthesize(..., df_windows=...)`.
+    """
+    print("⚡ Pulse-Harmonization (windowed): sliding-window statistics...")
+    signal = signal_memmap(file_path, memmap_path, block_rows)
+    n_rows, width = signal.shape
+    window = max(2, min(int(round(window_s * fs)), width))
+    hop = max(1, int(round(hop_s * fs)))
+    if window < window_s * fs:
+        print(f"   ⚠️  {window_s:g}s window exceeds the {width}-sample records → clipped to {window}")
+    print(f"   window {window} samples, hop {hop} samples, {n_rows:,} records → {memmap_path}")
+
+    blocks = joblib.Parallel(n_jobs=n_jobs, prefer='processes', return_as='generator')(
+        joblib.delayed(_window_block)(memmap_path, start, min(start + block_rows, n_rows),
+                                      window, hop, fs)
+        for start in range(0, n_rows, block_rows)
+    )
+    blocks = list(blocks)
+    feats = np.concatenate(blocks) if blocks else np.empty((0, len(window_feature_names())))
+    annotate(rows=n_rows)
+
+    df = pd.DataFrame(feats, columns=window_feature_names())
+    df.insert(0, 'id', np.arange(len(df)).astype(str))
+    print(f"✅ Pulse-Harmonization (windowed) Complete  →  {len(df):,} ECG records")
+    return df
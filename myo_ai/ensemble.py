@@ -0,0 +1,140 @@
+"""
+Stacking stage — a blended "champion" from the tournament contestants.
+
+Out-of-fold (OOF) probabilities are computed once per contestant: all
+(contestant × fold) fits run on one joblib process pool, and each
+contestant's OOF vector is cached on disk under a hash of its pipeline
+configuration and the training data, so re-running the notebook (or
+adding one contestant) only refits what changed.
+
+A logistic-regression meta-learner is fitted on the logits of those OOF
+probabilities.  At scoring time the tournament's *already fitted*
+contestants supply the base probabilities — nothing is retrained — and
+`StackedChampion` bundles them with the meta-learner into one
+`predict_proba` artifact that `joblib.dump` writes to a single file.
+
+Pulse-Sync is not stacked: its k-fold refits would each need a full
+TensorFlow training run.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from ._lazy import lazy_import
+
+joblib         = lazy_import('joblib')
+_base          = lazy_import('sklearn.base')
+_linear_model  = lazy_import('sklearn.linear_model')
+_model_select  = lazy_import('sklearn.model_selection')
+
+
+STACK_N_SPLITS = 5
+STACK_CACHE_DIR = os.path.join('cache', 'stack_oof')
+STACK_PROB_CLIP = 1e-6          # keeps logits finite for 0 / 1 probabilities
+
+
+def _logit(p: np.ndarray) -> np.ndarray:
+    p = np.clip(p, STACK_PROB_CLIP, 1 - STACK_PROB_CLIP)
+    return np.log(p / (1 - p))
+
+
+# ── Out-of-fold probabilities ───────────────────────────────
+def _fit_predict_fold(pipeline, X, y, train_idx, valid_idx):
+    """Fit a fresh clone of *pipeline* on one fold → P(class 1) on its hold-out."""
+    model = _base.clone(pipeline).fit(X.iloc[train_idx], y[train_idx])
+    return model.predict_proba(X.iloc[valid_idx])[:, 1]
+
+
+def oof_probabilities(pipelines: dict, X, y, n_splits: int = STACK_N_SPLITS,
+                      seed: int = 42, cache_dir: str = STACK_CACHE_DIR,
+                      n_jobs: int = -1) -> pd.DataFrame:
+    """
+    Out-of-fold P(class 1) for every contestant on the training split.
+
+    Parameters
+    ----------
+    pipelines : dict[str, Pipeline]   Contestant name → (fitted or unfitted)
+                                      pipeline; only its configuration is used.
+    X, y                              Training split (DataFrame, Series / array).
+    cache_dir : str | None            Where OOF vectors are cached (None = off).
+
+    Returns
+    -------
+    pd.DataFrame  (n_train × contestants) OOF probabilities, index of *X*.
+    """
+    y = np.asarray(y)
+    folds = list(_model_select.StratifiedKFold(
+        n_splits=n_splits, shuffle=True, random_state=seed).split(X, y))
+
+    oof, cache_paths, pending = {}, {}, []
+    for name, pipeline in pipelines.items():
+        template = _base.clone(pipeline)
+        if cache_dir is not None:
+            key = joblib.hash((template, X, y, n_splits, seed))
+            cache_paths[name] = os.path.join(cache_dir, f'oof_{key}.npy')
+            if os.path.exists(cache_paths[name]):
+                oof[name] = np.load(cache_paths[name])
+                continue
+        pending.append((name, template))
+
+    tasks = [(name, template, k) for name, template in pending for k in range(n_splits)]
+    results = joblib.Parallel(n_jobs=n_jobs, prefer='processes')(
+        joblib.delayed(_fit_predict_fold)(template, X, y, *folds[k])
+        for _, template, k in tasks
+    )
+    for name, _ in pending:
+        oof[name] = np.empty(len(y), dtype=np.float64)
+    for (name, _, k), prob in zip(tasks, results):
+        oof[name][folds[k][1]] = prob
+
+    if cache_dir is not None:
+        os.makedirs(cache_dir, exist_ok=True)
+        for name, _ in pending:
+            np.save(cache_paths[name], oof[name])
+
+    return pd.DataFrame({name: oof[name] for name in pipelines}, index=X.index)
+
+
+# ── Stacked model ───────────────────────────────────────────
+class StackedChampion:
+    """
+    Fitted contestants + logistic meta-learner as one scoring artifact.
+
+    Exposes the scikit-learn classifier interface (`predict_proba`,
+    `predict`), so it drops into `joblib.dump` / `demo_app.py` like any
+    fitted pipeline.
+    """
+
+    def __init__(self, base_models: dict, meta_C: float = 1.0):
+        self.base_models = dict(base_models)
+        self.meta_C = meta_C
+        self.meta = None
+
+    @property
+    def names(self) -> list:
+        return list(self.base_models)
+
+    def fit_meta(self, oof: pd.DataFrame, y) -> 'StackedChampion':
+        """Fit the meta-learner on OOF probabilities (columns = `names`)."""
+        self.meta = _linear_model.LogisticRegression(C=self.meta_C, max_iter=1000)
+        self.meta.fit(_logit(oof[self.names].to_numpy()), np.asarray(y))
+        return self
+
+    @property
+    def weights(self) -> pd.Series:
+        """Meta-learner coefficient per contestant (on the logit scale)."""
+        return pd.Series(self.meta.coef_[0], index=self.names, name='Weight')
+
+    def base_probabilities(self, X) -> np.ndarray:
+        """(n × contestants) P(class 1) from every fitted contestant."""
+        return np.column_stack([m.predict_proba(X)[:, 1] for m in self.base_models.values()])
+
+    def predict_proba(self, X) -> np.ndarray:
+        """Return blended class probabilities, shape (n, 2)."""
+        return self.meta.predict_proba(_logit(self.base_probabilities(X)))
+
+    def predict(self, X, threshold: float = 0.5) -> np.ndarray:
+        """Return hard 0/1 labels at *threshold*."""
+        return (self.predict_proba(X)[:, 1] >= threshold).astype(int)
@@ -0,0 +1,249 @@
+"""
+Evaluation engine — every tournament metric from one sorted array.
+
+All contestants' test-set probabilities are stacked into a single
+(models × samples) array and sorted once per model.  ROC and PR curves,
+ROC-AUC (trapezoid over the tie-collapsed ROC points, equal to the
+mid-rank Mann–Whitney statistic), average precision, confusion matrices
+at a whole grid of thresholds and calibration bins are then read off the
+same sorted cumulative counts in vectorized passes, instead of one
+`roc_curve` / `auc` / `confusion_matrix` call per model per cell.
+
+Bootstrap confidence intervals for ROC-AUC reuse the significance
+stage's paired, sort-once bootstrap (`significance.bootstrap_auc`).
+
+The evaluation labels come from `shared_labels`, which checks that every
+contestant was scored on the same test split rather than trusting the
+first contestant's `y_test`.
+"""
+
+import numpy as np
+import pandas as pd
+
+from ._lazy import lazy_import
+
+significance = lazy_import(f'{__package__}.significance')
+
+
+EVAL_THRESHOLDS = np.linspace(0.0, 1.0, 101)
+CALIBRATION_BINS = 10
+BOOTSTRAP_N = 1000
+
+
+# ── Inputs ──────────────────────────────────────────────────
+def shared_labels(labels: dict) -> np.ndarray:
+    """
+    The single test-label vector shared by all contestants.
+
+    Raises
+    ------
+    ValueError  if any contestant was evaluated on a different split.
+    """
+    names = list(labels)
+    if not names:
+        raise ValueError("No contestant labels registered")
+    ref = np.asarray(labels[names[0]])
+    for name in names[1:]:
+        if not np.array_equal(ref, np.asarray(labels[name])):
+            raise ValueError(f"{name!r} was scored on a different test split than {names[0]!r}")
+    return ref.astype(int)
+
+
+def stack_probabilities(probabilities: dict, names: list = None):
+    """(names, P) with P the (models × samples) float64 probability array."""
+    names = list(names or probabilities)
+    return names, np.vstack([np.asarray(probabilities[n], dtype=np.float64) for n in names])
+
+
+# ── Sorted cumulative counts ────────────────────────────────
+def _tie_bounds(p_sorted: np.ndarray):
+    """
+    First / last column of the run of equal scores around each position
+    of a row-sorted array, plus a mask of each run's last position.
+    """
+    n = p_sorted.shape[1]
+    cols = np.arange(n)
+    same_prev = np.zeros(p_sorted.shape, dtype=bool)
+    same_prev[:, 1:] = p_sorted[:, 1:] == p_sorted[:, :-1]
+    same_next = np.zeros_like(same_prev)
+    same_next[:, :-1] = same_prev[:, 1:]
+    start = np.maximum.accumulate(np.where(same_prev, 0, cols), axis=1)
+    end = np.minimum.accumulate(np.where(same_next, n - 1, cols)[:, ::-1], axis=1)[:, ::-1]
+    return start, end, ~same_next
+
+
+def _sorted_counts(y: np.ndarray, P: np.ndarray) -> dict:
+    """
+    Sort each row of *P* in descending order (once) and derive the
+    cumulative true / false positive counts and the tie-group bounds.
+    """
+    order = np.argsort(-P, axis=1, kind='stable')
+    p_sorted = np.take_along_axis(P, order, axis=1)
+    y_sorted = y[order]
+    tps = np.cumsum(y_sorted, axis=1)
+    fps = np.arange(1, P.shape[1] + 1) - tps
+    start, end, is_end = _tie_bounds(p_sorted)
+    return {
+        'p_sorted': p_sorted, 'y_sorted': y_sorted, 'tps': tps, 'fps': fps,
+        'start': start, 'end': end, 'is_end': is_end,
+        'n_pos': int(y.sum()), 'n_neg': int(len(y) - y.sum()),
+    }
+
+
+def _before_group(counts: dict, key: str) -> np.ndarray:
+    """Cumulative count *key* just before each position's tie group (0 for the first)."""
+    start = counts['start']
+    return np.where(start > 0,
+                    np.take_along_axis(counts[key], np.maximum(start - 1, 0), axis=1), 0)
+
+
+def _rank_auc(counts: dict) -> np.ndarray:
+    """
+    ROC-AUC per model: the trapezoid area under the tie-collapsed ROC
+    points, i.e. the Mann–Whitney statistic with mid-ranks for ties,
+    read off the already sorted counts (no second sort).
+    """
+    tps, fps, is_end = counts['tps'], counts['fps'], counts['is_end']
+    tps_before, fps_before = _before_group(counts, 'tps'), _before_group(counts, 'fps')
+    area = np.where(is_end, (fps - fps_before) * (tps + tps_before) / 2.0, 0).sum(axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return area / (counts['n_pos'] * counts['n_neg'])
+
+
+# ── Curves & metrics ────────────────────────────────────────
+def roc_curves(counts: dict) -> list:
+    """Per-model (fpr, tpr, thresholds) at every distinct score, like `roc_curve`."""
+    curves = []
+    for i in range(len(counts['tps'])):
+        keep = counts['is_end'][i]
+        tpr = np.r_[0.0, counts['tps'][i, keep] / counts['n_pos']]
+        fpr = np.r_[0.0, counts['fps'][i, keep] / counts['n_neg']]
+        thr = np.r_[np.inf, counts['p_sorted'][i, keep]]
+        curves.append((fpr, tpr, thr))
+    return curves
+
+
+def pr_curves(counts: dict) -> list:
+    """Per-model (precision, recall, thresholds) at every distinct score."""
+    curves = []
+    for i in range(len(counts['tps'])):
+        keep = counts['is_end'][i]
+        tps, fps = counts['tps'][i, keep], counts['fps'][i, keep]
+        curves.append((tps / (tps + fps), tps / counts['n_pos'], counts['p_sorted'][i, keep]))
+    return curves
+
+
+def average_precision(counts: dict) -> np.ndarray:
+    """Step-wise average precision per model (sklearn's definition)."""
+    tps, fps, is_end = counts['tps'], counts['fps'], counts['is_end']
+    pos_in_group = np.where(is_end, tps - _before_group(counts, 'tps'), 0)
+    precision = tps / (tps + fps)
+    return (pos_in_group * precision).sum(axis=1) / counts['n_pos']
+
+
+def threshold_confusion(counts: dict, thresholds=EVAL_THRESHOLDS) -> np.ndarray:
+    """
+    Confusion matrices for every model at every threshold (predict 1 when
+    p >= t).
+
+    Returns
+    -------
+    np.ndarray  (models × thresholds × 2 × 2) counts, rows = actual
+                [0, 1], columns = predicted [0, 1] (sklearn layout).
+    """
+    thresholds = np.asarray(thresholds, dtype=np.float64)
+    m, n = counts['tps'].shape
+    tps = np.hstack([np.zeros((m, 1)), counts['tps']])
+    fps = np.hstack([np.zeros((m, 1)), counts['fps']])
+    n_flagged = np.vstack([
+        np.searchsorted(-counts['p_sorted'][i], -thresholds, side='right') for i in range(m)
+    ])
+    tp = np.take_along_axis(tps, n_flagged, axis=1)
+    fp = np.take_along_axis(fps, n_flagged, axis=1)
+    fn = counts['n_pos'] - tp
+    tn = counts['n_neg'] - fp
+    return np.stack([np.stack([tn, fp], axis=-1), np.stack([fn, tp], axis=-1)], axis=-2).astype(int)
+
+
+def calibration_bins(y: np.ndarray, P: np.ndarray, n_bins: int = CALIBRATION_BINS) -> dict:
+    """
+    Equal-width reliability bins for all models in one `bincount`.
+
+    Returns
+    -------
+    dict  mean_pred, frac_pos, count — each (models × n_bins); empty
+          bins hold NaN.
+    """
+    m, n = P.shape
+    bins = np.minimum((P * n_bins).astype(np.intp), n_bins - 1)
+    flat = (bins + np.arange(m)[:, None] * n_bins).ravel()
+    size = m * n_bins
+    count = np.bincount(flat, minlength=size).reshape(m, n_bins)
+    sum_pred = np.bincount(flat, weights=P.ravel(), minlength=size).reshape(m, n_bins)
+    sum_pos = np.bincount(flat, weights=np.broadcast_to(y, P.shape).ravel(),
+                          minlength=size).reshape(m, n_bins)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return {'mean_pred': sum_pred / count, 'frac_pos': sum_pos / count, 'count': count}
+
+
+# ── Bootstrap ───────────────────────────────────────────────
+def bootstrap_auc_ci(y, P, n_boot: int = BOOTSTRAP_N, alpha: float = 0.05,
+                     n_jobs: int = -1, seed: int = 42):
+    """
+    Percentile bootstrap (1 - *alpha*) interval of ROC-AUC per model.
+
+    Replicates come from `significance.bootstrap_auc` (paired resamples,
+    O(n) each on the precomputed sort orders, spread over a process pool).
+
+    Returns
+    -------
+    (np.ndarray, np.ndarray)  (models × 2) lower / upper bounds, and the
+                              (n_boot × models) replicates themselves.
+    """
+    reps = significance.bootstrap_auc(y, P, n_replicates=n_boot, n_jobs=n_jobs, seed=seed)
+    ci = np.nanpercentile(reps, [100 * alpha / 2, 100 * (1 - alpha / 2)], axis=0).T
+    return ci, reps
+
+
+# ── One-call evaluation ─────────────────────────────────────
+def evaluate_models(y, probabilities: dict, names: list = None,
+                    thresholds=EVAL_THRESHOLDS, n_bins: int = CALIBRATION_BINS,
+                    n_boot: int = BOOTSTRAP_N, n_jobs: int = -1) -> dict:
+    """
+    Evaluate every contestant from one stacked probability array.
+
+    Returns
+    -------
+    dict
+        names, P            : model order and (models × samples) array
+        roc_auc, avg_precision, auc_ci : per-model metrics
+        auc_replicates      : (n_boot × models) bootstrap AUCs (or None)
+        roc, pr             : per-model curve tuples
+        thresholds, confusion : grid and (models × thresholds × 2 × 2) counts
+        calibration         : see `calibration_bins`
+        summary             : DataFrame, one row per model
+    """
+    y = np.asarray(y).astype(int)
+    names, P = stack_probabilities(probabilities, names)
+    counts = _sorted_counts(y, P)
+    roc_auc = _rank_auc(counts)
+    ap = average_precision(counts)
+    if n_boot:
+        auc_ci, auc_reps = bootstrap_auc_ci(y, P, n_boot=n_boot, n_jobs=n_jobs)
+    else:
+        auc_ci, auc_reps = np.full((len(names), 2), np.nan), None
+
+    summary = pd.DataFrame({
+        'Model': names,
+        'ROC-AUC': roc_auc,
+        'AUC 95% CI': [f"[{lo:.4f}, {hi:.4f}]" for lo, hi in auc_ci],
+        'PR-AUC': ap,
+    })
+    return {
+        'names': names, 'P': P,
+        'roc_auc': roc_auc, 'avg_precision': ap, 'auc_ci': auc_ci, 'auc_replicates': auc_reps,
+        'roc': roc_curves(counts), 'pr': pr_curves(counts),
+        'thresholds': np.asarray(thresholds), 'confusion': threshold_confusion(counts, thresholds),
+        'calibration': calibration_bins(y, P, n_bins),
+        'summary': summary,
+    }
@@ -0,0 +1,199 @@
+"""
+Layer 3 — The Intelligence (explainability & analysis stage).
+
+- Zenith:  PCA + KMeans risk-group clustering, scatter or density rendering
+- Oracle:  SHAP TreeExplainer values and the density-binned beeswarm
+
+Density rendering pre-aggregates points into 2-D histograms with NumPy so
+draw cost is independent of N.  matplotlib, shap and the sklearn
+decomposition / clustering modules are imported on first use.  SHAP
+value computation is recorded as a `telemetry` stage.
+"""
+
+import numpy as np
+
+from ._lazy import lazy_import
+from .telemetry import profiled
+
+_mpl      = lazy_import('matplotlib')
+mcolors   = lazy_import('matplotlib.colors')
+shap      = lazy_import('shap')
+_decomp   = lazy_import('sklearn.decomposition')
+_cluster  = lazy_import('sklearn.cluster')
+
+
+# ══════════════════════════════════════════════════════════════
+#  DENSITY RENDERING — N-independent rasters for large point clouds
+# ══════════════════════════════════════════════════════════════
+
+DENSITY_SWITCH_POINTS = 200_000     # 'auto' → density above this many points
+DENSITY_GRID_BINS     = 400         # raster resolution (bins per axis)
+DENSITY_CHUNK_SIZE    = 1_000_000   # points binned per pass (bounds temp memory)
+
+
+def resolve_render_mode(mode: str, n_points: int,
+                        switch_points: int = DENSITY_SWITCH_POINTS) -> str:
+    """Map 'auto' onto 'scatter' / 'density' based on the point count."""
+    if mode == 'auto':
+        return 'density' if n_points > switch_points else 'scatter'
+    return mode
+
+
+def _bin_index(values: np.ndarray, lo: float, hi: float, bins: int) -> np.ndarray:
+    """Vectorized uniform-bin lookup, clipped into [0, bins - 1]."""
+    span = (hi - lo) or 1.0
+    idx = ((values - lo) * (bins / span)).astype(np.intp)
+    return np.clip(idx, 0, bins - 1, out=idx)
+
+
+def group_density_image(x, y, groups, colors, bins=DENSITY_GRID_BINS,
+                        extent=None, chunk_size=DENSITY_CHUNK_SIZE):
+    """
+    Pre-aggregate (x, y) points into one 2-D histogram per group and
+    blend them into an RGBA raster.
+
+    Each bin takes the count-weighted mix of its groups' colours, and its
+    opacity follows log(count) so sparse regions stay visible.  Points are
+    binned in chunks with a single ``np.bincount`` per chunk, so peak
+    temporary memory is bounded by ``chunk_size`` regardless of N.
+
+    Parameters
+    ----------
+    x, y : np.ndarray         Point coordinates (same length).
+    groups : np.ndarray       Integer group id per point, in [0, len(colors)).
+    colors : sequence         One matplotlib colour per group.
+    bins : int                Raster resolution (bins per axis).
+    extent : tuple, optional  (xmin, xmax, ymin, ymax); defaults to data range.
+
+    Returns
+    -------
+    (np.ndarray, tuple)  RGBA image of shape (bins, bins, 4) and its extent.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    groups = np.asarray(groups, dtype=np.intp)
+    if extent is None:
+        extent = (float(x.min()), float(x.max()), float(y.min()), float(y.max()))
+    x0, x1, y0, y1 = extent
+
+    n_groups = len(colors)
+    counts = np.zeros(n_groups * bins * bins, dtype=np.int64)
+    for start in range(0, len(x), chunk_size):
+        stop = start + chunk_size
+        ix = _bin_index(x[start:stop], x0, x1, bins)
+        iy = _bin_index(y[start:stop], y0, y1, bins)
+        flat = (groups[start:stop] * bins + iy) * bins + ix
+        counts += np.bincount(flat, minlength=counts.size)
+    counts = counts.reshape(n_groups, bins, bins)
+
+    total = counts.sum(axis=0)
+    rgb = np.array([mcolors.to_rgb(c) for c in colors])
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mix = np.einsum('gyx,gc->yxc', counts, rgb) / total[..., None]
+    alpha = np.log1p(total) / max(np.log1p(total.max()), 1e-12)
+
+    rgba = np.dstack([np.nan_to_num(mix), alpha])
+    return rgba, extent
+
+
+def draw_density(ax, rgba, extent):
+    """Draw a pre-aggregated RGBA raster onto *ax* (cost independent of N)."""
+    return ax.imshow(rgba, extent=extent, origin='lower', aspect='auto',
+                     interpolation='nearest')
+
+
+# ══════════════════════════════════════════════════════════════
+#  ZENITH — Unsupervised Patient Risk Grouping
+# ══════════════════════════════════════════════════════════════
+
+RISK_NAMES  = {0: 'Low Risk', 1: 'Moderate Risk', 2: 'High Risk'}
+RISK_COLORS = {0: '#2ecc71',  1: '#f39c12',       2: '#e74c3c'}
+
+
+def zenith_clusters(X, n_clusters: int = 3, random_state: int = 42):
+    """
+    Project *X* to 2-D with PCA and group patients with KMeans.
+
+    Cluster ids are relabelled by ascending mean PC1 so that 0 / 1 / 2
+    map onto Low / Moderate / High risk.
+
+    Returns
+    -------
+    (np.ndarray, np.ndarray, PCA, KMeans)
+        2-D coordinates, risk-group label per row, fitted PCA and KMeans.
+    """
+    pca = _decomp.PCA(n_components=2, random_state=random_state)
+    X_pca = pca.fit_transform(X)
+
+    kmeans = _cluster.KMeans(n_clusters=n_clusters, random_state=random_state, n_init=10)
+    clusters = kmeans.fit_predict(X_pca)
+
+    cluster_order = [X_pca[clusters == c, 0].mean() for c in range(n_clusters)]
+    label_map = {c: rank for rank, c in enumerate(sorted(range(n_clusters), key=lambda i: cluster_order[i]))}
+    label_lut = np.array([label_map[c] for c in range(n_clusters)])
+    return X_pca, label_lut[clusters], pca, kmeans
+
+
+# ══════════════════════════════════════════════════════════════
+#  ORACLE — SHAP Explainability
+# ══════════════════════════════════════════════════════════════
+
+ORACLE_MAX_DISPLAY = 20       # features shown (top by mean |SHAP|)
+
+
+@profiled('Oracle · SHAP values', rows='X')
+def tree_shap_values(model, X):
+    """Return (TreeExplainer, SHAP values) for a fitted tree model."""
+    explainer = shap.TreeExplainer(model)
+    return explainer, explainer.shap_values(X)
+
+
+def shap_density_image(shap_vals, feature_vals, bins=DENSITY_GRID_BINS,
+                       max_display=ORACLE_MAX_DISPLAY, cmap='coolwarm',
+                       chunk_size=DENSITY_CHUNK_SIZE):
+    """
+    Density version of the SHAP beeswarm: one raster row per feature.
+
+    Each row histograms that feature's SHAP values along the x-axis; a
+    bin is coloured by the mean feature value (percentile-normalized
+    like SHAP's own colouring) of the rows that fell into it, and its
+    opacity follows log(count) within the row.
+
+    Returns
+    -------
+    (np.ndarray, tuple, np.ndarray)
+        RGBA image (n_display, bins, 4), its extent, and the displayed
+        feature indices ordered bottom → top (ascending importance).
+    """
+    shap_vals = np.asarray(shap_vals)
+    feature_vals = np.asarray(feature_vals, dtype=float)
+    order = np.argsort(np.abs(shap_vals).mean(axis=0))[-max_display:]
+    n_show = len(order)
+
+    lo = float(shap_vals[:, order].min())
+    hi = float(shap_vals[:, order].max())
+    vmin = np.nanpercentile(feature_vals[:, order], 5, axis=0)
+    vmax = np.nanpercentile(feature_vals[:, order], 95, axis=0)
+    vspan = np.where(vmax > vmin, vmax - vmin, 1.0)
+    row_offset = np.arange(n_show) * bins
+
+    counts = np.zeros(n_show * bins)
+    sums = np.zeros(n_show * bins)
+    for start in range(0, len(shap_vals), chunk_size):
+        stop = start + chunk_size
+        ix = _bin_index(shap_vals[start:stop, order], lo, hi, bins) + row_offset
+        fnorm = np.clip((feature_vals[start:stop, order] - vmin) / vspan, 0, 1)
+        fnorm = np.nan_to_num(fnorm, nan=0.5)
+        counts += np.bincount(ix.ravel(), minlength=counts.size)
+        sums += np.bincount(ix.ravel(), weights=fnorm.ravel(), minlength=sums.size)
+    counts = counts.reshape(n_show, bins)
+    sums = sums.reshape(n_show, bins)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean_val = np.nan_to_num(sums / counts, nan=0.5)
+        row_max = np.log1p(counts.max(axis=1, keepdims=True))
+        alpha = np.nan_to_num(np.log1p(counts) / row_max)
+    rgba = _mpl.colormaps[cmap](mean_val)
+    rgba[..., 3] = alpha
+    extent = (lo, hi, -0.5, n_show - 0.5)
+    return rgba, extent, order
@@ -0,0 +1,137 @@
+"""
+Streaming median imputation — a drop-in for `SimpleImputer(strategy='median')`.
+
+`SimpleImputer` sorts every full column (through masked arrays) to find
+its median.  On the outer-joined MASTER_DATA many columns are mostly
+NaN across sources, so most of that work is spent on missing cells.
+`StreamingMedianImputer` keeps one mergeable KLL sketch per column
+(`sketch.ColumnSketch`) instead:
+
+- `partial_fit` folds in a chunk at a time, so the training matrix never
+  has to be materialized (see `outofcore`);
+- `merge` combines imputers fitted by different workers or on different
+  row groups;
+- `transform` is a single vectorized `np.where`.
+
+Columns with at most `SKETCH_K` observed values keep every value and
+get the exact median; larger columns get a median whose rank is within
+`compare_exact`'s reported tolerance (typically < 1e-3).  As in
+`SimpleImputer`, columns with no observed value are dropped on
+`transform` unless `keep_empty_features=True` (then filled with 0).
+float32 input stays float32 (the lean Aegis pipeline casts before
+imputing); anything else is converted to float64.
+
+This module imports scikit-learn's base classes on load; stages bind it
+with `lazy_import`.
+"""
+
+import numpy as np
+import pandas as pd
+from sklearn.base import BaseEstimator, TransformerMixin
+from sklearn.utils.validation import check_is_fitted, validate_data
+
+from .sketch import SKETCH_K, ColumnSketch, relative_rank_error
+
+
+class StreamingMedianImputer(TransformerMixin, BaseEstimator):
+    """
+    Median imputer backed by mergeable per-column quantile sketches.
+
+    Parameters
+    ----------
+    k : int                     Sketch capacity (rank error ~1.7 / k).
+    keep_empty_features : bool  Keep all-NaN columns (filled with 0).
+    seed : int                  Seed of the sketches' compaction coin flips.
+
+    Attributes
+    ----------
+    statistics_ : np.ndarray    Per-column median (NaN for empty columns).
+    counts_ : np.ndarray        Observed (non-NaN) values per column.
+    """
+
+    def __init__(self, k: int = SKETCH_K, keep_empty_features: bool = False, seed: int = 42):
+        self.k = k
+        self.keep_empty_features = keep_empty_features
+        self.seed = seed
+
+    def _validate(self, X, reset: bool):
+        return validate_data(self, X, reset=reset, dtype=[np.float64, np.float32],
+                             ensure_all_finite='allow-nan', copy=False)
+
+    def _refresh(self):
+        self.statistics_ = self.sketch_.quantiles([0.5])[0]
+        self.counts_ = self.sketch_.counts
+        return self
+
+    # ── Fitting ─────────────────────────────────────────────
+    def fit(self, X, y=None):
+        """Fit on all of *X* (one chunk)."""
+        for attr in ('sketch_', 'statistics_', 'counts_'):
+            self.__dict__.pop(attr, None)
+        return self.partial_fit(X)
+
+    def partial_fit(self, X, y=None):
+        """Fold another chunk of rows into the column sketches."""
+        first = not hasattr(self, 'sketch_')
+        X = self._validate(X, reset=first)
+        if first:
+            self.sketch_ = ColumnSketch(X.shape[1], k=self.k, seed=self.seed)
+        self.sketch_.update(X)
+        return self._refresh()
+
+    def merge(self, other: 'StreamingMedianImputer'):
+        """Combine with an imputer fitted on other rows of the same columns."""
+        check_is_fitted(self)
+        check_is_fitted(other)
+        if other.n_features_in_ != self.n_features_in_:
+            raise ValueError(f"Cannot merge imputers over {self.n_features_in_} and "
+                             f"{other.n_features_in_} features")
+        self.sketch_.merge(other.sketch_)
+        return self._refresh()
+
+    # ── Transform ───────────────────────────────────────────
+    @property
+    def _kept(self) -> np.ndarray:
+        return np.ones(len(self.statistics_), dtype=bool) if self.keep_empty_features \
+            else self.counts_ > 0
+
+    def transform(self, X):
+        """Fill NaNs with the column medians (one vectorized `np.where`, input dtype kept)."""
+        check_is_fitted(self)
+        X = self._validate(X, reset=False)
+        fill = np.nan_to_num(self.statistics_).astype(X.dtype)
+        kept = self._kept
+        if not kept.all():
+            X, fill = X[:, kept], fill[kept]
+        return np.where(np.isnan(X), fill, X)
+
+    def get_feature_names_out(self, input_features=None):
+        check_is_fitted(self)
+        if input_features is None:
+            input_features = getattr(self, 'feature_names_in_',
+                                     [f'x{i}' for i in range(self.n_features_in_)])
+        return np.asarray(input_features, dtype=object)[self._kept]
+
+    # ── Accuracy ────────────────────────────────────────────
+    def compare_exact(self, X) -> pd.DataFrame:
+        """
+        Sketch vs. exact median per column of *X* (the data it was fitted on).
+
+        Returns
+        -------
+        pd.DataFrame  Feature, Observed, Sketch Median, Exact Median, Rank Error
+                      (|rank / n − 0.5| of the sketch median in the exact data).
+        """
+        check_is_fitted(self)
+        X = self._validate(X, reset=False)
+        exact = np.array([np.median(col[~np.isnan(col)]) if self.counts_[j] else np.nan
+                          for j, col in enumerate(X.T)])
+        return pd.DataFrame({
+            'Feature': getattr(self, 'feature_names_in_',
+                               [f'x{i}' for i in range(self.n_features_in_)]),
+            'Observed': self.counts_,
+            'Sketch Median': self.statistics_,
+            'Exact Median': exact,
+            'Rank Error': [relative_rank_error(col, m) if n else 0.0
+                           for col, m, n in zip(X.T, self.statistics_, self.counts_)],
+        })
@@ -0,0 +1,178 @@
+"""
+Incremental stage — daily patient batches without a full retrain.
+
+A fitted contestant pipeline keeps its preprocessing (imputer medians,
+scaler statistics) frozen, and only its classifier learns from the new
+rows:
+
+| Contestant | Classifier            | Update                                   |
+|---|---|---|
+| Sentinel   | `GaussianNB`          | `partial_fit` — exact running class moments |
+| Vanguard   | `SGDClassifier` (log-loss, `train.build_vanguard_pipeline(online=True)`) | `partial_fit` — one SGD epoch over the batch |
+| Myo-Core   | `HistGradientBoosting` | warm start: `MYOCORE_WARM_ITER` extra trees fitted to the batch's gradients |
+
+Myo-Core's warm start keeps the bin mapper learned on the original
+training data.  scikit-learn would otherwise re-fit the mapper on the
+new batch and replay the existing trees on those re-binned codes, so
+the gradients the new trees fit would start from wrong predictions.
+Keeping it means overriding the model's private ``_bin_data`` hook, so
+the warm start checks the scikit-learn version against
+`SKLEARN_TESTED` (``requirements.txt`` pins it) and the hook's
+signature, and raises `RuntimeError` rather than silently re-binning
+on a release it was not tested with.
+
+Every update is saved as a new version directory (`vNNNN/`) holding one
+joblib file per model and a `manifest.json` with the parent version,
+row counts, a hash of the batch and the caller's metrics, so any
+earlier model can be restored.
+"""
+
+import contextlib
+import datetime
+import inspect
+import json
+import os
+
+import numpy as np
+
+from ._lazy import lazy_import
+
+joblib     = lazy_import('joblib')
+sklearn    = lazy_import('sklearn')
+_ensemble  = lazy_import('sklearn.ensemble')
+
+
+INCREMENTAL_ROOT = os.path.join('artifacts', 'incremental')
+MYOCORE_WARM_ITER = 20          # extra boosting iterations per batch
+MANIFEST = 'manifest.json'
+SKLEARN_TESTED = ('1.6',)       # minor releases whose private HGB binning `_frozen_bins` overrides
+
+
+# ── Classifier updates ──────────────────────────────────────
+def _check_bin_hook(hgb):
+    """Raise if *hgb*'s private binning may differ from the one `_frozen_bins` replaces."""
+    version = '.'.join(sklearn.__version__.split('.')[:2])
+    if version not in SKLEARN_TESTED:
+        raise RuntimeError(f"Myo-Core warm start overrides private HistGradientBoosting binning "
+                           f"tested on scikit-learn {', '.join(SKLEARN_TESTED)}, not "
+                           f"{sklearn.__version__}; install the version in requirements.txt "
+                           f"or retrain from scratch")
+    params = list(inspect.signature(hgb._bin_data).parameters)
+    if params != ['X', 'is_training_data'] or not hasattr(hgb, '_bin_mapper'):
+        raise RuntimeError(f"Unexpected HistGradientBoosting binning hook _bin_data{tuple(params)} "
+                           f"in scikit-learn {sklearn.__version__}")
+
+
+@contextlib.contextmanager
+def _frozen_bins(hgb):
+    """Make a fitted HGB model reuse its bin mapper while it warm-starts."""
+    _check_bin_hook(hgb)
+    mapper = hgb._bin_mapper
+
+    def bin_data(X, is_training_data):
+        hgb._bin_mapper = mapper
+        X_binned = mapper.transform(X)
+        return X_binned if is_training_data else np.ascontiguousarray(X_binned)
+
+    hgb._bin_data = bin_data
+    try:
+        yield hgb
+    finally:
+        del hgb._bin_data
+        hgb._bin_mapper = mapper
+
+
+def warm_start_boosting(hgb, X, y, extra_iter: int = MYOCORE_WARM_ITER):
+    """Fit *extra_iter* more trees of a fitted HGB classifier on (X, y)."""
+    hgb.set_params(warm_start=True, max_iter=hgb.n_iter_ + extra_iter)
+    with _frozen_bins(hgb):
+        hgb.fit(X, y)
+    return hgb
+
+
+def partial_update(pipeline, X_new, y_new, extra_iter: int = MYOCORE_WARM_ITER):
+    """
+    Update a fitted contestant pipeline in place with a new labelled batch.
+
+    The preprocessing steps only `transform`; the final classifier is
+    updated with `partial_fit` when it has one, or by a boosting warm
+    start for `HistGradientBoostingClassifier`.
+
+    Raises
+    ------
+    TypeError  if the classifier supports neither (e.g. RandomForest,
+               lbfgs LogisticRegression — use their online variants).
+    """
+    clf = pipeline[-1]
+    X_t = pipeline[:-1].transform(X_new) if len(pipeline) > 1 else X_new
+    y_new = np.asarray(y_new)
+    if hasattr(clf, 'partial_fit'):
+        clf.partial_fit(X_t, y_new)
+    elif isinstance(clf, _ensemble.HistGradientBoostingClassifier):
+        warm_start_boosting(clf, X_t, y_new, extra_iter)
+    else:
+        raise TypeError(f"{type(clf).__name__} does not support incremental updates")
+    return pipeline
+
+
+# ── Versioned artifacts ─────────────────────────────────────
+def list_versions(root: str = INCREMENTAL_ROOT) -> list:
+    """Saved version numbers, oldest first."""
+    if not os.path.isdir(root):
+        return []
+    return sorted(int(d[1:]) for d in os.listdir(root)
+                  if d.startswith('v') and d[1:].isdigit()
+                  and os.path.exists(os.path.join(root, d, MANIFEST)))
+
+
+def save_version(models: dict, root: str = INCREMENTAL_ROOT, X_batch=None,
+                 rows_total: int = None, metrics: dict = None) -> dict:
+    """
+    Save *models* (name → fitted pipeline) as the next version.
+
+    Returns
+    -------
+    dict  The written manifest.
+    """
+    versions = list_versions(root)
+    version = versions[-1] + 1 if versions else 1
+    vdir = os.path.join(root, f'v{version:04d}')
+    os.makedirs(vdir, exist_ok=True)
+
+    files = {}
+    for name, model in models.items():
+        files[name] = f'{name}.joblib'
+        joblib.dump(model, os.path.join(vdir, files[name]))
+
+    manifest = {
+        'version': version,
+        'parent': versions[-1] if versions else None,
+        'created': datetime.datetime.now().isoformat(timespec='seconds'),
+        'rows_added': None if X_batch is None else len(X_batch),
+        'rows_total': rows_total,
+        'batch_hash': None if X_batch is None else joblib.hash(X_batch),
+        'models': files,
+        'metrics': metrics or {},
+    }
+    with open(os.path.join(vdir, MANIFEST), 'w') as f:
+        json.dump(manifest, f, indent=2, default=float)
+    return manifest
+
+
+def load_version(root: str = INCREMENTAL_ROOT, version: int = None):
+    """
+    Load a saved version (latest when *version* is None).
+
+    Returns
+    -------
+    (dict, dict)  name → model, and the version's manifest.
+    """
+    versions = list_versions(root)
+    if not versions:
+        raise FileNotFoundError(f"No saved versions under {root}")
+    version = versions[-1] if version is None else version
+    vdir = os.path.join(root, f'v{version:04d}')
+    with open(os.path.join(vdir, MANIFEST)) as f:
+        manifest = json.load(f)
+    models = {name: joblib.load(os.path.join(vdir, file)) for name, file in manifest['models'].items()}
+    return models, manifest
@@ -0,0 +1,277 @@
+"""
+Layer 1 — The Foundation (data engineering stage).
+
+- `SynapseIngestionEngine`     download & harmonize the tabular CSV sources (via `sources`)
+- `run_pulse_harmonization`    stream the ECG time-series into per-record features
+- `CatalystFeatureSynthesizer` merge modalities and engineer MASTER_DATA
+
+Source files resolve through the offline-first `registry` (verified,
+resumable, air-gap capable); it and `scipy.stats` are only imported when
+a download or an ECG moment computation actually runs.  Every engine
+call is recorded as a `telemetry` stage.
+"""
+
+import pandas as pd
+
+from ._lazy import lazy_import
+from .telemetry import annotate, profiled
+
+registry = lazy_import(f'{__package__}.registry')
+sources  = lazy_import(f'{__package__}.sources')
+stats = lazy_import('scipy.stats')
+
+
+# ══════════════════════════════════════════════════════════════
+#  SYNAPSE INGESTION ENGINE — Multi-Source Clinical Data Loader
+# ══════════════════════════════════════════════════════════════
+
+class SynapseIngestionEngine:
+    """
+    Downloads and harmonizes heterogeneous cardiac datasets into a
+    single analysis-ready tabular DataFrame.
+
+    Datasources
+    -----------
+    - Heart Attack (Kaggle)
+    - Cardiac Failure (Kaggle)
+    - Cardiac Failure Base (semicolon-delimited)
+
+    Each is a `sources.SourceAdapter`; further feeds are added with
+    `sources.register_source`.
+    """
+
+    FILE_IDS = {
+        'heart_attack':          '1mopCa200spbeFRFpkr_ppuLbqsdl0BaR',
+        'cardiac_failure':       '1NBL96uw95T5nhH2_bncc-jvVEOp6_Mjn',
+        'ecg_timeseries':        '1MFOoFkk_ypdbH2jvPXU7YWiNDlvPd-en',
+        'cardiac_failure_base':  '1_pcIRUWpHoUNkiHcDK01HlLkOOMXi9hn',
+    }
+
+    # ── Download ────────────────────────────────────────────────
+    @profiled('Synapse · download')
+    def download_data(self, store: str = None, backend=None, air_gapped: bool = None) -> dict:
+        """
+        Resolve all CSVs through the local data registry.
+
+        Files already in *store* that match `registry.DATA_MANIFEST_PATH`
+        (size + SHA-256) are reused; anything missing, truncated or not yet
+        pinned is fetched concurrently — resuming partial downloads — from
+        *backend* (default: `MYO_DATA_MIRROR`, else Google Drive) and pinned
+        in the manifest on first use.  With *air_gapped*
+        (default: `MYO_AIR_GAPPED`) nothing is fetched and a missing or
+        unverifiable file raises `FileNotFoundError`.
+        """
+        manifest = registry.load_manifest(
+            registry.DATA_MANIFEST_PATH, {name: f'{name}.csv' for name in self.FILE_IDS})
+        resolved = registry.fetch(
+            manifest, list(self.FILE_IDS),
+            backend=backend or registry.backend_from_env(self.FILE_IDS),
+            store=store or registry.DATA_STORE, air_gapped=air_gapped,
+        )
+        for name, r in resolved.items():
+            pinned = ('  (pinned on first fetch)' if r['pinned'] else
+                      '' if manifest[name]['sha256'] else '  (unpinned)')
+            print(f"  {'✓' if r['status'] == 'cached' else '↓'}  {name:<22} {r['status']}{pinned}")
+        print("✅ Synapse Download Complete.")
+        return {name: r['path'] for name, r in resolved.items()}
+
+    # ── Ingest & Harmonize ──────────────────────────────────────
+    @profiled('Synapse · harmonize')
+    def ingest_and_harmonize(self, paths: dict, adapters=None, columns: list = None) -> pd.DataFrame:
+        """
+        Read the tabular CSVs through their source adapters, project them
+        onto the canonical schema, tag with source, and stack them into
+        one DataFrame.
+
+        Parameters
+        ----------
+        paths : dict      Source name → file path (non-tabular entries are ignored).
+        adapters : list   `sources.SourceAdapter` objects (default: `sources.SOURCE_ADAPTERS`).
+        columns : list    Canonical columns to keep (default: all of them).
+        """
+        df_tabular, report = sources.harmonize(paths, adapters, columns)
+        if 'id' in df_tabular.columns:
+            df_tabular['id'] = df_tabular['id'].astype(str)
+
+        for name, r in report.items():
+            print(f"   {name:<22} {r['rows']:>10,} rows  {r['seconds']:6.2f}s")
+            if r['dropped']:
+                print(f"      dropped (not in schema): {', '.join(map(str, r['dropped']))}")
+        print(f"✅ Synapse Harmonization Complete  →  {len(df_tabular):,} patient rows")
+        return df_tabular
+
+
+# ══════════════════════════════════════════════════════════════
+#  PULSE-HARMONIZATION ENGINE — ECG Time-Series Feature Extractor
+# ══════════════════════════════════════════════════════════════
+
+def _extract_ecg_stats(group: pd.Series) -> pd.Series:
+    """Compute 4 statistical moments from raw ECG amplitude values."""
+    data = pd.to_numeric(group, errors='coerce').dropna()
+
+    if len(data) == 0:
+        return pd.Series({
+            'ecg_mean': 0, 'ecg_std': 0,
+            'ecg_skew': 0, 'ecg_kurtosis': 0,
+        })
+
+    return pd.Series({
+        'ecg_mean':     data.mean(),
+        'ecg_std':      data.std()      if len(data) >= 2 else 0,
+        'ecg_skew':     stats.skew(data)      if len(data) >= 3 else 0,
+        'ecg_kurtosis': stats.kurtosis(data)  if len(data) >= 3 else 0,
+    })
+
+
+@profiled('Pulse · ECG harmonization')
+def run_pulse_harmonization(file_path: str, chunk_size: int = 100_000) -> pd.DataFrame:
+    """
+    Stream-process a large ECG CSV in chunks, extracting per-patient
+    statistical features (mean, std, skew, kurtosis).
+
+    Parameters
+    ----------
+    file_path : str
+        Path to `ecg_timeseries.csv`.
+    chunk_size : int
+        Rows per chunk (default 100 000).
+
+    Returns
+    -------
+    pd.DataFrame
+        Columns: id | ecg_mean | ecg_std | ecg_skew | ecg_kurtosis | source
+    """
+    print("⚡ Pulse-Harmonization: Processing ECG signal file...")
+
+    # 1. Detect signal column automatically
+    header = pd.read_csv(file_path, nrows=2)
+    all_cols = header.columns.tolist()
+    print(f"   Columns detected: {all_cols}")
+
+    sig_candidates = [
+        c for c in all_cols
+        if c.isdigit() or 'sig' in c.lower() or 'val' in c.lower()
+    ]
+    if '0' in sig_candidates:
+        sig_col = '0'
+    elif sig_candidates:
+        sig_col = sig_candidates[0]
+    else:
+        sig_col = all_cols[1]
+
+    print(f"   Signal column: '{sig_col}'")
+
+    # 2. Chunk-wise feature extraction
+    ecg_feature_list = []
+    global_row_offset = 0
+
+    for chunk in pd.read_csv(file_path, chunksize=chunk_size, low_memory=False):
+        chunk['id'] = (chunk.index + global_row_offset).astype(str)
+        global_row_offset += len(chunk)
+
+        feats = chunk.groupby('id')[sig_col].apply(_extract_ecg_stats).unstack()
+        ecg_feature_list.append(feats)
+
+    annotate(rows=global_row_offset)          # raw signal rows streamed
+
+    # 3. Aggregate across chunks
+    df_ecg_features = pd.concat(ecg_feature_list).groupby(level=0).mean()
+    df_ecg_features['source'] = 'ECG_Signal'
+    df_ecg_features.index.name = 'id'
+    df_ecg_features = df_ecg_features.reset_index()
+
+    print(f"✅ Pulse-Harmonization Complete  →  {len(df_ecg_features):,} ECG records")
+    return df_ecg_features
+
+
+# ══════════════════════════════════════════════════════════════
+#  CATALYST FEATURE SYNTHESIZER — Multimodal Feature Engineering
+# ══════════════════════════════════════════════════════════════
+
+class CatalystFeatureSynthesizer:
+    """
+    Merges tabular clinical data with ECG statistical features and
+    synthesizes clinically meaningful derived variables.
+
+    Pipeline
+    --------
+    1. Left-merge tabular + ECG (+ optional window summaries) on patient `id`
+    2. Create `sensor_signal_available` missingness flag
+    3. Clip blood-pressure outliers to physiological ranges
+    4. Engineer BMI and Pulse Pressure
+    5. Canonicalize the target column
+    """
+
+    # Physiological clipping ranges
+    BP_SYSTOLIC_RANGE  = (80, 200)   # ap_hi
+    BP_DIASTOLIC_RANGE = (50, 120)   # ap_lo
+
+    # Possible names for the binary target across datasets
+    TARGET_CANDIDATES = ['cardio', 'heartdisease', 'output', 'target']
+
+    @profiled('Catalyst · synthesize')
+    def synthesize(
+        self,
+        df_tab: pd.DataFrame,
+        df_ecg: pd.DataFrame,
+        df_windows: pd.DataFrame = None,
+    ) -> pd.DataFrame:
+        """
+        Execute the full Catalyst pipeline and return MASTER_DATA.
+
+        Parameters
+        ----------
+        df_tab : pd.DataFrame   Harmonized tabular patient data.
+        df_ecg : pd.DataFrame   ECG statistical features (from Pulse engine).
+        df_windows : pd.DataFrame, optional
+            Per-record window summaries (`ecg_features.run_pulse_windows`).
+
+        Returns
+        -------
+        pd.DataFrame  Analysis-ready MASTER_DATA with all derived features.
+        """
+        # ── 1. Standardize IDs & merge ──────────────────────────
+        df_tab  = df_tab.copy()
+        df_ecg  = df_ecg.copy()
+        df_tab['id']  = df_tab['id'].astype(str).str.strip()
+        df_ecg['id']  = df_ecg['id'].astype(str).str.strip()
+
+        if df_windows is not None:
+            df_ecg = df_ecg.merge(df_windows.assign(id=df_windows['id'].astype(str).str.strip()),
+                                  on='id', how='left')
+
+        df = pd.merge(df_tab, df_ecg, on='id', how='left').reset_index(drop=True)
+        df.columns = df.columns.str.lower()
+        print(f"   Merged shape: {df.shape}")
+
+        # ── 2. Sensor-availability flag ─────────────────────────
+        df['sensor_signal_available'] = df['ecg_mean'].notnull().astype(int)
+        avail = df['sensor_signal_available'].sum()
+        print(f"   ECG signal present for {avail:,} / {len(df):,} patients")
+
+        # ── 3. Blood-pressure outlier clipping ──────────────────
+        if 'ap_hi' in df.columns:
+            df['ap_hi'] = df['ap_hi'].clip(*self.BP_SYSTOLIC_RANGE)
+        if 'ap_lo' in df.columns:
+            df['ap_lo'] = df['ap_lo'].clip(*self.BP_DIASTOLIC_RANGE)
+
+        # ── 4. Clinical feature engineering ─────────────────────
+        if 'weight' in df.columns and 'height' in df.columns:
+            df['bmi'] = df['weight'] / ((df['height'] / 100) ** 2)
+            print("   ✓ BMI synthesized  (weight / height²)")
+
+        if 'ap_hi' in df.columns and 'ap_lo' in df.columns:
+            df['pulse_pressure'] = df['ap_hi'] - df['ap_lo']
+            print("   ✓ Pulse Pressure synthesized  (systolic − diastolic)")
+
+        # ── 5. Canonicalize target column ───────────────────────
+        # Sources label different columns (`cardio` next to the renamed
+        # `target`), so coalesce them in priority order into one column.
+        present = [c for c in self.TARGET_CANDIDATES if c in df.columns]
+        if present:
+            target = df[present].bfill(axis=1).iloc[:, 0]
+            df = df.drop(columns=present).assign(target=target)
+
+        print(f"✅ Catalyst Synthesis Complete  →  {df.shape[1]} features, "
+              f"{len(df):,} rows")
+        return df
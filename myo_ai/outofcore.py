@@ -0,0 +1,281 @@
+"""
+Out-of-core tournament — train on a columnar MASTER_DATA larger than RAM.
+
+The in-memory Layer 2 holds MASTER_DATA, `select_dtypes` copies and a
+`train_test_split` per contestant.  Here MASTER_DATA is cached once as
+Parquet (`cache_master_data`) and every step streams it one row group at
+a time:
+
+| Pass | Reads | Work |
+|---|---|---|
+| 1 | `target` only | labels → exact stratified test mask (1 byte per row) |
+| 2 | train rows | `impute.StreamingMedianImputer.partial_fit` → KLL sketches → per-column medians and 255-bin quantile edges |
+| 3 | train rows | imputed rows → `MinMaxScaler` / `StandardScaler.partial_fit`; uint8 bin codes into the HGBC matrix |
+| 4 | train rows, row groups in random order | Sentinel `GaussianNB.partial_fit` (first epoch), Vanguard SGD `partial_fit` (`VANGUARD_EPOCHS`) |
+| 5 | test rows | P(class 1) of every model |
+
+Myo-Core fits `HistGradientBoostingClassifier` on the binned matrix.  Its
+row count is capped by `memory_plan` so the matrix plus HGBC's internal
+float64 copies (~21 bytes per cell in total) fit the budget; beyond
+that a uniform subsample of the train rows is binned.  The fitted models are ordinary Pipelines
+(fixed-median imputer → scaler / binner → classifier) that score
+in-memory frames like the tournament contestants.
+
+Peak RSS is measured from the kernel's high-water mark, reset at the
+start of training where Linux allows it.  Aegis and Pulse-Sync are not
+trained out of core.
+"""
+
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from ._lazy import lazy_import
+from .telemetry import current_rss_mb, peak_rss_mb, reset_peak_rss
+from .train import LEAKAGE_COLS, SPLIT_PARAMS, MYOCORE_PARAMS, VANGUARD_SGD_PARAMS
+from .tuning import PREBIN_MAX_BINS, apply_bins
+
+pa             = lazy_import('pyarrow')
+pq             = lazy_import('pyarrow.parquet')
+_pipeline      = lazy_import('sklearn.pipeline')
+_preprocessing = lazy_import('sklearn.preprocessing')
+_ensemble      = lazy_import('sklearn.ensemble')
+_linear_model  = lazy_import('sklearn.linear_model')
+_naive_bayes   = lazy_import('sklearn.naive_bayes')
+impute         = lazy_import(f'{__package__}.impute')
+
+
+MASTER_PARQUET = os.path.join('cache', 'master_data.parquet')
+ROW_GROUP_ROWS = 100_000
+MEMORY_BUDGET_MB = 1024         # peak RSS of the whole process
+VANGUARD_EPOCHS = 3
+
+# Working-set estimates used by `memory_plan`
+STREAM_COPIES = 6               # arrow buffer, frame, float64, imputed, scaled, codes
+HGB_BYTES_PER_CELL = 21         # uint8 codes + HGBC's float64 copy, its early-stopping
+                                # split and re-binned arrays (measured)
+HGB_BYTES_PER_ROW = 40          # gradients, hessians, raw predictions, labels
+
+
+# ── Memory accounting ───────────────────────────────────────
+def memory_plan(n_train: int, n_features: int, row_group_rows: int,
+                budget_mb: float = MEMORY_BUDGET_MB) -> dict:
+    """
+    Split the headroom between *budget_mb* and the current RSS.
+
+    A quarter goes to one streamed row group, the rest (after the models
+    and sketches) to the HGBC binned matrix.
+
+    Raises
+    ------
+    MemoryError  if a single row group does not fit its share.
+    """
+    headroom = budget_mb - current_rss_mb()
+    stream_mb = row_group_rows * n_features * 8 * STREAM_COPIES / 2 ** 20
+    if stream_mb > 0.25 * headroom:
+        raise MemoryError(
+            f"A {row_group_rows:,}-row group needs ~{stream_mb:.0f} MB but only "
+            f"{0.25 * headroom:.0f} MB of the {budget_mb:.0f} MB budget is free for streaming; "
+            f"re-cache with a smaller row_group_rows or raise the budget")
+    hgb_mb = 0.6 * headroom
+    hgb_rows = int(hgb_mb * 2 ** 20 / (n_features * HGB_BYTES_PER_CELL + HGB_BYTES_PER_ROW))
+    return {'headroom_mb': headroom, 'stream_mb': stream_mb,
+            'hgb_rows': min(n_train, hgb_rows), 'hgb_mb': hgb_mb}
+
+
+# ── Columnar MASTER_DATA ────────────────────────────────────
+def cache_master_data(master_data: pd.DataFrame, path: str = MASTER_PARQUET,
+                      row_group_rows: int = ROW_GROUP_ROWS) -> str:
+    """Write MASTER_DATA as Parquet with *row_group_rows*-row groups."""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    table = pa.Table.from_pandas(master_data, preserve_index=False)
+    pq.write_table(table, path, row_group_size=row_group_rows)
+    return path
+
+
+class ColumnarMaster:
+    """Row-group reader over a Parquet MASTER_DATA cache."""
+
+    def __init__(self, path: str = MASTER_PARQUET):
+        self.path = path
+        self.file = pq.ParquetFile(path)
+        meta = self.file.metadata
+        self.n_rows = meta.num_rows
+        self.group_rows = np.array([meta.row_group(i).num_rows for i in range(meta.num_row_groups)])
+        self.group_start = np.r_[0, np.cumsum(self.group_rows)[:-1]]
+
+        # Same selection as `train.select_features`: numeric, minus leakage
+        self.feature_names = [
+            f.name for f in self.file.schema_arrow
+            if (pa.types.is_integer(f.type) or pa.types.is_floating(f.type))
+            and f.name not in LEAKAGE_COLS
+        ]
+
+    @property
+    def n_groups(self) -> int:
+        return len(self.group_rows)
+
+    def read_group(self, i: int, columns: list = None) -> pd.DataFrame:
+        return self.file.read_row_group(i, columns=columns).to_pandas()
+
+    def features(self, i: int) -> np.ndarray:
+        """float64 feature matrix of row group *i*."""
+        return self.read_group(i, self.feature_names).to_numpy(dtype=np.float64, na_value=np.nan)
+
+    def read_target(self) -> np.ndarray:
+        """Binary labels for every row (int8), streamed from the `target` column."""
+        y = np.empty(self.n_rows, dtype=np.int8)
+        for i in range(self.n_groups):
+            start = self.group_start[i]
+            y[start:start + self.group_rows[i]] = (
+                self.read_group(i, ['target'])['target'].fillna(0).astype(int).to_numpy())
+        return y
+
+
+def stratified_test_mask(y: np.ndarray, test_size: float = SPLIT_PARAMS['test_size'],
+                         seed: int = SPLIT_PARAMS['random_state']) -> np.ndarray:
+    """Boolean test mask holding exactly round(test_size · n_c) rows of each class."""
+    rng = np.random.default_rng(seed)
+    mask = np.zeros(len(y), dtype=bool)
+    for cls in np.unique(y):
+        rows = np.flatnonzero(y == cls)
+        mask[rng.choice(rows, int(round(test_size * len(rows))), replace=False)] = True
+    return mask
+
+
+def _select_columns(X, columns):
+    """Training columns of a frame, as the float64 array the models were fitted on."""
+    if hasattr(X, 'columns'):
+        X = X[columns].to_numpy(dtype=np.float64, na_value=np.nan)
+    return np.asarray(X, dtype=np.float64)
+
+
+# ── Training ────────────────────────────────────────────────
+def train_out_of_core(path: str = MASTER_PARQUET, budget_mb: float = MEMORY_BUDGET_MB,
+                      myocore_params: dict = None, vanguard_epochs: int = VANGUARD_EPOCHS,
+                      seed: int = 42) -> dict:
+    """
+    Train Sentinel, Vanguard (SGD) and Myo-Core from a Parquet cache.
+
+    Returns
+    -------
+    dict
+        models         : name → fitted Pipeline (scores in-memory frames)
+        y_test, probabilities : streamed test labels and P(class 1) per model
+        plan           : `memory_plan` output
+        timings        : seconds per pass
+        peak_rss_mb, budget_mb, within_budget
+    """
+    reset_peak_rss()
+    rng = np.random.default_rng(seed)
+    src = ColumnarMaster(path)
+    n_features = len(src.feature_names)
+    timings = {}
+
+    # ── Pass 1: labels → stratified split ───────────────────
+    t0 = time.perf_counter()
+    y = src.read_target()
+    test_mask = stratified_test_mask(y)
+    n_train = int((~test_mask).sum())
+    plan = memory_plan(n_train, n_features, int(src.group_rows.max()), budget_mb)
+    timings['labels & split'] = time.perf_counter() - t0
+
+    def train_groups(order=None):
+        for i in (range(src.n_groups) if order is None else order):
+            start, stop = src.group_start[i], src.group_start[i] + src.group_rows[i]
+            keep = ~test_mask[start:stop]
+            if keep.any():
+                yield i, src.features(i)[keep], y[start:stop][keep]
+
+    # ── Pass 2: quantile sketches → medians & bin edges ─────
+    t0 = time.perf_counter()
+    imputer = impute.StreamingMedianImputer(keep_empty_features=True, seed=seed)  # all-NaN column → 0
+    for _, X, _ in train_groups():
+        imputer.partial_fit(X)
+    qs = np.linspace(0, 1, PREBIN_MAX_BINS + 1)[1:-1]
+    edges = [np.unique(col) for col in imputer.sketch_.quantiles(qs).T]
+    edges = [e[~np.isnan(e)] for e in edges]
+    timings['sketch'] = time.perf_counter() - t0
+
+    # ── Pass 3: scalers + bounded binned matrix ─────────────
+    t0 = time.perf_counter()
+    minmax, standard = _preprocessing.MinMaxScaler(), _preprocessing.StandardScaler()
+    hgb_take = np.ones(n_train, dtype=bool)
+    if plan['hgb_rows'] < n_train:
+        hgb_take[:] = False
+        hgb_take[rng.choice(n_train, plan['hgb_rows'], replace=False)] = True
+    X_binned = np.empty((plan['hgb_rows'], n_features), dtype=np.uint8)
+    y_binned = np.empty(plan['hgb_rows'], dtype=np.int8)
+    seen = filled = 0
+    for _, X, y_g in train_groups():
+        X = imputer.transform(X)
+        minmax.partial_fit(X)
+        standard.partial_fit(X)
+        take = hgb_take[seen:seen + len(X)]
+        n_take = int(take.sum())
+        X_binned[filled:filled + n_take] = apply_bins(X[take], edges)
+        y_binned[filled:filled + n_take] = y_g[take]
+        seen, filled = seen + len(X), filled + n_take
+    timings['scale & bin'] = time.perf_counter() - t0
+
+    # ── Myo-Core on the binned matrix ───────────────────────
+    t0 = time.perf_counter()
+    hgb = _ensemble.HistGradientBoostingClassifier(**{**MYOCORE_PARAMS, **(myocore_params or {})},
+                                                   random_state=seed)
+    hgb.fit(X_binned, y_binned)
+    del X_binned
+    timings['myo-core fit'] = time.perf_counter() - t0
+
+    # ── Pass 4: incremental Sentinel / Vanguard ─────────────
+    t0 = time.perf_counter()
+    gnb = _naive_bayes.GaussianNB()
+    sgd = _linear_model.SGDClassifier(**VANGUARD_SGD_PARAMS, random_state=seed)
+    classes = np.array([0, 1])
+    for epoch in range(vanguard_epochs):
+        for _, X, y_g in train_groups(rng.permutation(src.n_groups)):
+            X = imputer.transform(X)
+            if epoch == 0:
+                gnb.partial_fit(minmax.transform(X), y_g, classes=classes)
+            sgd.partial_fit(standard.transform(X), y_g, classes=classes)
+    timings['sentinel & vanguard'] = time.perf_counter() - t0
+
+    select = ('select', _preprocessing.FunctionTransformer(
+        _select_columns, kw_args={'columns': src.feature_names}))
+    models = {
+        'Sentinel Node (NB)': _pipeline.Pipeline(
+            [select, ('imputer', imputer), ('scaler', minmax), ('clf', gnb)]),
+        'Vanguard System (SGD)': _pipeline.Pipeline(
+            [select, ('imputer', imputer), ('scaler', standard), ('clf', sgd)]),
+        'Myo-Core Engine (HGBC)': _pipeline.Pipeline(
+            [select, ('imputer', imputer),
+             ('binner', _preprocessing.FunctionTransformer(apply_bins, kw_args={'edges': edges})),
+             ('clf', hgb)]),
+    }
+
+    # ── Pass 5: stream the test rows through every model ────
+    t0 = time.perf_counter()
+    y_test, probabilities = [], {name: [] for name in models}
+    for i in range(src.n_groups):
+        start, stop = src.group_start[i], src.group_start[i] + src.group_rows[i]
+        keep = test_mask[start:stop]
+        if not keep.any():
+            continue
+        X = src.features(i)[keep]
+        y_test.append(y[start:stop][keep])
+        for name, model in models.items():
+            probabilities[name].append(model[1:].predict_proba(X)[:, 1])
+    timings['score test'] = time.perf_counter() - t0
+
+    peak = peak_rss_mb()
+    return {
+        'models': models,
+        'y_test': np.concatenate(y_test).astype(int),
+        'probabilities': {name: np.concatenate(p) for name, p in probabilities.items()},
+        'plan': plan,
+        'timings': timings,
+        'peak_rss_mb': peak,
+        'budget_mb': budget_mb,
+        'within_budget': peak <= budget_mb,
+    }
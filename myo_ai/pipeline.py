@@ -0,0 +1,345 @@
+"""
+Pipeline DAG — the Myo AI stages as cached, incremental `dag` nodes.
+
+    synapse ─┐
+    pulse ───┼─ catalyst ─ split ─┬─ aegis ──────┐
+    windows ─┘                    ├─ sentinel ───┤
+                                  ├─ vanguard ───┼─ leaderboard
+                                  ├─ pulse_sync ─┤
+                                  └─ myocore ────┼─ zenith
+                                                 ├─ permutation
+                                                 ├─ oracle
+                                                 ├─ cohort
+                                                 └─ archive
+
+Every node's hyperparameters live in `PIPELINE_CONFIG`; `build_pipeline`
+merges overrides into it, so changing ``vanguard.clf__C`` re-runs
+Vanguard and the leaderboard only, while Synapse → split, the other
+contestants and the Myo-Core explainers are reused from the cache.  The
+source files are fingerprinted (size + mtime), so a refreshed download
+re-runs everything downstream of it.
+
+Contestant options are the keyword arguments of their `train` builder,
+plus ``<step>__<param>`` overrides applied with `Pipeline.set_params`.
+``windows.enabled`` / ``pulse_sync.enabled`` drop those nodes.
+
+The node outputs mirror the notebook's variables: DataFrames for the
+ingestion stages, ``(X_train, X_test, y_train, y_test)`` for the split,
+a dict with the fitted ``pipeline`` and its test scores per contestant
+(Pulse-Sync keeps scores only), the leaderboard DataFrame, the Zenith /
+permutation / SHAP results and the Chronos cohort quantiles (the
+trajectories are written by `cohort.project_cohort`).  Read one with ``graph.load(name)``.
+The cohort Parquet files and the archived Myo-Core pickle are declared
+as node `outputs`, so the nodes re-run when those files are deleted or
+overwritten, not only when their inputs change.
+
+Usage
+-----
+    python -m myo_ai.pipeline [--store DIR] [--synthetic ROWS] [--set vanguard.clf__C=0.5]
+                              [--targets leaderboard oracle] [--workers N] [--prune]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import time
+
+import pandas as pd
+
+from ._lazy import lazy_import
+from .dag import DAG, DAG_CACHE_DIR, DAG_WORKERS, print_timeline
+
+joblib        = lazy_import('joblib')
+_inspection   = lazy_import('sklearn.inspection')
+_model_select = lazy_import('sklearn.model_selection')
+cohort        = lazy_import(f'{__package__}.cohort')
+ecg_features  = lazy_import(f'{__package__}.ecg_features')
+evaluate      = lazy_import(f'{__package__}.evaluate')
+explain       = lazy_import(f'{__package__}.explain')
+impute        = lazy_import(f'{__package__}.impute')
+ingest        = lazy_import(f'{__package__}.ingest')
+pulse_cnn     = lazy_import(f'{__package__}.pulse_cnn')     # TensorFlow — only inside the node
+sources       = lazy_import(f'{__package__}.sources')
+train         = lazy_import(f'{__package__}.train')
+tuning        = lazy_import(f'{__package__}.tuning')
+
+
+PIPELINE_CONFIG = {
+    'synapse':     {'columns': None},
+    'pulse':       {'mode': 'extended'},                  # 'moments' | 'extended'
+    'windows':     {'enabled': True, 'window_s': 0.4, 'hop_s': 0.2},
+    'aegis':       {'lean': False},
+    'myocore':     {'params': None, 'profile': 'standard'},   # None → tuned / default params
+    'sentinel':    {},
+    'vanguard':    {'online': False},
+    'pulse_sync':  {'enabled': True, 'epochs': 10, 'batch_size': 256, 'patience': 3,
+                    'val_fraction': 0.15},
+    'leaderboard': {'n_boot': 10_000},
+    'zenith':      {'n_clusters': 3},
+    'permutation': {'n_repeats': 10, 'scoring': 'accuracy', 'n_jobs': 1},
+    'oracle':      {'n_explain': 300},
+    'cohort':      {'scenarios': ['ageing', 'sbp_minus_10', 'smoking_cessation'], 'horizon': 20},
+    'archive':     {'filename': 'myocore_pipeline_v1.pkl'},
+}
+CONTESTANTS = {                          # node → (leaderboard name, `train` builder)
+    'aegis':    ('Aegis Protocol (RF)',      'build_aegis_pipeline'),
+    'myocore':  ('Myo-Core Engine (HGBC)',   'build_myocore_pipeline'),
+    'sentinel': ('Sentinel Node (NB)',       'build_sentinel_pipeline'),
+    'vanguard': ('Vanguard System (LogReg)', 'build_vanguard_pipeline'),
+}
+
+
+# ── Node functions ──────────────────────────────────────────
+def synapse_node(paths: dict, adapters: list, columns: list = None) -> pd.DataFrame:
+    return ingest.SynapseIngestionEngine().ingest_and_harmonize(paths, adapters, columns)
+
+
+def pulse_node(path: str, mode: str = 'extended') -> pd.DataFrame:
+    if mode == 'extended':
+        return ecg_features.run_pulse_features(path)
+    return ingest.run_pulse_harmonization(path)
+
+
+def windows_node(path: str, window_s: float, hop_s: float) -> pd.DataFrame:
+    return ecg_features.run_pulse_windows(path, window_s, hop_s)
+
+
+def catalyst_node(df_tab, df_ecg, df_windows=None) -> pd.DataFrame:
+    return ingest.CatalystFeatureSynthesizer().synthesize(df_tab, df_ecg, df_windows)
+
+
+def split_node(master) -> tuple:
+    return tuple(train.stratified_split(*train.select_features(master)))
+
+
+def contestant_node(split: tuple, name: str, builder: str, **options) -> dict:
+    """Build, override (``step__param``), fit and score one `train` contestant."""
+    overrides = {k: v for k, v in options.items() if '__' in k}
+    kwargs = {k: v for k, v in options.items() if '__' not in k}
+    pipeline = getattr(train, builder)(**kwargs).set_params(**overrides)
+    X_train, X_test, y_train, y_test = split
+    scores = train.fit_and_score(pipeline, X_train, y_train, X_test, y_test, name=name)
+    return {'name': name, 'pipeline': pipeline, **scores}
+
+
+def pulse_sync_node(split: tuple, epochs: int, batch_size: int, patience: int,
+                    val_fraction: float) -> dict:
+    """Pulse-Sync with early stopping on a validation hold-out (scores only)."""
+    X_train, X_test, y_train, y_test = split
+    prep = train.build_vanguard_pipeline()[:-1].fit(X_train)       # imputer → scaler
+    X_fit, X_val, y_fit, y_val = _model_select.train_test_split(
+        prep.transform(X_train), y_train.to_numpy(), test_size=val_fraction,
+        random_state=42, stratify=y_train)
+    model = pulse_cnn.build_pulse_sync(X_fit.shape[1])
+    stop = pulse_cnn.keras.callbacks.EarlyStopping(patience=patience, restore_best_weights=True)
+    t0 = time.time()
+    history = model.fit(pulse_cnn.make_pulse_dataset(X_fit, y_fit, batch_size, shuffle=True),
+                        validation_data=pulse_cnn.make_pulse_dataset(X_val, y_val, batch_size),
+                        epochs=epochs, callbacks=[stop], verbose=0)
+    elapsed = time.time() - t0
+    y_prob = model.predict(pulse_cnn.make_pulse_dataset(prep.transform(X_test), y_test.to_numpy(),
+                                                        batch_size), verbose=0).ravel()
+    y_pred = (y_prob >= 0.5).astype(int)
+    return {
+        'name': 'Pulse-Sync (CNN)', 'pipeline': None, 'y_pred': y_pred, 'y_prob': y_prob,
+        'accuracy': train.metrics.accuracy_score(y_test, y_pred),
+        'roc_auc': train.metrics.roc_auc_score(y_test, y_prob),
+        'elapsed': elapsed,
+        'epochs': len(history.history['loss']),
+    }
+
+
+def leaderboard_node(split: tuple, *contestants, n_boot: int) -> pd.DataFrame:
+    """The notebook's leaderboard: accuracy, ROC-AUC with bootstrap CI, PR-AUC, train time."""
+    results = pd.DataFrame([{'Model': c['name'], 'Accuracy': c['accuracy'],
+                             'Train Time (s)': c['elapsed']} for c in contestants])
+    ev = evaluate.evaluate_models(split[3], {c['name']: c['y_prob'] for c in contestants},
+                                  n_boot=n_boot)
+    board = (results.merge(ev['summary'], on='Model')
+             [['Model', 'Accuracy', 'ROC-AUC', 'AUC 95% CI', 'PR-AUC', 'Train Time (s)']]
+             .sort_values('ROC-AUC', ascending=False))
+    board.index = pd.RangeIndex(1, len(board) + 1, name='Rank')
+    return board
+
+
+def zenith_node(split: tuple, myocore: dict, n_clusters: int) -> dict:
+    X_pca, labels, pca, kmeans = explain.zenith_clusters(
+        myocore['pipeline'][:-1].transform(split[1]), n_clusters)
+    return {'X_pca': X_pca, 'labels': labels, 'pca': pca, 'kmeans': kmeans}
+
+
+def permutation_node(split: tuple, myocore: dict, n_repeats: int, scoring: str,
+                     n_jobs: int) -> pd.DataFrame:
+    X_test, y_test = split[1], split[3]
+    result = _inspection.permutation_importance(myocore['pipeline'], X_test, y_test,
+                                                n_repeats=n_repeats, random_state=42,
+                                                n_jobs=n_jobs, scoring=scoring)
+    return (pd.DataFrame({'feature': X_test.columns, 'importance_mean': result.importances_mean,
+                          'importance_std': result.importances_std})
+            .sort_values('importance_mean', ascending=False, ignore_index=True))
+
+
+def oracle_node(split: tuple, myocore: dict, n_explain: int) -> dict:
+    pipeline = myocore['pipeline']
+    X_explain = pipeline[:-1].transform(split[1][:n_explain])
+    explainer, shap_values = explain.tree_shap_values(pipeline.named_steps['clf'], X_explain)
+    return {'expected_value': explainer.expected_value, 'shap_values': shap_values,
+            'X_explain': X_explain,
+            'feature_names': pipeline[:-1].get_feature_names_out(split[1].columns).tolist()}
+
+
+def cohort_node(split: tuple, myocore: dict, scenarios: list, horizon: int) -> pd.DataFrame:
+    """Chronos projection of the whole population (train + test rows)."""
+    return cohort.project_cohort(myocore['pipeline'], pd.concat([split[0], split[1]]),
+                                 scenarios, horizon)
+
+
+def archive_node(myocore: dict, filename: str) -> dict:
+    """Layer 4: dump the Myo-Core pipeline → {path, kb, md5}."""
+    joblib.dump(myocore['pipeline'], filename)
+    with open(filename, 'rb') as f:
+        md5 = hashlib.md5(f.read()).hexdigest()
+    return {'path': os.path.abspath(filename), 'kb': os.path.getsize(filename) / 1024, 'md5': md5}
+
+
+# ── Graph ───────────────────────────────────────────────────
+def resolve_config(config: dict = None) -> dict:
+    """`PIPELINE_CONFIG` with *config* (node → {option: value}) merged in."""
+    unknown = set(config or {}) - set(PIPELINE_CONFIG)
+    if unknown:
+        raise KeyError(f"Unknown pipeline nodes in config: {sorted(unknown)}")
+    return {node: {**opts, **(config or {}).get(node, {})} for node, opts in PIPELINE_CONFIG.items()}
+
+
+def build_pipeline(paths: dict, config: dict = None, cache_dir: str = DAG_CACHE_DIR) -> DAG:
+    """
+    Declare the Myo AI stage graph for the source files in *paths*.
+
+    Parameters
+    ----------
+    paths : dict       Source name → file path (`SynapseIngestionEngine.download_data`).
+    config : dict      Per-node overrides of `PIPELINE_CONFIG`.
+    cache_dir : str    Where node outputs are cached.
+
+    Returns
+    -------
+    dag.DAG
+    """
+    cfg = resolve_config(config)
+    tabular = {k: v for k, v in paths.items() if k in sources.SOURCE_ADAPTERS}
+    ecg = paths['ecg_timeseries']
+    graph = DAG(cache_dir)
+
+    graph.add('synapse', synapse_node,
+              params={'paths': tabular, 'adapters': list(sources.SOURCE_ADAPTERS.values()),
+                      **cfg['synapse']},
+              code=(ingest.SynapseIngestionEngine.ingest_and_harmonize, sources),
+              files=tabular.values())
+    graph.add('pulse', pulse_node, params={'path': ecg, **cfg['pulse']},
+              code=(ingest.run_pulse_harmonization, ingest._extract_ecg_stats, ecg_features),
+              files=[ecg])
+    windows = dict(cfg['windows'])
+    if windows.pop('enabled'):
+        graph.add('windows', windows_node, params={'path': ecg, **windows},
+                  code=(ecg_features,), files=[ecg])
+    graph.add('catalyst', catalyst_node,
+              deps=['synapse', 'pulse'] + (['windows'] if 'windows' in graph.nodes else []),
+              code=(ingest.CatalystFeatureSynthesizer,))
+    graph.add('split', split_node, deps=['catalyst'],
+              code=(train.select_features, train.stratified_split, train.LEAKAGE_COLS,
+                    train.SPLIT_PARAMS))
+
+    for node, (name, builder) in CONTESTANTS.items():
+        options = dict(cfg[node])
+        if node == 'myocore' and options.get('params') is None:
+            options['params'] = tuning.load_tuned_params()
+        graph.add(node, contestant_node, deps=['split'],
+                  params={'name': name, 'builder': builder, **options},
+                  code=(getattr(train, builder), train.fit_and_score, impute,
+                        f'{__package__}.sketch', train.MYOCORE_PARAMS, train.MYOCORE_FAST_PARAMS,
+                        train.AEGIS_LEAN_PARAMS, train.VANGUARD_SGD_PARAMS))
+    pulse_sync = dict(cfg['pulse_sync'])
+    if pulse_sync.pop('enabled'):
+        graph.add('pulse_sync', pulse_sync_node, deps=['split'], params=pulse_sync,
+                  code=(f'{__package__}.pulse_cnn', train.build_vanguard_pipeline, impute,
+                        f'{__package__}.sketch'))
+
+    contestants = [n for n in (*CONTESTANTS, 'pulse_sync') if n in graph.nodes]
+    graph.add('leaderboard', leaderboard_node, deps=['split', *contestants],
+              params=cfg['leaderboard'], code=(evaluate,))
+    graph.add('zenith', zenith_node, deps=['split', 'myocore'], params=cfg['zenith'],
+              code=(explain.zenith_clusters,))
+    graph.add('permutation', permutation_node, deps=['split', 'myocore'],
+              params=cfg['permutation'])
+    graph.add('oracle', oracle_node, deps=['split', 'myocore'], params=cfg['oracle'],
+              code=(explain.tree_shap_values,))
+    graph.add('cohort', cohort_node, deps=['split', 'myocore'], params=cfg['cohort'],
+              code=(cohort,),
+              outputs=[os.path.join(cohort.COHORT_OUTPUT_DIR, f'{k}.parquet')
+                       for k in ('trajectories', 'quantiles')])
+    graph.add('archive', archive_node, deps=['myocore'], params=cfg['archive'],
+              outputs=[cfg['archive']['filename']])
+    return graph
+
+
+def run_pipeline(paths: dict, config: dict = None, targets=None, workers: int = DAG_WORKERS,
+                 cache_dir: str = DAG_CACHE_DIR) -> tuple:
+    """Build the graph, bring *targets* up to date and print the timeline → (graph, records)."""
+    graph = build_pipeline(paths, config, cache_dir)
+    records = graph.run(targets, workers)
+    print_timeline(records)
+    return graph, records
+
+
+# ── Command line ────────────────────────────────────────────
+def parse_overrides(items: list) -> dict:
+    """``['vanguard.clf__C=0.5', …]`` → {'vanguard': {'clf__C': 0.5}} (values parsed as JSON)."""
+    config = {}
+    for item in items:
+        target, eq, raw = item.partition('=')
+        node, _, option = target.partition('.')
+        if not (eq and node and option):
+            raise ValueError(f"Expected node.option=value, got {item!r}")
+        try:
+            value = json.loads(raw)
+        except ValueError:
+            value = raw
+        config.setdefault(node, {})[option] = value
+    return config
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--store', default=None, help='source file directory (registry store)')
+    parser.add_argument('--synthetic', type=int, metavar='ROWS',
+                        help='use synthetic sources with ROWS patients (written once)')
+    parser.add_argument('--set', action='append', default=[], metavar='NODE.OPTION=VALUE')
+    parser.add_argument('--targets', nargs='*', default=None)
+    parser.add_argument('--workers', type=int, default=DAG_WORKERS)
+    parser.add_argument('--cache-dir', default=DAG_CACHE_DIR)
+    parser.add_argument('--prune', action='store_true', help='delete stale cached outputs')
+    args = parser.parse_args()
+
+    if args.synthetic:
+        from . import synthetic
+        store = args.store or os.path.join('cache', 'synthetic')
+        paths = {name: os.path.join(store, file)
+                 for name, (file, _) in synthetic.SOURCE_FILES.items()}
+        if not all(os.path.exists(p) for p in paths.values()):
+            paths = synthetic.write_synthetic_sources(store, args.synthetic)
+    else:
+        paths = ingest.SynapseIngestionEngine().download_data(args.store)
+
+    graph, records = run_pipeline(paths, parse_overrides(args.set), args.targets, args.workers,
+                                  args.cache_dir)
+    if 'leaderboard' in records:
+        print(f"\n{graph.load('leaderboard').to_string()}")
+    if args.prune:
+        print(f"🧹 Pruned {graph.prune()} stale cached output(s)")
+    print("✅ Pipeline DAG Complete.")
+
+
+if __name__ == '__main__':
+    from myo_ai.pipeline import main        # node functions must pickle by reference, not from __main__
+    main()
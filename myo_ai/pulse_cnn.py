@@ -0,0 +1,193 @@
+"""
+Pulse-Sync — 1D-CNN contestant (TensorFlow / Keras).
+
+Importing this module imports TensorFlow, so `train` only binds it
+lazily; nothing here is loaded unless Pulse-Sync is actually trained.
+
+- `configure_tf_cpu`     thread pools + optional mixed_bfloat16 policy
+- `make_pulse_dataset`   prefetched float32 tf.data input pipeline
+- `build_pulse_sync`     compile the Conv1D network
+- `EpochTimer`           per-epoch wall-clock callback
+- `PulseCheckpoint`      early stopping + resumable checkpoints
+"""
+
+import json
+import os
+import time
+
+import numpy as np
+import tensorflow as tf
+from tensorflow import keras
+from tensorflow.keras import layers
+
+
+# ── Training defaults ───────────────────────────────────────
+PULSE_EPOCHS           = 10
+PULSE_BATCH_SIZE       = 256
+PULSE_VAL_FRACTION     = 0.15
+PULSE_SHUFFLE_BUFFER   = 100_000   # elements held in the shuffle buffer
+PULSE_INTRA_OP_THREADS = 0         # threads inside one op (0 = TF default)
+PULSE_INTER_OP_THREADS = 0         # ops run concurrently (0 = TF default)
+PULSE_MIXED_PRECISION  = False     # True → 'mixed_bfloat16' (AVX512-BF16 / AMX CPUs)
+PULSE_PATIENCE         = 3         # epochs without val_loss improvement before stopping
+PULSE_CHECKPOINT_DIR   = 'checkpoints/pulse_sync'
+PULSE_CHECKPOINT_EVERY = 1         # epochs between resumable checkpoints
+
+
+def configure_tf_cpu(intra_op=PULSE_INTRA_OP_THREADS,
+                     inter_op=PULSE_INTER_OP_THREADS,
+                     mixed_precision=PULSE_MIXED_PRECISION):
+    """
+    Apply CPU thread-pool sizes and the Keras precision policy.
+
+    Thread pools can only be changed before TensorFlow executes its first
+    op; afterwards the runtime keeps its existing pools and a notice is
+    printed instead of failing the cell.
+    """
+    try:
+        tf.config.threading.set_intra_op_parallelism_threads(intra_op)
+        tf.config.threading.set_inter_op_parallelism_threads(inter_op)
+    except RuntimeError:
+        print("   ⚠ TF runtime already initialized — thread pools unchanged.")
+    policy = 'mixed_bfloat16' if mixed_precision else 'float32'
+    keras.mixed_precision.set_global_policy(policy)
+    print(f"   TF threads: intra={tf.config.threading.get_intra_op_parallelism_threads()} "
+          f"inter={tf.config.threading.get_inter_op_parallelism_threads()}  |  policy={policy}")
+
+
+def make_pulse_dataset(X, y, batch_size=PULSE_BATCH_SIZE, shuffle=False, seed=42,
+                       shuffle_buffer=PULSE_SHUFFLE_BUFFER):
+    """
+    Wrap 2-D feature rows as a batched, prefetched ``tf.data.Dataset``
+    of ``(batch, n_features, 1)`` float32 tensors.
+    """
+    X = np.ascontiguousarray(X, dtype=np.float32)[..., np.newaxis]
+    y = np.asarray(y, dtype=np.float32)
+    ds = tf.data.Dataset.from_tensor_slices((X, y))
+    if shuffle:
+        ds = ds.shuffle(min(len(X), shuffle_buffer), seed=seed,
+                        reshuffle_each_iteration=True)
+    return ds.batch(batch_size).prefetch(tf.data.AUTOTUNE)
+
+
+def build_pulse_sync(n_features: int) -> keras.Model:
+    """Build and compile the Pulse-Sync Conv1D network."""
+    model = keras.Sequential([
+        layers.Conv1D(filters=64, kernel_size=3, activation='relu', padding='same', input_shape=(n_features, 1)),
+        layers.Conv1D(filters=32, kernel_size=3, activation='relu', padding='same'),
+        layers.Flatten(),
+        layers.Dense(64, activation='relu'),
+        layers.Dropout(0.3),
+        layers.Dense(1, activation='sigmoid', dtype='float32'),
+    ], name='Pulse_Sync_CNN')
+    model.compile(optimizer='adam', loss='binary_crossentropy', metrics=['accuracy'])
+    return model
+
+
+class EpochTimer(keras.callbacks.Callback):
+    """Record wall-clock seconds per training epoch."""
+
+    def __init__(self):
+        super().__init__()
+        self.epoch_times = []
+
+    def on_train_begin(self, logs=None):
+        self.epoch_times = []
+
+    def on_epoch_begin(self, epoch, logs=None):
+        self._t0 = time.perf_counter()
+
+    def on_epoch_end(self, epoch, logs=None):
+        self.epoch_times.append(time.perf_counter() - self._t0)
+
+
+class PulseCheckpoint(keras.callbacks.Callback):
+    """
+    Patience-based early stopping with best-weight restore, plus periodic
+    checkpoints that let an interrupted run resume where it stopped.
+
+    Files in ``ckpt_dir``
+    ---------------------
+    - ``last.keras``       full model incl. optimizer state
+    - ``best.weights.h5``  weights of the best ``monitor`` epoch so far
+    - ``state.json``       epoch counter, best score, patience counter,
+                           finished flag and the run signature
+
+    A saved run is only reused when its ``signature`` matches the current
+    one — pass everything the weights depend on: training configuration,
+    a hash of the training data and the model builder's source.
+    """
+
+    def __init__(self, ckpt_dir, signature, patience=PULSE_PATIENCE,
+                 every=PULSE_CHECKPOINT_EVERY, monitor='val_loss'):
+        super().__init__()
+        self.ckpt_dir  = ckpt_dir
+        self.signature = signature
+        self.patience  = patience
+        self.every     = every
+        self.monitor   = monitor
+        self.last_path  = os.path.join(ckpt_dir, 'last.keras')
+        self.best_path  = os.path.join(ckpt_dir, 'best.weights.h5')
+        self.state_path = os.path.join(ckpt_dir, 'state.json')
+        self.state = {'signature': signature, 'epoch': 0, 'best': float('inf'),
+                      'best_epoch': 0, 'wait': 0, 'finished': False}
+
+    def restore(self, build_fn):
+        """
+        Return ``(model, initial_epoch)`` for this run.
+
+        Resumes from ``last.keras`` for an interrupted run, reloads the
+        best weights for a finished one, and otherwise builds a fresh
+        model via *build_fn* and clears stale checkpoint files.
+        """
+        saved = None
+        if os.path.exists(self.state_path):
+            with open(self.state_path) as f:
+                saved = json.load(f)
+        if saved is None or saved.get('signature') != self.signature:
+            for path in (self.last_path, self.best_path, self.state_path):
+                if os.path.exists(path):
+                    os.remove(path)
+            return build_fn(), 0
+
+        self.state = saved
+        if saved['finished']:
+            model = build_fn()
+            model.load_weights(self.best_path)
+            print(f"   ↺ Reusing finished run — best epoch {saved['best_epoch']} "
+                  f"({self.monitor}={saved['best']:.4f})")
+        else:
+            model = keras.models.load_model(self.last_path)
+            print(f"   ↺ Resuming from checkpoint at epoch {saved['epoch']}")
+        return model, saved['epoch']
+
+    def _save(self):
+        # Write-then-rename so a crash mid-save never leaves a torn file
+        os.makedirs(self.ckpt_dir, exist_ok=True)
+        tmp_model = os.path.join(self.ckpt_dir, 'last.tmp.keras')
+        self.model.save(tmp_model)
+        os.replace(tmp_model, self.last_path)
+        with open(self.state_path + '.tmp', 'w') as f:
+            json.dump(self.state, f, indent=2)
+        os.replace(self.state_path + '.tmp', self.state_path)
+
+    def on_epoch_end(self, epoch, logs=None):
+        current = (logs or {}).get(self.monitor)
+        state = self.state
+        state['epoch'] = epoch + 1
+        if current is not None and current < state['best']:
+            state.update(best=float(current), best_epoch=epoch + 1, wait=0)
+            os.makedirs(self.ckpt_dir, exist_ok=True)
+            self.model.save_weights(self.best_path)
+        else:
+            state['wait'] += 1
+            if state['wait'] >= self.patience:
+                self.model.stop_training = True
+        if state['epoch'] % self.every == 0:
+            self._save()
+
+    def on_train_end(self, logs=None):
+        self.state['finished'] = True
+        self._save()
+        if os.path.exists(self.best_path):
+            self.model.load_weights(self.best_path)
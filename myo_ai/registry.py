@@ -0,0 +1,366 @@
+"""
+Offline-first data registry — verified, resumable source fetching.
+
+Synapse used to `gdown` each Drive file in turn and reuse anything that
+merely existed, so a truncated download was silently ingested and
+nothing ran air-gapped.  Every source now resolves through a local store:
+
+1. A file in the store whose size and SHA-256 match the manifest is used
+   as-is (the hash is cached in a ``<file>.verified`` stamp keyed on size
+   and mtime, so unchanged files are not re-read every run).
+2. Otherwise it is fetched from a pluggable backend into
+   ``<file>.part``, resumed from the bytes already there with an HTTP
+   ``Range`` request, hashed while it streams, checked against the
+   manifest and only then renamed into place.  A failed check deletes
+   the partial file; a resumed download is then retried once from the
+   first byte (the kept prefix may be what was corrupt), anything else
+   raises `ValueError`.
+3. With ``air_gapped=True`` (or ``MYO_AIR_GAPPED=1``) step 2 is never
+   taken: a missing or unverifiable file raises instead.
+
+Sources are fetched concurrently on a joblib thread pool.
+
+| Backend | Source |
+|---|---|
+| `LocalBackend(root)` | A directory (USB mirror, network share) |
+| `HTTPBackend(base_url)` | Any HTTP mirror serving ``<base_url>/<file>`` with range support — e.g. `serve`, a local stand-in server |
+| `DriveBackend(file_ids)` | Google Drive direct download by file id (the default) |
+
+`backend_from_env` picks `MYO_DATA_MIRROR` (a URL or a directory) over
+Drive.  The manifest (`DATA_MANIFEST_PATH`) maps each source to its file
+name, size and SHA-256; `pin` records them from a trusted store.
+
+Unpinned sources are trusted on first use: a local file that is not in
+the manifest never counts as verified, so it is (re)fetched, and a
+download must match the size the backend announces (``Content-Range`` /
+``Content-Length``).  Nothing can vouch for a partial file of an
+unpinned source, so its download always starts from the first byte.
+Its size and SHA-256 are then written to the manifest, so every later
+run verifies against them.  `DriveBackend`
+rejects ``text/html`` responses (Drive's quota / virus-scan interstitial
+pages), which would otherwise be stored as the CSV.
+"""
+
+import hashlib
+import http.server
+import json
+import os
+import threading
+
+from ._lazy import lazy_import
+
+joblib   = lazy_import('joblib')
+_request = lazy_import('urllib.request')
+_error   = lazy_import('urllib.error')
+
+
+DATA_STORE = os.environ.get('MYO_DATA_STORE', '.')
+DATA_MANIFEST_PATH = os.path.join('configs', 'data_manifest.json')
+FETCH_WORKERS = 4
+CHUNK_BYTES = 1 << 20           # streamed / hashed per read
+HTTP_TIMEOUT = 60               # seconds per socket operation
+
+DRIVE_URL = 'https://drive.usercontent.google.com/download?id={id}&export=download&confirm=t'
+
+
+# ── Manifest ────────────────────────────────────────────────
+def load_manifest(path: str = DATA_MANIFEST_PATH, files: dict = None) -> dict:
+    """
+    Source → {file, size, sha256}.
+
+    *files* (source → file name) lists the expected sources; entries
+    missing from the manifest file are unpinned (size / sha256 None).
+    """
+    pinned = {}
+    if os.path.exists(path):
+        with open(path) as f:
+            pinned = json.load(f)
+    manifest = {name: {'file': file, 'size': None, 'sha256': None}
+                for name, file in (files or {}).items()}
+    for name, entry in pinned.items():
+        manifest[name] = {**manifest.get(name, {}), **entry}
+    return manifest
+
+
+def file_digest(path: str) -> tuple:
+    """(size in bytes, SHA-256 hex digest) of *path*, read in `CHUNK_BYTES` blocks."""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(CHUNK_BYTES), b''):
+            h.update(block)
+    return os.path.getsize(path), h.hexdigest()
+
+
+def pin(manifest: dict, store: str = DATA_STORE, path: str = DATA_MANIFEST_PATH) -> dict:
+    """Record the size and SHA-256 of every source present in *store* and save the manifest."""
+    for entry in manifest.values():
+        local = os.path.join(store, entry['file'])
+        if os.path.exists(local):
+            entry['size'], entry['sha256'] = file_digest(local)
+    save_manifest(manifest, path)
+    return manifest
+
+
+def _matches(entry: dict, size: int, sha256: str = None) -> bool:
+    if entry.get('size') is not None and size != entry['size']:
+        return False
+    return sha256 is None or entry.get('sha256') is None or sha256 == entry['sha256']
+
+
+def save_manifest(manifest: dict, path: str = DATA_MANIFEST_PATH):
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(manifest, f, indent=2)
+
+
+def verify(path: str, entry: dict) -> bool:
+    """True if *path* exists and matches the pinned manifest *entry* (stamp-cached hash)."""
+    if not os.path.exists(path) or entry.get('sha256') is None:
+        return False
+    st = os.stat(path)
+    if not _matches(entry, st.st_size):
+        return False
+    key = [st.st_size, st.st_mtime_ns]
+    stamp = f'{path}.verified'
+    try:
+        with open(stamp) as f:
+            cached = json.load(f)
+        if cached['key'] == key:
+            return cached['sha256'] == entry['sha256']
+    except (OSError, ValueError, KeyError):
+        pass
+    _, digest = file_digest(path)
+    with open(stamp, 'w') as f:
+        json.dump({'key': key, 'sha256': digest}, f)
+    return digest == entry['sha256']
+
+
+# ── Backends ────────────────────────────────────────────────
+def _range_total(content_range: str):
+    """Total size from a ``Content-Range: bytes a-b/total`` header (None if unknown)."""
+    total = (content_range or '').rpartition('/')[2]
+    return int(total) if total.isdigit() else None
+
+
+class LocalBackend:
+    """Sources copied from a local directory."""
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def open(self, name: str, entry: dict, offset: int = 0):
+        """(offset actually served, iterator of byte chunks, total file size)."""
+        path = os.path.join(self.root, entry['file'])
+        total = os.path.getsize(path)
+        offset = min(offset, total)
+
+        def chunks():
+            with open(path, 'rb') as f:
+                f.seek(offset)
+                yield from iter(lambda: f.read(CHUNK_BYTES), b'')
+        return offset, chunks(), total
+
+
+class HTTPBackend:
+    """Sources from an HTTP mirror; resumes with ``Range`` requests."""
+
+    def __init__(self, base_url: str, timeout: float = HTTP_TIMEOUT):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+
+    def url(self, name: str, entry: dict) -> str:
+        return f"{self.base_url}/{entry['file']}"
+
+    def open(self, name: str, entry: dict, offset: int = 0):
+        """
+        (offset actually served, iterator of byte chunks, total file size or
+        None if the server does not say); the offset is 0 if the server
+        ignores ranges.
+        """
+        req = _request.Request(self.url(name, entry),
+                               headers={'Range': f'bytes={offset}-'} if offset else {})
+        try:
+            resp = _request.urlopen(req, timeout=self.timeout)
+        except _error.HTTPError as e:
+            if e.code == 416:                              # nothing left past *offset*
+                return offset, iter(()), _range_total(e.headers.get('Content-Range'))
+            raise
+        self.check(name, resp)
+        if resp.status == 206:
+            served, total = offset, _range_total(resp.headers.get('Content-Range'))
+        else:
+            length = resp.headers.get('Content-Length')
+            served, total = 0, int(length) if length else None
+
+        def chunks():
+            with resp:
+                yield from iter(lambda: resp.read(CHUNK_BYTES), b'')
+        return served, chunks(), total
+
+    def check(self, name: str, resp):
+        """Reject a response that is not the file (hook for subclasses)."""
+
+
+class DriveBackend(HTTPBackend):
+    """Sources from Google Drive by file id (direct download, range-resumable)."""
+
+    def __init__(self, file_ids: dict, timeout: float = HTTP_TIMEOUT):
+        super().__init__('', timeout)
+        self.file_ids = file_ids
+
+    def url(self, name: str, entry: dict) -> str:
+        return DRIVE_URL.format(id=self.file_ids[name])
+
+    def check(self, name: str, resp):
+        if 'text/html' in resp.headers.get('Content-Type', ''):
+            resp.close()
+            raise ValueError(f"{name}: Google Drive answered with an HTML page instead of the "
+                             f"file (quota or confirmation interstitial)")
+
+
+def backend_from_env(file_ids: dict):
+    """`MYO_DATA_MIRROR` (http(s) URL → `HTTPBackend`, directory → `LocalBackend`) or Drive."""
+    mirror = os.environ.get('MYO_DATA_MIRROR')
+    if mirror:
+        return HTTPBackend(mirror) if mirror.startswith(('http://', 'https://')) \
+            else LocalBackend(mirror)
+    return DriveBackend(file_ids)
+
+
+def air_gapped_from_env() -> bool:
+    return os.environ.get('MYO_AIR_GAPPED', '').lower() in ('1', 'true', 'yes')
+
+
+# ── Fetching ────────────────────────────────────────────────
+def _download(name: str, entry: dict, backend, path: str, retry: bool = True):
+    part = f'{path}.part'
+    if entry.get('sha256') is None and os.path.exists(part):    # unverifiable prefix → start over
+        os.remove(part)
+    offset = os.path.getsize(part) if os.path.exists(part) else 0
+    served, chunks, total = backend.open(name, entry, offset)
+
+    h = hashlib.sha256()
+    if served:                                       # resume: hash the bytes already on disk
+        with open(part, 'rb') as f:
+            remaining = served
+            while remaining:
+                block = f.read(min(CHUNK_BYTES, remaining))
+                h.update(block)
+                remaining -= len(block)
+    with open(part, 'r+b' if served else 'wb') as f:
+        f.truncate(served)
+        f.seek(served)
+        for chunk in chunks:
+            f.write(chunk)
+            h.update(chunk)
+        size = f.tell()
+
+    if total is not None and size != total:
+        os.remove(part)
+        if served and retry:
+            return _download(name, entry, backend, path, retry=False)
+        raise ValueError(f"{name}: downloaded {size:,} bytes, the backend announced {total:,}")
+    if not _matches(entry, size, h.hexdigest()):
+        os.remove(part)
+        if served and retry:                         # the resumed prefix was corrupt
+            return _download(name, entry, backend, path, retry=False)
+        raise ValueError(f"{name}: downloaded {size:,} bytes with SHA-256 {h.hexdigest()[:12]}… "
+                         f"— manifest expects {entry['size']} bytes / {str(entry['sha256'])[:12]}…")
+    os.replace(part, path)
+    if entry.get('sha256') is None and total is not None:       # trust on first use
+        entry['size'], entry['sha256'] = size, h.hexdigest()
+    if entry.get('sha256'):
+        st = os.stat(path)
+        with open(f'{path}.verified', 'w') as f:
+            json.dump({'key': [st.st_size, st.st_mtime_ns], 'sha256': h.hexdigest()}, f)
+    return 'resumed' if served else 'fetched'
+
+
+def fetch_one(name: str, entry: dict, backend=None, store: str = DATA_STORE,
+              air_gapped: bool = False) -> tuple:
+    """Resolve one source → (local path, 'cached' | 'fetched' | 'resumed')."""
+    path = os.path.join(store, entry['file'])
+    if verify(path, entry):
+        return path, 'cached'
+    if air_gapped:
+        state = ('is missing' if not os.path.exists(path) else
+                 'fails verification' if entry.get('sha256') else 'is not pinned (see `pin`)')
+        raise FileNotFoundError(f"Air-gapped: {name} ({path}) {state} in the local store")
+    if os.path.exists(path) and entry.get('sha256') is not None:    # truncated / corrupt → refetch
+        if entry.get('size') is not None and os.path.getsize(path) < entry['size']:
+            os.replace(path, f'{path}.part')                        # resume
+        else:
+            os.remove(path)
+    return path, _download(name, entry, backend, path)   # an unpinned file stays until replaced
+
+
+def fetch(manifest: dict, names=None, backend=None, store: str = DATA_STORE,
+          air_gapped: bool = None, workers: int = FETCH_WORKERS,
+          manifest_path: str = DATA_MANIFEST_PATH) -> dict:
+    """
+    Resolve *names* (default: every manifest source) concurrently.
+
+    Sources pinned on first use are written back to *manifest_path*
+    (None leaves the file alone).
+
+    Returns
+    -------
+    dict  source → {'path', 'status', 'pinned'} with status 'cached', 'fetched'
+          or 'resumed'; pinned is True if the fetch pinned the source.
+    """
+    names = list(names or manifest)
+    air_gapped = air_gapped_from_env() if air_gapped is None else air_gapped
+    os.makedirs(store, exist_ok=True)
+    unpinned = {name for name in names if manifest[name].get('sha256') is None}
+    results = joblib.Parallel(n_jobs=min(workers, len(names)) or 1, prefer='threads')(
+        joblib.delayed(fetch_one)(name, manifest[name], backend, store, air_gapped)
+        for name in names
+    )
+    pinned = {name for name in unpinned if manifest[name].get('sha256') is not None}
+    if pinned and manifest_path is not None:
+        save_manifest(manifest, manifest_path)
+    return {name: {'path': path, 'status': status, 'pinned': name in pinned}
+            for name, (path, status) in zip(names, results)}
+
+
+# ── Local stand-in server ───────────────────────────────────
+class _RangeHandler(http.server.SimpleHTTPRequestHandler):
+    """Static files with single ``bytes=start-`` range support."""
+
+    def send_head(self):
+        rng = self.headers.get('Range', '')
+        path = self.translate_path(self.path)
+        if not rng.startswith('bytes=') or not os.path.isfile(path):
+            return super().send_head()
+        size = os.path.getsize(path)
+        start = int(rng[6:].split('-')[0] or 0)
+        if start >= size:
+            self.send_response(416)
+            self.send_header('Content-Range', f'bytes */{size}')
+            self.end_headers()
+            return None
+        f = open(path, 'rb')
+        f.seek(start)
+        self.send_response(206)
+        self.send_header('Content-Type', 'application/octet-stream')
+        self.send_header('Content-Range', f'bytes {start}-{size - 1}/{size}')
+        self.send_header('Content-Length', str(size - start))
+        self.end_headers()
+        return f
+
+    def log_message(self, *args):
+        pass
+
+
+def serve(directory: str, port: int = 0):
+    """
+    Serve *directory* over HTTP (with ranges) on a daemon thread.
+
+    Returns
+    -------
+    (server, base_url)  call ``server.shutdown()`` to stop.
+    """
+    handler = lambda *a, **kw: _RangeHandler(*a, directory=directory, **kw)  # noqa: E731
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f'http://127.0.0.1:{server.server_address[1]}'
@@ -0,0 +1,181 @@
+"""
+Significance stage — is the leaderboard winner actually better?
+
+Contestant ROC-AUCs often differ only in the third decimal, so point
+estimates alone cannot crown a champion.  This stage adds:
+
+- **Bootstrap replicates** of every contestant's AUC.  Each model's test
+  scores are sorted *once*; a bootstrap resample is then just a vector
+  of multinomial counts over the test rows, and the weighted
+  Mann–Whitney AUC of that resample is read off cumulative sums along
+  the fixed sort order — O(n) per replicate, no re-sorting.  All models
+  share the same resamples (paired), and chunks of replicates run on a
+  joblib process pool.
+- **Paired DeLong tests** between every pair of contestants, using the
+  O(n log n) mid-rank formulation of Sun & Xu (2014) for the AUC
+  covariance matrix.
+"""
+
+import math
+
+import numpy as np
+import pandas as pd
+
+from ._lazy import lazy_import
+from .evaluate import _tie_bounds
+
+joblib = lazy_import('joblib')
+
+
+BOOTSTRAP_REPLICATES = 10_000
+BOOTSTRAP_CHUNK = 250           # replicates per worker task
+
+
+# ── Precomputed sort orders ─────────────────────────────────
+def _sort_orders(y: np.ndarray, P: np.ndarray) -> list:
+    """
+    Per model, from one ascending sort: the test rows of the negatives in
+    score order, the test rows of the positives, and for each positive
+    how many negatives score strictly below it and how many tie with it.
+    """
+    orders = []
+    order = np.argsort(P, axis=1, kind='stable')
+    start, end, _ = _tie_bounds(np.take_along_axis(P, order, axis=1))
+    for k in range(len(P)):
+        is_neg = y[order[k]] == 0
+        neg_before = np.r_[0, np.cumsum(is_neg)]          # negatives in sorted[:i]
+        pos = ~is_neg
+        below = neg_before[start[k][pos]]
+        orders.append({
+            'neg_rows': order[k][is_neg],
+            'pos_rows': order[k][pos],
+            'neg_below': below,
+            'neg_upto': neg_before[end[k][pos] + 1],      # below + tied
+        })
+    return orders
+
+
+def _weighted_auc_chunk(sorted_orders: list, n_rows: int, n_replicates: int, seed) -> np.ndarray:
+    """
+    AUC of *n_replicates* paired bootstrap resamples → (replicates × models).
+
+    A resample is a vector w of multinomial counts over the test rows.
+    With C the running sum of w over the negatives in score order, the
+    AUC numerator is Σ_pos w_i · (C[below_i] + C[upto_i]) / 2 — negatives
+    strictly below count fully, tied ones half.
+    """
+    rng = np.random.default_rng(seed)
+    draws = rng.integers(0, n_rows, size=(n_replicates, n_rows))
+    draws += (np.arange(n_replicates) * n_rows)[:, None]
+    counts = np.bincount(draws.ravel(), minlength=n_replicates * n_rows)
+    counts = counts.reshape(n_replicates, n_rows).astype(np.int32)
+
+    aucs = np.empty((n_replicates, len(sorted_orders)))
+    for k, so in enumerate(sorted_orders):
+        neg_cum = np.zeros((n_replicates, len(so['neg_rows']) + 1), dtype=np.int32)
+        np.cumsum(counts[:, so['neg_rows']], axis=1, out=neg_cum[:, 1:])
+        w_pos = counts[:, so['pos_rows']]
+        twice_num = (w_pos * (neg_cum[:, so['neg_below']] + neg_cum[:, so['neg_upto']])).sum(
+            axis=1, dtype=np.int64)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            aucs[:, k] = twice_num / (2.0 * w_pos.sum(axis=1) * neg_cum[:, -1])
+    return aucs
+
+
+def bootstrap_auc(y, P, n_replicates: int = BOOTSTRAP_REPLICATES,
+                  n_jobs: int = -1, seed: int = 42) -> np.ndarray:
+    """
+    Paired bootstrap replicates of ROC-AUC.
+
+    Parameters
+    ----------
+    y : array (n,)          Binary test labels.
+    P : array (models × n)  Test-set probabilities.
+
+    Returns
+    -------
+    np.ndarray  (n_replicates × models) AUC replicates (NaN for the rare
+                resample that contains a single class).
+    """
+    y = np.asarray(y).astype(int)
+    P = np.atleast_2d(np.asarray(P, dtype=np.float64))
+    sorted_orders = _sort_orders(y, P)
+    sizes = [min(BOOTSTRAP_CHUNK, n_replicates - s) for s in range(0, n_replicates, BOOTSTRAP_CHUNK)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    chunks = joblib.Parallel(n_jobs=n_jobs, prefer='processes')(
+        joblib.delayed(_weighted_auc_chunk)(sorted_orders, len(y), size, s)
+        for size, s in zip(sizes, seeds)
+    )
+    return np.vstack(chunks)
+
+
+# ── DeLong ──────────────────────────────────────────────────
+def _midranks(X: np.ndarray) -> np.ndarray:
+    """Row-wise 1-based mid-ranks (ties share their average rank)."""
+    order = np.argsort(X, axis=1, kind='stable')
+    start, end, _ = _tie_bounds(np.take_along_axis(X, order, axis=1))
+    ranks = np.empty(X.shape, dtype=np.float64)
+    np.put_along_axis(ranks, order, (start + end) / 2.0 + 1.0, axis=1)
+    return ranks
+
+
+def delong_covariance(y, P):
+    """
+    ROC-AUCs and their DeLong covariance matrix (fast mid-rank algorithm).
+
+    Returns
+    -------
+    (np.ndarray, np.ndarray)  aucs (models,), covariance (models × models).
+    """
+    y = np.asarray(y).astype(bool)
+    P = np.atleast_2d(np.asarray(P, dtype=np.float64))
+    pos, neg = P[:, y], P[:, ~y]
+    n_pos, n_neg = pos.shape[1], neg.shape[1]
+
+    tz = _midranks(np.hstack([pos, neg]))
+    tx, ty = _midranks(pos), _midranks(neg)
+    aucs = tz[:, :n_pos].sum(axis=1) / (n_pos * n_neg) - (n_pos + 1.0) / (2.0 * n_neg)
+
+    v01 = (tz[:, :n_pos] - tx) / n_neg          # structural components, positives
+    v10 = 1.0 - (tz[:, n_pos:] - ty) / n_pos    # structural components, negatives
+    cov = np.atleast_2d(np.cov(v01)) / n_pos + np.atleast_2d(np.cov(v10)) / n_neg
+    return aucs, cov
+
+
+def pairwise_tests(y, P, names: list, replicates: np.ndarray = None,
+                   alpha: float = 0.05) -> pd.DataFrame:
+    """
+    Paired DeLong test for every pair of contestants.
+
+    If bootstrap *replicates* (from `bootstrap_auc`) are given, the
+    percentile interval of each paired ΔAUC is reported as well.
+    p-values are also Holm-adjusted across all pairs.
+
+    Returns
+    -------
+    pd.DataFrame  one row per pair, sorted by p-value.
+    """
+    aucs, cov = delong_covariance(y, P)
+    rows = []
+    for a in range(len(names)):
+        for b in range(a + 1, len(names)):
+            diff = aucs[a] - aucs[b]
+            var = cov[a, a] + cov[b, b] - 2.0 * cov[a, b]
+            z = diff / math.sqrt(var) if var > 0 else 0.0
+            row = {
+                'Model A': names[a], 'Model B': names[b],
+                'ΔAUC': diff, 'z': z,
+                'p-value': math.erfc(abs(z) / math.sqrt(2.0)),
+            }
+            if replicates is not None:
+                lo, hi = np.nanpercentile(replicates[:, a] - replicates[:, b],
+                                          [100 * alpha / 2, 100 * (1 - alpha / 2)])
+                row['ΔAUC 95% CI'] = f"[{lo:+.4f}, {hi:+.4f}]"
+            rows.append(row)
+
+    tests = pd.DataFrame(rows).sort_values('p-value', ignore_index=True)
+    n_tests = len(tests)
+    holm = np.maximum.accumulate((n_tests - np.arange(n_tests)) * tests['p-value'].to_numpy())
+    tests['p (Holm)'] = np.minimum(holm, 1.0)
+    tests['Significant'] = tests['p (Holm)'] < alpha
+    return tests
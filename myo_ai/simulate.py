@@ -0,0 +1,141 @@
+"""
+Layer 3 — Myo-Sim (risk simulation stage).
+
+Single-patient scoring against the Myo-Core pipeline schema, the CVD
+risk gauge, and the Chronos 20-year projection used by the Bio-Deck
+dashboard.  Only NumPy / pandas are needed to score; matplotlib patches
+are imported the first time a gauge is drawn.
+"""
+
+import numpy as np
+import pandas as pd
+
+from ._lazy import lazy_import
+
+mpatches = lazy_import('matplotlib.patches')
+
+
+CHRONOS_YEARS = 20   # projection horizon (years)
+
+
+# ── Patient construction & scoring ──────────────────────────
+def patient_frame(feature_names, age, sys_bp, dia_bp, cholesterol, weight,
+                  height, smoker, active, years_future=0) -> pd.DataFrame:
+    """
+    Build single-patient rows matching the training schema.
+
+    `years_future` may be a scalar or a sequence; one row is produced
+    per offset so a whole projection can be scored in a single call.
+    Features the simulator does not control are left at 0.
+    """
+    offsets = np.atleast_1d(years_future)
+    bmi = weight / ((height / 100) ** 2) if height > 0 else 0
+    pulse_pressure = sys_bp - dia_bp
+
+    # Map widget inputs → canonical feature names
+    mapping = {
+        'age': age + offsets,
+        'ap_hi': sys_bp, 'sys_bp': sys_bp, 'restingbp': sys_bp,
+        'ap_lo': dia_bp,
+        'cholesterol': cholesterol,
+        'weight': weight,
+        'height': height,
+        'bmi': bmi,
+        'pulse_pressure': pulse_pressure,
+        'smoke': int(smoker),
+        'active': int(active),
+        'sensor_signal_available': 0,
+    }
+    df = pd.DataFrame(0.0, index=range(len(offsets)), columns=list(feature_names))
+    for key, val in mapping.items():
+        if key in df.columns:
+            df[key] = val
+    return df
+
+
+def predict_risk(pipeline, feature_names, age, sys_bp, dia_bp, cholesterol,
+                 weight, height, smoker, active, years_future=0):
+    """
+    Return P(CVD) from a fitted pipeline (imputer → scaler → model).
+
+    Scalar `years_future` → float; a sequence → array, one per offset.
+    """
+    df = patient_frame(feature_names, age, sys_bp, dia_bp, cholesterol,
+                       weight, height, smoker, active, years_future)
+    probs = pipeline.predict_proba(df)[:, 1]
+    return probs if np.ndim(years_future) else probs[0]
+
+
+def chronos_projection(pipeline, feature_names, age, sys_bp, dia_bp,
+                       cholesterol, weight, height, smoker, active,
+                       horizon=CHRONOS_YEARS):
+    """Ages and projected risks for the next *horizon* years (one batched predict)."""
+    years = np.arange(horizon + 1)
+    risks = predict_risk(pipeline, feature_names, age, sys_bp, dia_bp,
+                         cholesterol, weight, height, smoker, active, years)
+    return age + years, risks
+
+
+# ── Drawing ─────────────────────────────────────────────────
+def draw_gauge(ax, prob):
+    """Render a semicircular gauge chart for CVD risk probability."""
+    ax.clear()
+    ax.set_aspect('equal')
+    ax.set_xlim(-1.3, 1.3)
+    ax.set_ylim(-0.3, 1.4)
+    ax.axis('off')
+
+    # Background arc segments (green → yellow → red)
+    n_seg = 100
+    for i in range(n_seg):
+        frac = i / n_seg
+        angle = np.pi * (1 - frac)  # pi → 0
+        if frac < 0.4:
+            color = '#2ecc71'
+        elif frac < 0.7:
+            color = '#f39c12'
+        else:
+            color = '#e74c3c'
+        a1 = np.degrees(np.pi - frac * np.pi)
+        a2 = np.degrees(np.pi - (frac + 1/n_seg) * np.pi)
+        wedge = mpatches.Wedge((0, 0), 1.0, min(a1, a2), max(a1, a2),
+                               width=0.25, color=color, alpha=0.35)
+        ax.add_patch(wedge)
+
+    # Needle
+    needle_angle = np.pi * (1 - prob)
+    nx = 0.85 * np.cos(needle_angle)
+    ny = 0.85 * np.sin(needle_angle)
+    ax.annotate('', xy=(nx, ny), xytext=(0, 0),
+                arrowprops=dict(arrowstyle='->', color='black', lw=2.5))
+    ax.plot(0, 0, 'ko', markersize=8)
+
+    # Labels
+    status = 'HIGH RISK' if prob > 0.5 else 'LOW RISK'
+    status_color = '#e74c3c' if prob > 0.5 else '#2ecc71'
+    ax.text(0, -0.15, f'{prob:.1%}', ha='center', va='center',
+            fontsize=28, fontweight='bold', color=status_color)
+    ax.text(0, 1.25, 'CVD Risk Gauge', ha='center', va='center',
+            fontsize=14, fontweight='bold')
+    ax.text(-1.1, -0.05, '0%', fontsize=9, ha='center')
+    ax.text(1.1, -0.05, '100%', fontsize=9, ha='center')
+    ax.text(0, -0.30, status, ha='center', fontsize=13,
+            fontweight='bold', color=status_color,
+            bbox=dict(boxstyle='round,pad=0.3', facecolor=status_color,
+                      alpha=0.15, edgecolor=status_color))
+
+
+def draw_chronos_projection(ax, ages, risks):
+    """Plot projected CVD risk over the projection horizon."""
+    ax.clear()
+    ax.fill_between(ages, risks, alpha=0.15, color='#e74c3c')
+    ax.plot(ages, risks, 'o-', color='#e74c3c', linewidth=2.5,
+            markersize=5, label='Projected CVD Risk')
+    ax.axhline(y=0.5, color='gray', linestyle='--', alpha=0.6, label='Risk Threshold (50%)')
+
+    ax.set_xlabel('Age (years)', fontsize=12)
+    ax.set_ylabel('CVD Probability', fontsize=12)
+    ax.set_title(f'Chronos Engine: {len(ages) - 1}-Year Risk Projection', fontsize=14, fontweight='bold')
+    ax.set_ylim(-0.02, 1.02)
+    ax.legend(loc='upper left', fontsize=10)
+    ax.grid(True, alpha=0.3)
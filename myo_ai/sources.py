@@ -0,0 +1,260 @@
+"""
+Source adapters — pluggable Synapse harmonization.
+
+Every tabular feed is described by a `SourceAdapter` instead of code in
+`SynapseIngestionEngine`:
+
+| Declaration | Meaning |
+|---|---|
+| `reader` | `pd.read_csv` keyword arguments (``sep``, ``encoding`` …) |
+| `rename` | raw column → canonical name (matched exactly, then case-insensitively) |
+| `schema` | canonical columns kept (default `CANONICAL_COLUMNS`; None keeps every column) |
+| `dtypes` | raw column → dtype, applied while parsing |
+| `units` | raw column → unit; converted to `CANONICAL_UNITS` by a factor from `UNIT_FACTORS` |
+| `tag` | value of the `source` provenance column |
+
+Rename targets and unit factors are validated and precompiled when the
+adapter is built; the column plan for a file header is compiled once and
+cached, so projecting a source is a straight loop over ``(raw, canonical,
+factor)`` triples.  Raw columns outside the schema are skipped by the CSV
+parser (`usecols`), so a feed's private columns are never parsed and
+never widen the union; `harmonize` reports them per source (``dropped``)
+so a misnamed clinical column is visible.  Raw names that are not renamed
+are lowercased, as Catalyst does after the merge, so ``HeartDisease`` or
+``Age`` headers still match the lowercase schema.  Adding a hospital feed
+is one `register_source` call.
+
+`harmonize` reads the sources concurrently (joblib threads; the CSV parser
+releases the GIL).  Instead of an outer `pd.concat` — which reindexes
+every source to the column union before copying it again — the result is
+allocated once, column by column, and every source fills only its own row
+slice of the columns it has.  Columns keep their order of first
+appearance; a column's dtype follows `pd.concat` (kept if every source has
+it with one dtype, float64 for numeric columns with gaps, object
+otherwise).
+"""
+
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from ._lazy import lazy_import
+
+joblib = lazy_import('joblib')
+
+
+CANONICAL_UNITS = {
+    'age':         'years',
+    'height':      'cm',
+    'weight':      'kg',
+    'sys_bp':      'mmHg',
+    'ap_hi':       'mmHg',
+    'ap_lo':       'mmHg',
+    'cholesterol': 'mg/dL',
+}
+UNIT_FACTORS = {                        # (from, to) → multiply by
+    ('days', 'years'):    1 / 365.25,
+    ('months', 'years'):  1 / 12,
+    ('m', 'cm'):          100.0,
+    ('in', 'cm'):         2.54,
+    ('lb', 'kg'):         0.45359237,
+    ('g', 'kg'):          1e-3,
+    ('kPa', 'mmHg'):      7.50062,
+    ('mmol/L', 'mg/dL'):  38.67,
+}
+CANONICAL_COLUMNS = [                   # harmonized tabular schema (after renaming)
+    'id', 'age', 'sex', 'gender', 'height', 'weight', 'sys_bp', 'ap_hi', 'ap_lo',
+    'cholesterol', 'gluc', 'smoke', 'smoking', 'alco', 'active', 'target', 'cardio',
+    # Heart Attack
+    'cp', 'fbs', 'restecg', 'thalachh', 'exng', 'oldpeak', 'slp', 'caa', 'thall',
+    # Cardiac Failure
+    'anaemia', 'creatinine_phosphokinase', 'diabetes', 'ejection_fraction', 'platelets',
+    'serum_creatinine', 'serum_sodium', 'time',
+]
+READ_WORKERS = min(8, os.cpu_count() or 1)
+
+
+class SourceAdapter:
+    """
+    Declarative description of one tabular source.
+
+    Parameters
+    ----------
+    name : str      Key of the source in the *paths* dict.
+    tag : str       Value written to the ``source`` column.
+    reader : dict   Extra `pd.read_csv` arguments.
+    rename : dict   Raw column → canonical column; other columns are lowercased.
+    dtypes : dict   Raw column → dtype while parsing.
+    units : dict    Raw column → unit of the raw values.
+    schema : list   Canonical columns to keep; None keeps every column.
+    """
+
+    def __init__(self, name: str, tag: str, reader: dict = None, rename: dict = None,
+                 dtypes: dict = None, units: dict = None, schema=CANONICAL_COLUMNS):
+        self.name = name
+        self.tag = tag
+        self.reader = dict(reader or {})
+        self.rename = dict(rename or {})
+        self._rename_lower = {raw.lower(): canonical for raw, canonical in self.rename.items()}
+        self.dtypes = dict(dtypes or {})
+        self.units = dict(units or {})
+        self.schema = None if schema is None else frozenset(schema)
+        self.factors = {raw: self._factor(raw, unit) for raw, unit in self.units.items()}
+        self._plans = {}
+
+    def canonical(self, raw: str) -> str:
+        """Canonical name of raw column *raw*."""
+        if raw in self.rename:
+            return self.rename[raw]
+        return self._rename_lower.get(raw.lower(), raw.lower())
+
+    def _factor(self, raw: str, unit: str) -> float:
+        canonical = self.canonical(raw)
+        target = CANONICAL_UNITS.get(canonical)
+        if target is None or unit == target:
+            return 1.0
+        if (unit, target) not in UNIT_FACTORS:
+            raise ValueError(f"{self.name}: no conversion for {raw} from {unit!r} to {target!r}")
+        return UNIT_FACTORS[(unit, target)]
+
+    def plan(self, columns) -> list:
+        """``(raw, canonical, factor)`` per column of a header (compiled once per header)."""
+        key = tuple(columns)
+        if key not in self._plans:
+            self._plans[key] = [(raw, self.canonical(raw), self.factors.get(raw, 1.0))
+                                for raw in key]
+        return self._plans[key]
+
+    def keeps(self, raw: str) -> bool:
+        """True if raw column *raw* maps into the schema."""
+        return self.schema is None or self.canonical(raw) in self.schema
+
+    def dropped(self, path: str) -> list:
+        """Raw columns of the file at *path* that fall outside the schema."""
+        if self.schema is None:
+            return []
+        header = pd.read_csv(path, nrows=0, **self.reader).columns
+        return [raw for raw in header if not self.keeps(raw)]
+
+    def read(self, path: str) -> pd.DataFrame:
+        return pd.read_csv(path, dtype=self.dtypes or None,
+                           usecols=None if self.schema is None else self.keeps, **self.reader)
+
+    def project(self, df: pd.DataFrame) -> dict:
+        """Canonical column → values (unit-converted) plus ``source``."""
+        out = {}
+        for raw, canonical, factor in self.plan(df.columns):
+            values = df[raw].to_numpy()
+            out[canonical] = values * factor if factor != 1.0 else values
+        out['source'] = np.full(len(df), self.tag, dtype=object)
+        return out
+
+    def __getstate__(self):                     # stable pickles / hashes: no plan cache, sorted schema
+        state = {k: v for k, v in self.__dict__.items() if k not in ('_plans', '_rename_lower')}
+        state['schema'] = None if self.schema is None else sorted(self.schema)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state, _plans={})
+        self._rename_lower = {raw.lower(): canonical for raw, canonical in self.rename.items()}
+        if self.schema is not None:
+            self.schema = frozenset(self.schema)
+
+    def __repr__(self):
+        return f"SourceAdapter({self.name!r}, tag={self.tag!r})"
+
+
+# ── Registry ────────────────────────────────────────────────
+SOURCE_ADAPTERS = {}
+
+
+def register_source(adapter: SourceAdapter) -> SourceAdapter:
+    """Add (or replace) *adapter* in `SOURCE_ADAPTERS`."""
+    SOURCE_ADAPTERS[adapter.name] = adapter
+    return adapter
+
+
+CARDIAC_RENAME = {                      # shared by the three Kaggle-style feeds
+    'output': 'target',
+    'DEATH_EVENT': 'target',
+    'label': 'target',
+    'HeartDisease': 'target',
+    'trtbps': 'sys_bp',
+    'RestingBP': 'sys_bp',
+    'high_blood_pressure': 'sys_bp',
+    'chol': 'cholesterol',
+    'serum_cholesterol': 'cholesterol',
+}
+
+register_source(SourceAdapter('heart_attack', 'HeartAttack', rename=CARDIAC_RENAME))
+register_source(SourceAdapter('cardiac_failure', 'CardiacFailure', rename=CARDIAC_RENAME,
+                              dtypes={'id': str}))
+register_source(SourceAdapter('cardiac_failure_base', 'CardiacFailureBase', reader={'sep': ';'},
+                              rename=CARDIAC_RENAME, dtypes={'id': str}))
+
+
+# ── Harmonization ───────────────────────────────────────────
+def _load(adapter: SourceAdapter, path: str, columns) -> tuple:
+    t0 = time.perf_counter()
+    dropped = adapter.dropped(path)
+    df = adapter.read(path)
+    projected = adapter.project(df)
+    if columns is not None:
+        projected = {c: v for c, v in projected.items() if c in columns}
+    return adapter.name, len(df), projected, time.perf_counter() - t0, dropped
+
+
+def _union_dtype(dtypes: list, complete: bool):
+    if complete and len(set(dtypes)) == 1:
+        return dtypes[0]
+    if all(d.kind in 'iuf' for d in dtypes):
+        return np.result_type(np.float64, *dtypes)
+    return np.dtype(object)
+
+
+def harmonize(paths: dict, adapters=None, columns: list = None,
+              workers: int = READ_WORKERS) -> tuple:
+    """
+    Read, project and stack the sources in *paths*.
+
+    Parameters
+    ----------
+    paths : dict      Source name → file path; sources without an adapter are skipped.
+    adapters : list   `SourceAdapter` objects (default: `SOURCE_ADAPTERS`).
+    columns : list    Keep only these canonical columns (default: the union).
+    workers : int     Concurrent readers.
+
+    Returns
+    -------
+    (pd.DataFrame, dict)  Harmonized rows in adapter order, and source →
+                          ``{'rows', 'seconds', 'dropped'}`` (read + project time,
+                          raw columns outside the adapter's schema).
+    """
+    adapters = [a for a in (adapters or SOURCE_ADAPTERS.values()) if a.name in paths]
+    loaded = joblib.Parallel(n_jobs=max(1, min(workers, len(adapters))), prefer='threads')(
+        joblib.delayed(_load)(a, paths[a.name], columns) for a in adapters
+    )
+
+    offsets, total = [], 0
+    for _, n, _, _, _ in loaded:
+        offsets.append(total)
+        total += n
+    order = list(columns) if columns is not None else list(dict.fromkeys(
+        c for _, _, projected, _, _ in loaded for c in projected))
+
+    data = {}
+    for col in order:
+        parts = [(off, n, p.get(col)) for off, (_, n, p, _, _) in zip(offsets, loaded)]
+        present = [v.dtype for _, n, v in parts if v is not None]
+        if not present:
+            continue
+        complete = all(v is not None or n == 0 for _, n, v in parts)
+        buf = np.empty(total, dtype=_union_dtype(present, complete))
+        for off, n, values in parts:                   # gaps only are NaN-filled
+            buf[off:off + n] = np.nan if values is None else values
+        data[col] = buf
+
+    report = {name: {'rows': n, 'seconds': s, 'dropped': d} for name, n, _, s, d in loaded}
+    return pd.DataFrame(data, copy=False), report
@@ -0,0 +1,173 @@
+"""
+Synthetic cardiac data — the four Synapse sources without Google Drive.
+
+Writes files with the same names, delimiters and raw columns as the
+Drive CSVs, so `SynapseIngestionEngine.ingest_and_harmonize`,
+`run_pulse_harmonization` and `CatalystFeatureSynthesizer` run on them
+unchanged:
+
+| Source | File | Columns (raw → harmonized by `sources.CARDIAC_RENAME`) |
+|---|---|---|
+| Heart Attack | `heart_attack.csv` | age, sex, cp, trtbps → sys_bp, chol → cholesterol, fbs, restecg, thalachh, exng, oldpeak, slp, caa, thall, output → target |
+| Cardiac Failure | `cardiac_failure.csv` | age, anaemia, creatinine_phosphokinase, diabetes, ejection_fraction, high_blood_pressure → sys_bp, platelets, serum_creatinine, serum_sodium, sex, smoking, time, DEATH_EVENT → target |
+| Cardiac Failure Base | `cardiac_failure_base.csv` (`;`) | id, age, gender, height, weight, ap_hi, ap_lo, cholesterol, gluc, smoke, alco, active, cardio → target |
+| ECG Time-Series | `ecg_timeseries.csv` | `0` … `ecg_samples − 1` (one heartbeat per row), label |
+
+Rows are split across the tabular sources by `SOURCE_SHARES`; ECG rows
+cover the first `ECG_COVERAGE` of the base patients (Pulse numbers its
+records 0, 1, … which Catalyst joins to the base `id`).  Targets follow
+a logistic model of age, blood pressure, cholesterol, BMI and smoking,
+so contestants reach realistic (not perfect) AUCs.
+
+Files are written in chunks of about `CHUNK_CELLS` values, so anything
+from 10k to 50M rows is generated in bounded memory.  Output is fully
+determined by (*n_rows*, *ecg_samples*, *seed*).
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+
+SOURCE_FILES = {                        # source → (file name, delimiter)
+    'heart_attack':         ('heart_attack.csv', ','),
+    'cardiac_failure':      ('cardiac_failure.csv', ','),
+    'ecg_timeseries':       ('ecg_timeseries.csv', ','),
+    'cardiac_failure_base': ('cardiac_failure_base.csv', ';'),
+}
+SOURCE_SHARES = {'heart_attack': 0.05, 'cardiac_failure': 0.05, 'cardiac_failure_base': 0.90}
+ECG_COVERAGE = 0.5                      # base patients with an ECG record
+ECG_SAMPLES = 187                       # samples per heartbeat (MIT-BIH length)
+CHUNK_CELLS = 8_000_000                 # values generated per written chunk
+
+
+def _risk_label(rng, logit) -> np.ndarray:
+    return (rng.random(len(logit)) < 1 / (1 + np.exp(-logit))).astype(np.int8)
+
+
+# ── Source generators (one chunk each) ──────────────────────
+def heart_attack_chunk(rng, n: int) -> pd.DataFrame:
+    """UCI / Kaggle heart-attack rows."""
+    age = rng.integers(29, 78, n)
+    trtbps = rng.normal(131, 17, n).round()
+    chol = rng.normal(246, 51, n).round()
+    thalachh = (210 - 0.8 * age + rng.normal(0, 18, n)).round()
+    df = pd.DataFrame({
+        'age': age, 'sex': rng.integers(0, 2, n), 'cp': rng.integers(0, 4, n),
+        'trtbps': trtbps, 'chol': chol, 'fbs': (rng.random(n) < 0.15).astype(np.int8),
+        'restecg': rng.integers(0, 3, n), 'thalachh': thalachh,
+        'exng': (rng.random(n) < 0.33).astype(np.int8),
+        'oldpeak': rng.gamma(1.2, 0.9, n).round(1), 'slp': rng.integers(0, 3, n),
+        'caa': rng.integers(0, 5, n), 'thall': rng.integers(0, 4, n),
+    })
+    df['output'] = _risk_label(rng, (age - 54) / 9 + (chol - 246) / 60
+                               - (thalachh - 150) / 25 + df['cp'] * 0.5 - 0.7)
+    return df
+
+
+def cardiac_failure_chunk(rng, n: int) -> pd.DataFrame:
+    """Heart-failure clinical-records rows."""
+    age = rng.integers(40, 96, n)
+    ef = rng.integers(14, 81, n)
+    creat = rng.lognormal(0.2, 0.45, n).round(2)
+    df = pd.DataFrame({
+        'age': age, 'anaemia': rng.integers(0, 2, n),
+        'creatinine_phosphokinase': rng.lognormal(5.7, 1.0, n).round().astype(int),
+        'diabetes': rng.integers(0, 2, n), 'ejection_fraction': ef,
+        'high_blood_pressure': (rng.random(n) < 0.35).astype(np.int8),
+        'platelets': rng.normal(263_000, 97_000, n).round(-2),
+        'serum_creatinine': creat, 'serum_sodium': rng.normal(137, 4.4, n).round(),
+        'sex': rng.integers(0, 2, n), 'smoking': (rng.random(n) < 0.32).astype(np.int8),
+        'time': rng.integers(4, 286, n),
+    })
+    df['DEATH_EVENT'] = _risk_label(rng, (age - 60) / 12 - (ef - 38) / 12
+                                    + (creat - 1.4) * 0.8 - 0.8)
+    return df
+
+
+def cardiac_base_chunk(rng, n: int, id_start: int = 0) -> pd.DataFrame:
+    """Cardiovascular-disease (semicolon) rows with ids from *id_start*."""
+    age = rng.integers(30, 65, n)
+    gender = rng.integers(1, 3, n)
+    height = rng.normal(np.where(gender == 2, 170, 161), 7, n).round()
+    weight = rng.normal(74, 14, n).clip(35, 200).round(1)
+    ap_hi = rng.normal(127 + 0.4 * (age - 50), 17, n).round()
+    ap_lo = (ap_hi * 0.62 + rng.normal(2, 8, n)).round()
+    outliers = rng.random(n) < 0.002                            # Catalyst clips these
+    ap_hi[outliers] *= 10
+    cholesterol = rng.choice([1, 2, 3], n, p=[0.75, 0.14, 0.11])
+    smoke = (rng.random(n) < 0.09).astype(np.int8)
+    bmi = weight / (height / 100) ** 2
+    df = pd.DataFrame({
+        'id': np.arange(id_start, id_start + n), 'age': age, 'gender': gender,
+        'height': height, 'weight': weight, 'ap_hi': ap_hi, 'ap_lo': ap_lo,
+        'cholesterol': cholesterol, 'gluc': rng.choice([1, 2, 3], n, p=[0.85, 0.07, 0.08]),
+        'smoke': smoke, 'alco': (rng.random(n) < 0.05).astype(np.int8),
+        'active': (rng.random(n) < 0.8).astype(np.int8),
+    })
+    df['cardio'] = _risk_label(rng, (np.minimum(ap_hi, 200) - 127) / 15 + (age - 50) / 8
+                               + (cholesterol - 1) * 0.5 + (bmi - 27) / 8 + 0.3 * smoke)
+    return df
+
+
+def ecg_chunk(rng, n: int, samples: int = ECG_SAMPLES) -> pd.DataFrame:
+    """Heartbeats normalized to [0, 1] (P wave, QRS complex, T wave) plus noise."""
+    t = np.linspace(0, 1, samples)
+    label = rng.choice(5, n, p=[0.83, 0.03, 0.07, 0.01, 0.06])
+    shift = rng.normal(0, 0.02, (n, 1))
+    qrs_width = 0.012 * (1 + (label[:, None] == 2) * 1.5)          # widened ventricular beats
+
+    def wave(center, width, height):
+        return height * np.exp(-((t - center - shift) / width) ** 2)
+
+    beat = (wave(0.15, 0.03, 0.15) + wave(0.30, qrs_width, 1.0)
+            - wave(0.34, 0.015, 0.25) + wave(0.55, 0.06, rng.normal(0.3, 0.08, (n, 1))))
+    beat += rng.normal(0, 0.02, beat.shape)
+    lo, hi = beat.min(axis=1, keepdims=True), beat.max(axis=1, keepdims=True)
+    df = pd.DataFrame(((beat - lo) / (hi - lo)).astype(np.float32),
+                      columns=[str(i) for i in range(samples)])
+    df['label'] = label
+    return df
+
+
+# ── Writers ─────────────────────────────────────────────────
+def source_rows(n_rows: int) -> dict:
+    """Rows per source for *n_rows* tabular patients."""
+    rows = {name: int(n_rows * share) for name, share in SOURCE_SHARES.items()}
+    rows['cardiac_failure_base'] += n_rows - sum(rows.values())
+    rows['ecg_timeseries'] = int(rows['cardiac_failure_base'] * ECG_COVERAGE)
+    return rows
+
+
+def write_synthetic_sources(directory: str = '.', n_rows: int = 10_000,
+                            ecg_samples: int = ECG_SAMPLES, seed: int = 0) -> dict:
+    """
+    Write the four source CSVs for *n_rows* tabular patients.
+
+    Returns
+    -------
+    dict  source → file path, like `SynapseIngestionEngine.download_data`.
+    """
+    os.makedirs(directory, exist_ok=True)
+    rows = source_rows(n_rows)
+    rngs = dict(zip(SOURCE_FILES, (np.random.default_rng(s)
+                                   for s in np.random.SeedSequence(seed).spawn(len(SOURCE_FILES)))))
+    paths = {}
+    for name, (file_name, sep) in SOURCE_FILES.items():
+        path = paths[name] = os.path.join(directory, file_name)
+        width = ecg_samples + 1 if name == 'ecg_timeseries' else 14
+        chunk = max(1, CHUNK_CELLS // width)
+        for start in range(0, max(rows[name], 1), chunk):
+            n = min(chunk, rows[name] - start)
+            if name == 'heart_attack':
+                df = heart_attack_chunk(rngs[name], n)
+            elif name == 'cardiac_failure':
+                df = cardiac_failure_chunk(rngs[name], n)
+            elif name == 'cardiac_failure_base':
+                df = cardiac_base_chunk(rngs[name], n, id_start=start)
+            else:
+                df = ecg_chunk(rngs[name], n, ecg_samples)
+            df.to_csv(path, sep=sep, index=False, header=start == 0,
+                      mode='w' if start == 0 else 'a', float_format='%.6g')
+    return paths
@@ -0,0 +1,236 @@
+"""
+Stage telemetry — wall time, CPU time, peak RSS and rows per stage.
+
+The per-contestant `Train Time (s)` column cannot say whether a slow
+nightly run was spent in ingestion, merging, SHAP or plotting.  Every
+engine records itself into the run-wide recorder `RUN` instead:
+
+- `stage(name, rows=...)` is a context manager for notebook cells;
+- `profiled(name, rows=...)` decorates engine functions and methods
+  (Synapse, Pulse, Catalyst, `train.fit_and_score`, the SHAP values);
+- `annotate(rows=...)` lets a running stage report what it processed.
+
+Stages nest; a record keeps its parent and depth.  Peak RSS is read from
+the kernel's high-water mark (`VmHWM`), reset on entry to each stage and
+folded back into every enclosing stage on exit, so parents still see
+their children's peaks.  CPU time is `time.process_time` of this process
+(all threads) — work done in joblib worker processes is not included,
+so a CPU / wall ratio below 1 there means time spent waiting on workers.
+
+`RUN.summary()` aggregates the records into a table and `RUN.to_json`
+writes them, with run metadata, as one JSON document.
+"""
+
+import functools
+import inspect
+import json
+import numbers
+import os
+import platform
+import time
+from contextlib import contextmanager
+
+from ._lazy import lazy_import
+
+pd = lazy_import('pandas')              # only for `summary`
+
+
+TELEMETRY_PATH = os.path.join('artifacts', 'telemetry', 'run.json')
+
+
+# ── Memory accounting ───────────────────────────────────────
+def _status_mb(field: str) -> float:
+    with open('/proc/self/status') as f:
+        for line in f:
+            if line.startswith(field):
+                return int(line.split()[1]) / 1024
+    raise KeyError(field)
+
+
+def current_rss_mb() -> float:
+    """Resident set size of this process in MB."""
+    try:
+        return _status_mb('VmRSS')
+    except OSError:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def peak_rss_mb() -> float:
+    """Peak RSS since the last `reset_peak_rss` (process lifetime otherwise)."""
+    try:
+        return _status_mb('VmHWM')
+    except OSError:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def reset_peak_rss() -> bool:
+    """
+    Reset the kernel's RSS high-water mark (Linux); False if unsupported.
+
+    The peak reached so far is first credited to every open `RUN` stage.
+    """
+    RUN._fold_peak(peak_rss_mb())
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+        return True
+    except OSError:
+        return False
+
+
+def _count_rows(obj):
+    """Rows of a frame / array / list (first item of a tuple), an int as-is; None otherwise."""
+    if isinstance(obj, tuple) and obj:
+        obj = obj[0]
+    if isinstance(obj, numbers.Integral) and not isinstance(obj, bool):
+        return int(obj)
+    if hasattr(obj, 'shape') and len(getattr(obj, 'shape', ())):
+        return int(obj.shape[0])
+    if isinstance(obj, list):
+        return len(obj)
+    return None
+
+
+# ── Recorder ────────────────────────────────────────────────
+class Telemetry:
+    """Collects one record per executed stage (see module docstring)."""
+
+    def __init__(self):
+        self.enabled = True
+        self.reset()
+
+    def reset(self):
+        """Drop all records and start a new run."""
+        self.records = []
+        self._stack = []
+        self.started = time.time()
+
+    def _fold_peak(self, mb: float):
+        for rec in self._stack:
+            rec['peak_rss_mb'] = max(rec['peak_rss_mb'], mb)
+
+    @contextmanager
+    def stage(self, name: str, rows: int = None, **fields):
+        """
+        Record the enclosed block as stage *name*.
+
+        Yields the record dict; set ``rec['rows']`` (or call `annotate`)
+        when the row count is only known inside the block.
+        """
+        if not self.enabled:
+            yield {}
+            return
+        reset_peak_rss()
+        rec = {
+            'stage': name,
+            'parent': self._stack[-1]['stage'] if self._stack else None,
+            'depth': len(self._stack),
+            'rows': rows,
+            'start': time.time() - self.started,
+            'wall_s': 0.0,
+            'cpu_s': 0.0,
+            'rss_start_mb': current_rss_mb(),
+            'peak_rss_mb': 0.0,
+            'ok': False,
+            **fields,
+        }
+        self._stack.append(rec)
+        self.records.append(rec)
+        wall0, cpu0 = time.perf_counter(), time.process_time()
+        try:
+            yield rec
+            rec['ok'] = True
+        finally:
+            rec['wall_s'] = time.perf_counter() - wall0
+            rec['cpu_s'] = time.process_time() - cpu0
+            self._fold_peak(peak_rss_mb())
+            self._stack.pop()
+
+    def annotate(self, **fields):
+        """Update the innermost running stage (e.g. ``rows=n``); no-op outside one."""
+        if self._stack:
+            self._stack[-1].update(fields)
+
+    def profiled(self, name: str = None, rows=None):
+        """
+        Decorator recording every call of a function as a stage.
+
+        Parameters
+        ----------
+        name : str   Stage name (default: the function's qualified name).
+        rows         None → rows of the return value; str → rows of that
+                     argument; callable → ``rows(result)``.
+        """
+        def wrap(fn):
+            label = name or fn.__qualname__
+            sig = inspect.signature(fn)
+
+            @functools.wraps(fn)
+            def inner(*args, **kwargs):
+                with self.stage(label) as rec:
+                    result = fn(*args, **kwargs)
+                    if rec and rec['rows'] is None:
+                        if isinstance(rows, str):
+                            rec['rows'] = _count_rows(sig.bind(*args, **kwargs).arguments[rows])
+                        elif callable(rows):
+                            rec['rows'] = rows(result)
+                        else:
+                            rec['rows'] = _count_rows(result)
+                    return result
+            return inner
+        return wrap
+
+    # ── Reporting ───────────────────────────────────────────
+    def summary(self) -> pd.DataFrame:
+        """
+        One row per stage name (first-seen order, indented by depth).
+
+        Returns
+        -------
+        pd.DataFrame  Stage, Calls, Wall (s), CPU (s), CPU / Wall,
+                      Peak RSS (MB), Rows, Rows / s
+        """
+        if not self.records:
+            return pd.DataFrame(columns=['Stage', 'Calls', 'Wall (s)', 'CPU (s)', 'CPU / Wall',
+                                         'Peak RSS (MB)', 'Rows', 'Rows / s'])
+        df = pd.DataFrame(self.records)
+        df['rows'] = pd.to_numeric(df['rows'])
+        df['key'] = list(zip(df['depth'], df['stage']))
+        g = df.groupby('key', sort=False).agg(
+            depth=('depth', 'first'), stage=('stage', 'first'), calls=('stage', 'size'),
+            wall=('wall_s', 'sum'), cpu=('cpu_s', 'sum'), peak=('peak_rss_mb', 'max'),
+            rows=('rows', lambda r: r.sum(min_count=1)),
+        )
+        return pd.DataFrame({
+            'Stage': ['  ' * d + s for d, s in zip(g['depth'], g['stage'])],
+            'Calls': g['calls'].to_numpy(),
+            'Wall (s)': g['wall'].to_numpy(),
+            'CPU (s)': g['cpu'].to_numpy(),
+            'CPU / Wall': (g['cpu'] / g['wall'].where(g['wall'] > 0)).to_numpy(),
+            'Peak RSS (MB)': g['peak'].to_numpy(),
+            'Rows': g['rows'].to_numpy(),
+            'Rows / s': (g['rows'] / g['wall'].where(g['wall'] > 0)).to_numpy(),
+        })
+
+    def to_json(self, path: str = TELEMETRY_PATH) -> str:
+        """Write run metadata and every stage record to *path* (JSON)."""
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        doc = {
+            'started': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(self.started)),
+            'wall_s': time.time() - self.started,
+            'host': platform.node(),
+            'python': platform.python_version(),
+            'cpus': os.cpu_count(),
+            'stages': self.records,
+        }
+        with open(path, 'w') as f:
+            json.dump(doc, f, indent=2, default=lambda o: o.item() if hasattr(o, 'item') else str(o))
+        return path
+
+
+RUN = Telemetry()
+stage = RUN.stage
+annotate = RUN.annotate
+profiled = RUN.profiled
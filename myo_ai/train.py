@@ -0,0 +1,189 @@
+"""
+Layer 2 — The Tournament (training stage).
+
+Feature selection, the shared split protocol and the four scikit-learn
+contestant pipelines.  Every contestant cell still builds, fits and
+evaluates its *own* pipeline — these helpers only remove the copy-paste.
+
+Every pipeline imputes with `impute.StreamingMedianImputer`, a sketch-based
+drop-in for `SimpleImputer(strategy='median')`.
+
+Heavy imports are deferred: sklearn estimators load when a pipeline is
+first built, and TensorFlow only when `pulse_cnn` (Pulse-Sync) is used.
+"""
+
+import time
+
+import numpy as np
+
+from ._lazy import lazy_import
+from .telemetry import stage
+
+_pipeline      = lazy_import('sklearn.pipeline')
+_preprocessing = lazy_import('sklearn.preprocessing')
+_ensemble      = lazy_import('sklearn.ensemble')
+_linear_model  = lazy_import('sklearn.linear_model')
+_naive_bayes   = lazy_import('sklearn.naive_bayes')
+_model_select  = lazy_import('sklearn.model_selection')
+metrics        = lazy_import('sklearn.metrics')
+impute         = lazy_import(f'{__package__}.impute')      # streaming median imputer
+pulse_cnn      = lazy_import(f'{__package__}.pulse_cnn')   # TensorFlow / Keras
+
+
+# Identifier / leakage columns removed before any contestant sees the data
+LEAKAGE_COLS = ['target', 'id', 'unnamed: 0', 'patient_id']
+
+# Identical split parameters for every contestant (fair tournament)
+SPLIT_PARAMS = {'test_size': 0.2, 'random_state': 42}
+
+# Memory-lean Aegis: each tree sees a half-size bootstrap sample
+AEGIS_LEAN_PARAMS = {'max_samples': 0.5}
+
+# Hand-picked Myo-Core HGBC configuration (also the tuning baseline)
+MYOCORE_PARAMS = {
+    'max_iter': 300,
+    'learning_rate': 0.05,
+    'max_depth': 12,
+    'l2_regularization': 1.5,
+}
+
+# "fast" Myo-Core profile: no scaler (a no-op for trees) and explicit
+# validation-based early stopping instead of always running max_iter
+MYOCORE_PROFILES = ('standard', 'fast')
+MYOCORE_FAST_PARAMS = {
+    'early_stopping': True,
+    'validation_fraction': 0.1,
+    'n_iter_no_change': 10,
+}
+
+# Online Vanguard: logistic regression trained by SGD (supports partial_fit);
+# averaged weights reach the lbfgs solution within one or two passes
+VANGUARD_SGD_PARAMS = {'loss': 'log_loss', 'alpha': 1e-4, 'average': True,
+                       'max_iter': 1000, 'tol': 1e-4}
+
+
+# ── Feature selection & split ───────────────────────────────
+def select_features(master_data):
+    """
+    Numeric feature matrix and binary target from MASTER_DATA.
+
+    Returns
+    -------
+    (pd.DataFrame, pd.Series)  X without id / leakage columns, y as int.
+    """
+    X_raw = master_data.select_dtypes(include=[np.number])
+    X = X_raw.drop(columns=[c for c in LEAKAGE_COLS if c in X_raw.columns])
+    y = master_data['target'].fillna(0).astype(int)
+    return X, y
+
+
+def stratified_split(X, y):
+    """The tournament's stratified 80/20 split (`random_state=42`)."""
+    return _model_select.train_test_split(X, y, stratify=y, **SPLIT_PARAMS)
+
+
+# ── Contestant pipelines ────────────────────────────────────
+def build_aegis_pipeline(lean: bool = False):
+    """
+    Aegis Protocol: Imputer → RandomForest.
+
+    ``lean=True`` casts the input to float32 first — the dtype sklearn
+    trees use internally, so the forest no longer makes its own copy —
+    and fits each tree on a `max_samples` bootstrap subsample
+    (`AEGIS_LEAN_PARAMS`), which also makes the trees smaller.  Compact
+    the fitted forest for inference with `aegis_lite.export_aegis`.
+    """
+    steps = []
+    rf_params = {'n_estimators': 100, 'max_depth': 12, 'random_state': 42, 'n_jobs': -1}
+    if lean:
+        steps.append(('float32', _preprocessing.FunctionTransformer(
+                                     np.asarray, kw_args={'dtype': np.float32})))
+        rf_params.update(AEGIS_LEAN_PARAMS)
+    steps.append(('imputer', impute.StreamingMedianImputer()))
+    steps.append(('clf', _ensemble.RandomForestClassifier(**rf_params)))
+    return _pipeline.Pipeline(steps)
+
+
+def build_myocore_pipeline(params: dict = None, profile: str = 'standard'):
+    """
+    Myo-Core Engine: Imputer → Scaler → HistGradientBoosting.
+
+    *params* overrides `MYOCORE_PARAMS` (e.g. a configuration found by
+    `tuning.successive_halving` and loaded with `tuning.load_tuned_params`).
+
+    ``profile='fast'`` drops the StandardScaler — HGBC bins features by
+    quantile, so scaling never changes the trees — and stops boosting once
+    the internal validation loss stalls (`MYOCORE_FAST_PARAMS`).
+    """
+    if profile not in MYOCORE_PROFILES:
+        raise ValueError(f"profile must be one of {MYOCORE_PROFILES}, got {profile!r}")
+
+    steps = [('imputer', impute.StreamingMedianImputer())]
+    hgb_params = dict(MYOCORE_PARAMS)
+    if profile == 'standard':
+        steps.append(('scaler', _preprocessing.StandardScaler()))
+    else:
+        hgb_params.update(MYOCORE_FAST_PARAMS)
+    hgb_params.update(params or {})
+
+    steps.append(('clf', _ensemble.HistGradientBoostingClassifier(**hgb_params, random_state=42)))
+    return _pipeline.Pipeline(steps)
+
+
+def build_sentinel_pipeline():
+    """Sentinel Node: Imputer → MinMaxScaler → GaussianNB."""
+    return _pipeline.Pipeline([
+        ('imputer', impute.StreamingMedianImputer()),
+        ('scaler',  _preprocessing.MinMaxScaler()),
+        ('clf',     _naive_bayes.GaussianNB()),
+    ])
+
+
+def build_vanguard_pipeline(online: bool = False):
+    """
+    Vanguard System: Imputer → Scaler → LogisticRegression.
+
+    ``online=True`` swaps in a log-loss `SGDClassifier` (`VANGUARD_SGD_PARAMS`)
+    — the same model family, but one that `incremental.partial_update`
+    can keep training on new batches.
+    """
+    if online:
+        clf = _linear_model.SGDClassifier(**VANGUARD_SGD_PARAMS, random_state=42)
+    else:
+        clf = _linear_model.LogisticRegression(max_iter=1000, random_state=42)
+    return _pipeline.Pipeline([
+        ('imputer', impute.StreamingMedianImputer()),
+        ('scaler',  _preprocessing.StandardScaler()),
+        ('clf',     clf),
+    ])
+
+
+# ── Fit & evaluate ──────────────────────────────────────────
+def fit_and_score(pipeline, X_train, y_train, X_test, y_test, name: str = None) -> dict:
+    """
+    Fit *pipeline* on the train split and score it on the test split.
+
+    The fit and the test predictions are recorded as the `telemetry`
+    stages ``'<name> · fit'`` and ``'<name> · predict'`` (*name* defaults
+    to the final estimator's class).
+
+    Returns
+    -------
+    dict  keys: y_pred, y_prob, accuracy, roc_auc, elapsed (train seconds)
+    """
+    name = name or type(getattr(pipeline, 'steps', [(None, pipeline)])[-1][1]).__name__
+    t0 = time.time()
+    with stage(f'{name} · fit', rows=len(X_train)):
+        pipeline.fit(X_train, y_train)
+    elapsed = time.time() - t0
+
+    with stage(f'{name} · predict', rows=len(X_test)):
+        y_pred = pipeline.predict(X_test)
+        y_prob = pipeline.predict_proba(X_test)[:, 1]
+    return {
+        'y_pred':   y_pred,
+        'y_prob':   y_prob,
+        'accuracy': metrics.accuracy_score(y_test, y_pred),
+        'roc_auc':  metrics.roc_auc_score(y_test, y_prob),
+        'elapsed':  elapsed,
+    }
@@ -0,0 +1,241 @@
+"""
+Myo-Core tuning stage — successive halving for the HGBC contestant.
+
+A naive grid over 300-iteration models is far too slow, so candidates
+are raced on a growing budget: every rung raises both the training rows
+and the boosting iterations by `eta`, and only the best 1/`eta` of the
+candidates advance to the next rung.
+
+- Folds are imputed once (median, fitted per fold on its train part),
+  shuffled, and cached to disk; every rung reads row *prefixes* of the
+  same cached arrays, so no rung repeats preprocessing.
+- Each rung's (candidate × fold) fits run on a joblib process pool.
+- The winning parameters are saved as JSON and picked up by
+  `train.build_myocore_pipeline` when the tournament runs.
+
+Scaling is omitted in the cached folds: HGBC bins features by quantile,
+so a StandardScaler in front of it does not change the fitted trees.
+"""
+
+import json
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from ._lazy import lazy_import
+from .train import MYOCORE_PARAMS
+
+joblib         = lazy_import('joblib')
+impute         = lazy_import(f'{__package__}.impute')
+_ensemble      = lazy_import('sklearn.ensemble')
+_model_select  = lazy_import('sklearn.model_selection')
+metrics        = lazy_import('sklearn.metrics')
+
+
+# (kind, low, high) for continuous / integer ranges, or a list of choices
+MYOCORE_SEARCH_SPACE = {
+    'learning_rate':     ('log', 0.01, 0.3),
+    'max_depth':         [4, 6, 8, 12, None],
+    'max_leaf_nodes':    [15, 31, 63, 127],
+    'min_samples_leaf':  ('int', 10, 200),
+    'l2_regularization': ('log', 1e-3, 10.0),
+}
+
+MYOCORE_TUNED_PATH = os.path.join('configs', 'myocore_tuned.json')
+
+# Pre-binning: same bin budget and subsample as HGBC's own bin mapper
+PREBIN_MAX_BINS = 255
+PREBIN_SUBSAMPLE = 200_000
+
+
+# ── Search space ────────────────────────────────────────────
+def sample_configs(space: dict, n: int, seed: int = 42) -> list:
+    """Draw *n* random configurations from *space*."""
+    rng = np.random.default_rng(seed)
+    configs = []
+    for _ in range(n):
+        cfg = {}
+        for name, spec in space.items():
+            if isinstance(spec, list):
+                cfg[name] = spec[rng.integers(len(spec))]
+            elif spec[0] == 'log':
+                cfg[name] = float(np.exp(rng.uniform(np.log(spec[1]), np.log(spec[2]))))
+            elif spec[0] == 'int':
+                cfg[name] = int(rng.integers(spec[1], spec[2] + 1))
+            else:
+                cfg[name] = float(rng.uniform(spec[1], spec[2]))
+        configs.append(cfg)
+    return configs
+
+
+# ── Pre-binning ─────────────────────────────────────────────
+def quantile_bin_edges(X, max_bins: int = PREBIN_MAX_BINS,
+                       subsample: int = PREBIN_SUBSAMPLE, seed: int = 42) -> list:
+    """Per-feature quantile bin edges (at most *max_bins* - 1 per feature)."""
+    X = np.asarray(X, dtype=np.float64)
+    if len(X) > subsample:
+        X = X[np.random.default_rng(seed).choice(len(X), subsample, replace=False)]
+    qs = np.linspace(0, 1, max_bins + 1)[1:-1]
+    return [np.unique(np.nanquantile(col, qs)) for col in X.T]
+
+
+def apply_bins(X, edges: list) -> np.ndarray:
+    """Map *X* to uint8 bin codes with *edges* from `quantile_bin_edges`."""
+    X = np.asarray(X, dtype=np.float64)
+    codes = np.empty(X.shape, dtype=np.uint8)
+    for j, e in enumerate(edges):
+        codes[:, j] = np.searchsorted(e, X[:, j], side='right')
+    return codes
+
+
+# ── Cached preprocessed folds ───────────────────────────────
+def make_folds(X, y, n_splits: int = 3, seed: int = 42, cache_dir: str = None,
+               prebin: bool = False) -> list:
+    """
+    Stratified CV folds with median imputation fitted on each fold's
+    train part.  Train rows are shuffled once so any prefix is a random
+    subsample.
+
+    With ``prebin=True`` each fold is also quantile-binned once (edges
+    from its train part) and stored as uint8 codes.  HGBC re-bins a
+    matrix with ≤ 255 distinct values per feature one-to-one, so the
+    trees match binning the raw values, while the cached folds shrink 8×
+    and every tuning fit ships less data to the worker processes.
+
+    Returns
+    -------
+    list[tuple]  (X_tr, y_tr, X_va, y_va) float64 (or uint8) / int arrays per fold.
+    """
+    X = np.asarray(X, dtype=np.float64)
+    y = np.asarray(y)
+
+    cache_path = None
+    if cache_dir is not None:
+        key = joblib.hash((X, y, n_splits, seed, prebin))
+        cache_path = os.path.join(cache_dir, f'folds_{key}.joblib')
+        if os.path.exists(cache_path):
+            return joblib.load(cache_path, mmap_mode='r')
+
+    rng = np.random.default_rng(seed)
+    skf = _model_select.StratifiedKFold(n_splits=n_splits, shuffle=True, random_state=seed)
+    folds = []
+    for tr_idx, va_idx in skf.split(X, y):
+        tr_idx = rng.permutation(tr_idx)
+        imputer = impute.StreamingMedianImputer()
+        X_tr, X_va = imputer.fit_transform(X[tr_idx]), imputer.transform(X[va_idx])
+        if prebin:
+            edges = quantile_bin_edges(X_tr, seed=seed)
+            X_tr, X_va = apply_bins(X_tr, edges), apply_bins(X_va, edges)
+        folds.append((X_tr, y[tr_idx], X_va, y[va_idx]))
+
+    if cache_path is not None:
+        os.makedirs(cache_dir, exist_ok=True)
+        joblib.dump(folds, cache_path)
+    return folds
+
+
+# ── Evaluation ──────────────────────────────────────────────
+def _fit_fold(params, fold, n_rows, max_iter, seed):
+    """Fit one candidate on the first *n_rows* of a fold → validation AUC."""
+    X_tr, y_tr, X_va, y_va = fold
+    clf = _ensemble.HistGradientBoostingClassifier(
+        **{**params, 'max_iter': max_iter},
+        early_stopping=False,
+        random_state=seed,
+    )
+    clf.fit(X_tr[:n_rows], y_tr[:n_rows])
+    return metrics.roc_auc_score(y_va, clf.predict_proba(X_va)[:, 1])
+
+
+def evaluate_config(params, folds, n_rows=None, max_iter=None, n_jobs=-1, seed=42) -> float:
+    """Mean CV AUC of *params* (defaults: all rows, `params['max_iter']`)."""
+    params = dict(params)
+    max_iter = max_iter or params.pop('max_iter', MYOCORE_PARAMS['max_iter'])
+    params.pop('max_iter', None)
+    n_rows = n_rows or len(folds[0][0])
+    aucs = joblib.Parallel(n_jobs=n_jobs, prefer='processes')(
+        joblib.delayed(_fit_fold)(params, fold, n_rows, max_iter, seed) for fold in folds
+    )
+    return float(np.mean(aucs))
+
+
+# ── Successive halving ──────────────────────────────────────
+def successive_halving(folds, n_candidates: int = 27, eta: int = 3,
+                       max_iter: int = 300, min_rows: int = 2_000,
+                       min_iter: int = 20, space: dict = None,
+                       n_jobs: int = -1, seed: int = 42) -> dict:
+    """
+    Race *n_candidates* random configurations over data-size and
+    iteration budgets.
+
+    With R = ⌈log_eta(n_candidates)⌉ rungs, rung r trains on
+    `eta^(r-R)` of the fold rows and `eta^(r-R)` of `max_iter`
+    (floored at `min_rows` / `min_iter`); the final rung is the full
+    budget for the surviving candidate(s).
+
+    Returns
+    -------
+    dict
+        best_params : winning configuration (incl. ``max_iter``)
+        best_auc    : its mean CV AUC at the full budget
+        history     : DataFrame, one row per rung (candidates, budget,
+                      best AUC, cumulative wall-clock seconds)
+        elapsed     : total wall-clock seconds
+    """
+    space = space or MYOCORE_SEARCH_SPACE
+    candidates = sample_configs(space, n_candidates, seed)
+    n_train = len(folds[0][0])
+    n_rungs = int(np.ceil(np.log(n_candidates) / np.log(eta))) if n_candidates > 1 else 0
+
+    t_start = time.perf_counter()
+    history = []
+    with joblib.Parallel(n_jobs=n_jobs, prefer='processes') as parallel:
+        for rung in range(n_rungs + 1):
+            frac = float(eta) ** (rung - n_rungs)
+            n_rows = min(n_train, max(min_rows, int(n_train * frac)))
+            iters = min(max_iter, max(min_iter, int(max_iter * frac)))
+
+            aucs = parallel(
+                joblib.delayed(_fit_fold)(cfg, fold, n_rows, iters, seed)
+                for cfg in candidates for fold in folds
+            )
+            scores = np.asarray(aucs).reshape(len(candidates), len(folds)).mean(axis=1)
+            order = np.argsort(scores)[::-1]
+
+            history.append({
+                'Rung': rung,
+                'Candidates': len(candidates),
+                'Rows': n_rows,
+                'Max Iter': iters,
+                'Best CV AUC': float(scores[order[0]]),
+                'Wall Clock (s)': round(time.perf_counter() - t_start, 2),
+            })
+            best_params, best_auc = candidates[order[0]], float(scores[order[0]])
+            keep = max(1, len(candidates) // eta)
+            candidates = [candidates[i] for i in order[:keep]]
+
+    return {
+        'best_params': {**best_params, 'max_iter': max_iter},
+        'best_auc': best_auc,
+        'history': pd.DataFrame(history),
+        'elapsed': time.perf_counter() - t_start,
+    }
+
+
+# ── Persistence ─────────────────────────────────────────────
+def save_tuned_params(params: dict, path: str = MYOCORE_TUNED_PATH) -> str:
+    """Write the winning configuration to JSON (one file per site)."""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(params, f, indent=2)
+    return path
+
+
+def load_tuned_params(path: str = MYOCORE_TUNED_PATH) -> dict:
+    """Tuned Myo-Core parameters if *path* exists, else the hand-picked defaults."""
+    if os.path.exists(path):
+        with open(path) as f:
+            return {**MYOCORE_PARAMS, **json.load(f)}
+    return dict(MYOCORE_PARAMS)